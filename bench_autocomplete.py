@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+슬래시 명령어 자동완성 벤치마크
+이전 자동완성(ItemSearchIndex.autocomplete: 접두어 이진 탐색 + 부분 문자열/초성/오타 검색) vs 접두어 트라이
+
+Discord 자동완성 응답 제한은 3초, 목표는 p99 5ms 미만
+
+사용법:
+    python bench_autocomplete.py
+"""
+
+import random
+import time
+
+from item_search import ItemSearchIndex
+from merchant_model import ITEM_CATALOG
+from prefix_trie import PrefixTrie
+
+SYLLABLES = "가나다라마바사아자차카타파하전설영웅희귀카드팩룬상자기록주술서향신료"
+
+
+def build_names(size: int):
+    random.seed(23)
+    names = set(ITEM_CATALOG)
+    while len(names) < size:
+        names.add(''.join(random.choices(SYLLABLES, k=random.randint(2, 6))) + random.choice(["", " 상자", " 주머니", " 카드"]))
+    return sorted(names)
+
+
+def build_inputs(names):
+    """사용자가 한 글자씩 입력하는 것처럼 이름 앞부분 1~4글자"""
+    random.seed(29)
+    return [random.choice(names)[:random.randint(1, 4)] for _ in range(2000)]
+
+
+def timed(complete, inputs):
+    samples = []
+    for text in inputs:
+        started = time.perf_counter()
+        complete(text)
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return sum(samples) / len(samples), samples[int(len(samples) * 0.99)]
+
+
+def main():
+    print(f"{'이름 수':>8}{'이전 평균':>12}{'이전 p99':>12}{'트라이 평균':>12}{'트라이 p99':>12}{'트라이 생성':>12}")
+    print("=" * 68)
+    for size in (len(ITEM_CATALOG), 1_000, 10_000, 50_000):
+        names = build_names(size)
+        inputs = build_inputs(names)
+
+        index = ItemSearchIndex(catalog=names)
+        started = time.perf_counter()
+        trie = PrefixTrie(limit=25)
+        for name in names:
+            trie.add(name)
+        build_ms = (time.perf_counter() - started) * 1000
+
+        old_avg, old_p99 = timed(lambda text: index.autocomplete(text, limit=25), inputs)
+        trie_avg, trie_p99 = timed(trie.complete, inputs)
+        print(f"{size:>8,}{old_avg:>10.3f}ms{old_p99:>10.3f}ms{trie_avg:>10.3f}ms{trie_p99:>10.3f}ms{build_ms:>10.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
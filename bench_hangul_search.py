@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+초성 / 오타 허용 아이템 검색 벤치마크
+선형 비교(이름마다 미리 분해해 둔 초성/자모와 비교 + 편집 거리) vs 초성/자모 2-gram 역색인
+
+기본 아이템 목록(ITEM_CATALOG) 전체 + 합성 이름으로 늘린 목록 1천/1만/5만 개
+
+사용법:
+    python bench_hangul_search.py
+"""
+
+import random
+import time
+
+from hangul_search import bounded_distance, choseong, decompose, fuzzy_limit
+from item_search import ItemSearchIndex, normalize_text
+from merchant_model import ITEM_CATALOG
+
+SYLLABLES = "가나다라마바사아자차카타파하전설영웅희귀카드팩룬상자기록주술서향신료닭과"
+
+
+def build_catalog(size: int):
+    random.seed(13)
+    names = set(ITEM_CATALOG)
+    while len(names) < size:
+        names.add(''.join(random.choices(SYLLABLES, k=random.randint(2, 6))) + random.choice(["", " 상자", " 주머니", " 카드"]))
+    return sorted(names)
+
+
+def build_queries(names):
+    """초성 검색어 반, 글자 하나 틀린 검색어 반"""
+    random.seed(17)
+    queries = []
+    for name in random.choices(names, k=200):
+        text = normalize_text(name)
+        if len(queries) % 2:
+            typo = list(text)
+            typo[random.randrange(len(typo))] = random.choice(SYLLABLES)
+            queries.append(''.join(typo))
+        else:
+            queries.append(choseong(text)[:3])
+    return queries
+
+
+class LinearSearch:
+    """색인 없이 이름마다 비교 (초성/자모 분해는 미리 해 둠)"""
+
+    def __init__(self, names):
+        self.entries = [(name, choseong(normalize_text(name)), decompose(normalize_text(name))) for name in names]
+
+    def search(self, query):
+        normalized = normalize_text(query)
+        initials, jamo = choseong(normalized), decompose(normalized)
+        limit = fuzzy_limit(jamo)
+        hits = []
+        for name, name_initials, name_jamo in self.entries:
+            if initials in name_initials or (limit and bounded_distance(jamo, name_jamo, limit) <= limit):
+                hits.append(name)
+        return hits
+
+
+def percentile(samples, ratio):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * ratio))]
+
+
+def timed(search, queries):
+    samples = []
+    for query in queries:
+        started = time.perf_counter()
+        search(query)
+        samples.append((time.perf_counter() - started) * 1_000_000)
+    return sum(samples) / len(samples), percentile(samples, 0.99)
+
+
+def main():
+    print(f"{'이름 수':>8}{'선형 평균':>12}{'선형 p99':>12}{'색인 평균':>12}{'색인 p99':>12}{'색인 생성':>12}")
+    print("=" * 68)
+    for size in (len(ITEM_CATALOG), 1_000, 10_000, 50_000):
+        names = build_catalog(size)
+        queries = build_queries(names)
+
+        started = time.perf_counter()
+        index = ItemSearchIndex(catalog=names)
+        build_ms = (time.perf_counter() - started) * 1000
+
+        linear_avg, linear_p99 = timed(LinearSearch(names).search, queries)
+        index_avg, index_p99 = timed(lambda q: index.search(q, limit=10), queries)
+        print(f"{size:>8,}{linear_avg:>10.0f}µs{linear_p99:>10.0f}µs{index_avg:>10.0f}µs{index_p99:>10.0f}µs{build_ms:>10.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+/확률 계산 벤치마크
+지난 스냅샷 전체를 요청마다 다시 세는 방식 vs 스냅샷마다 증분 갱신한 카운트 표 조회
+(등장 직전 몰리는 요청을 가정해 같은 표에 연속 조회)
+
+사용법:
+    python bench_item_forecast.py
+"""
+
+import random
+import time
+from datetime import datetime, timedelta
+
+from item_forecast import ItemForecaster
+from merchant_history import cycle_start
+
+REGION_COUNT = 40
+POOL_SIZE = 12
+RANDOM_SLOTS = 3
+POLLS_PER_CYCLE = 4
+
+
+def build_regions():
+    return [
+        {'name': f"지역{r}", 'npcName': f"상인{r}", 'group': r % 4 + 1,
+         'items': [{'name': f"아이템{(r * 5 + i) % 150}", 'default': i < 2} for i in range(POOL_SIZE)]}
+        for r in range(REGION_COUNT)
+    ]
+
+
+def build_polls(regions, days):
+    random.seed(3)
+    started = datetime(2024, 1, 1, 4)
+    polls = []
+    for cycle in range(days * 4):
+        cycle_at = started + timedelta(hours=6 * cycle)
+        merchants = []
+        for region in regions:
+            if region['group'] != cycle % 4 + 1 and random.random() < 0.5:
+                continue
+            defaults = [item['name'] for item in region['items'] if item['default']]
+            others = [item['name'] for item in region['items'] if not item['default']]
+            merchants.append({'region_name': region['name'], 'npc_name': region['npcName'],
+                              'items': defaults + random.sample(others, RANDOM_SLOTS)})
+        for poll in range(POLLS_PER_CYCLE):
+            polls.append((cycle_at + timedelta(minutes=10 * poll), merchants))
+    return polls
+
+
+def rescan_estimate(polls, item):
+    """요청마다 지난 스냅샷을 모두 다시 세는 방식"""
+    seen, visits, counts = set(), {}, {}
+    for observed_at, merchants in polls:
+        cycle = cycle_start(observed_at)
+        for merchant in merchants:
+            region = merchant['region_name']
+            if (cycle, region) not in seen:
+                seen.add((cycle, region))
+                visits[region] = visits.get(region, 0) + 1
+            if item in merchant['items'] and (cycle, region, item) not in seen:
+                seen.add((cycle, region, item))
+                counts[region] = counts.get(region, 0) + 1
+    return sorted(((counts[region] / visits[region], region) for region in counts), reverse=True)
+
+
+def percentile(samples, ratio):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * ratio))]
+
+
+def timed(func, queries):
+    samples = []
+    for query in queries:
+        started = time.perf_counter()
+        func(query)
+        samples.append((time.perf_counter() - started) * 1_000_000)
+    return sum(samples) / len(samples), percentile(samples, 0.99)
+
+
+def main():
+    regions = build_regions()
+    random.seed(9)
+    queries = [f"아이템{random.randrange(150)}" for _ in range(500)]
+
+    print(f"{'기간':>8}{'스냅샷':>10}{'재집계 평균':>14}{'재집계 p99':>14}{'표 평균':>12}{'표 p99':>12}{'반영/스냅샷':>14}")
+    print("=" * 90)
+    for days in (7, 90, 365):
+        polls = build_polls(regions, days)
+        forecaster = ItemForecaster()
+        forecaster.set_pools(regions)
+        started = time.perf_counter()
+        for observed_at, merchants in polls:
+            forecaster.observe(merchants, observed_at)
+        observe_us = (time.perf_counter() - started) / len(polls) * 1_000_000
+
+        now = polls[-1][0] + timedelta(hours=6)
+        rescan_avg, rescan_p99 = timed(lambda q: rescan_estimate(polls, q), queries[:20])
+        table_avg, table_p99 = timed(lambda q: forecaster.estimate(q, now=now), queries)
+
+        print(f"{days:>7}일{len(polls):>10,}{rescan_avg:>12.0f}µs{rescan_p99:>12.0f}µs"
+              f"{table_avg:>10.0f}µs{table_p99:>10.0f}µs{observe_us:>12.0f}µs")
+
+
+if __name__ == "__main__":
+    main()
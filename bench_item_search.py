@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""
+아이템 이름 검색 벤치마크
+기존 방식(모든 상인의 모든 아이템에 query.lower() in name.lower()) vs n-gram/접두어 역색인
+
+사용법:
+    python bench_item_search.py
+"""
+
+import random
+import time
+
+from item_search import ItemSearchIndex
+from merchant_snapshot import MerchantSnapshotStore
+
+SYLLABLES = "가나다라마바사아자차카타파하전설영웅희귀카드팩룬상자기록주술서향신료"
+ITEMS_PER_MERCHANT = 10
+
+
+def build_merchants(item_count: int):
+    random.seed(11)
+    names = list({''.join(random.choices(SYLLABLES, k=random.randint(3, 8))) for _ in range(item_count * 2)})[:item_count]
+    return [
+        {'region_name': f"지역{i}", 'npc_name': f"상인{i}",
+         'items': [{'name': name, 'grade': '전설'} for name in names[i:i + ITEMS_PER_MERCHANT]]}
+        for i in range(0, len(names), ITEMS_PER_MERCHANT)
+    ]
+
+
+def linear_search(merchants, query):
+    found = []
+    for merchant in merchants:
+        for item in merchant['items']:
+            if query.lower() in item['name'].lower():
+                found.append(merchant)
+                break
+    return found
+
+
+def percentile(samples, ratio):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * ratio))]
+
+
+def timed(func, queries):
+    samples = []
+    for query in queries:
+        started = time.perf_counter()
+        func(query)
+        samples.append((time.perf_counter() - started) * 1_000_000)
+    return sum(samples) / len(samples), percentile(samples, 0.99)
+
+
+def main():
+    random.seed(5)
+    queries = [''.join(random.choices(SYLLABLES, k=random.randint(1, 3))) for _ in range(300)]
+
+    print(f"{'아이템 수':>10}{'선형 평균':>12}{'선형 p99':>12}{'색인 평균':>12}{'색인 p99':>12}{'전체 색인':>12}{'증분 갱신':>12}")
+    print("=" * 84)
+    for item_count in (1_000, 10_000, 50_000):
+        merchants = build_merchants(item_count)
+        store = MerchantSnapshotStore()
+        snapshot = store.publish(merchants)
+
+        index = ItemSearchIndex()
+        started = time.perf_counter()
+        index.sync(snapshot)
+        build_ms = (time.perf_counter() - started) * 1000
+
+        linear_avg, linear_p99 = timed(lambda q: linear_search(snapshot.merchants, q), queries)
+        index_avg, index_p99 = timed(lambda q: index.find(snapshot, q), queries)
+
+        # 상인 1명의 아이템이 바뀐 스냅샷 반영
+        changed = list(merchants)
+        changed[0] = dict(changed[0], items=[{'name': "새 아이템 상자", 'grade': '영웅'}])
+        next_snapshot = store.publish(changed)
+        started = time.perf_counter()
+        index.sync(next_snapshot)
+        update_ms = (time.perf_counter() - started) * 1000
+
+        print(f"{item_count:>10,}{linear_avg:>10.0f}µs{linear_p99:>10.0f}µs{index_avg:>10.0f}µs{index_p99:>10.0f}µs"
+              f"{build_ms:>10.1f}ms{update_ms:>10.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""
+상인 기록 통계 조회 벤치마크
+1년치 기록(하루 4주기 × 365일, 주기마다 내용이 바뀐 스냅샷 3개)에서
+원본 JSON 다시 읽기(폴링 페이로드를 전부 json.loads 후 집계) vs SQLite 주간 집계 테이블 조회
+
+사용법:
+    python bench_merchant_history.py
+"""
+
+import json
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from merchant_history import MerchantHistoryStore, cycle_start
+
+DAYS = 365
+SNAPSHOTS_PER_CYCLE = 3
+REGIONS = [f"지역 {i:02d}" for i in range(20)]
+POOL = {region: [(f"{region} 아이템 {i}", random.Random(i).randint(1, 5)) for i in range(12)] for region in REGIONS}
+
+
+def build_year():
+    """(관측 시각, 상인 목록) 1년치"""
+    random.seed(31)
+    start = datetime(2024, 1, 1, 4, 0)
+    history = []
+    for cycle in range(DAYS * 4):
+        begin = start + timedelta(hours=6 * cycle)
+        regions = random.sample(REGIONS, 8)
+        merchants = []
+        for step in range(SNAPSHOTS_PER_CYCLE):
+            # 주기 안에서 상인이 하나씩 더 나타나는 것처럼 내용이 바뀜
+            merchants = merchants + [
+                {'region_name': region, 'npc_name': f"{region} 상인",
+                 'items': [{'name': name, 'grade': grade} for name, grade in random.sample(POOL[region], 4)]}
+                for region in regions[step * 3:step * 3 + 3]
+            ]
+            history.append((begin + timedelta(minutes=5 + step * 30), merchants))
+    return history
+
+
+def replay_item_regions(payloads, item):
+    """원본 JSON 다시 읽어서 주기별로 한 번씩 지역별 등장 집계"""
+    seen = set()
+    for observed_at, raw in payloads:
+        cycle = cycle_start(observed_at)
+        for merchant in json.loads(raw):
+            for entry in merchant['items']:
+                if entry['name'] == item:
+                    seen.add((cycle, merchant['region_name']))
+    counts = {}
+    for _, region in seen:
+        counts[region] = counts.get(region, 0) + 1
+    return sorted(counts.items(), key=lambda x: (-x[1], x[0]))
+
+
+def timed(func, repeat=20):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return (time.perf_counter() - started) / repeat * 1000, result
+
+
+def main():
+    history = build_year()
+    payloads = [(observed_at, json.dumps(merchants, ensure_ascii=False)) for observed_at, merchants in history]
+
+    path = os.path.join(tempfile.mkdtemp(), "bench_history.db")
+    store = MerchantHistoryStore(path)
+    started = time.perf_counter()
+    for observed_at, merchants in history:
+        store.append(merchants, observed_at)
+    append_ms = (time.perf_counter() - started) / len(history) * 1000
+
+    item = POOL["지역 03"][0][0]
+    replay_ms, replay_result = timed(lambda: replay_item_regions(payloads, item), repeat=3)
+    query_ms, query_result = timed(lambda: store.item_appearances(item))
+    assert [tuple(row) for row in query_result] == replay_result
+
+    grade_ms, _ = timed(lambda: store.grade_distribution())
+    recent_ms, _ = timed(lambda: store.region_items("지역 03", weeks=4, now=datetime(2024, 12, 31)))
+
+    stats = store.get_stats()
+    raw_kb = sum(len(raw.encode('utf-8')) for _, raw in payloads) / 1024
+    print(f"1년치 기록: 스냅샷 {stats['snapshots']:,}개 / 등장 주기 {stats['cycles']:,}회")
+    print(f"원본 JSON {raw_kb:,.0f}KB → SQLite {os.path.getsize(path) / 1024:,.0f}KB, 스냅샷 추가 평균 {append_ms:.2f}ms")
+    print("=" * 60)
+    print(f"{'아이템 지역별 등장 (원본 JSON 다시 읽기)':<40}{replay_ms:>10.1f}ms")
+    print(f"{'아이템 지역별 등장 (주간 집계)':<40}{query_ms:>10.3f}ms")
+    print(f"{'등급 분포 전체 (주간 집계)':<40}{grade_ms:>10.3f}ms")
+    print(f"{'지역 최근 4주 상위 아이템 (주간 집계)':<40}{recent_ms:>10.3f}ms")
+    store.close()
+
+
+if __name__ == "__main__":
+    main()
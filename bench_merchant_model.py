@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""
+상인/아이템 데이터 모델 메모리 벤치마크
+기존 방식(상인/아이템 dict + 아이템마다 grade_text/grade_emoji/type_text 문자열) vs
+__slots__ Merchant/Item (정수 등급/타입, intern된 이름, 같은 아이템 객체 재사용)
+
+합성 폴링 기록: 폴링 500회 × 상인 4명 × 아이템 5개 = 아이템 10,000개
+폴링마다 kloa JSON을 새로 파싱하는 것처럼 json.loads로 새 문자열/딕셔너리를 만든 뒤 변환해서 기록에 보관
+
+사용법:
+    python bench_merchant_model.py
+"""
+
+import gc
+import json
+import random
+import sys
+import time
+import tracemalloc
+
+from merchant_model import Item, Merchant
+
+POLLS = 500
+MERCHANTS_PER_POLL = 4
+ITEMS_PER_MERCHANT = 5
+
+GRADE_TEXT = {1: '일반', 2: '고급', 3: '희귀', 4: '영웅', 5: '전설'}
+GRADE_EMOJI = {1: '⚪', 2: '🟢', 3: '🔵', 4: '🟣', 5: '🟠'}
+TYPE_TEXT = {1: '카드', 2: '아이템', 3: '재료'}
+
+
+def build_raw_polls():
+    """폴링별 kloa 지역 JSON (문자열)"""
+    random.seed(7)
+    catalog = [(f"아이템 {i:03d}", random.randint(1, 5), random.randint(1, 3)) for i in range(300)]
+    regions = [(f"지역 {i:02d}", f"상인 {i:02d}") for i in range(40)]
+
+    polls = []
+    for _ in range(POLLS):
+        poll = []
+        for region, npc in random.sample(regions, MERCHANTS_PER_POLL):
+            poll.append({
+                'name': region, 'npcName': npc, 'group': random.randint(1, 10),
+                'items': [
+                    {'name': name, 'grade': grade, 'type': item_type, 'hidden': False}
+                    for name, grade, item_type in random.sample(catalog, ITEMS_PER_MERCHANT)
+                ],
+            })
+        polls.append(json.dumps(poll, ensure_ascii=False))
+    return polls
+
+
+def legacy_convert(regions):
+    """기존 WanderingMerchantTracker.get_merchant_items 방식"""
+    merchants = []
+    for region in regions:
+        items = []
+        for item in region['items']:
+            if item.get('hidden', False):
+                continue
+            items.append({
+                'name': item.get('name', '알 수 없음'),
+                'grade': item.get('grade', 1),
+                'grade_text': GRADE_TEXT.get(item.get('grade', 1), '알 수 없음'),
+                'grade_emoji': GRADE_EMOJI.get(item.get('grade', 1), '⚪'),
+                'type': item.get('type', 1),
+                'type_text': TYPE_TEXT.get(item.get('type', 1), '알 수 없음'),
+            })
+        items.sort(key=lambda x: x['grade'], reverse=True)
+        merchants.append({
+            'region_name': region.get('name', '알 수 없음'),
+            'npc_name': region.get('npcName', '알 수 없음'),
+            'group': region.get('group'),
+            'items': items,
+        })
+    return merchants
+
+
+def model_convert(regions):
+    """Merchant/Item 방식"""
+    merchants = []
+    for region in regions:
+        items = [Item.from_raw(item) for item in region['items'] if not item.get('hidden', False)]
+        items.sort(key=lambda x: x.grade, reverse=True)
+        merchants.append(Merchant.from_region(region, items=items))
+    return merchants
+
+
+def measure(convert, raw_polls):
+    """기록 전체 메모리, 폴링당 남는 메모리 블록 수, 폴링당 변환 시간"""
+    Item._pool.clear()
+    gc.collect()
+
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+
+    history = []
+    retained_blocks = 0
+    for raw in raw_polls:
+        gc.collect()
+        blocks_before = sys.getallocatedblocks()
+        merchants = convert(json.loads(raw))
+        history.append(merchants)
+        gc.collect()
+        retained_blocks += sys.getallocatedblocks() - blocks_before
+
+    gc.collect()
+    history_bytes = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+
+    # 변환 시간은 tracemalloc 없이 따로 측정
+    parsed = [json.loads(raw) for raw in raw_polls]
+    started = time.perf_counter()
+    for regions in parsed:
+        convert(regions)
+    elapsed = time.perf_counter() - started
+
+    items = sum(len(merchant['items']) for merchants in history for merchant in merchants)
+    return {
+        'items': items,
+        'history_kb': history_bytes / 1024,
+        'per_snapshot_bytes': history_bytes / len(history),
+        'per_item_bytes': history_bytes / items,
+        'blocks_per_poll': retained_blocks / len(history),
+        'convert_us': elapsed / len(history) * 1_000_000,
+    }
+
+
+def main():
+    raw_polls = build_raw_polls()
+    print(f"합성 폴링 기록: 폴링 {POLLS}회 × 상인 {MERCHANTS_PER_POLL}명 × 아이템 {ITEMS_PER_MERCHANT}개")
+    print("=" * 78)
+    print(f"{'방식':<18}{'기록 전체':>12}{'폴링(스냅샷)당':>16}{'아이템당':>12}{'폴링당 블록':>12}{'변환':>10}")
+
+    results = {}
+    for label, convert in (("dict (기존)", legacy_convert), ("Merchant/Item", model_convert)):
+        result = results[label] = measure(convert, raw_polls)
+        print(f"{label:<18}{result['history_kb']:>10.1f}KB{result['per_snapshot_bytes']:>14.0f}B"
+              f"{result['per_item_bytes']:>10.0f}B{result['blocks_per_poll']:>12.1f}{result['convert_us']:>8.1f}µs")
+
+    legacy, model = results["dict (기존)"], results["Merchant/Item"]
+    print("=" * 78)
+    print(f"아이템 {model['items']:,}개 기록 메모리: {legacy['history_kb'] / model['history_kb']:.1f}배 감소, "
+          f"폴링당 남는 할당 {legacy['blocks_per_poll']:.0f} → {model['blocks_per_poll']:.0f}블록")
+
+
+if __name__ == "__main__":
+    main()
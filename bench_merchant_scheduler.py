@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""
+떠상 체크 횟수 / 알림 지연 비교 (일주일 시뮬레이션, 네트워크 없음)
+고정 간격 폴링(30초, 5분) vs 스케줄 경계 기반 스케줄러
+
+사용법:
+    python bench_merchant_scheduler.py
+"""
+
+from datetime import datetime, timedelta
+
+from merchant_scheduler import MerchantScheduler
+from schedule_index import ScheduleIndex
+
+# 떠상 시간: 04:00~09:30, 10:00~15:30, 16:00~21:30, 22:00~03:30 (매일)
+SCHEDULES = [
+    {'dayOfWeek': day, 'startTime': start, 'duration': '05:30:00', 'groups': [group]}
+    for day in range(7)
+    for group, start in enumerate(['04:00:00', '10:00:00', '16:00:00', '22:00:00'], start=1)
+]
+
+# 2026-10-18은 일요일
+WEEK_START = datetime(2026, 10, 18)
+WEEK = timedelta(days=7)
+LEAD = timedelta(minutes=30)
+
+
+def boundaries_in_week(index: ScheduleIndex):
+    """일주일 동안의 모든 알림 경계 시각"""
+    moments = []
+    moment = WEEK_START
+    while True:
+        moment = index.next_boundary_after(moment, LEAD)
+        if moment is None or moment >= WEEK_START + WEEK:
+            return moments
+        moments.append(moment)
+
+
+def simulate_fixed(interval: float):
+    """고정 간격 폴링: 체크 횟수, 경계 이후 평균/최대 알림 지연(초)"""
+    checks = int(WEEK.total_seconds() // interval)
+    # 루프 시작 시각이 임의이므로 경계마다 지연은 0 ~ interval 균등 분포
+    return checks, interval / 2, interval
+
+
+def simulate_scheduler(index: ScheduleIndex, verify_rounds: int):
+    """스케줄러: plan()을 따라 시계를 옮기며 체크 횟수 계산 (경계마다 verify_rounds번 재확인)"""
+    scheduler = MerchantScheduler(None, lambda now: index.next_boundary_after(now, LEAD))
+    now = WEEK_START
+    checks = 1  # 시작할 때 1회
+    while True:
+        delay, reason = scheduler.plan(now)
+        now += timedelta(seconds=delay)
+        if now >= WEEK_START + WEEK:
+            return checks, scheduler.grace, scheduler.grace
+        checks += 1
+        if reason == 'boundary':
+            checks += verify_rounds
+            now += timedelta(seconds=scheduler.verify_delays[verify_rounds - 1] if verify_rounds else 0)
+
+
+def main():
+    """벤치마크 실행"""
+    print("🚀 떠상 체크 스케줄 비교 (일주일)")
+    print("=" * 70)
+
+    index = ScheduleIndex(SCHEDULES)
+    boundaries = boundaries_in_week(index)
+    print(f"📅 스케줄 {len(SCHEDULES)}개 → 알림 경계 {len(boundaries)}개 (등장/마감 30분 전/마감)")
+
+    rows = [
+        ("고정 30초", *simulate_fixed(30)),
+        ("고정 5분", *simulate_fixed(300)),
+        ("스케줄러 (재확인 없음)", *simulate_scheduler(index, 0)),
+        ("스케줄러 (매 경계 재확인 3회)", *simulate_scheduler(index, 3)),
+    ]
+
+    baseline = rows[0][1]
+    for name, checks, avg_delay, max_delay in rows:
+        print(f"  {name:<28}: 체크 {checks:6d}회 (x{baseline / checks:7.1f} 적음)  "
+              f"알림 지연 평균 {avg_delay:6.1f}초 / 최대 {max_delay:6.1f}초")
+
+
+if __name__ == "__main__":
+    main()
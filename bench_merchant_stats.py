@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""
+!통계 / !등급별 계산 벤치마크
+기존 방식(상인/아이템 dict를 파이썬 반복문으로 여러 번 순회) vs NumPy 열 배열 bincount / 마스크
+
+- 스냅샷: 등급 분포 + 타입 분포 + 지역별 상인 수 + 전설 아이템 상인 필터 (!통계 + !등급별 전설 한 번)
+- 기록: 최근 4주 등급 분포 + 지역별 횟수 + 지난주 대비 (주 × 등급)
+- 열 변환: 스냅샷 → 열 배열 변환 시간 (스냅샷 버전마다 한 번, 이후 명령어는 배열만 사용)
+
+사용법:
+    python bench_merchant_stats.py
+"""
+
+import random
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from merchant_stats import ObservationHistory, SnapshotColumns
+
+GRADES = ('일반', '고급', '희귀', '영웅', '전설')
+ITEMS_PER_MERCHANT = 5
+REGION_COUNT = 60
+REPEAT = 5
+
+
+def build_merchants(item_count: int):
+    random.seed(1)
+    return [
+        {'region_name': f"지역{i % REGION_COUNT}", 'npc_name': f"상인{i}",
+         'items': [{'name': f"아이템{j}", 'grade': random.choice(GRADES), 'type': random.randint(1, 3)}
+                   for j in range(ITEMS_PER_MERCHANT)]}
+        for i in range(item_count // ITEMS_PER_MERCHANT)
+    ]
+
+
+def build_observations(item_count: int, now: datetime):
+    random.seed(2)
+    start = (now - timedelta(weeks=12)).timestamp()
+    span = now.timestamp() - start
+    timestamps = sorted(start + random.random() * span for _ in range(item_count))
+    return [(ts, random.randrange(REGION_COUNT), random.randint(1, 5)) for ts in timestamps]
+
+
+def loop_snapshot_stats(merchants):
+    """기존 show_statistics / filter_by_grade 방식"""
+    grade_count = {grade: 0 for grade in GRADES}
+    for merchant in merchants:
+        for item in merchant['items']:
+            if item['grade'] in grade_count:
+                grade_count[item['grade']] += 1
+    type_count = {1: 0, 2: 0, 3: 0}
+    for merchant in merchants:
+        for item in merchant['items']:
+            if item['type'] in type_count:
+                type_count[item['type']] += 1
+    region_count = {}
+    for merchant in merchants:
+        region_count[merchant['region_name']] = region_count.get(merchant['region_name'], 0) + 1
+    legendary = [merchant for merchant in merchants if any(item['grade'] == '전설' for item in merchant['items'])]
+    return grade_count, type_count, region_count, len(legendary)
+
+
+def numpy_snapshot_stats(columns):
+    return (columns.grade_counts(), columns.type_counts(), columns.region_item_counts(),
+            len(columns.merchants_with(grade=5)))
+
+
+def loop_history_stats(rows, now):
+    """행마다 주 번호를 계산하며 dict로 세는 방식"""
+    this_week = now.isocalendar()[:2]
+    cutoff = datetime.combine((now - timedelta(weeks=3, days=now.weekday())).date(), datetime.min.time())
+    last_week = (now - timedelta(weeks=1)).isocalendar()[:2]
+    grades, regions, trend = {}, {}, {}
+    for ts, region, grade in rows:
+        moment = datetime.fromtimestamp(ts)
+        if moment >= cutoff:
+            grades[grade] = grades.get(grade, 0) + 1
+            regions[region] = regions.get(region, 0) + 1
+        week = moment.isocalendar()[:2]
+        if week in (this_week, last_week):
+            trend[(week, grade)] = trend.get((week, grade), 0) + 1
+    return grades, sorted(regions.items(), key=lambda pair: -pair[1])[:5], trend
+
+
+def numpy_history_stats(history, now):
+    return history.grade_distribution(weeks=4, now=now), history.region_counts(weeks=4, now=now, limit=5), \
+        history.week_over_week(now)
+
+
+def timed(func):
+    started = time.perf_counter()
+    for _ in range(REPEAT):
+        func()
+    return (time.perf_counter() - started) / REPEAT * 1000
+
+
+def main():
+    now = datetime(2024, 6, 5, 12)
+    print(f"{'관측 수':>10}{'스냅샷 반복문':>14}{'스냅샷 NumPy':>14}{'열 변환':>10}"
+          f"{'기록 반복문':>14}{'기록 NumPy':>12}")
+    print("=" * 80)
+    for item_count in (100, 10_000, 1_000_000):
+        merchants = build_merchants(item_count)
+        started = time.perf_counter()
+        columns = SnapshotColumns(merchants)
+        convert_ms = (time.perf_counter() - started) * 1000
+        assert loop_snapshot_stats(merchants)[3] == numpy_snapshot_stats(columns)[3]
+
+        rows = build_observations(item_count, now)
+        history = ObservationHistory()
+        history.extend(np.array([row[0] for row in rows]), [row[1] for row in rows], [row[2] for row in rows])
+        assert sum(loop_history_stats(rows, now)[0].values()) == sum(numpy_history_stats(history, now)[0].values())
+
+        snapshot_loop = timed(lambda: loop_snapshot_stats(merchants))
+        snapshot_numpy = timed(lambda: numpy_snapshot_stats(columns))
+        history_loop = timed(lambda: loop_history_stats(rows, now))
+        history_numpy = timed(lambda: numpy_history_stats(history, now))
+
+        print(f"{item_count:>10,}{snapshot_loop:>12.3f}ms{snapshot_numpy:>12.3f}ms{convert_ms:>8.1f}ms"
+              f"{history_loop:>12.2f}ms{history_numpy:>10.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
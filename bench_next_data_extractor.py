@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""
+__NEXT_DATA__ 추출 벤치마크
+BeautifulSoup 전체 파싱 vs 고속 검색 추출기
+
+사용법:
+    python bench_next_data_extractor.py [HTML 파일 ...]
+
+파일을 지정하지 않으면 현재 폴더의 kloa_merchant_*.html
+(test_real_website.save_html_for_analysis 가 저장하는 파일)을 사용하고,
+그것도 없으면 비슷한 크기의 합성 페이지로 측정
+"""
+
+import glob
+import json
+import sys
+import time
+
+from bs4 import BeautifulSoup
+
+from next_data_extractor import extract_next_data
+
+
+def extract_with_beautifulsoup(html):
+    """기존 방식: 전체 트리 생성 후 스크립트 찾기"""
+    soup = BeautifulSoup(html, 'html.parser')
+    next_data_script = soup.find('script', {'id': '__NEXT_DATA__'})
+    return json.loads(next_data_script.string)
+
+
+def build_synthetic_page(region_count: int = 40, item_count: int = 15, filler_divs: int = 3000) -> str:
+    """실제 상인 페이지와 비슷한 구조의 합성 HTML 생성"""
+    regions = []
+    for r in range(region_count):
+        regions.append({
+            'id': str(r),
+            'name': f'지역{r}',
+            'npcName': f'상인{r}',
+            'group': r % 8 + 1,
+            'items': [
+                {
+                    'id': f'{r}-{i}',
+                    'type': i % 3 + 1,
+                    'name': f'아이템 {r}-{i}',
+                    'grade': i % 5 + 1,
+                    'icon': 'efui_iconatlas/use/use_2_13.png',
+                    'default': False,
+                    'hidden': False,
+                }
+                for i in range(item_count)
+            ],
+        })
+
+    next_data = {
+        'props': {'pageProps': {'initialData': {'scheme': {'schedules': [], 'regions': regions}}}},
+        'buildId': 'synthetic',
+    }
+
+    body = ''.join(
+        f'<div class="px-8 py-3"><span class="text-base font-medium">지역{i}</span>'
+        f'<p class="px-1 rounded text-lostark-grade" data-grade="3"><img title="카드"/>아이템</p></div>'
+        for i in range(filler_divs)
+    )
+
+    return (
+        '<!DOCTYPE html><html><head><title>떠돌이 상인</title></head><body>'
+        f'<div id="__next">{body}</div>'
+        f'<script id="__NEXT_DATA__" type="application/json">{json.dumps(next_data, ensure_ascii=False)}</script>'
+        '</body></html>'
+    )
+
+
+def bench(func, html, repeat: int) -> float:
+    """평균 실행 시간(ms)"""
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func(html)
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+def main():
+    """벤치마크 실행"""
+    paths = sys.argv[1:] or sorted(glob.glob('kloa_merchant_*.html'))
+
+    fixtures = []
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            fixtures.append((path, f.read()))
+
+    if not fixtures:
+        print("ℹ️ 저장된 HTML이 없어서 합성 페이지로 측정합니다.")
+        fixtures.append(('synthetic', build_synthetic_page()))
+
+    print("🚀 __NEXT_DATA__ 추출 벤치마크")
+    print("=" * 70)
+
+    for name, html in fixtures:
+        html_bytes = html.encode('utf-8')
+        assert extract_with_beautifulsoup(html) == extract_next_data(html_bytes)
+
+        bs4_ms = bench(extract_with_beautifulsoup, html, repeat=5)
+        fast_str_ms = bench(extract_next_data, html, repeat=50)
+        fast_bytes_ms = bench(extract_next_data, html_bytes, repeat=50)
+
+        print(f"📄 {name} ({len(html_bytes):,} 바이트)")
+        print(f"  BeautifulSoup 전체 파싱 : {bs4_ms:8.2f} ms")
+        print(f"  고속 추출 (str)         : {fast_str_ms:8.2f} ms  (x{bs4_ms / fast_str_ms:.1f})")
+        print(f"  고속 추출 (bytes)       : {fast_bytes_ms:8.2f} ms  (x{bs4_ms / fast_bytes_ms:.1f})")
+
+
+if __name__ == "__main__":
+    main()
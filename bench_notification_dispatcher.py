@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""
+알림 전송 벤치마크 (로컬 가짜 채널, 네트워크 없음)
+기존 방식(서버 하나씩 순서대로 await) vs NotificationDispatcher 동시 전송
+
+가짜 채널은 전송에 5~20ms, 1%는 느린 채널(500ms), 0.5%는 일시적 오류(503) 후 성공
+디스코드 전역 한도(초당 50회)는 여기서는 끄고 측정하고, 한도를 적용했을 때의 최소 시간은 따로 표시
+
+사용법:
+    python bench_notification_dispatcher.py
+"""
+
+import asyncio
+import random
+import time
+
+from notification_dispatcher import NotificationDispatcher, percentile
+
+
+class FakeHTTPError(Exception):
+    def __init__(self, status):
+        super().__init__(f"HTTP {status}")
+        self.status = status
+
+
+def build_channels(count: int):
+    """채널 ID → (지연 시간, 처음 실패 여부)"""
+    random.seed(count)
+    channels = {}
+    for channel_id in range(count):
+        roll = random.random()
+        delay = 0.5 if roll < 0.01 else random.uniform(0.005, 0.02)
+        channels[channel_id] = (delay, 0.01 <= roll < 0.015)
+    return channels
+
+
+def make_send(channels):
+    failed_once = set()
+
+    async def send(channel_id):
+        delay, flaky = channels[channel_id]
+        await asyncio.sleep(delay)
+        if flaky and channel_id not in failed_once:
+            failed_once.add(channel_id)
+            raise FakeHTTPError(503)
+
+    return send
+
+
+def sequential_estimate(channels):
+    """순서대로 await하면 마지막 서버가 받는 시각 = 모든 전송 시간의 합 (실제로 돌리면 수 분 걸려서 계산만)"""
+    total = 0.0
+    for delay, flaky in channels.values():
+        total += delay * (2 if flaky else 1)
+    return total
+
+
+async def bench_dispatcher(channels):
+    dispatcher = NotificationDispatcher(max_concurrency=25, global_rate=1e6, global_burst=1e6,
+                                        backoff_base=0.05, backoff_cap=0.2)
+    started = time.perf_counter()
+    results = await dispatcher.dispatch(list(channels), make_send(channels))
+    elapsed = time.perf_counter() - started
+    latencies = [r.latency for r in results]
+    return elapsed, percentile(latencies, 0.5), percentile(latencies, 0.99), dispatcher.get_stats()
+
+
+def main():
+    """벤치마크 실행"""
+    print("🚀 알림 전송 벤치마크")
+    print("=" * 70)
+
+    for count in (1000, 5000, 10000):
+        channels = build_channels(count)
+        sequential = sequential_estimate(channels)
+        elapsed, p50, p99, stats = asyncio.run(bench_dispatcher(channels))
+
+        print(f"📨 채널 {count}개")
+        print(f"  순서대로 전송 (마지막 서버 도착)  : {sequential:8.2f} 초")
+        print(f"  동시 전송 25개 (전체 완료)      : {elapsed:8.2f} 초  (x{sequential / elapsed:.1f})")
+        print(f"  서버별 도착 지연 p50 / p99     : {p50:8.2f} / {p99:.2f} 초")
+        print(f"  성공 {stats['sent']} / 실패 {stats['failed']} / 재시도 {stats['retries']}")
+        print(f"  디스코드 전역 한도(초당 45회) 적용시 최소 : {count / 45:8.1f} 초")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""
+스케줄 조회 벤치마크
+기존 방식(매번 모든 스케줄 문자열 파싱 + 지역 선형 검색) vs 주간 스케줄 인덱스
+
+사용법:
+    python bench_schedule_index.py
+"""
+
+import random
+import time
+from datetime import datetime, timedelta
+
+from schedule_index import ScheduleIndex, build_regions_by_group
+
+
+def build_payload(schedules_per_day: int, group_count: int, regions_per_group: int):
+    """합성 스케줄/지역 데이터"""
+    random.seed(42)
+    schedules = []
+    for day in range(7):
+        for i in range(schedules_per_day):
+            start_minutes = (i * 24 * 60 // schedules_per_day)
+            schedules.append({
+                'dayOfWeek': day,
+                'startTime': f"{start_minutes // 60:02d}:{start_minutes % 60:02d}:00",
+                'duration': '05:30:00',
+                'groups': random.sample(range(1, group_count + 1), k=min(3, group_count)),
+            })
+
+    regions = [
+        {'id': f"{g}-{r}", 'name': f"지역{g}-{r}", 'npcName': f"상인{g}-{r}", 'group': g, 'items': []}
+        for g in range(1, group_count + 1)
+        for r in range(regions_per_group)
+    ]
+    return schedules, regions
+
+
+def legacy_active_merchants(schedules, regions, now):
+    """기존 MerchantParser.get_current_active_merchants 방식"""
+    current_day = (now.weekday() + 1) % 7
+    current = datetime.strptime(now.strftime('%H:%M:%S'), '%H:%M:%S')
+
+    active = []
+    for schedule in schedules:
+        if schedule.get('dayOfWeek') != current_day:
+            continue
+
+        start = datetime.strptime(schedule['startTime'], '%H:%M:%S')
+        hours, minutes, seconds = schedule['duration'].split(':')
+        end = start + timedelta(hours=int(hours), minutes=int(minutes), seconds=int(seconds))
+
+        if end.day > start.day:
+            in_range = current >= start or current <= end.replace(day=start.day)
+        else:
+            in_range = start <= current <= end
+
+        if in_range:
+            names = []
+            for group_id in schedule.get('groups', []):
+                region = next((r for r in regions if r.get('group') == group_id), None)
+                if region:
+                    names.append(region['name'])
+            active.append(names)
+    return active
+
+
+def indexed_active_merchants(index, regions_by_group, now):
+    """스케줄 인덱스 방식"""
+    return [
+        [region['name'] for group_id in slot.groups for region in regions_by_group.get(group_id, [])]
+        for slot in index.active_slots(now)
+    ]
+
+
+def bench(func, moments) -> float:
+    """조회 1회 평균 시간(µs)"""
+    started = time.perf_counter()
+    for moment in moments:
+        func(moment)
+    return (time.perf_counter() - started) / len(moments) * 1e6
+
+
+def main():
+    """벤치마크 실행"""
+    print("🚀 스케줄 조회 벤치마크")
+    print("=" * 70)
+
+    base = datetime(2026, 10, 18)
+    moments = [base + timedelta(seconds=random.randrange(7 * 86400)) for _ in range(2000)]
+
+    for schedules_per_day, group_count, regions_per_group in [(4, 8, 4), (24, 40, 4), (96, 200, 4)]:
+        schedules, regions = build_payload(schedules_per_day, group_count, regions_per_group)
+
+        started = time.perf_counter()
+        index = ScheduleIndex(schedules)
+        regions_by_group = build_regions_by_group(regions)
+        build_ms = (time.perf_counter() - started) * 1000
+
+        legacy_us = bench(lambda m: legacy_active_merchants(schedules, regions, m), moments)
+        indexed_us = bench(lambda m: indexed_active_merchants(index, regions_by_group, m), moments)
+        next_us = bench(index.next_change_after, moments)
+
+        print(f"📅 스케줄 {len(schedules)}개 / 지역 {len(regions)}개")
+        print(f"  인덱스 생성 (페이로드당 1회) : {build_ms:8.2f} ms")
+        print(f"  기존 전체 검색               : {legacy_us:8.1f} µs")
+        print(f"  인덱스 조회                  : {indexed_us:8.1f} µs  (x{legacy_us / indexed_us:.1f})")
+        print(f"  다음 변경 시각               : {next_us:8.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
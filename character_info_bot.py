@@ -8,63 +8,13 @@ import json
 import asyncio
 from datetime import datetime
 from typing import Dict, List, Optional
-import requests
-import urllib.parse
 
 # Discord 봇 관련
 import discord
 from discord.ext import commands
 
-class LostArkCharacterAPI:
-    """로스트아크 캐릭터 정보 조회 API 클래스"""
-    
-    def __init__(self, api_key: str):
-        self.api_key = api_key
-        self.base_url = "https://developer-lostark.game.onstove.com"
-        self.headers = {
-            'accept': 'application/json',
-            'authorization': f'bearer {api_key}'
-        }
-    
-    async def get_character_info(self, character_name: str) -> Optional[Dict]:
-        """캐릭터 기본 정보 조회"""
-        try:
-            encoded_name = urllib.parse.quote(character_name)
-            url = f"{self.base_url}/characters/{encoded_name}"
-            
-            response = requests.get(url, headers=self.headers)
-            
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 404:
-                return None
-            else:
-                print(f"API 오류: {response.status_code}")
-                return None
-                
-        except Exception as e:
-            print(f"캐릭터 정보 조회 오류: {e}")
-            return None
-    
-    async def get_character_siblings(self, character_name: str) -> Optional[List[Dict]]:
-        """캐릭터 원정대 정보 조회"""
-        try:
-            encoded_name = urllib.parse.quote(character_name)
-            url = f"{self.base_url}/characters/{encoded_name}/siblings"
-            
-            response = requests.get(url, headers=self.headers)
-            
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 404:
-                return None
-            else:
-                print(f"API 오류: {response.status_code}")
-                return None
-                
-        except Exception as e:
-            print(f"원정대 정보 조회 오류: {e}")
-            return None
+from lostark_api_client import LostArkCharacterAPI
+from discord_runner import run_bot
 
 class CharacterInfoBot:
     """캐릭터 정보 조회 디스코드 봇"""
@@ -192,7 +142,7 @@ class CharacterInfoBot:
     def run(self):
         """봇 실행"""
         try:
-            self.bot.run(self.discord_token)
+            run_bot(self.bot, self.discord_token, self.lostark_api)
         except Exception as e:
             print(f"❌ 캐릭터 정보 봇 실행 오류: {e}")
 
@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+"""
+Selenium Chrome 드라이버 풀
+- 상인 페이지를 띄워 둔 Chrome 세션을 재사용 (새로고침마다 Chrome 콜드 스타트 방지)
+- 헬스 체크, 사용 횟수/메모리(RSS) 기준 드라이버 재생성
+- 수집 1회당 지연시간 메트릭
+"""
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Dict, Optional, Any
+
+try:
+    import psutil
+except ImportError:  # psutil이 없으면 RSS 기준 재생성만 비활성화
+    psutil = None
+
+
+class PooledDriver:
+    """풀에서 관리되는 Chrome 드라이버 1개"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.created_at = time.time()
+        self.use_count = 0
+        self.warm = False  # 상인 페이지 로드 + 서버 탭 선택이 끝난 상태인지
+        self.broken = False
+
+
+class ChromeDriverPool:
+    """재사용 가능한 Chrome 드라이버 풀"""
+
+    def __init__(self, driver_factory: Callable[[], Any], size: int = 1,
+                 max_uses: int = 100, max_rss_mb: Optional[int] = 1024,
+                 acquire_timeout: float = 60.0):
+        """
+        초기화
+        Args:
+            driver_factory: 새 드라이버를 만드는 함수 (실패시 None 반환)
+            size: 동시에 유지할 최대 드라이버 수
+            max_uses: 이 횟수만큼 사용한 드라이버는 재생성
+            max_rss_mb: Chrome 프로세스 트리 메모리가 이 값을 넘으면 재생성 (None이면 비활성화)
+            acquire_timeout: 빈 드라이버를 기다리는 최대 시간(초)
+        """
+        self.driver_factory = driver_factory
+        self.size = max(1, size)
+        self.max_uses = max_uses
+        self.max_rss_mb = max_rss_mb
+        self.acquire_timeout = acquire_timeout
+
+        self._idle = deque()
+        self._total = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+        # 메트릭
+        self._latencies = deque(maxlen=500)
+        self._fetch_count = 0
+        self._fetch_failures = 0
+        self._drivers_created = 0
+        self._recycled = {'max_uses': 0, 'rss': 0, 'unhealthy': 0, 'broken': 0}
+
+    def acquire(self, timeout: Optional[float] = None) -> Optional[PooledDriver]:
+        """드라이버 빌려오기 (없으면 생성, 풀이 가득 차면 대기)"""
+        deadline = time.monotonic() + (timeout if timeout is not None else self.acquire_timeout)
+
+        with self._cond:
+            while not self._idle and self._total >= self.size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or self._closed:
+                    print("❌ 사용 가능한 Chrome 드라이버가 없습니다 (대기 시간 초과)")
+                    return None
+                self._cond.wait(remaining)
+
+            if self._closed:
+                return None
+
+            pooled = self._idle.popleft() if self._idle else None
+            if pooled is None:
+                self._total += 1
+
+        if pooled is not None:
+            reason = self._recycle_reason(pooled)
+            if reason is None:
+                pooled.use_count += 1
+                return pooled
+
+            print(f"♻️ Chrome 드라이버 재생성 ({reason}, 사용 {pooled.use_count}회)")
+            with self._cond:
+                self._recycled[reason] += 1
+            self._quit(pooled)
+
+        pooled = self._create()
+        if pooled is None:
+            with self._cond:
+                self._total -= 1
+                self._cond.notify()
+            return None
+
+        pooled.use_count += 1
+        return pooled
+
+    def release(self, pooled: Optional[PooledDriver], broken: bool = False):
+        """드라이버 반납 (broken이면 다음 acquire 때 재생성)"""
+        if pooled is None:
+            return
+
+        if broken:
+            pooled.broken = True
+            pooled.warm = False
+
+        with self._cond:
+            if self._closed:
+                self._total -= 1
+                closed = True
+            else:
+                self._idle.append(pooled)
+                closed = False
+            self._cond.notify()
+
+        if closed:
+            self._quit(pooled)
+
+    @contextmanager
+    def driver(self, timeout: Optional[float] = None):
+        """with 문으로 드라이버 사용 (예외 발생시 broken 처리)"""
+        pooled = self.acquire(timeout)
+        try:
+            yield pooled
+        except Exception:
+            self.release(pooled, broken=True)
+            raise
+        else:
+            self.release(pooled, broken=pooled.broken if pooled else False)
+
+    def is_healthy(self, pooled: PooledDriver) -> bool:
+        """드라이버가 아직 응답하는지 확인"""
+        try:
+            pooled.driver.current_url
+            return pooled.driver.execute_script("return document.readyState") is not None
+        except Exception:
+            return False
+
+    def get_rss_mb(self, pooled: PooledDriver) -> Optional[float]:
+        """chromedriver + Chrome 자식 프로세스들의 RSS 합계 (MB)"""
+        if psutil is None:
+            return None
+
+        try:
+            pid = pooled.driver.service.process.pid
+            root = psutil.Process(pid)
+            processes = [root] + root.children(recursive=True)
+            rss = 0
+            for process in processes:
+                try:
+                    rss += process.memory_info().rss
+                except psutil.Error:
+                    continue
+            return rss / (1024 * 1024)
+        except Exception:
+            return None
+
+    def record_fetch(self, latency: float, success: bool = True):
+        """수집 1회 지연시간 기록"""
+        with self._cond:
+            self._fetch_count += 1
+            if not success:
+                self._fetch_failures += 1
+            self._latencies.append(latency)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """풀 상태 및 수집 지연시간 통계"""
+        with self._cond:
+            latencies = sorted(self._latencies)
+            metrics = {
+                'fetch_count': self._fetch_count,
+                'fetch_failures': self._fetch_failures,
+                'drivers_created': self._drivers_created,
+                'drivers_alive': self._total,
+                'drivers_idle': len(self._idle),
+                'recycled': dict(self._recycled),
+            }
+
+        if latencies:
+            metrics['latency_avg'] = sum(latencies) / len(latencies)
+            metrics['latency_p50'] = latencies[len(latencies) // 2]
+            metrics['latency_p95'] = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+            metrics['latency_max'] = latencies[-1]
+
+        return metrics
+
+    def close(self):
+        """풀 종료 (대기 중인 드라이버 모두 종료)"""
+        with self._cond:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._total -= len(idle)
+            self._cond.notify_all()
+
+        for pooled in idle:
+            self._quit(pooled)
+
+    def _recycle_reason(self, pooled: PooledDriver) -> Optional[str]:
+        """재생성이 필요한 이유 반환 (필요 없으면 None)"""
+        if pooled.broken:
+            return 'broken'
+        if self.max_uses and pooled.use_count >= self.max_uses:
+            return 'max_uses'
+        if not self.is_healthy(pooled):
+            return 'unhealthy'
+        if self.max_rss_mb:
+            rss = self.get_rss_mb(pooled)
+            if rss is not None and rss > self.max_rss_mb:
+                return 'rss'
+        return None
+
+    def _create(self) -> Optional[PooledDriver]:
+        """새 드라이버 생성"""
+        driver = self.driver_factory()
+        if not driver:
+            return None
+
+        with self._cond:
+            self._drivers_created += 1
+        return PooledDriver(driver)
+
+    def _quit(self, pooled: PooledDriver):
+        """드라이버 종료 (오류 무시)"""
+        try:
+            pooled.driver.quit()
+        except Exception:
+            pass
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""
+조건부 HTTP 요청 및 페이로드 변경 감지
+- ETag / Last-Modified 값을 저장했다가 If-None-Match / If-Modified-Since 로 재요청
+- 304 Not Modified 응답이면 저장해 둔 본문을 그대로 사용
+- initialData 해시로 내용이 바뀌었는지 확인 (파싱/변경 감지 생략 여부 판단)
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, Optional
+
+import requests
+
+
+class ConditionalResponse:
+    """조건부 요청 결과"""
+
+    def __init__(self, status_code: int, content: bytes, not_modified: bool = False):
+        self.status_code = status_code
+        self.content = content
+        self.not_modified = not_modified
+
+    def raise_for_status(self):
+        """4xx/5xx 응답이면 HTTPError 발생"""
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"HTTP {self.status_code}")
+
+    def json(self) -> Any:
+        """본문 JSON 파싱"""
+        return json.loads(self.content)
+
+    @property
+    def text(self) -> str:
+        """본문 문자열"""
+        return self.content.decode('utf-8', errors='replace')
+
+
+class ConditionalHTTPClient:
+    """URL별 검증값(ETag/Last-Modified)을 기억하는 HTTP 클라이언트"""
+
+    def __init__(self, session: Optional[requests.Session] = None):
+        self.session = session or requests.Session()
+
+        # url -> {'etag', 'last_modified', 'content'}
+        self._validators: Dict[str, Dict[str, Any]] = {}
+
+        self.stats = {
+            'requests': 0,
+            'not_modified': 0,   # 304로 본문 다운로드 생략
+            'downloaded': 0,
+            'bytes_downloaded': 0,
+            'bytes_saved': 0,
+        }
+
+    def get(self, url: str, timeout: float = 10.0) -> ConditionalResponse:
+        """
+        조건부 GET
+        Returns:
+            ConditionalResponse (304면 저장된 본문과 not_modified=True)
+        """
+        cached = self._validators.get(url)
+        headers = {}
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+
+        response = self.session.get(url, headers=headers, timeout=timeout)
+        self.stats['requests'] += 1
+
+        if response.status_code == 304 and cached:
+            self.stats['not_modified'] += 1
+            self.stats['bytes_saved'] += len(cached['content'])
+            return ConditionalResponse(200, cached['content'], not_modified=True)
+
+        content = response.content
+        self.stats['downloaded'] += 1
+        self.stats['bytes_downloaded'] += len(content)
+
+        if response.status_code == 200:
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            if etag or last_modified:
+                self._validators[url] = {'etag': etag, 'last_modified': last_modified, 'content': content}
+            else:
+                self._validators.pop(url, None)
+        else:
+            self._validators.pop(url, None)
+
+        return ConditionalResponse(response.status_code, content)
+
+    def forget(self, url: str):
+        """저장된 검증값 삭제"""
+        self._validators.pop(url, None)
+
+    def get_stats(self) -> Dict[str, int]:
+        """요청 통계"""
+        return dict(self.stats)
+
+
+def payload_hash(payload: Any) -> str:
+    """JSON 페이로드 해시 (키 순서와 무관)"""
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+class PayloadChangeTracker:
+    """마지막 페이로드 해시를 기억해서 변경 여부 판단"""
+
+    def __init__(self):
+        self.last_hash: Optional[str] = None
+        self._last_payload: Any = None
+        self.hits = 0     # 내용이 같아서 파싱/변경 감지를 생략한 횟수
+        self.misses = 0   # 내용이 바뀌어서 다시 처리한 횟수
+
+    def check(self, payload: Any) -> bool:
+        """
+        페이로드가 바뀌었는지 확인
+        Returns:
+            바뀌었으면 True (첫 호출 포함)
+        """
+        # 304 응답으로 같은 객체를 그대로 받은 경우 해시 계산도 생략
+        if payload is not None and payload is self._last_payload:
+            self.hits += 1
+            return False
+
+        current_hash = payload_hash(payload)
+        self._last_payload = payload
+
+        if current_hash == self.last_hash:
+            self.hits += 1
+            return False
+
+        self.last_hash = current_hash
+        self.misses += 1
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """적중/미스 통계"""
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+            'last_hash': self.last_hash,
+        }
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""
+디스코드 봇 실행 도우미
+- bot.run()과 같은 흐름(async with bot → bot.start)으로 실행
+- 종료할 때 이벤트 루프가 아직 살아 있는 동안 공유 aiohttp 세션(LostArkCharacterAPI 등)을 닫음
+  → bot.run()은 루프를 닫은 뒤 돌아오므로 그 뒤에는 세션을 await로 닫을 수 없음 ("Unclosed client session")
+"""
+
+import asyncio
+from typing import Any, Optional
+
+import discord
+
+
+async def serve_bot(bot, token: str, api: Optional[Any] = None):
+    """봇 연결 유지, 끝나면 api.close() (api가 없으면 생략)"""
+    try:
+        async with bot:
+            await bot.start(token)
+    finally:
+        if api is not None:
+            await api.close()
+
+
+def run_bot(bot, token: str, api: Optional[Any] = None):
+    """bot.run() 대신 사용 (기본 로깅 설정, Ctrl+C는 조용히 종료)"""
+    discord.utils.setup_logging()
+    try:
+        asyncio.run(serve_bot(bot, token, api))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""
+떠돌이 상인 embed 렌더링 캐시
+- 상인 데이터 버전마다 화면(요약, 등급별, 통계 등)을 한 번만 만들고
+  다음 데이터 변경 전까지 모든 서버/명령어에서 재사용
+- 캐시된 embed를 고쳐 써야 하면(남은 시간 등 실시간 필드 추가) copy_embed() 후 수정
+"""
+
+import copy
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+def copy_embed(embed):
+    """
+    캐시된 embed의 수정용 복사본
+    discord.Embed.copy()는 필드 목록을 원본과 공유하므로 add_field()가 캐시까지 바꿈 → dict로 깊은 복사
+    """
+    return embed.__class__.from_dict(copy.deepcopy(embed.to_dict()))
+
+
+class EmbedRenderCache:
+    """데이터 버전별 렌더링 결과 캐시"""
+
+    def __init__(self):
+        self._views: Dict[Hashable, Tuple[Any, Any]] = {}   # view → (version, 렌더링 결과)
+
+        # 통계
+        self.hits = 0
+        self.renders = 0
+        self.render_time = 0.0
+        self.last_render_time: Optional[float] = None
+
+    def get(self, view: Hashable, version: Any, render: Callable[[], Any]) -> Any:
+        """
+        view의 렌더링 결과 (같은 데이터 버전이면 캐시 사용)
+        Args:
+            view: 화면 이름 (예: 'summary', ('grade', '전설'))
+            version: 상인 데이터 버전 (바뀌면 다시 렌더링)
+            render: 렌더링 함수
+        """
+        cached = self._views.get(view)
+        if cached is not None and cached[0] == version:
+            self.hits += 1
+            return cached[1]
+
+        started = time.perf_counter()
+        value = render()
+        elapsed = time.perf_counter() - started
+
+        self.renders += 1
+        self.render_time += elapsed
+        self.last_render_time = elapsed
+
+        # 이전 버전으로 만든 화면은 다시 쓸 일이 없으므로 정리
+        self._views = {key: v for key, v in self._views.items() if v[0] == version}
+        self._views[view] = (version, value)
+        return value
+
+    def clear(self):
+        self._views.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계"""
+        total = self.hits + self.renders
+        return {
+            'views': len(self._views),
+            'hits': self.hits,
+            'renders': self.renders,
+            'hit_rate': round(self.hits / total, 3) if total else 0.0,
+            'avg_render_ms': round(self.render_time / self.renders * 1000, 3) if self.renders else None,
+            'last_render_ms': round(self.last_render_time * 1000, 3) if self.last_render_time is not None else None,
+        }
@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+"""
+한글 초성 / 오타 허용 이름 검색
+- 초성 검색: `ㅈㅈㄹ` → `집중 룬`, 초성과 완성 글자를 섞은 `집ㅈ` 같은 검색어도 지원
+- 오타 허용 검색: 이름을 자모 단위로 분해(겹받침/겹모음도 분리)한 뒤 편집 거리 비교
+  → `케이사루` → `케이사르` (ㅡ/ㅜ 한 글자 차이)
+- 초성 2-gram, 자모 2-gram 역색인으로 후보를 먼저 좁힌 뒤에만 검증 (이름 전체 선형 비교 없음)
+
+이 모듈은 정규화된 문자열만 다룸 (정규화는 item_search.normalize_text)
+"""
+
+from collections import Counter
+from typing import Dict, List, Optional, Set, Tuple
+
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+
+CHOSEONG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+JUNGSEONG = 'ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ'
+JONGSEONG = ('', 'ㄱ', 'ㄲ', 'ㄳ', 'ㄴ', 'ㄵ', 'ㄶ', 'ㄷ', 'ㄹ', 'ㄺ', 'ㄻ', 'ㄼ', 'ㄽ', 'ㄾ', 'ㄿ', 'ㅀ',
+             'ㅁ', 'ㅂ', 'ㅄ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ')
+
+# 겹받침 / 겹모음 → 입력하는 자모 순서대로
+COMPOUND_JAMO = {
+    'ㄳ': 'ㄱㅅ', 'ㄵ': 'ㄴㅈ', 'ㄶ': 'ㄴㅎ', 'ㄺ': 'ㄹㄱ', 'ㄻ': 'ㄹㅁ', 'ㄼ': 'ㄹㅂ', 'ㄽ': 'ㄹㅅ',
+    'ㄾ': 'ㄹㅌ', 'ㄿ': 'ㄹㅍ', 'ㅀ': 'ㄹㅎ', 'ㅄ': 'ㅂㅅ',
+    'ㅘ': 'ㅗㅏ', 'ㅙ': 'ㅗㅐ', 'ㅚ': 'ㅗㅣ', 'ㅝ': 'ㅜㅓ', 'ㅞ': 'ㅜㅔ', 'ㅟ': 'ㅜㅣ', 'ㅢ': 'ㅡㅣ',
+}
+
+_CONSONANTS = set(CHOSEONG) | set(JONGSEONG[1:])
+
+
+def _compat_jamo(char: str) -> Optional[str]:
+    """조합형 자모(NFKC 결과) / 호환 자모 → 호환 자모 (자모가 아니면 None)"""
+    code = ord(char)
+    if 0x1100 <= code <= 0x1112:
+        return CHOSEONG[code - 0x1100]
+    if 0x1161 <= code <= 0x1175:
+        return JUNGSEONG[code - 0x1161]
+    if 0x11A8 <= code <= 0x11C2:
+        return JONGSEONG[code - 0x11A7]
+    if 0x3131 <= code <= 0x3163:
+        return char
+    return None
+
+
+def to_compat_jamo(text: str) -> str:
+    """조합형 자모를 호환 자모로 (NFKC 정규화가 `ㅈ`을 조합형으로 바꾸므로 초성 키와 비교할 때 사용)"""
+    return ''.join(_compat_jamo(char) or char for char in text)
+
+
+def lone_consonant(char: str) -> Optional[str]:
+    """완성되지 않은 자음 한 글자면 그 자음 (초성 검색어 판별)"""
+    jamo = _compat_jamo(char)
+    return jamo if jamo in _CONSONANTS else None
+
+
+def is_choseong_query(text: str) -> bool:
+    """검색어에 초성(자음만 있는 글자)이 섞여 있는지"""
+    return any(lone_consonant(char) for char in text)
+
+
+def choseong(text: str) -> str:
+    """글자별 초성 (한글이 아닌 글자는 그대로, 길이는 원래 문자열과 같음)"""
+    result = []
+    for char in text:
+        code = ord(char)
+        if HANGUL_BASE <= code <= HANGUL_LAST:
+            result.append(CHOSEONG[(code - HANGUL_BASE) // 588])
+        else:
+            result.append(_compat_jamo(char) or char)
+    return ''.join(result)
+
+
+def decompose(text: str) -> str:
+    """자모 단위 분해 (겹받침/겹모음 분리, 한글이 아닌 글자는 그대로)"""
+    result = []
+    for char in text:
+        code = ord(char)
+        if HANGUL_BASE <= code <= HANGUL_LAST:
+            index = code - HANGUL_BASE
+            jamo = CHOSEONG[index // 588] + JUNGSEONG[index % 588 // 28] + JONGSEONG[index % 28]
+        else:
+            jamo = _compat_jamo(char) or char
+        result.append(''.join(COMPOUND_JAMO.get(j, j) for j in jamo))
+    return ''.join(result)
+
+
+def bounded_distance(a: str, b: str, limit: int) -> int:
+    """편집 거리 (limit를 넘으면 limit + 1)"""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return min(previous[-1], limit + 1)
+
+
+def fuzzy_limit(jamo: str) -> int:
+    """허용 오타 수 (자모 4개 미만이면 오타 검색 안 함)"""
+    if len(jamo) < 4:
+        return 0
+    if len(jamo) <= 8:
+        return 1
+    return 2 if len(jamo) <= 16 else 3
+
+
+def _grams(text: str) -> Set[str]:
+    if len(text) < 2:
+        return {text} if text else set()
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+def _count_grams(text: str) -> Counter:
+    return Counter(text[i:i + 2] for i in range(len(text) - 1))
+
+
+class HangulNameIndex:
+    """초성 / 자모 역색인 (이름 추가/삭제는 ItemSearchIndex가 호출)"""
+
+    def __init__(self):
+        self._choseong: Dict[str, str] = {}                # 이름 → 초성 문자열
+        self._jamo: Dict[str, str] = {}                    # 이름 → 자모 문자열
+        self._choseong_grams: Dict[str, Set[str]] = {}     # 초성 2-gram / 글자 → 이름
+        self._jamo_grams: Dict[str, Set[str]] = {}         # 자모 2-gram → 이름
+
+    def __len__(self):
+        return len(self._jamo)
+
+    def add(self, name: str, normalized: str):
+        """정규화된 이름 색인"""
+        initials = self._choseong[name] = choseong(normalized)
+        jamo = self._jamo[name] = decompose(normalized)
+        for gram in _grams(initials) | set(initials):
+            self._choseong_grams.setdefault(gram, set()).add(name)
+        for gram in _grams(jamo):
+            self._jamo_grams.setdefault(gram, set()).add(name)
+
+    def remove(self, name: str):
+        """색인에서 이름 제거"""
+        initials = self._choseong.pop(name, None)
+        jamo = self._jamo.pop(name, None)
+        if initials is None:
+            return
+        for table, grams in ((self._choseong_grams, _grams(initials) | set(initials)), (self._jamo_grams, _grams(jamo))):
+            for gram in grams:
+                names = table.get(gram)
+                if names is not None:
+                    names.discard(name)
+                    if not names:
+                        del table[gram]
+
+    @property
+    def gram_count(self) -> int:
+        return len(self._choseong_grams) + len(self._jamo_grams)
+
+    def choseong_matches(self, query: str, normalized_names: Dict[str, str]) -> List[Tuple[str, int]]:
+        """
+        초성 검색 (자음만 있는 글자는 초성과, 완성 글자는 글자 그대로 비교)
+        Returns:
+            (이름, 일치 위치) 목록
+        """
+        pattern = choseong(query)
+        postings = []
+        for gram in (_grams(pattern) if len(pattern) >= 2 else {pattern}):
+            names = self._choseong_grams.get(gram)
+            if not names:
+                return []
+            postings.append(names)
+        postings.sort(key=len)
+        candidates = set(postings[0]).intersection(*postings[1:])
+
+        fixed = [(offset, char) for offset, char in enumerate(query) if not lone_consonant(char)]
+        matches = []
+        for name in candidates:
+            initials, text = self._choseong[name], normalized_names[name]
+            position = initials.find(pattern)
+            while position >= 0:
+                if all(text[position + offset] == char for offset, char in fixed):
+                    matches.append((name, position))
+                    break
+                position = initials.find(pattern, position + 1)
+        return matches
+
+    def fuzzy_matches(self, query: str) -> List[Tuple[str, int]]:
+        """
+        자모 편집 거리 검색 (공통 자모 2-gram 수로 후보를 거른 뒤 거리 계산)
+        Returns:
+            (이름, 편집 거리) 목록
+        """
+        jamo = decompose(query)
+        limit = fuzzy_limit(jamo)
+        if not limit:
+            return []
+
+        # 편집 1번에 2-gram은 최대 2개 달라짐 → 공통 2-gram이 (긴 쪽 길이 - 1 - 2 × 허용 오타) 미만이면 제외
+        shared = Counter()
+        for gram, count in _count_grams(jamo).items():
+            names = self._jamo_grams.get(gram)
+            for _ in range(count if names else 0):
+                shared.update(names)
+        minimum = len(jamo) - 1 - 2 * limit
+
+        matches = []
+        for name, count in [(name, count) for name, count in shared.items() if count >= minimum]:
+            candidate = self._jamo[name]
+            if abs(len(candidate) - len(jamo)) > limit or count < minimum + max(0, len(candidate) - len(jamo)):
+                continue
+            distance = bounded_distance(jamo, candidate, limit)
+            if distance <= limit:
+                matches.append((name, distance))
+        return matches
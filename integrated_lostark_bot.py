@@ -6,14 +6,12 @@
 - 캐릭터 정보 조회 (로스트아크 API 기반)
 """
 
-import json
 import time
+import threading
 from datetime import datetime, timedelta
 import asyncio
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 import pytz
-import requests
-import urllib.parse
 
 # Selenium 관련
 from selenium import webdriver
@@ -21,22 +19,68 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import (
+    TimeoutException, NoSuchElementException, StaleElementReferenceException, WebDriverException,
+)
 
 # Discord 봇 관련 (슬래시 명령어용)
 import discord
-from discord.ext import commands, tasks
+from discord.ext import commands
 from discord import app_commands
 
+from chrome_driver_pool import ChromeDriverPool
+from merchant_fetch_worker import MerchantFetchWorker, FetchCancelledError
+from lostark_api_client import LostArkCharacterAPI
+from discord_runner import run_bot
+from ttl_lru_cache import TTLLRUCache, normalize_character_name
+from next_data_client import NextDataClient
+from schedule_index import ScheduleIndex
+from merchant_scheduler import MerchantScheduler
+from notification_dispatcher import NotificationDispatcher, PermanentDeliveryError
+from notification_queue import NotificationQueue, NotificationOutbox
+from conditional_http import payload_hash
+from subscription_store import SubscriptionStore
+from merchant_diff import diff_merchants
+from embed_cache import EmbedRenderCache
+from merchant_snapshot import MerchantSnapshot
+from item_search import ItemSearchIndex, normalize_text
+from prefix_trie import AutocompleteIndex
+from merchant_history import MerchantHistoryStore
+from item_forecast import ItemForecaster
+from merchant_realms import REALMS, DEFAULT_REALM, REALM_SETTING, RealmSnapshotStore, resolve_realm
+from merchant_dom_extractor import (
+    EXTRACT_ALL_REALMS_SCRIPT, MERCHANT_SELECTOR, SERVER_NAME_SELECTOR, REGION_SELECTOR, NPC_SELECTOR,
+    ITEM_SELECTOR, PANEL_SELECTOR, EMPTY_SETTLE_SECONDS, RealmPanelWait, item_grade, item_type,
+    parse_realm_panels, script_selectors,
+)
+from merchant_model import ITEM_CATALOG
+
 # ============================================================================
 # Selenium 떠돌이상인 데이터 수집 클래스
 # ============================================================================
 
 class SeleniumMerchantFetcher:
-    """Selenium을 사용한 실시간 떠돌이 상인 데이터 가져오기"""
+    """Selenium을 사용한 실시간 떠돌이 상인 데이터 가져오기 (페이지 한 번 로드로 모든 서버)"""
+    
+    # 서버 선택 버튼 (버튼 순서 = REALMS 순서, 8번째 버튼 = 니나브)
+    SERVER_BUTTON_SELECTOR = "button.text-secondary.font-medium"
+    # 서버 버튼을 누른 뒤 상인 목록이 바뀔 때까지 기다리는 최대 시간(초)
+    REALM_WAIT_SECONDS = 10
     
-    def __init__(self):
+    def __init__(self, driver_pool: Optional[ChromeDriverPool] = None, realms: Iterable[str] = REALMS,
+                 single_pass: bool = True):
+        """
+        초기화
+        Args:
+            driver_pool: Chrome 세션 풀 (없으면 새로 생성)
+            realms: 수집할 서버 목록
+            single_pass: True면 스크립트 한 번으로 모든 서버 탭을 읽음 (실패하면 서버별 클릭으로 대체)
+        """
         self.base_url = "https://kloa.gg/merchant"
+        self.realms = tuple(realms)
+        self.single_pass = single_pass
+        # 페이지를 띄워 둔 Chrome 세션을 재사용 (매 새로고침마다 Chrome을 새로 띄우지 않음)
+        self.driver_pool = driver_pool or ChromeDriverPool(self.setup_driver)
     
     def setup_driver(self):
         """Chrome 드라이버 설정"""
@@ -56,243 +100,250 @@ class SeleniumMerchantFetcher:
             print("ChromeDriver가 설치되어 있는지 확인하세요.")
             return None
 
-    def fetch_merchant_data_selenium(self):
-        """Selenium으로 떠상 데이터 가져오기"""
-        driver = self.setup_driver()
-        if not driver:
-            return None
-        
-        try:
+    def _server_buttons_ready(self, driver):
+        """서버 버튼이 모두 렌더링되었으면 버튼 목록 반환"""
+        buttons = driver.find_elements(By.CSS_SELECTOR, self.SERVER_BUTTON_SELECTOR)
+        return buttons if len(buttons) >= len(REALMS) else False
+
+    def prepare_page(self, pooled) -> Optional[list]:
+        """상인 페이지 준비 (처음이면 로드, 재사용이면 소프트 리로드) 후 서버 버튼 목록 반환"""
+        driver = pooled.driver
+
+        if pooled.warm and driver.current_url.startswith(self.base_url):
+            print("♻️ 기존 Chrome 세션에서 kloa.gg 페이지 새로고침 중...")
+            driver.refresh()
+        else:
             print("kloa.gg 페이지 로딩 중...")
             driver.get(self.base_url)
-            
-            # 페이지가 완전히 로드될 때까지 대기
-            time.sleep(3)
-            
-            # 니나브 서버 클릭
+
+        # 서버 버튼이 렌더링될 때까지 대기 (고정 sleep 대신)
+        try:
+            buttons = WebDriverWait(driver, 15).until(self._server_buttons_ready)
+        except TimeoutException:
+            print("❌ 서버 버튼을 찾을 수 없습니다. 페이지 구조가 변경되었을 수 있습니다.")
+            return None
+
+        pooled.warm = True
+        return buttons
+
+    def _merchant_panel(self, driver):
+        """상인 목록이 있는 두 번째 div.bg-elevated 요소"""
+        print("div.bg-elevated 요소들 로딩 대기 중...")
+        bg_elevated_elements = WebDriverWait(driver, 15).until(
+            EC.presence_of_all_elements_located((By.CSS_SELECTOR, PANEL_SELECTOR))
+        )
+        if len(bg_elevated_elements) < 2:
+            print(f"❌ div.bg-elevated 요소가 충분하지 않습니다. 발견된 요소 수: {len(bg_elevated_elements)}")
+            return None
+        return bg_elevated_elements[1]
+
+    def _select_realm(self, driver, buttons, realm: str) -> bool:
+        """서버 버튼 클릭 후 상인 목록이 그 서버 것으로 바뀔 때까지 대기"""
+        buttons[REALMS.index(realm)].click()
+        # 다시 그리는 도중 잠깐 빈 목록을 "상인 없음"으로 읽지 않도록 빈 상태가 유지될 때만 인정
+        wait = RealmPanelWait(realm)
+
+        def panel_shows_realm(driver):
+            panel = self._merchant_panel(driver)
+            if panel is None:
+                return wait.ready(None)
+            names = [element.text.strip() for element in panel.find_elements(By.CSS_SELECTOR, SERVER_NAME_SELECTOR)]
+            return wait.ready(names)
+
+        try:
+            WebDriverWait(driver, self.REALM_WAIT_SECONDS, poll_frequency=0.1,
+                          ignored_exceptions=(StaleElementReferenceException,)).until(panel_shows_realm)
+        except TimeoutException:
+            print(f"❌ {realm} 서버 상인 목록으로 바뀌지 않았습니다.")
+            return False
+        print(f"{realm} 서버 선택 완료")
+        return True
+
+    def _extract_merchants(self, panel, cancel_event: Optional[threading.Event] = None) -> Optional[List[Dict]]:
+        """상인 목록 요소에서 상인/아이템 추출 (취소되면 None)"""
+        # 각 상인 정보가 담긴 div 요소들 찾기
+        merchant_divs = panel.find_elements(By.CSS_SELECTOR, MERCHANT_SELECTOR)
+        
+        merchants = []
+        
+        for merchant_div in merchant_divs:
+            if cancel_event and cancel_event.is_set():
+                return None
+
             try:
-                driver.find_elements(By.CSS_SELECTOR, "button.text-secondary.font-medium")[7].click()
-                print("니나브 서버 선택 완료")
-            except IndexError:
-                print("❌ 니나브 서버 버튼을 찾을 수 없습니다. 페이지 구조가 변경되었을 수 있습니다.")
-                return []
-            
-            # 페이지 로딩 대기
-            wait = WebDriverWait(driver, 15)
-            
-            # div.bg-elevated 요소들 대기 및 찾기
-            print("div.bg-elevated 요소들 로딩 대기 중...")
-            bg_elevated_elements = wait.until(
-                EC.presence_of_all_elements_located((By.CSS_SELECTOR, "div.bg-elevated"))
-            )
-            
-            if len(bg_elevated_elements) < 2:
-                print(f"❌ div.bg-elevated 요소가 충분하지 않습니다. 발견된 요소 수: {len(bg_elevated_elements)}")
-                return []
-            
-            # 두 번째 div.bg-elevated 요소에서 데이터 추출
-            print("두 번째 div.bg-elevated 요소에서 상인 데이터 추출 중...")
-            second_element = bg_elevated_elements[1]
-            
-            # 각 상인 정보가 담긴 div 요소들 찾기
-            merchant_divs = second_element.find_elements(By.CSS_SELECTOR, "div.px-8.py-3")
-            
-            merchants = []
-            
-            for merchant_div in merchant_divs:
-                try:
-                    # 서버명 확인
-                    server_element = merchant_div.find_element(By.CSS_SELECTOR, "p.text-sm.font-medium.text-bola")
-                    server_name = server_element.text.strip()
-                    
-                    # 지역명과 NPC명 추출
-                    location_element = merchant_div.find_element(By.CSS_SELECTOR, "span.text-base.font-medium")
-                    region_name = location_element.text.strip()
-                    
-                    npc_element = merchant_div.find_element(By.CSS_SELECTOR, "span.text-sm.font-medium.text-secondary")
-                    npc_name = npc_element.text.strip()
-                    
-                    # 아이템들 추출
-                    items = []
-                    item_elements = merchant_div.find_elements(By.CSS_SELECTOR, "p.px-1.rounded.text-lostark-grade")
-                    
-                    for item_element in item_elements:
-                        try:
-                            # data-grade 속성에서 등급 추출 및 변환
-                            grade_attr = item_element.get_attribute("data-grade")
-                            
-                            if grade_attr is not None and grade_attr.strip() != "":
-                                try:
-                                    grade_num = int(grade_attr)
-                                except ValueError:
-                                    grade_num = 3
-                            else:
-                                grade_num = 3
-                            
-                            # 등급 숫자를 텍스트로 변환
-                            grade_map = {
-                                4: "전설",
-                                3: "영웅", 
-                                2: "희귀",
-                                1: "고급",
-                                0: "일반"
-                            }
-                            grade = grade_map.get(grade_num, "영웅")
-                            
-                            # 아이템명 추출
-                            item_name = item_element.text.strip()
-                            
-                            # 아이템 타입 추출
-                            img_element = item_element.find_element(By.TAG_NAME, "img")
-                            item_type_title = img_element.get_attribute("title")
-                            
-                            # 타입 매핑
-                            if "카드" in item_type_title:
-                                item_type = 1
-                            elif "호감도" in item_type_title:
-                                item_type = 2
-                            else:
-                                item_type = 3  # 특수 아이템
-                            
-                            if item_name:
-                                items.append({
-                                    'name': item_name,
-                                    'type': item_type,
-                                    'grade': grade,
-                                    'hidden': False
-                                })
+                # 지역명과 NPC명 추출
+                location_element = merchant_div.find_element(By.CSS_SELECTOR, REGION_SELECTOR)
+                region_name = location_element.text.strip()
+                
+                npc_element = merchant_div.find_element(By.CSS_SELECTOR, NPC_SELECTOR)
+                npc_name = npc_element.text.strip()
+                
+                # 아이템들 추출
+                items = []
+                item_elements = merchant_div.find_elements(By.CSS_SELECTOR, ITEM_SELECTOR)
+                
+                for item_element in item_elements:
+                    try:
+                        # 아이템명 / data-grade 등급 / 아이콘 title 타입
+                        item_name = item_element.text.strip()
+                        grade = item_grade(item_element.get_attribute("data-grade"))
+                        img_element = item_element.find_element(By.TAG_NAME, "img")
                         
-                        except Exception as e:
-                            print(f"아이템 파싱 오류: {e}")
-                            continue
+                        if item_name:
+                            items.append({
+                                'name': item_name,
+                                'type': item_type(img_element.get_attribute("title")),
+                                'grade': grade,
+                                'hidden': False
+                            })
                     
-                    if items:
-                        merchant_info = {
-                            'region_name': region_name,
-                            'npc_name': npc_name,
-                            'group': 1,
-                            'items': items
-                        }
-                        merchants.append(merchant_info)
-                        print(f"  ✅ {region_name} - {npc_name}: {len(items)}개 아이템")
-                
-                except Exception as e:
-                    print(f"상인 정보 파싱 오류: {e}")
-                    continue
-            
-            print(f"데이터 수집 완료! 총 {len(merchants)}명의 상인 발견")
-            return merchants
+                    except Exception as e:
+                        print(f"아이템 파싱 오류: {e}")
+                        continue
+                
+                if items:
+                    merchant_info = {
+                        'region_name': region_name,
+                        'npc_name': npc_name,
+                        'group': 1,
+                        'items': items
+                    }
+                    merchants.append(merchant_info)
+                    print(f"  ✅ {region_name} - {npc_name}: {len(items)}개 아이템")
             
+            except Exception as e:
+                print(f"상인 정보 파싱 오류: {e}")
+                continue
+        
+        return merchants
+
+    def _read_all_realms(self, driver, realms: List[str]) -> Optional[Dict[str, List[Dict]]]:
+        """
+        브라우저 안에서 서버 탭을 차례로 눌러 읽는 스크립트 한 번 실행 (WebDriver 왕복 한 번)
+        Returns:
+            서버 → 상인 목록 (스크립트 실행 자체가 실패하면 None)
+        """
+        args = [[realm, REALMS.index(realm)] for realm in realms]
+        # 서버마다 최대 REALM_WAIT_SECONDS 대기 + 여유
+        driver.set_script_timeout(len(realms) * self.REALM_WAIT_SECONDS + 5)
+        try:
+            payload = driver.execute_async_script(
+                EXTRACT_ALL_REALMS_SCRIPT, args, script_selectors(self.SERVER_BUTTON_SELECTOR),
+                self.REALM_WAIT_SECONDS * 1000, int(EMPTY_SETTLE_SECONDS * 1000),
+            )
+        except WebDriverException as e:
+            print(f"⚠️ 한 번에 읽기 실패, 서버별 클릭으로 대체: {e.__class__.__name__}")
+            return None
+
+        by_realm = parse_realm_panels(payload)
+        for realm in realms:
+            if realm not in by_realm:
+                print(f"❌ {realm} 서버 상인 목록으로 바뀌지 않았습니다.")
+        return by_realm
+
+    def fetch_merchant_data_selenium(self, cancel_event: Optional[threading.Event] = None,
+                                     realms: Optional[Iterable[str]] = None) -> Optional[Dict[str, List[Dict]]]:
+        """
+        Selenium으로 떠상 데이터 가져오기 (페이지 한 번 로드 후 서버 버튼만 바꿔 가며 읽음)
+        single_pass면 모든 서버 탭을 스크립트 한 번으로 읽고, 실패하면 서버별 클릭 + 요소별 추출
+        Returns:
+            서버 → 상인 목록 (읽지 못한 서버는 빠짐, 드라이버가 없으면 None)
+        """
+        started = time.perf_counter()
+        pooled = self.driver_pool.acquire()
+        if not pooled:
+            return None
+
+        driver = pooled.driver
+        success = False
+        by_realm: Dict[str, List[Dict]] = {}
+
+        try:
+            buttons = self.prepare_page(pooled)
+            if not buttons:
+                return {}
+
+            realms = list(realms or self.realms)
+            if self.single_pass:
+                read = self._read_all_realms(driver, realms)
+                if cancel_event and cancel_event.is_set():
+                    print("⏹️ 상인 데이터 수집 취소됨")
+                    success = True
+                    return {}
+                # 스크립트 실행이 실패했을 때만 아래에서 서버별 클릭으로 다시 읽음
+                if read is not None:
+                    by_realm, realms = read, []
+
+            for realm in realms:
+                if cancel_event and cancel_event.is_set():
+                    print("⏹️ 상인 데이터 수집 취소됨")
+                    success = True  # 페이지는 정상이므로 드라이버는 그대로 재사용
+                    return {}
+
+                if not self._select_realm(driver, buttons, realm):
+                    continue
+                
+                # 두 번째 div.bg-elevated 요소에서 데이터 추출
+                panel = self._merchant_panel(driver)
+                if panel is None:
+                    continue
+                merchants = self._extract_merchants(panel, cancel_event)
+                if merchants is None:
+                    print("⏹️ 상인 데이터 수집 취소됨")
+                    success = True
+                    return {}
+                by_realm[realm] = merchants
+            
+            total = sum(len(merchants) for merchants in by_realm.values())
+            print(f"데이터 수집 완료! {len(by_realm)}개 서버, 총 {total}명의 상인 발견")
+            success = bool(by_realm)
+            return by_realm
+
         except TimeoutException:
             print("페이지 로딩 시간 초과")
-            return []
+            return by_realm
         except NoSuchElementException:
             print("div.bg-elevated 요소를 찾을 수 없음")
-            return []
+            return by_realm
         except Exception as e:
             print(f"예상치 못한 오류: {e}")
-            return []
+            return by_realm
         finally:
-            driver.quit()
-    
-    def get_current_active_merchants(self) -> List[Dict]:
-        """현재 활성화된 상인들 가져오기"""
+            # 드라이버는 종료하지 않고 풀에 반납 (실패한 세션은 다음 사용 때 재생성)
+            self.driver_pool.release(pooled, broken=not success)
+            self.driver_pool.record_fetch(time.perf_counter() - started, success)
+
+    def close(self):
+        """드라이버 풀 종료"""
+        self.driver_pool.close()
+
+    def get_all_realm_merchants(self, cancel_event: Optional[threading.Event] = None) -> Dict[str, List[Dict]]:
+        """모든 서버의 현재 활성 상인 (서버 → 상인 목록)"""
         try:
             print("🔄 Selenium으로 실시간 데이터 가져오는 중...")
             
-            merchants_data = self.fetch_merchant_data_selenium()
-            if not merchants_data:
-                return []
+            by_realm = self.fetch_merchant_data_selenium(cancel_event)
+            if not by_realm:
+                return {}
             
-            print(f"✅ 니나브 서버 상인 {len(merchants_data)}명 발견")
-            return merchants_data
+            for realm, merchants in by_realm.items():
+                print(f"✅ {realm} 서버 상인 {len(merchants)}명 발견")
+            return by_realm
             
         except Exception as e:
             print(f"❌ 실시간 데이터 가져오기 실패: {e}")
-            return []
-
-# ============================================================================
-# 로스트아크 캐릭터 정보 조회 API 클래스
-# ============================================================================
+            return {}
 
-class LostArkCharacterAPI:
-    """로스트아크 캐릭터 정보 조회 API 클래스"""
-    
-    def __init__(self, api_key: str):
-        self.api_key = api_key
-        self.base_url = "https://developer-lostark.game.onstove.com"
-        self.headers = {
-            'accept': 'application/json',
-            'authorization': f'Bearer {api_key}'  # Bearer의 B를 대문자로!
-        }
-    
-    async def get_character_info(self, character_name: str) -> Optional[Dict]:
-        """캐릭터 기본 정보 조회"""
-        try:
-            encoded_name = urllib.parse.quote(character_name)
-            url = f"{self.base_url}/characters/{encoded_name}/siblings"
-            
-            print(f"🔍 API 요청: {url}")
-            print(f"🔑 API 키: {self.api_key[:10]}...")
-            
-            response = requests.get(url, headers=self.headers)
-            
-            print(f"📡 응답 상태: {response.status_code}")
-            print(f"📄 응답 헤더: {dict(response.headers)}")
-            print(f"📝 응답 내용 (처음 200자): {response.text[:200]}")
-            
-            if response.status_code == 200:
-                # 응답이 비어있는지 확인
-                if not response.text or response.text.strip() == "":
-                    print("❌ 빈 응답 받음")
-                    return None
-                
-                try:
-                    data = response.json()
-                    print(f"✅ 캐릭터 정보 조회 성공: {data.get('CharacterName', 'Unknown')}")
-                    return data
-                except json.JSONDecodeError as e:
-                    print(f"❌ JSON 파싱 오류: {e}")
-                    print(f"전체 응답 내용: {response.text}")
-                    return None
-                    
-            elif response.status_code == 404:
-                print(f"❌ 캐릭터 '{character_name}'를 찾을 수 없음")
-                return None
-            elif response.status_code == 401:
-                print(f"❌ API 키 인증 실패")
-                return None
-            elif response.status_code == 429:
-                print(f"❌ API 요청 한도 초과")
-                return None
-            else:
-                print(f"❌ API 오류: {response.status_code}")
-                print(f"응답 내용: {response.text}")
-                return None
-                
-        except Exception as e:
-            print(f"❌ 캐릭터 정보 조회 오류: {e}")
-            return None
-    
-    async def get_character_siblings(self, character_name: str) -> Optional[List[Dict]]:
-        """캐릭터 원정대 정보 조회"""
+    def get_current_active_merchants(self, cancel_event: Optional[threading.Event] = None,
+                                     realm: str = DEFAULT_REALM) -> List[Dict]:
+        """서버 하나의 현재 활성화된 상인들 가져오기"""
         try:
-            encoded_name = urllib.parse.quote(character_name)
-            url = f"{self.base_url}/characters/{encoded_name}/siblings"
-            
-            response = requests.get(url, headers=self.headers)
+            by_realm = self.fetch_merchant_data_selenium(cancel_event, realms=[realm])
+            return (by_realm or {}).get(realm, [])
             
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 404:
-                return None
-            else:
-                print(f"API 오류: {response.status_code}")
-                return None
-                
         except Exception as e:
-            print(f"원정대 정보 조회 오류: {e}")
-            return None
+            print(f"❌ 실시간 데이터 가져오기 실패: {e}")
+            return []
 
 # ============================================================================
 # 통합 로스트아크 디스코드 봇 (떠돌이상인 + 캐릭터정보)
@@ -310,8 +361,20 @@ class IntegratedLostArkBot:
         intents.message_content = True
         self.bot = commands.Bot(command_prefix='!', intents=intents)  # prefix는 슬래시 명령어에서 사용안함
         
-        # 서버별 알림 채널 설정 (여러 서버 지원)
-        self.merchant_channels = {}  # {guild_id: channel_id}
+        # 서버별 알림 채널 설정 (여러 서버 지원, 재시작해도 유지)
+        self.merchant_channels = SubscriptionStore("subscriptions.db")  # {guild_id: channel_id}
+        
+        # 알림은 서버별로 동시에 전송 (디스코드 전역/채널별 한도 준수, 일시적 오류 재시도)
+        self.notification_dispatcher = NotificationDispatcher()
+        
+        # 보내기 전에 디스크에 기록 → 재시작/연결 끊김 후에도 못 받은 서버에 이어서 전송
+        self.notification_queue = NotificationQueue("notification_queue.db")
+        self.notification_outbox = NotificationOutbox(
+            self.notification_queue,
+            self.notification_dispatcher,
+            self.send_queued_notification,
+            on_permanent_failures=self.remove_dead_channels
+        )
         
         # 로스트아크 API 초기화 (API 키가 있는 경우)
         if self.lostark_api_key:
@@ -319,16 +382,72 @@ class IntegratedLostArkBot:
         else:
             self.lostark_api = None
         
+        # 캐릭터/원정대 조회 캐시 (없는 캐릭터는 1분, 만료 후 10분간은 이전 값 + 백그라운드 갱신)
+        self.character_cache = TTLLRUCache(
+            maxsize=512, ttl=300, negative_ttl=60, stale_ttl=600,
+            key_func=normalize_character_name
+        )
+        
         # Selenium 떠돌이상인 데이터 가져오기 초기화
         self.merchant_fetcher = SeleniumMerchantFetcher()
         
+        # Selenium 수집은 전용 스레드에서 실행 (동시 요청은 하나의 수집으로 합쳐짐)
+        self.fetch_worker = MerchantFetchWorker(self.merchant_fetcher.get_all_realm_merchants, timeout=90)
+        
         # 떠돌이상인 관련 변수들
-        self.merchant_data = None
+        # 수집할 때마다 서버별 읽기 전용 스냅샷을 새로 만들어 교체 (명령어는 복사 없이 current를 읽음)
+        # 기록/확률/자동완성은 기본 서버(니나브) 스냅샷 기준
+        self.realm_snapshots = RealmSnapshotStore(REALMS)
+        self.merchant_snapshots = self.realm_snapshots.store(DEFAULT_REALM)
         self.last_data_update = None
+        
+        # 내용이 바뀐 스냅샷만 SQLite에 추가하고 주 × 아이템 × 지역 / 등급 집계를 바로 갱신
+        self.merchant_history = MerchantHistoryStore("merchant_history.db")
+        
+        # /확률용 지역 × 아이템 등장 카운트 표 (시작할 때 기록에서 한 번 읽고, 이후 스냅샷마다 증분 갱신)
+        self.item_forecaster = ItemForecaster()
+        self.item_forecaster.load(*self.merchant_history.cycle_counts(before=datetime.now()))
+        
+        # 아이템 이름 검색 인덱스 (서버마다 하나, 스냅샷이 바뀌면 바뀐 상인만 반영, 기본 아이템 목록은 항상 포함)
+        self.item_indexes = {realm: ItemSearchIndex(catalog=ITEM_CATALOG) for realm in REALMS}
+        self.item_index = self.item_indexes[DEFAULT_REALM]
+        
+        # 슬래시 명령어 자동완성 (아이템/지역/NPC 접두어 트라이, 스냅샷 버전이 바뀔 때만 다시 만듦)
+        self.autocomplete = AutocompleteIndex(items=ITEM_CATALOG)
         self.last_notification = None
         
+        # 상인 embed는 데이터가 바뀔 때만 다시 만들고 모든 서버/명령어에서 재사용
+        self.embed_cache = EmbedRenderCache()
+        
+        # 떠상 스케줄 (등장/마감 시각) - kloa 데이터 라우트에서 가져와 다음 확인 시각 계산에만 사용
+        self.schedule_client = NextDataClient(timeout=15)
+        self.schedule_index = None
+        self.schedule_loaded_at = None
+        
+        # 5분 고정 폴링 대신 다음 등장/마감/마감 30분 전 시각에만 Selenium 수집
+        self.merchant_scheduler = MerchantScheduler(
+            self.check_merchants,
+            self.get_next_merchant_boundary,
+            fallback_interval=300
+        )
+        
         self.setup_commands()
     
+    async def get_character_siblings_cached(self, character_name: str) -> Optional[List[Dict]]:
+        """원정대 정보 조회 (캐시 사용, API 오류는 캐시하지 않고 예외로 전달)"""
+        async def load():
+            siblings = await self.lostark_api.get_character_siblings(character_name, raise_errors=True)
+            
+            # 같은 원정대 캐릭터들은 결과가 같으므로 미리 채워둠
+            for sibling in siblings or []:
+                sibling_name = sibling.get('CharacterName')
+                if sibling_name and self.character_cache.get(sibling_name) is None:
+                    self.character_cache.set(sibling_name, siblings)
+            
+            return siblings
+        
+        return await self.character_cache.get_or_load(character_name, load)
+    
     def format_item_with_color(self, item):
         """아이템을 등급별 색깔로 포맷팅"""
         grade = item['grade']
@@ -353,22 +472,104 @@ class IntegratedLostArkBot:
             formatted_items.append(self.format_item_with_color(item))
         return formatted_items
     
+    @property
+    def merchant_data(self):
+        """현재 스냅샷의 상인 목록 (읽기 전용 tuple, 아직 수집 전이면 None)"""
+        return self.merchant_snapshots.merchants
+    
+    def guild_realm(self, guild_id: Optional[int]) -> str:
+        """서버(guild)가 선택한 로스트아크 서버 (알림 설정이 없으면 기본 서버)"""
+        return self.merchant_channels.get_setting(guild_id, REALM_SETTING, DEFAULT_REALM)
+    
+    def command_realm(self, interaction: discord.Interaction, realm: Optional[str]) -> Optional[str]:
+        """명령어에서 입력한 서버 (입력 안 하면 이 Discord 서버 설정, 모르는 이름이면 None)"""
+        if realm:
+            return resolve_realm(realm)
+        return self.guild_realm(interaction.guild_id)
+    
+    def realm_choices(self, current: str) -> List[app_commands.Choice[str]]:
+        """로스트아크 서버 이름 자동완성"""
+        query = normalize_text(current)
+        return [app_commands.Choice(name=realm, value=realm) for realm in REALMS if query in normalize_text(realm)]
+    
+    def render_merchant_fields(self, snapshot: MerchantSnapshot, realm: str = DEFAULT_REALM) -> List[tuple]:
+        """상인별 embed 필드 (이름, 아이템 목록) - 서버별 스냅샷 버전마다 한 번만 생성"""
+        def render():
+            fields = []
+            for merchant in snapshot.merchants:
+                # 색상이 적용된 아이템 목록 생성
+                colored_items = self.format_items_for_discord(merchant['items'])
+                
+                # 아이템을 2개씩 나누어 표시
+                item_chunks = [colored_items[i:i+2] for i in range(0, len(colored_items), 2)]
+                item_text = '\n'.join([' • '.join(chunk) for chunk in item_chunks])
+                
+                fields.append((f"📍 {merchant['region_name']} - {merchant['npc_name']}", item_text))
+            return fields
+        
+        return self.embed_cache.get(('merchant_fields', realm), snapshot.version, render)
+    
+    def render_merchant_summary_embed(self, snapshot: MerchantSnapshot, realm: str = DEFAULT_REALM) -> discord.Embed:
+        """/떠상 응답 embed (서버별 스냅샷 버전마다 한 번만 생성)"""
+        def render():
+            if len(snapshot) == 0:
+                embed = discord.Embed(
+                    title=f"🏪 {realm} 떠돌이 상인",
+                    description="현재 활성화된 상인이 없습니다.",
+                    color=0x808080,
+                    timestamp=snapshot.fetched_at
+                )
+            else:
+                embed = discord.Embed(
+                    title=f"🏪 {realm} 떠돌이 상인",
+                    description=f"현재 **{len(snapshot)}명**의 상인이 활성화되어 있습니다!",
+                    color=0x00ff00,
+                    timestamp=snapshot.fetched_at
+                )
+                
+                for name, item_text in self.render_merchant_fields(snapshot, realm):
+                    embed.add_field(name=name, value=item_text, inline=False)
+            
+            # 데이터 업데이트 시간 표시
+            update_time = snapshot.fetched_at.strftime("%H:%M:%S")
+            embed.set_footer(text=f"통합 봇 | 데이터 업데이트: {update_time}")
+            return embed
+        
+        return self.embed_cache.get(('summary', realm), snapshot.version, render)
+    
     async def load_merchant_data(self) -> bool:
         """Selenium으로 상인 데이터 로드"""
         try:
             print("🔄 Selenium으로 상인 데이터 가져오는 중...")
             
-            merchant_data = self.merchant_fetcher.get_current_active_merchants()
+            by_realm = await self.fetch_worker.fetch()
             
-            if merchant_data:
-                self.merchant_data = merchant_data
+            if by_realm:
+                # 한 번 수집한 결과를 서버별 스냅샷으로 교체 (모든 서버가 같은 세대 번호)
+                snapshots = self.realm_snapshots.publish_all(by_realm)
                 self.last_data_update = datetime.now()
-                print(f"✅ Selenium 데이터 로드 성공: {len(merchant_data)}명의 상인")
+                for realm, realm_snapshot in snapshots.items():
+                    self.item_indexes[realm].sync(realm_snapshot)
+                
+                snapshot = snapshots.get(DEFAULT_REALM)
+                if snapshot is not None:
+                    # 자동완성 트라이는 여기서 미리 만들어 두고 자동완성 요청은 조회만
+                    self.autocomplete.sync(snapshot)
+                    self.item_forecaster.observe(snapshot)
+                    await self.record_history(snapshot)
+                total = sum(len(merchants) for merchants in by_realm.values())
+                print(f"✅ Selenium 데이터 로드 성공: {len(by_realm)}개 서버, {total}명의 상인")
                 return True
             else:
                 print("❌ Selenium 데이터 로드 실패")
                 return False
                 
+        except asyncio.TimeoutError:
+            print(f"⏱️ Selenium 데이터 로드 시간 초과 ({self.fetch_worker.timeout}초)")
+            return False
+        except FetchCancelledError:
+            print("⏹️ Selenium 데이터 로드 취소됨")
+            return False
         except Exception as e:
             print(f"❌ Selenium 데이터 로드 오류: {e}")
             return False
@@ -388,151 +589,212 @@ class IntegratedLostArkBot:
         except Exception as e:
             print(f"❌ 자동 새로고침 오류: {e}")
     
-    @tasks.loop(minutes=5)
-    async def check_merchants(self):
-        """5분마다 상인 상태 확인 및 데이터 변경시에만 알림"""
+    async def record_history(self, snapshot: MerchantSnapshot):
+        """상인 기록에 스냅샷 추가 (SQLite 쓰기는 스레드에서, 실패해도 수집은 계속)"""
         try:
-            # 알림 채널이 설정된 서버가 없으면 체크만 하고 알림은 보내지 않음
-            if not self.merchant_channels:
-                # 데이터만 새로고침
-                await self.refresh_data_if_needed()
-                return
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self.merchant_history.append, snapshot)
+        except Exception as e:
+            print(f"❌ 상인 기록 저장 오류: {e}")
+    
+    def autocomplete_choices(self, kind: str, current: str) -> List[app_commands.Choice[str]]:
+        """자동완성 후보 (Discord 3초 제한 안에 응답하도록 수집/검색 없이 메모리 트라이만 조회)"""
+        names = self.autocomplete.sync(self.merchant_snapshots.current).complete(kind, current)
+        return [app_commands.Choice(name=name, value=name) for name in names]
+    
+    def forecast_groups(self, now: datetime) -> Optional[frozenset]:
+        """이번 주기에 등장하는 그룹 (등장 중이 아니면 다음 등장, 스케줄을 모르면 None)"""
+        if self.schedule_index is None:
+            return None
+        groups = self.schedule_index.active_groups(now)
+        if not groups:
+            next_change = self.schedule_index.next_change_after(now)
+            groups = self.schedule_index.active_groups(next_change) if next_change else frozenset()
+        return groups or None
+    
+    def load_schedule_index(self) -> bool:
+        """kloa 데이터 라우트에서 떠상 스케줄을 가져와 인덱스 생성 (동기, 스레드에서 실행)"""
+        try:
+            page_data = self.schedule_client.fetch('merchant')
+            schedules = page_data['pageProps']['initialData']['scheme']['schedules'] if page_data else None
+            if not schedules:
+                print("⚠️ 떠상 스케줄을 가져오지 못했습니다. 고정 간격으로 확인합니다.")
+                return False
             
-            # 이전 데이터 백업
-            previous_data = self.merchant_data.copy() if self.merchant_data else None
+            self.schedule_index = ScheduleIndex(schedules)
+            self.schedule_loaded_at = datetime.now()
             
-            # 데이터 새로고침
-            await self.refresh_data_if_needed()
+            # 같은 데이터의 전체 지역/NPC/아이템 목록은 자동완성 고정 목록으로 사용
+            regions = page_data['pageProps']['initialData']['scheme'].get('regions') or []
+            self.autocomplete.set_catalog(
+                items=list(ITEM_CATALOG) + [item['name'] for region in regions for item in region.get('items', [])
+                                            if not item.get('hidden', False)],
+                regions=[region.get('name') for region in regions],
+                npcs=[region.get('npcName') for region in regions]
+            )
+            self.item_forecaster.set_pools(regions)
+            print(f"📅 떠상 스케줄 {len(schedules)}개 로드")
+            return True
             
-            # 데이터 변경 감지
-            data_changed = self.has_merchant_data_changed(previous_data, self.merchant_data)
+        except Exception as e:
+            print(f"❌ 떠상 스케줄 로드 오류: {e}")
+            return False
+    
+    async def refresh_schedule_if_needed(self):
+        """필요시 떠상 스케줄 새로고침 (6시간마다)"""
+        if (self.schedule_index is None or
+            self.schedule_loaded_at is None or
+            (datetime.now() - self.schedule_loaded_at).total_seconds() > 6 * 3600):
+            
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self.load_schedule_index)
+    
+    def get_next_merchant_boundary(self, now: datetime) -> Optional[datetime]:
+        """다음 등장/마감/마감 30분 전 시각 (스케줄을 모르면 None → 고정 간격)"""
+        if self.schedule_index is None:
+            return None
+        return self.schedule_index.next_boundary_after(now, lead=timedelta(minutes=30))
+    
+    async def check_merchants(self, reason: str = 'manual') -> bool:
+        """스케줄 경계마다 모든 서버 상인 상태 확인 및 데이터가 바뀐 서버만 알림 (하나라도 변경되었으면 True)"""
+        try:
+            await self.refresh_schedule_if_needed()
             
-            if data_changed:
-                now = datetime.now()
-                
-                # 상인이 새로 등장하거나 변경된 경우
-                if self.merchant_data and len(self.merchant_data) > 0:
-                    # 처음 등장인지 변경인지 구분
-                    if not previous_data or len(previous_data) == 0:
-                        title = "🚨 떠돌이 상인 등장 알림"
-                        description = f"떠돌이 상인이 등장했습니다! 현재 **{len(self.merchant_data)}명**의 상인이 활성화되어 있습니다."
-                    else:
-                        title = "🔄 떠돌이 상인 변경 알림"
-                        description = f"상인 정보가 업데이트되었습니다! 현재 **{len(self.merchant_data)}명**의 상인이 활성화되어 있습니다."
-                    
-                    embed = discord.Embed(
-                        title=title,
-                        description=description,
-                        color=0xff6b35,
-                        timestamp=now
-                    )
-                    
-                    for merchant in self.merchant_data:
-                        region = merchant['region_name']
-                        npc = merchant['npc_name']
-                        
-                        # 색상이 적용된 아이템 목록 생성
-                        colored_items = self.format_items_for_discord(merchant['items'])
-                        
-                        # 아이템을 2개씩 나누어 표시
-                        item_chunks = [colored_items[i:i+2] for i in range(0, len(colored_items), 2)]
-                        item_text = '\n'.join([' • '.join(chunk) for chunk in item_chunks])
-                        
-                        embed.add_field(
-                            name=f"📍 {region} - {npc}",
-                            value=f"```\n{item_text}```",
-                            inline=False
-                        )
-                    
-                    embed.set_footer(text="통합 봇 | 상인 정보 알림")
-                    
-                    # 모든 등록된 서버에 알림 전송
-                    await self.send_notification_to_all_servers(embed)
-                    self.last_notification = now
-                    print(f"✅ 상인 알림 전송: {len(self.merchant_data)}명 → {len(self.merchant_channels)}개 서버")
-                
-                # 상인이 모두 사라진 경우
-                elif previous_data and len(previous_data) > 0:
-                    embed = discord.Embed(
-                        title="📴 떠돌이 상인 종료 알림",
-                        description="모든 떠돌이 상인이 비활성화되었습니다.",
-                        color=0x808080,
-                        timestamp=now
-                    )
-                    embed.set_footer(text="통합 봇 | 상인 종료 알림")
-                    
-                    # 모든 등록된 서버에 알림 전송
-                    await self.send_notification_to_all_servers(embed)
-                    print(f"✅ 상인 종료 알림 전송 → {len(self.merchant_channels)}개 서버")
+            # 이전 스냅샷 (읽기 전용이라 복사 없이 참조만 보관)
+            previous = {realm: self.realm_snapshots.current(realm) for realm in REALMS}
+            
+            # 경계 시각에는 항상 새로 수집 (그 외에는 30분마다)
+            if reason in ('boundary', 'verify'):
+                await self.load_merchant_data()
+            else:
+                await self.refresh_data_if_needed()
+            
+            any_changed = False
+            for realm in REALMS:
+                # 이번 확인에서는 끝까지 같은 스냅샷을 사용 (알림 전송 중 새로 수집되어도 섞이지 않음)
+                current = self.realm_snapshots.current(realm)
+                if current is previous[realm]:
+                    continue
+                if self.has_merchant_data_changed(previous[realm], current):
+                    any_changed = True
+                    await self.notify_realm_change(realm, previous[realm], current)
+            
+            return any_changed
             
         except Exception as e:
             print(f"❌ 상인 체크 오류: {e}")
+            return False
     
-    async def send_notification_to_all_servers(self, embed):
-        """모든 등록된 서버에 알림 전송"""
-        failed_channels = []
+    async def notify_realm_change(self, realm: str, previous: Optional[MerchantSnapshot],
+                                  current: Optional[MerchantSnapshot]):
+        """서버 하나의 상인 변경 알림 (그 서버를 선택한 Discord 서버에만)"""
+        previous_data = previous.merchants if previous is not None else None
+        current_data = current.merchants if current is not None else None
         
-        for guild_id, channel_id in self.merchant_channels.items():
-            try:
-                channel = self.bot.get_channel(channel_id)
-                if channel:
-                    await channel.send(embed=embed)
-                else:
-                    failed_channels.append(guild_id)
-                    print(f"⚠️ 채널을 찾을 수 없음: {channel_id} (서버: {guild_id})")
-            except Exception as e:
-                failed_channels.append(guild_id)
-                print(f"❌ 알림 전송 실패: {channel_id} (서버: {guild_id}) - {e}")
+        # 이 서버 알림을 받는 Discord 서버가 없으면 체크만 하고 알림은 보내지 않음
+        if not any(self.guild_realm(guild_id) == realm for guild_id in list(self.merchant_channels)):
+            return
         
-        # 실패한 채널들 제거
-        for guild_id in failed_channels:
-            del self.merchant_channels[guild_id]
-    
-    def has_merchant_data_changed(self, previous_data, current_data):
-        """상인 데이터 변경 여부 확인"""
-        try:
-            # 이전 데이터가 없고 현재 데이터가 있으면 = 처음 상인 등장
-            if not previous_data and current_data and len(current_data) > 0:
-                return True
-            
-            # 둘 다 None이거나 빈 리스트인 경우 = 변경 없음
-            if not previous_data and not current_data:
-                return False
+        now = datetime.now()
+        
+        # 상인이 새로 등장하거나 변경된 경우
+        if current_data and len(current_data) > 0:
+            # 처음 등장인지 변경인지 구분
+            if not previous_data or len(previous_data) == 0:
+                title = f"🚨 {realm} 떠돌이 상인 등장 알림"
+                description = f"떠돌이 상인이 등장했습니다! 현재 **{len(current_data)}명**의 상인이 활성화되어 있습니다."
+            else:
+                title = f"🔄 {realm} 떠돌이 상인 변경 알림"
+                description = f"상인 정보가 업데이트되었습니다! 현재 **{len(current_data)}명**의 상인이 활성화되어 있습니다."
             
-            # 이전에 데이터가 있었는데 현재 없으면 = 상인 모두 사라짐
-            if previous_data and len(previous_data) > 0 and (not current_data or len(current_data) == 0):
-                return True
+            embed = discord.Embed(
+                title=title,
+                description=description,
+                color=0xff6b35,
+                timestamp=now
+            )
             
-            # 현재 데이터가 없으면 변경 없음
-            if not current_data:
-                return False
+            for name, item_text in self.render_merchant_fields(current, realm):
+                embed.add_field(
+                    name=name,
+                    value=f"```\n{item_text}```",
+                    inline=False
+                )
             
-            # 상인 수가 다른 경우
-            if len(previous_data) != len(current_data):
-                return True
+            embed.set_footer(text=f"통합 봇 | {realm} 상인 정보 알림")
             
-            # 각 상인의 정보를 비교
-            for prev_merchant in previous_data:
-                # 현재 데이터에서 같은 상인 찾기
-                current_merchant = None
-                for curr_merchant in current_data:
-                    if (curr_merchant.get('region_name') == prev_merchant.get('region_name') and 
-                        curr_merchant.get('npc_name') == prev_merchant.get('npc_name')):
-                        current_merchant = curr_merchant
-                        break
-                
-                # 상인이 사라진 경우
-                if not current_merchant:
-                    return True
-                
-                # 아이템 목록 비교
-                prev_items = set(item['name'] for item in prev_merchant.get('items', []))
-                curr_items = set(item['name'] for item in current_merchant.get('items', []))
-                
-                if prev_items != curr_items:
-                    return True
+            # 이 서버를 선택한 Discord 서버에 알림 전송 (같은 상인 목록은 채널당 한 번만)
+            alert_key = payload_hash({'kind': 'merchants', 'realm': realm, 'merchants': current_data})
+            sent_to = await self.send_notification_to_all_servers(embed, alert_key, realm)
+            self.last_notification = now
+            print(f"✅ {realm} 상인 알림 전송: {len(current_data)}명 → {sent_to}개 서버")
+        
+        # 상인이 모두 사라진 경우
+        elif previous_data and len(previous_data) > 0:
+            embed = discord.Embed(
+                title=f"📴 {realm} 떠돌이 상인 종료 알림",
+                description="모든 떠돌이 상인이 비활성화되었습니다.",
+                color=0x808080,
+                timestamp=now
+            )
+            embed.set_footer(text=f"통합 봇 | {realm} 상인 종료 알림")
             
-            return False
+            alert_key = payload_hash({'kind': 'ended', 'realm': realm, 'merchants': previous_data})
+            sent_to = await self.send_notification_to_all_servers(embed, alert_key, realm)
+            print(f"✅ {realm} 상인 종료 알림 전송 → {sent_to}개 서버")
+    
+    async def send_notification_to_all_servers(self, embed, alert_key: str, realm: Optional[str] = None) -> int:
+        """
+        등록된 서버(realm을 주면 그 로스트아크 서버를 선택한 곳만)에 알림 동시 전송
+        대기열에 먼저 기록한 뒤 보내므로 도중에 재시작해도 못 받은 서버에 이어서 전송
+        (alert_key + 채널이 같은 알림은 한 번만 들어감)
+        Returns:
+            대상 채널 수
+        """
+        payload = {'embed': embed.to_dict()}
+        targets = [
+            (guild_id, channel_id) for guild_id, channel_id in list(self.merchant_channels.items())
+            if realm is None or self.guild_realm(guild_id) == realm
+        ]
+        added = self.notification_queue.enqueue(
+            (f"{alert_key}:{channel_id}", guild_id, channel_id, payload)
+            for guild_id, channel_id in targets
+        )
+        
+        results = await self.notification_outbox.drain()
+        
+        for result in results:
+            if not result.ok:
+                job = result.target
+                print(f"❌ 알림 전송 실패: {job.channel_id} (서버: {job.guild_id}, {result.attempts}회 시도) - {result.error}")
+        
+        sent = sum(1 for result in results if result.ok)
+        print(f"📨 알림 {added}건 추가, {sent}/{len(results)}건 전송")
+        return len(targets)
+    
+    async def send_queued_notification(self, job):
+        """대기열 작업 하나 전송"""
+        channel = self.bot.get_channel(job.channel_id)
+        if not channel:
+            raise PermanentDeliveryError(f"채널을 찾을 수 없음: {job.channel_id}")
+        await channel.send(embed=discord.Embed.from_dict(job.payload['embed']))
+    
+    def remove_dead_channels(self, jobs):
+        """삭제된 채널/권한 없음으로 영구 실패한 알림 채널 일괄 제거 (일시적 오류는 대기열에서 재시도)"""
+        removed = self.merchant_channels.prune((job.guild_id, job.channel_id) for job in jobs)
+        if removed:
+            print(f"🗑️ 알림 채널 {removed}개 제거")
+    
+    def has_merchant_data_changed(self, previous: Optional[MerchantSnapshot], current: Optional[MerchantSnapshot]):
+        """상인 데이터 변경 여부 확인 (스냅샷마다 미리 만든 (지역, NPC) 인덱스로 비교)"""
+        try:
+            if current is not None:
+                changes = current.changes_since(previous)
+            else:
+                changes = diff_merchants(previous.index if previous is not None else None, None)
+            if changes:
+                print(f"🔄 상인 변경 감지: {changes.summary()}")
+            return bool(changes)
             
         except Exception as e:
             print(f"❌ 데이터 변경 감지 오류: {e}")
@@ -568,7 +830,8 @@ class IntegratedLostArkBot:
             
             print('=' * 60)
             print('사용 가능한 슬래시 명령어:')
-            print('📍 떠돌이상인: /떠상, /새로고침, /떠상검색')
+            print('📍 떠돌이상인: /떠상, /새로고침, /떠상검색, /상인검색, /출현기록, /확률')
+            print('🔔 알림: /알림설정, /서버설정, /알림해제, /알림상태')
             if self.lostark_api:
                 print('⚔️  캐릭터정보: /캐릭터정보')
             print('❓ 도움말: /도움말')
@@ -580,25 +843,42 @@ class IntegratedLostArkBot:
             # 초기 데이터 로드
             await self.load_merchant_data()
             
-            # 주기적 체크 시작
-            self.check_merchants.start()
+            # 알림 채널 변경은 모아서 백그라운드에서 저장
+            self.merchant_channels.start()
+            print(f"🔔 저장된 알림 채널 {len(self.merchant_channels)}개 불러옴")
+            
+            # 지난 실행에서 못 보낸 알림 이어서 전송 + 재시도 대기 작업 처리
+            pending = self.notification_queue.counts()['pending']
+            if pending:
+                print(f"📨 못 보낸 알림 {pending}건 이어서 전송")
+            self.notification_outbox.start()
+            
+            # 스케줄 경계 기반 체크 시작
+            self.merchant_scheduler.start()
         
         # ============================================================================
         # 떠돌이상인 슬래시 명령어들
         # ============================================================================
         
         @self.bot.tree.command(name="떠상", description="현재 활성화된 떠돌이상인을 확인합니다")
-        async def merchant_info(interaction: discord.Interaction):
+        @app_commands.describe(서버="확인할 로스트아크 서버 (선택, 기본은 알림 설정한 서버)")
+        async def merchant_info(interaction: discord.Interaction, 서버: Optional[str] = None):
             """현재 활성 떠돌이상인 확인"""
             try:
                 await interaction.response.defer()  # 응답 지연 (처리 시간이 길 수 있음)
                 
+                realm = self.command_realm(interaction, 서버)
+                if realm is None:
+                    await interaction.followup.send(f"❌ 알 수 없는 서버입니다: `{서버}` ({', '.join(REALMS)})")
+                    return
+                
                 # 최신 데이터 확인
                 await self.refresh_data_if_needed()
                 
-                if not self.merchant_data:
+                snapshot = self.realm_snapshots.current(realm)
+                if snapshot is None or not snapshot.merchants:
                     embed = discord.Embed(
-                        title="🏪 떠돌이 상인",
+                        title=f"🏪 {realm} 떠돌이 상인",
                         description="상인 데이터를 가져올 수 없습니다.",
                         color=0xff0000,
                         timestamp=datetime.now()
@@ -606,46 +886,8 @@ class IntegratedLostArkBot:
                     await interaction.followup.send(embed=embed)
                     return
                 
-                if len(self.merchant_data) == 0:
-                    embed = discord.Embed(
-                        title="🏪 떠돌이 상인",
-                        description="현재 활성화된 상인이 없습니다.",
-                        color=0x808080,
-                        timestamp=datetime.now()
-                    )
-                else:
-                    embed = discord.Embed(
-                        title="🏪 떠돌이 상인",
-                        description=f"현재 **{len(self.merchant_data)}명**의 상인이 활성화되어 있습니다!",
-                        color=0x00ff00,
-                        timestamp=datetime.now()
-                    )
-                    
-                    for merchant in self.merchant_data:
-                        region = merchant['region_name']
-                        npc = merchant['npc_name']
-                        
-                        # 색상이 적용된 아이템 목록 생성
-                        colored_items = self.format_items_for_discord(merchant['items'])
-                        
-                        # 아이템을 2개씩 나누어 표시
-                        item_chunks = [colored_items[i:i+2] for i in range(0, len(colored_items), 2)]
-                        item_text = '\n'.join([' • '.join(chunk) for chunk in item_chunks])
-                        
-                        embed.add_field(
-                            name=f"📍 {region} - {npc}",
-                            value=f"{item_text}",
-                            inline=False
-                        )
-                
-                # 데이터 업데이트 시간 표시
-                if self.last_data_update:
-                    update_time = self.last_data_update.strftime("%H:%M:%S")
-                    embed.set_footer(text=f"통합 봇 | 데이터 업데이트: {update_time}")
-                else:
-                    embed.set_footer(text="통합 봇 | 실시간 데이터")
-                
-                await interaction.followup.send(embed=embed)
+                # 같은 스냅샷이면 이전에 만든 embed 재사용
+                await interaction.followup.send(embed=self.render_merchant_summary_embed(snapshot, realm))
                 
             except Exception as e:
                 await interaction.followup.send(f"❌ 오류가 발생했습니다: {e}")
@@ -694,39 +936,50 @@ class IntegratedLostArkBot:
                 await interaction.followup.send(f"❌ 새로고침 오류: {e}")
         
         @self.bot.tree.command(name="떠상검색", description="특정 아이템을 판매하는 떠돌이상인을 검색합니다")
-        @app_commands.describe(아이템명="검색할 아이템 이름")
-        async def search_item(interaction: discord.Interaction, 아이템명: str):
+        @app_commands.describe(아이템명="검색할 아이템 이름", 서버="검색할 로스트아크 서버 (선택, 기본은 알림 설정한 서버)")
+        async def search_item(interaction: discord.Interaction, 아이템명: str, 서버: Optional[str] = None):
             """아이템으로 상인 검색"""
             try:
                 await interaction.response.defer()
                 
+                realm = self.command_realm(interaction, 서버)
+                if realm is None:
+                    await interaction.followup.send(f"❌ 알 수 없는 서버입니다: `{서버}` ({', '.join(REALMS)})")
+                    return
+                
                 await self.refresh_data_if_needed()
                 
-                if not self.merchant_data:
+                snapshot = self.realm_snapshots.current(realm)
+                if snapshot is None or not snapshot.merchants:
                     await interaction.followup.send("❌ 상인 데이터를 가져올 수 없습니다.")
                     return
                 
-                # 아이템 검색
-                found_merchants = []
-                for merchant in self.merchant_data:
-                    for item in merchant['items']:
-                        if 아이템명.lower() in item['name'].lower():
-                            found_merchants.append({
-                                'merchant': merchant,
-                                'item': item
-                            })
-                            break
+                # 아이템 검색 (서버별 이름 역색인 사용)
+                item_index = self.item_indexes[realm]
+                found_merchants = [
+                    {'merchant': merchant, 'item': item}
+                    for merchant, item in item_index.find(snapshot, 아이템명)
+                ]
                 
                 if not found_merchants:
                     embed = discord.Embed(
-                        title="🔍 아이템 검색 결과",
+                        title=f"🔍 {realm} 아이템 검색 결과",
                         description=f"`{아이템명}` 아이템을 판매하는 상인을 찾을 수 없습니다.",
                         color=0x808080,
                         timestamp=datetime.now()
                     )
+                    
+                    # 초성/오타 허용 검색으로 비슷한 아이템 이름 제안
+                    suggestions = item_index.search(아이템명, limit=5)
+                    if suggestions:
+                        embed.add_field(
+                            name="💡 혹시 이 아이템을 찾으셨나요?",
+                            value=', '.join(f"`{hit.name}`" for hit in suggestions),
+                            inline=False
+                        )
                 else:
                     embed = discord.Embed(
-                        title="🔍 아이템 검색 결과",
+                        title=f"🔍 {realm} 아이템 검색 결과",
                         description=f"`{아이템명}` 검색 결과: **{len(found_merchants)}명**의 상인이 발견되었습니다.",
                         color=0x00ff00,
                         timestamp=datetime.now()
@@ -753,6 +1006,205 @@ class IntegratedLostArkBot:
             except Exception as e:
                 await interaction.followup.send(f"❌ 검색 오류: {e}")
         
+        @search_item.autocomplete('아이템명')
+        async def search_item_autocomplete(interaction: discord.Interaction, current: str) -> List[app_commands.Choice[str]]:
+            """아이템 이름 자동완성 (새로 수집하지 않고 현재 스냅샷 + 고정 목록 트라이만 조회)"""
+            return self.autocomplete_choices('items', current)
+        
+        @self.bot.tree.command(name="상인검색", description="지역 또는 NPC 이름으로 현재 떠돌이상인을 검색합니다")
+        @app_commands.describe(지역="검색할 지역 이름", 상인="검색할 NPC 이름", 서버="검색할 로스트아크 서버 (선택, 기본은 알림 설정한 서버)")
+        async def search_merchant(interaction: discord.Interaction, 지역: Optional[str] = None, 상인: Optional[str] = None,
+                                  서버: Optional[str] = None):
+            """지역/NPC로 상인 검색"""
+            try:
+                if not 지역 and not 상인:
+                    await interaction.response.send_message("❌ 지역 또는 상인 이름을 입력해주세요.", ephemeral=True)
+                    return
+                
+                await interaction.response.defer()
+                
+                realm = self.command_realm(interaction, 서버)
+                if realm is None:
+                    await interaction.followup.send(f"❌ 알 수 없는 서버입니다: `{서버}` ({', '.join(REALMS)})")
+                    return
+                
+                await self.refresh_data_if_needed()
+                
+                snapshot = self.realm_snapshots.current(realm)
+                if snapshot is None:
+                    await interaction.followup.send("❌ 상인 데이터를 가져올 수 없습니다.")
+                    return
+                
+                region_query = normalize_text(지역 or '')
+                npc_query = normalize_text(상인 or '')
+                found_merchants = [
+                    merchant for merchant in snapshot.merchants
+                    if region_query in normalize_text(merchant['region_name'])
+                    and npc_query in normalize_text(merchant['npc_name'])
+                ]
+                
+                query_text = ' / '.join(text for text in (지역, 상인) if text)
+                if not found_merchants:
+                    embed = discord.Embed(
+                        title=f"🔍 {realm} 상인 검색 결과",
+                        description=f"`{query_text}` 상인은 현재 활성화되어 있지 않습니다.",
+                        color=0x808080,
+                        timestamp=datetime.now()
+                    )
+                else:
+                    embed = discord.Embed(
+                        title=f"🔍 {realm} 상인 검색 결과",
+                        description=f"`{query_text}` 검색 결과: **{len(found_merchants)}명**의 상인이 발견되었습니다.",
+                        color=0x00ff00,
+                        timestamp=datetime.now()
+                    )
+                    
+                    for merchant in found_merchants:
+                        embed.add_field(
+                            name=f"📍 {merchant['region_name']} - {merchant['npc_name']}",
+                            value=' • '.join(self.format_items_for_discord(merchant['items'])) or "아이템 정보 없음",
+                            inline=False
+                        )
+                
+                embed.set_footer(text="통합 봇 | 상인 검색")
+                await interaction.followup.send(embed=embed)
+                
+            except Exception as e:
+                await interaction.followup.send(f"❌ 검색 오류: {e}")
+        
+        @self.bot.tree.command(name="출현기록", description="아이템이 지역별로 몇 번 등장했는지 누적 기록을 확인합니다")
+        @app_commands.describe(아이템명="확인할 아이템 이름", 지역="특정 지역만 확인 (선택)")
+        async def item_history(interaction: discord.Interaction, 아이템명: str, 지역: Optional[str] = None):
+            """아이템 지역별 등장 기록 (주간 집계 테이블 조회)"""
+            try:
+                # 기록에 없는 이름이면 초성/오타 검색 결과로 맞춤 (검색은 메모리 인덱스라 루프에서)
+                hits = self.item_index.search(아이템명, limit=1)
+                candidate = hits[0].name if hits else 아이템명
+                
+                def load_history():
+                    # SQLite 조회는 기록 저장(append)과 락을 같이 쓰므로 이벤트 루프 밖에서 한 번에
+                    history = self.merchant_history
+                    item_name = 아이템명
+                    total = history.item_appearances(item_name)
+                    if not total and candidate != item_name:
+                        item_name = candidate
+                        total = history.item_appearances(item_name)
+                    return (item_name, dict(total), dict(history.item_appearances(item_name, weeks=4)),
+                            history.cycle_count(), history.cycle_count(weeks=4), history.region_cycle_counts())
+                
+                loop = asyncio.get_running_loop()
+                item_name, total, recent, total_cycles, recent_cycles, region_visits = \
+                    await loop.run_in_executor(None, load_history)
+                if 지역:
+                    total = {region: count for region, count in total.items() if region == 지역}
+                
+                embed = discord.Embed(
+                    title=f"📈 {item_name} 등장 기록",
+                    description=f"관측한 등장 주기: 전체 {total_cycles}회 / 최근 4주 {recent_cycles}회",
+                    color=0x7289da if total else 0x808080,
+                    timestamp=datetime.now()
+                )
+                
+                if not total:
+                    embed.add_field(
+                        name="기록 없음",
+                        value=f"`{item_name}` 아이템이 {f'{지역}에 ' if 지역 else ''}등장한 기록이 없습니다.",
+                        inline=False
+                    )
+                else:
+                    lines = []
+                    for region, count in list(total.items())[:15]:
+                        # 등장률 분모는 그 지역에 상인이 있었던 주기 수
+                        visits = region_visits.get(region, 0)
+                        rate = count / visits * 100 if visits else 0
+                        lines.append(f"{region}: {count}/{visits}주기 ({rate:.1f}%) / 최근 4주 {recent.get(region, 0)}회")
+                    embed.add_field(name="🗺️ 지역별 등장", value="```" + "\n".join(lines) + "```", inline=False)
+                
+                embed.set_footer(text="통합 봇 | 누적 등장 기록")
+                await interaction.response.send_message(embed=embed)
+                
+            except Exception as e:
+                await interaction.response.send_message(f"❌ 기록 조회 오류: {e}")
+        
+        @item_history.autocomplete('아이템명')
+        async def item_history_item_autocomplete(interaction: discord.Interaction, current: str) -> List[app_commands.Choice[str]]:
+            """아이템 이름 자동완성"""
+            return self.autocomplete_choices('items', current)
+        
+        @item_history.autocomplete('지역')
+        async def item_history_region_autocomplete(interaction: discord.Interaction, current: str) -> List[app_commands.Choice[str]]:
+            """지역 이름 자동완성"""
+            return self.autocomplete_choices('regions', current)
+        
+        @self.bot.tree.command(name="확률", description="이번 주기에 아이템이 지역별로 등장할 확률을 추정합니다")
+        @app_commands.describe(아이템명="확인할 아이템 이름", 지역="특정 지역만 확인 (선택)")
+        async def item_probability(interaction: discord.Interaction, 아이템명: str, 지역: Optional[str] = None):
+            """아이템 등장 확률 (메모리 카운트 표만 조회, 수집/DB 조회 없음)"""
+            try:
+                item_name = 아이템명
+                if item_name not in self.item_forecaster.item_regions and item_name not in self.item_forecaster.pool_regions:
+                    hits = self.item_index.search(아이템명, limit=1)
+                    if hits:
+                        item_name = hits[0].name
+                
+                now = datetime.now()
+                forecasts = self.item_forecaster.estimate(item_name, region=지역, now=now,
+                                                          active_groups=self.forecast_groups(now))
+                
+                embed = discord.Embed(
+                    title=f"🎲 {item_name} 등장 확률",
+                    description="관측한 등장 주기 기준 추정치 (지역 판매 목록을 사전 확률로 보정)",
+                    color=0x7289da if forecasts else 0x808080,
+                    timestamp=now
+                )
+                
+                if not forecasts:
+                    embed.add_field(
+                        name="정보 없음",
+                        value=f"`{item_name}` 아이템을 판매하거나 판매한 기록이 있는 지역이 없습니다.",
+                        inline=False
+                    )
+                else:
+                    status_text = {'selling': '지금 판매 중', 'absent': '이번 주기 미판매', 'off': '이번 주기 미등장'}
+                    lines = []
+                    for forecast in forecasts[:15]:
+                        detail = status_text.get(forecast.status, f"{forecast.appearances}/{forecast.visits}회 관측")
+                        lines.append(f"{forecast.region}: {forecast.probability * 100:.1f}% ({detail})")
+                    embed.add_field(name="🗺️ 지역별 확률", value="```" + "\n".join(lines) + "```", inline=False)
+                
+                embed.set_footer(text="통합 봇 | 등장 확률 추정")
+                await interaction.response.send_message(embed=embed)
+                
+            except Exception as e:
+                await interaction.response.send_message(f"❌ 확률 계산 오류: {e}")
+        
+        @item_probability.autocomplete('아이템명')
+        async def item_probability_item_autocomplete(interaction: discord.Interaction, current: str) -> List[app_commands.Choice[str]]:
+            """아이템 이름 자동완성"""
+            return self.autocomplete_choices('items', current)
+        
+        @item_probability.autocomplete('지역')
+        async def item_probability_region_autocomplete(interaction: discord.Interaction, current: str) -> List[app_commands.Choice[str]]:
+            """지역 이름 자동완성"""
+            return self.autocomplete_choices('regions', current)
+        
+        @search_merchant.autocomplete('지역')
+        async def search_region_autocomplete(interaction: discord.Interaction, current: str) -> List[app_commands.Choice[str]]:
+            """지역 이름 자동완성"""
+            return self.autocomplete_choices('regions', current)
+        
+        @search_merchant.autocomplete('상인')
+        async def search_npc_autocomplete(interaction: discord.Interaction, current: str) -> List[app_commands.Choice[str]]:
+            """NPC 이름 자동완성"""
+            return self.autocomplete_choices('npcs', current)
+        
+        @merchant_info.autocomplete('서버')
+        @search_item.autocomplete('서버')
+        @search_merchant.autocomplete('서버')
+        async def realm_autocomplete(interaction: discord.Interaction, current: str) -> List[app_commands.Choice[str]]:
+            """로스트아크 서버 이름 자동완성"""
+            return self.realm_choices(current)
+        
         # ============================================================================
         # 캐릭터 정보 조회 슬래시 명령어
         # ============================================================================
@@ -772,7 +1224,7 @@ class IntegratedLostArkBot:
                 print(f"🔍 캐릭터 조회 요청: '{캐릭터명}'")
                 
                 # siblings 정보 조회 (기본 정보)
-                siblings_info = await self.lostark_api.get_character_siblings(캐릭터명)
+                siblings_info = await self.get_character_siblings_cached(캐릭터명)
                 
                 if not siblings_info:
                     await interaction.followup.send(
@@ -818,7 +1270,7 @@ class IntegratedLostArkBot:
                 print(f"🔍 원정대 조회 요청: '{캐릭터명}'")
                 
                 # siblings 정보 조회
-                siblings_info = await self.lostark_api.get_character_siblings(캐릭터명)
+                siblings_info = await self.get_character_siblings_cached(캐릭터명)
                 
                 if not siblings_info:
                     await interaction.followup.send(f"❌ `{캐릭터명}` 캐릭터의 원정대 정보를 찾을 수 없습니다.")
@@ -850,19 +1302,26 @@ class IntegratedLostArkBot:
                 await interaction.followup.send(f"❌ 동기화 실패: {e}", ephemeral=True)
         
         @self.bot.tree.command(name="알림설정", description="현재 채널을 떠돌이상인 자동 알림 채널로 설정합니다")
-        async def set_notification_channel(interaction: discord.Interaction):
+        @app_commands.describe(서버="알림 받을 로스트아크 서버 (선택, 기본 니나브 또는 기존 설정 유지)")
+        async def set_notification_channel(interaction: discord.Interaction, 서버: Optional[str] = None):
             """알림 채널 설정 명령어 (관리자만 사용 가능)"""
             # 관리자 권한 확인
             if not interaction.user.guild_permissions.manage_channels:
                 await interaction.response.send_message("❌ 이 명령어는 채널 관리 권한이 있는 사용자만 사용할 수 있습니다.", ephemeral=True)
                 return
             
+            realm = self.command_realm(interaction, 서버)
+            if realm is None:
+                await interaction.response.send_message(f"❌ 알 수 없는 서버입니다: `{서버}` ({', '.join(REALMS)})", ephemeral=True)
+                return
+            
             guild_id = interaction.guild_id
             channel_id = interaction.channel_id
             channel_name = interaction.channel.name
             
-            # 알림 채널 설정
+            # 알림 채널 + 로스트아크 서버 설정
             self.merchant_channels[guild_id] = channel_id
+            self.merchant_channels.set_setting(guild_id, REALM_SETTING, realm)
             
             embed = discord.Embed(
                 title="✅ 알림 채널 설정 완료",
@@ -873,20 +1332,59 @@ class IntegratedLostArkBot:
             
             embed.add_field(
                 name="📋 설정 정보",
-                value=f"```\n서버: {interaction.guild.name}\n채널: #{channel_name}\n설정자: {interaction.user.display_name}```",
+                value=f"```\n서버: {interaction.guild.name}\n채널: #{channel_name}\n로스트아크 서버: {realm}\n설정자: {interaction.user.display_name}```",
                 inline=False
             )
             
             embed.add_field(
                 name="🔔 알림 안내",
-                value="이제 떠돌이상인 정보가 변경될 때마다 이 채널로 자동 알림이 전송됩니다.",
+                value=f"이제 **{realm}** 떠돌이상인 정보가 변경될 때마다 이 채널로 자동 알림이 전송됩니다.\n"
+                      f"`/서버설정`으로 로스트아크 서버를 바꿀 수 있습니다.",
                 inline=False
             )
             
             embed.set_footer(text="통합 봇 | 알림 채널 설정")
             await interaction.response.send_message(embed=embed)
             
-            print(f"✅ 알림 채널 설정: {interaction.guild.name} - #{channel_name} ({channel_id})")
+            print(f"✅ 알림 채널 설정: {interaction.guild.name} - #{channel_name} ({channel_id}, {realm})")
+        
+        @self.bot.tree.command(name="서버설정", description="알림과 명령어 기본값으로 쓸 로스트아크 서버를 설정합니다")
+        @app_commands.describe(서버="로스트아크 서버 이름")
+        async def set_realm(interaction: discord.Interaction, 서버: str):
+            """로스트아크 서버 설정 명령어 (관리자만 사용 가능)"""
+            if not interaction.user.guild_permissions.manage_channels:
+                await interaction.response.send_message("❌ 이 명령어는 채널 관리 권한이 있는 사용자만 사용할 수 있습니다.", ephemeral=True)
+                return
+            
+            realm = resolve_realm(서버)
+            if realm is None:
+                await interaction.response.send_message(f"❌ 알 수 없는 서버입니다: `{서버}` ({', '.join(REALMS)})", ephemeral=True)
+                return
+            
+            guild_id = interaction.guild_id
+            if guild_id not in self.merchant_channels:
+                await interaction.response.send_message("❌ 먼저 `/알림설정`으로 알림 채널을 설정해주세요.", ephemeral=True)
+                return
+            
+            # 서버 설정은 구독 저장소 서버별 설정에 저장 (쓰기 지연 저장)
+            self.merchant_channels.set_setting(guild_id, REALM_SETTING, realm)
+            
+            embed = discord.Embed(
+                title="✅ 로스트아크 서버 설정 완료",
+                description=f"이제 **{realm}** 떠돌이상인 알림을 받고, 명령어도 {realm} 기준으로 보여줍니다.",
+                color=0x00ff00,
+                timestamp=datetime.now()
+            )
+            embed.set_footer(text="통합 봇 | 서버 설정")
+            await interaction.response.send_message(embed=embed)
+            
+            print(f"✅ 로스트아크 서버 설정: {interaction.guild.name} → {realm}")
+        
+        @set_notification_channel.autocomplete('서버')
+        @set_realm.autocomplete('서버')
+        async def setting_realm_autocomplete(interaction: discord.Interaction, current: str) -> List[app_commands.Choice[str]]:
+            """로스트아크 서버 이름 자동완성"""
+            return self.realm_choices(current)
         
         @self.bot.tree.command(name="알림해제", description="떠돌이상인 자동 알림을 해제합니다")
         async def remove_notification_channel(interaction: discord.Interaction):
@@ -944,6 +1442,12 @@ class IntegratedLostArkBot:
                         inline=False
                     )
                     
+                    embed.add_field(
+                        name="🌐 로스트아크 서버",
+                        value=f"**{self.guild_realm(guild_id)}** (`/서버설정`으로 변경)",
+                        inline=False
+                    )
+                    
                     embed.add_field(
                         name="📊 등록된 서버 수",
                         value=f"현재 **{len(self.merchant_channels)}개** 서버에서 알림을 사용 중입니다.",
@@ -975,6 +1479,163 @@ class IntegratedLostArkBot:
             embed.set_footer(text="통합 봇 | 알림 상태 확인")
             await interaction.response.send_message(embed=embed)
         
+        @self.bot.tree.command(name="봇상태", description="봇 캐시/API 사용 현황을 확인합니다")
+        async def bot_status(interaction: discord.Interaction):
+            """봇 상태 확인 명령어"""
+            embed = discord.Embed(
+                title="📊 봇 상태",
+                color=0x00ff00,
+                timestamp=datetime.now()
+            )
+            
+            cache_stats = self.character_cache.get_stats()
+            embed.add_field(
+                name="🗂️ 캐릭터 캐시",
+                value=(
+                    f"적중률: **{cache_stats['hit_rate'] * 100:.1f}%**\n"
+                    f"적중 {cache_stats['hits']} / 없는 캐릭터 {cache_stats['negative_hits']} / "
+                    f"이전 값 {cache_stats['stale_hits']} / 미스 {cache_stats['misses']}\n"
+                    f"항목 {cache_stats['size']}/{cache_stats['maxsize']}, "
+                    f"LRU 제거 {cache_stats['evictions']}, 만료 {cache_stats['expirations']}, "
+                    f"백그라운드 갱신 {cache_stats['refreshes']}"
+                ),
+                inline=False
+            )
+            
+            if self.lostark_api:
+                api_stats = self.lostark_api.get_stats()
+                embed.add_field(
+                    name="⚔️ 로스트아크 API",
+                    value=(
+                        f"요청 {api_stats['requests']} / 재시도 {api_stats['retries']} / "
+                        f"429 {api_stats['rate_limited']} / 오류 {api_stats['errors']}\n"
+                        f"동시 조회 합침 {api_stats['coalesced']}회 (절약한 API 호출)\n"
+                        f"한도 대기 {api_stats['rate_limiter']['waited']}회 "
+                        f"({api_stats['rate_limiter']['total_wait']}초)"
+                    ),
+                    inline=False
+                )
+            
+            worker_stats = self.fetch_worker.get_stats()
+            last_duration = worker_stats['last_duration']
+            snapshot_stats = self.merchant_snapshots.get_stats()
+            embed.add_field(
+                name="📍 떠돌이상인 수집",
+                value=(
+                    f"수집 {worker_stats['calls']}회 / 합쳐진 요청 {worker_stats['shared']}회 / "
+                    f"타임아웃 {worker_stats['timeouts']}회\n"
+                    f"마지막 수집 시간: {f'{last_duration:.1f}초' if last_duration is not None else '없음'}\n"
+                    f"스냅샷 v{snapshot_stats['version']} ({snapshot_stats['merchants']}명, "
+                    f"아이템 {snapshot_stats['items']}개, {snapshot_stats['fetched_at'] or '수집 전'})\n"
+                    f"서버별 상인: " + " / ".join(
+                        f"{realm} {stats['merchants']}" for realm, stats in self.realm_snapshots.get_stats().items()
+                    )
+                ),
+                inline=False
+            )
+            
+            search_stats = self.item_index.get_stats()
+            embed.add_field(
+                name="🔍 아이템 검색 인덱스",
+                value=(
+                    f"아이템 {search_stats['names']}개 / n-gram {search_stats['grams']}개 / 갱신 {search_stats['syncs']}회\n"
+                    f"검색 {search_stats['queries']}회, 평균 "
+                    f"{search_stats['avg_query_us'] if search_stats['avg_query_us'] is not None else '-'}µs"
+                ),
+                inline=False
+            )
+            
+            history_stats = self.merchant_history.get_stats()
+            embed.add_field(
+                name="🗄️ 상인 기록",
+                value=(
+                    f"스냅샷 {history_stats['snapshots']}개 / 등장 주기 {history_stats['cycles']}회 / "
+                    f"아이템 {history_stats['items']}종\n"
+                    f"이번 실행: 추가 {history_stats['appended']}회, 같은 내용 생략 {history_stats['skipped']}회, 마지막 저장 "
+                    f"{history_stats['last_append_ms'] if history_stats['last_append_ms'] is not None else '-'}ms"
+                ),
+                inline=False
+            )
+            
+            forecast_stats = self.item_forecaster.get_stats()
+            embed.add_field(
+                name="🎲 등장 확률 표",
+                value=(
+                    f"지역 {forecast_stats['regions']}개 / (지역, 아이템) {forecast_stats['pairs']}개 / "
+                    f"판매 목록 {forecast_stats['pools']}개 지역\n"
+                    f"스냅샷 반영 {forecast_stats['observations']}회 / 확률 요청 {forecast_stats['estimates']}회"
+                ),
+                inline=False
+            )
+            
+            autocomplete_stats = self.autocomplete.get_stats()
+            embed.add_field(
+                name="⌨️ 자동완성",
+                value=(
+                    f"아이템 {autocomplete_stats['names'].get('items', 0)}개 / 지역 {autocomplete_stats['names'].get('regions', 0)}개 / "
+                    f"NPC {autocomplete_stats['names'].get('npcs', 0)}개 (트라이 {autocomplete_stats['builds']}회 생성)\n"
+                    f"요청 {autocomplete_stats['queries']}회, p99 "
+                    f"{autocomplete_stats['p99_us'] if autocomplete_stats['p99_us'] is not None else '-'}µs"
+                ),
+                inline=False
+            )
+            
+            render_stats = self.embed_cache.get_stats()
+            embed.add_field(
+                name="🖼️ embed 캐시",
+                value=(
+                    f"재사용 {render_stats['hits']}회 / 렌더링 {render_stats['renders']}회 "
+                    f"(재사용률 {render_stats['hit_rate'] * 100:.1f}%)\n"
+                    f"평균 렌더링 {render_stats['avg_render_ms'] if render_stats['avg_render_ms'] is not None else '-'}ms"
+                ),
+                inline=False
+            )
+            
+            dispatch_stats = self.notification_dispatcher.get_stats()
+            last_fanout = dispatch_stats['last_fanout']
+            send_p95 = dispatch_stats['send_p95']
+            embed.add_field(
+                name="📨 알림 전송",
+                value=(
+                    f"성공 {dispatch_stats['sent']} / 실패 {dispatch_stats['failed']} "
+                    f"(삭제된 채널 {dispatch_stats['permanent_failures']}) / 재시도 {dispatch_stats['retries']} / "
+                    f"429 {dispatch_stats['rate_limited']}\n"
+                    f"전송 p95: {f'{send_p95 * 1000:.0f}ms' if send_p95 is not None else '없음'}"
+                    + (f" / 마지막 알림 {last_fanout['targets']}개 서버 {last_fanout['duration']}초"
+                       if last_fanout else "")
+                ),
+                inline=False
+            )
+            
+            queue_stats = self.notification_outbox.get_stats()
+            store_stats = self.merchant_channels.get_stats()
+            embed.add_field(
+                name="📬 알림 대기열",
+                value=(
+                    f"대기 {queue_stats['depth']}건 / 포기 {queue_stats['failed']}건 / "
+                    f"중복 무시 {queue_stats['duplicates']}건 / 재시작 후 복구 {queue_stats['recovered']}건\n"
+                    f"전송 속도 {queue_stats['drain_rate']}건/초 (최근 1분)\n"
+                    f"알림 채널 {store_stats['subscriptions']}개 (저장 대기 {store_stats['pending_writes']}건, "
+                    f"저장 {store_stats['flushes']}회)"
+                ),
+                inline=False
+            )
+            
+            scheduler_stats = self.merchant_scheduler.get_stats()
+            next_wakeup = scheduler_stats['next_wakeup']
+            by_reason = scheduler_stats['by_reason']
+            embed.add_field(
+                name="⏰ 떠돌이상인 체크 스케줄",
+                value=(
+                    f"체크 {scheduler_stats['checks']}회 (경계 {by_reason.get('boundary', 0)} / "
+                    f"재확인 {by_reason.get('verify', 0)} / 고정 간격 {by_reason.get('fallback', 0)})\n"
+                    f"다음 확인: {next_wakeup.strftime('%H:%M:%S') if next_wakeup else '없음'}"
+                ),
+                inline=False
+            )
+            
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+        
         @self.bot.tree.command(name="도움말", description="봇의 모든 명령어를 확인합니다")
         async def help_command(interaction: discord.Interaction):
             """도움말 명령어"""
@@ -987,13 +1648,13 @@ class IntegratedLostArkBot:
             
             embed.add_field(
                 name="📍 떠돌이상인 명령어",
-                value="`/떠상` - 현재 활성 상인 확인\n`/새로고침` - 데이터 새로고침\n`/떠상검색` - 아이템으로 상인 검색",
+                value="`/떠상` - 현재 활성 상인 확인\n`/새로고침` - 데이터 새로고침\n`/떠상검색` - 아이템으로 상인 검색\n`/상인검색` - 지역/NPC로 상인 검색\n`/출현기록` - 아이템 지역별 누적 등장 기록\n`/확률` - 이번 주기 아이템 지역별 등장 확률",
                 inline=False
             )
             
             embed.add_field(
                 name="🔔 알림 설정 명령어",
-                value="`/알림설정` - 현재 채널을 알림 채널로 설정 (관리자)\n`/알림해제` - 자동 알림 해제 (관리자)\n`/알림상태` - 알림 설정 상태 확인",
+                value="`/알림설정` - 현재 채널을 알림 채널로 설정 (관리자)\n`/서버설정` - 알림/명령어 기본 로스트아크 서버 설정 (관리자)\n`/알림해제` - 자동 알림 해제 (관리자)\n`/알림상태` - 알림 설정 상태 확인\n`/봇상태` - 캐시/API 사용 현황",
                 inline=False
             )
             
@@ -1204,9 +1865,16 @@ class IntegratedLostArkBot:
     def run(self):
         """봇 실행"""
         try:
-            self.bot.run(self.discord_token)
+            run_bot(self.bot, self.discord_token, self.lostark_api)
         except Exception as e:
             print(f"❌ 통합 봇 실행 오류: {e}")
+        finally:
+            self.fetch_worker.close()
+            self.merchant_fetcher.close()
+            self.merchant_channels.close()  # 아직 저장 안 된 알림 채널 변경 저장
+            self.merchant_history.close()
+            self.notification_outbox.stop()
+            self.notification_queue.close()  # 못 보낸 알림은 다음 시작 때 이어서 전송
 
 def main():
     """메인 함수"""
@@ -1243,10 +1911,14 @@ def main():
     print(f"   - 데이터 새로고침: 30분마다")
     print(f"   - 다중 서버 지원: 활성화")
     print(f"\n사용 가능한 명령어:")
-    print(f"   - /알림설정 : 현재 채널을 알림 채널로 설정 (관리자)")
-    print(f"   - /떠상 : 현재 활성 상인 확인")
+    print(f"   - /알림설정 서버 : 현재 채널을 알림 채널로 설정 (관리자)")
+    print(f"   - /서버설정 서버 : 알림/명령어 기본 로스트아크 서버 설정 (관리자)")
+    print(f"   - /떠상 서버 : 현재 활성 상인 확인")
     print(f"   - /새로고침 : 데이터 새로고침")
     print(f"   - /떠상검색 아이템명 : 아이템으로 상인 검색")
+    print(f"   - /상인검색 지역 상인 : 지역/NPC로 상인 검색")
+    print(f"   - /출현기록 아이템명 지역 : 아이템 지역별 누적 등장 기록")
+    print(f"   - /확률 아이템명 지역 : 이번 주기 아이템 지역별 등장 확률")
     if lostark_api_key:
         print(f"   - /캐릭터정보 캐릭터명 : 캐릭터 정보 조회")
         print(f"   - /원정대정보 캐릭터명 : 원정대 정보 조회")
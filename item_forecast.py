@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+"""
+떠돌이 상인 아이템 등장 확률 추정
+- 스냅샷마다 등장 주기별로 (지역, 아이템) 첫 등장만 세는 카운트 표를 갱신 (지역 방문 수 / 지역 × 아이템 등장 수)
+- 지역 판매 목록(kloa scheme regions[].items, MerchantParser.search_item이 보는 목록)을 사전 확률로 사용
+  - default 아이템: 항상 판매
+  - 나머지: (방문당 평균 랜덤 아이템 수) / (랜덤 후보 수)
+- 추정치 = (등장 수 + M × 사전 확률) / (방문 수 + M)   (관측이 적으면 사전 확률 쪽으로)
+- /확률 요청은 표 조회 + 계산만 (지역 수십 개 수준), 과거 페이로드를 다시 읽지 않음
+"""
+
+from datetime import datetime
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from merchant_history import cycle_start
+
+PRIOR_WEIGHT = 2.0      # 사전 확률을 관측 몇 번만큼으로 볼지 (M)
+
+
+class Forecast(NamedTuple):
+    """지역별 등장 확률 추정"""
+    region: str
+    probability: float
+    appearances: int        # 관측한 등장 주기 수
+    visits: int             # 이 지역 상인을 관측한 주기 수
+    status: str             # estimate / selling(지금 판매 중) / absent(이번 주기 이미 없음) / off(이번 주기 등장 안 함)
+
+
+class ItemForecaster:
+    """지역 × 아이템 등장 카운트 표 (스냅샷마다 증분 갱신)"""
+
+    def __init__(self, prior_weight: float = PRIOR_WEIGHT):
+        self.prior_weight = prior_weight
+
+        self.visits: Dict[str, int] = {}                       # 지역 → 관측한 주기 수
+        self.counts: Dict[str, Dict[str, int]] = {}            # 지역 → 아이템 → 등장 주기 수
+        self.item_regions: Dict[str, Set[str]] = {}            # 아이템 → 등장한 적 있는 지역
+
+        # 지역 판매 목록 (scheme) - 스케줄 로드 스레드에서 통째로 교체
+        self.pools: Dict[str, Tuple[str, ...]] = {}
+        self.defaults: Dict[str, FrozenSet[str]] = {}
+        self.groups: Dict[str, int] = {}
+        self.pool_regions: Dict[str, FrozenSet[str]] = {}      # 아이템 → 판매 목록에 있는 지역
+
+        # 현재 주기 상태
+        self._cycle: Optional[datetime] = None
+        self._seen: Set[Tuple[str, str]] = set()
+        self._seen_regions: Set[str] = set()
+        self._current: Dict[str, FrozenSet[str]] = {}           # 이번 주기에 관측한 지역 → 아이템
+
+        # 통계
+        self.observations = 0
+        self.estimates = 0
+
+    # ------------------------------------------------------------------
+    # 카운트 갱신
+    # ------------------------------------------------------------------
+
+    def set_pools(self, regions: Iterable[Dict]):
+        """kloa scheme 지역 목록으로 판매 후보 / default 아이템 / 그룹 교체"""
+        pools, defaults, groups, pool_regions = {}, {}, {}, {}
+        for region in regions:
+            name = region.get('name')
+            if not name:
+                continue
+            items = [item for item in region.get('items', []) if not item.get('hidden', False)]
+            pools[name] = tuple(item['name'] for item in items)
+            defaults[name] = frozenset(item['name'] for item in items if item.get('default', False))
+            if region.get('group') is not None:
+                groups[name] = region['group']
+            for item in items:
+                pool_regions.setdefault(item['name'], set()).add(name)
+        pool_regions = {item: frozenset(names) for item, names in pool_regions.items()}
+        self.pools, self.defaults, self.groups, self.pool_regions = pools, defaults, groups, pool_regions
+
+    def load(self, visits: Dict[str, int], appearances: Iterable[Tuple[str, str, int]]):
+        """저장된 기록으로 카운트 표 초기화 (시작할 때 한 번)"""
+        for region, count in visits.items():
+            self.visits[region] = self.visits.get(region, 0) + count
+        for region, item, count in appearances:
+            region_counts = self.counts.setdefault(region, {})
+            region_counts[item] = region_counts.get(item, 0) + count
+            self.item_regions.setdefault(item, set()).add(region)
+
+    def observe(self, merchants: Iterable[Dict], observed_at: Optional[datetime] = None) -> int:
+        """
+        스냅샷 반영 (MerchantSnapshot 또는 상인 목록)
+        Returns:
+            새로 센 (지역, 아이템) 등장 수
+        """
+        observed_at = observed_at or getattr(merchants, 'fetched_at', None) or datetime.now()
+        cycle = cycle_start(observed_at)
+        if cycle != self._cycle:
+            self._cycle = cycle
+            self._seen, self._seen_regions, self._current = set(), set(), {}
+
+        added = 0
+        for merchant in merchants:
+            region = merchant['region_name']
+            names = frozenset(item if isinstance(item, str) else item['name'] for item in merchant['items'])
+            self._current[region] = self._current.get(region, frozenset()) | names
+            if region not in self._seen_regions:
+                self._seen_regions.add(region)
+                self.visits[region] = self.visits.get(region, 0) + 1
+            region_counts = self.counts.setdefault(region, {})
+            for name in names:
+                if (region, name) in self._seen:
+                    continue
+                self._seen.add((region, name))
+                region_counts[name] = region_counts.get(name, 0) + 1
+                self.item_regions.setdefault(name, set()).add(region)
+                added += 1
+
+        self.observations += 1
+        return added
+
+    # ------------------------------------------------------------------
+    # 추정
+    # ------------------------------------------------------------------
+
+    def prior(self, region: str, item: str) -> float:
+        """판매 목록 기준 사전 확률"""
+        pool = self.pools.get(region)
+        if not pool or item not in pool:
+            return 0.0
+        defaults = self.defaults.get(region, frozenset())
+        if item in defaults:
+            return 1.0
+        random_pool = len(pool) - len(defaults)
+        visits = self.visits.get(region, 0)
+        if visits:
+            observed = sum(count for name, count in self.counts.get(region, {}).items() if name not in defaults)
+            slots = observed / visits
+        else:
+            slots = 1.0
+        return min(1.0, slots / random_pool) if random_pool else 0.0
+
+    def estimate(self, item: str, region: Optional[str] = None, now: Optional[datetime] = None,
+                 active_groups: Optional[FrozenSet[int]] = None) -> List[Forecast]:
+        """
+        이번 주기 등장 확률 (높은 순)
+        Args:
+            region: 특정 지역만 (None이면 등장했거나 판매 목록에 있는 모든 지역)
+            now: 이번 주기 판단 기준 시각 (이미 관측한 지역은 확정값)
+            active_groups: 이번 주기에 등장하는 그룹 (모르면 None)
+        """
+        now = now or datetime.now()
+        current = self._current if self._cycle == cycle_start(now) else {}
+        if region:
+            regions = [region]
+        else:
+            regions = sorted(self.item_regions.get(item, set()) | self.pool_regions.get(item, frozenset()))
+        groups = self.groups
+
+        forecasts = []
+        for name in regions:
+            visits = self.visits.get(name, 0)
+            appearances = self.counts.get(name, {}).get(item, 0)
+            if name in current:
+                selling = item in current[name]
+                forecasts.append(Forecast(name, 1.0 if selling else 0.0, appearances, visits,
+                                          'selling' if selling else 'absent'))
+            elif active_groups is not None and name in groups and groups[name] not in active_groups:
+                forecasts.append(Forecast(name, 0.0, appearances, visits, 'off'))
+            else:
+                probability = (appearances + self.prior_weight * self.prior(name, item)) / (visits + self.prior_weight)
+                forecasts.append(Forecast(name, probability, appearances, visits, 'estimate'))
+
+        self.estimates += 1
+        forecasts.sort(key=lambda forecast: (-forecast.probability, -forecast.visits, forecast.region))
+        return forecasts
+
+    def get_stats(self) -> Dict:
+        """카운트 표 통계"""
+        return {
+            'regions': len(self.visits),
+            'pairs': sum(len(items) for items in self.counts.values()),
+            'pools': len(self.pools),
+            'observations': self.observations,
+            'estimates': self.estimates,
+        }
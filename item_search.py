@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+"""
+떠돌이 상인 아이템 이름 검색 인덱스
+- 아이템 이름을 정규화(NFKC 한글 조합 + 소문자 + 공백 제거)해서 2-gram(1글자 검색은 글자) 역색인 생성
+  → 부분 문자열 검색은 검색어 n-gram 목록의 교집합 후보만 확인 (전체 아이템 선형 탐색 없음)
+- 정렬된 이름 목록 + 이진 탐색으로 접두어 검색 (슬래시 명령어 자동완성)
+- 스냅샷이 바뀌면 이전 스냅샷과의 diff만 반영해서 갱신 (등장/사라진 상인, 바뀐 아이템)
+- 초성(`ㅈㅈㄹ`) / 오타 허용 검색은 hangul_search.HangulNameIndex, search()가 일치 종류별로 순위를 매김
+- catalog로 넘긴 이름(기본 아이템 목록)은 상인이 없어도 항상 색인에 남음
+"""
+
+import bisect
+import time
+import unicodedata
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from hangul_search import HangulNameIndex, is_choseong_query
+from merchant_diff import MerchantKey, diff_merchants, item_names, merchant_key
+
+# 기본 아이템 목록 이름을 붙잡아 두는 키 (실제 상인 키와 겹치지 않음)
+CATALOG_KEY: MerchantKey = ('*', '기본 아이템 목록')
+
+# 일치 종류별 순위 (작을수록 먼저)
+MATCH_RANK = {'exact': 0, 'prefix': 1, 'substring': 2, 'choseong': 3, 'fuzzy': 4}
+
+
+def normalize_text(text: str) -> str:
+    """검색용 정규화 (NFKC로 자모 조합/전각 문자 통일, 소문자, 공백 제거)"""
+    return ''.join(unicodedata.normalize('NFKC', text).casefold().split())
+
+
+def ngrams(text: str) -> Set[str]:
+    """2-gram 집합 (1글자면 글자 자체)"""
+    if len(text) < 2:
+        return {text} if text else set()
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+class SearchHit(NamedTuple):
+    """search() 결과 한 건"""
+    name: str
+    match: str          # exact / prefix / substring / choseong / fuzzy
+    position: int = 0   # 이름에서 일치한 위치 (fuzzy는 0)
+    distance: int = 0   # 자모 편집 거리 (fuzzy만)
+
+
+class ItemSearchIndex:
+    """스냅샷 아이템 이름 역색인 (sync()로 스냅샷에 맞춘 뒤 검색)"""
+
+    def __init__(self, catalog: Iterable[str] = ()):
+        self.version: Optional[int] = None
+        self._merchant_index: Dict = {}                    # 마지막으로 반영한 스냅샷의 (지역, NPC) 인덱스
+
+        self._holders: Dict[str, Set[MerchantKey]] = {}    # 아이템 이름 → 파는 상인 키
+        self._normalized: Dict[str, str] = {}              # 아이템 이름 → 정규화된 이름
+        self._grams: Dict[str, Set[str]] = {}              # n-gram / 글자 → 아이템 이름
+        self._sorted: List[Tuple[str, str]] = []           # (정규화된 이름, 이름) 정렬 목록 (접두어 검색)
+        self._hangul = HangulNameIndex()                   # 초성 / 자모 색인
+
+        # 통계
+        self.syncs = 0
+        self.names_added = 0
+        self.names_removed = 0
+        self.queries = 0
+        self.query_time = 0.0
+
+        self.catalog_size = 0
+        for name in catalog:
+            self._hold(name, CATALOG_KEY)
+            self.catalog_size += 1
+
+    # ------------------------------------------------------------------
+    # 스냅샷 반영
+    # ------------------------------------------------------------------
+
+    def sync(self, snapshot) -> 'ItemSearchIndex':
+        """스냅샷과 다르면 바뀐 부분만 반영 (MerchantSnapshot 또는 None)"""
+        if snapshot is None:
+            if self.version is not None:
+                self._apply(diff_merchants(self._merchant_index, None))
+                self._merchant_index, self.version = {}, None
+            return self
+
+        if snapshot.version != self.version:
+            self._apply(diff_merchants(self._merchant_index, snapshot.index))
+            self._merchant_index, self.version = snapshot.index, snapshot.version
+            self.syncs += 1
+        return self
+
+    def _apply(self, changes):
+        for merchant in changes.removed:
+            key = merchant_key(merchant)
+            for name in item_names(merchant):
+                self._release(name, key)
+        for merchant in changes.added:
+            key = merchant_key(merchant)
+            for name in item_names(merchant):
+                self._hold(name, key)
+        for change in changes.changed:
+            for name in change.removed_items:
+                self._release(name, change.key)
+            for name in change.added_items:
+                self._hold(name, change.key)
+
+    def _hold(self, name: str, key: MerchantKey):
+        holders = self._holders.get(name)
+        if holders is not None:
+            holders.add(key)
+            return
+
+        self._holders[name] = {key}
+        normalized = self._normalized[name] = normalize_text(name)
+        for gram in ngrams(normalized) | set(normalized):
+            self._grams.setdefault(gram, set()).add(name)
+        bisect.insort(self._sorted, (normalized, name))
+        self._hangul.add(name, normalized)
+        self.names_added += 1
+
+    def _release(self, name: str, key: MerchantKey):
+        holders = self._holders.get(name)
+        if holders is None:
+            return
+        holders.discard(key)
+        if holders:
+            return
+
+        del self._holders[name]
+        normalized = self._normalized.pop(name)
+        for gram in ngrams(normalized) | set(normalized):
+            names = self._grams.get(gram)
+            if names is not None:
+                names.discard(name)
+                if not names:
+                    del self._grams[gram]
+        position = bisect.bisect_left(self._sorted, (normalized, name))
+        if position < len(self._sorted) and self._sorted[position] == (normalized, name):
+            del self._sorted[position]
+        self._hangul.remove(name)
+        self.names_removed += 1
+
+    # ------------------------------------------------------------------
+    # 검색
+    # ------------------------------------------------------------------
+
+    def _candidates(self, query: str) -> Set[str]:
+        """검색어의 n-gram을 모두 가진 이름 (적은 목록부터 교집합)"""
+        postings = []
+        for gram in (ngrams(query) if len(query) >= 2 else {query}):
+            names = self._grams.get(gram)
+            if not names:
+                return set()
+            postings.append(names)
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for names in postings[1:]:
+            candidates &= names
+            if not candidates:
+                break
+        return candidates
+
+    def _substring_names(self, normalized: str) -> Iterable[str]:
+        candidates = self._candidates(normalized)
+        if len(normalized) > 2:  # 1~2글자는 색인 목록 자체가 정확한 결과
+            return [name for name in candidates if normalized in self._normalized[name]]
+        return candidates
+
+    def match_names(self, query: str) -> List[str]:
+        """검색어를 포함하는 아이템 이름 (정규화 기준 부분 문자열, 이름순)"""
+        started = time.perf_counter()
+        normalized = normalize_text(query)
+        if not normalized:
+            return []
+        names = sorted(self._substring_names(normalized))
+        self.queries += 1
+        self.query_time += time.perf_counter() - started
+        return names
+
+    def search(self, query: str, limit: int = 10) -> List[SearchHit]:
+        """
+        순위 검색: 정확히 일치 > 접두어 > 부분 문자열 > 초성 > 오타 허용(자모 편집 거리)
+        같은 순위 안에서는 편집 거리, 일치 위치, 이름 길이 순
+        오타 허용 검색은 앞의 결과가 limit보다 적을 때만 실행
+        """
+        started = time.perf_counter()
+        normalized = normalize_text(query)
+        if not normalized:
+            return []
+
+        hits: Dict[str, SearchHit] = {}
+        for name in self._substring_names(normalized):
+            text = self._normalized[name]
+            position = text.find(normalized)
+            match = 'exact' if text == normalized else 'prefix' if position == 0 else 'substring'
+            hits[name] = SearchHit(name, match, position)
+        if is_choseong_query(normalized):
+            for name, position in self._hangul.choseong_matches(normalized, self._normalized):
+                hits.setdefault(name, SearchHit(name, 'choseong', position))
+        if len(hits) < limit:
+            for name, distance in self._hangul.fuzzy_matches(normalized):
+                hits.setdefault(name, SearchHit(name, 'fuzzy', 0, distance))
+
+        ranked = sorted(hits.values(), key=lambda hit: (
+            MATCH_RANK[hit.match], hit.distance, hit.position, len(self._normalized[hit.name]), hit.name
+        ))
+        self.queries += 1
+        self.query_time += time.perf_counter() - started
+        return ranked[:limit]
+
+    def prefix_names(self, prefix: str, limit: int = 25) -> List[str]:
+        """정규화 기준 접두어로 시작하는 아이템 이름"""
+        normalized = normalize_text(prefix)
+        position = bisect.bisect_left(self._sorted, (normalized, ''))
+        names = []
+        for key, name in self._sorted[position:]:
+            if not key.startswith(normalized) or len(names) >= limit:
+                break
+            names.append(name)
+        return names
+
+    def autocomplete(self, text: str, limit: int = 25) -> List[str]:
+        """자동완성 후보 (search() 순위: 접두어 일치 먼저, 그다음 부분 문자열 / 초성 / 오타)"""
+        if not normalize_text(text):
+            return [name for _, name in self._sorted[:limit]]
+        return [hit.name for hit in self.search(text, limit)]
+
+    def find(self, snapshot, query: str, fuzzy: bool = True) -> List[Tuple[Dict, Dict]]:
+        """
+        검색어를 포함하는 아이템을 파는 상인 (스냅샷 순서)
+        부분 문자열로 찾은 아이템이 없으면 초성 / 오타 허용 검색 결과로 다시 찾음 (fuzzy=False면 안 함)
+        Returns:
+            (상인, 처음 일치한 아이템) 목록
+        """
+        self.sync(snapshot)
+        names = set(self.match_names(query))
+        if not names and fuzzy:
+            names = {hit.name for hit in self.search(query, limit=25)}
+        if not names or snapshot is None:
+            return []
+
+        keys = set()
+        for name in names:
+            keys |= self._holders[name]
+
+        results = []
+        for merchant in snapshot.merchants:
+            if merchant_key(merchant) not in keys:
+                continue
+            for item in merchant['items']:
+                if (item if isinstance(item, str) else item['name']) in names:
+                    results.append((merchant, item))
+                    break
+        return results
+
+    def get_stats(self) -> Dict:
+        """검색 인덱스 통계"""
+        return {
+            'version': self.version,
+            'names': len(self._holders),
+            'grams': len(self._grams),
+            'hangul_grams': self._hangul.gram_count,
+            'catalog': self.catalog_size,
+            'syncs': self.syncs,
+            'names_added': self.names_added,
+            'names_removed': self.names_removed,
+            'queries': self.queries,
+            'avg_query_us': round(self.query_time / self.queries * 1_000_000, 1) if self.queries else None,
+        }
@@ -4,12 +4,13 @@ KLOA 웹사이트에서 JSON 데이터 추출 및 파싱
 """
 
 import requests
-import json
 import re
-from bs4 import BeautifulSoup
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 
+from next_data_extractor import find_next_data_slice, extract_next_data
+from next_data_client import NextDataClient
+
 class KLOAJSONParser:
     """KLOA 웹사이트에서 JSON 데이터를 추출하고 파싱하는 클래스"""
     
@@ -23,15 +24,20 @@ class KLOAJSONParser:
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
         }
+        self.next_data_client = NextDataClient(headers=self.headers)
     
     def fetch_page_html(self) -> Optional[str]:
         """KLOA 상인 페이지 HTML 가져오기"""
         try:
             print("🌐 KLOA 상인 페이지 접속 중...")
-            response = requests.get(self.base_url, headers=self.headers, timeout=15)
+            # 조건부 요청 (304면 이전 본문 재사용)
+            response = self.next_data_client.http.get(self.base_url, timeout=15)
             response.raise_for_status()
             
-            print(f"✅ 응답 성공: {response.status_code}")
+            if response.not_modified:
+                print("✅ 변경 없음 (304), 이전 페이지 사용")
+            else:
+                print(f"✅ 응답 성공: {response.status_code}")
             return response.text
             
         except requests.exceptions.RequestException as e:
@@ -41,47 +47,45 @@ class KLOAJSONParser:
     def extract_next_data_json(self, html_content: str) -> Optional[Dict]:
         """HTML에서 __NEXT_DATA__ JSON 추출"""
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
-            # __NEXT_DATA__ 스크립트 태그 찾기
-            next_data_script = soup.find('script', {'id': '__NEXT_DATA__'})
-            
-            if not next_data_script:
-                print("❌ __NEXT_DATA__ 스크립트를 찾을 수 없습니다.")
-                return None
+            # 전체 HTML 트리를 만들지 않고 __NEXT_DATA__ 구간만 찾아서 파싱
+            json_data = extract_next_data(html_content)
             
-            # JSON 텍스트 추출
-            json_text = next_data_script.string
-            if not json_text:
-                print("❌ 스크립트 내용이 비어있습니다.")
+            if not json_data:
+                if find_next_data_slice(html_content) is None:
+                    print("❌ __NEXT_DATA__ 스크립트를 찾을 수 없습니다.")
+                else:
+                    print("❌ JSON 파싱 실패")
                 return None
             
-            # JSON 파싱
-            json_data = json.loads(json_text)
             print("✅ JSON 데이터 추출 성공!")
-            
             return json_data
             
-        except json.JSONDecodeError as e:
-            print(f"❌ JSON 파싱 실패: {e}")
-            return None
         except Exception as e:
             print(f"❌ JSON 추출 중 오류: {e}")
             return None
     
     def get_merchant_data(self) -> Optional[Dict]:
         """상인 데이터 가져오기 (전체 프로세스)"""
-        # 1. HTML 가져오기
+        # 1. Next.js 데이터 라우트 직접 호출 (HTML 전체 대신 JSON만)
+        try:
+            page_data = self.next_data_client.fetch('merchant')
+            if page_data:
+                print(f"✅ 데이터 라우트 사용 (buildId: {self.next_data_client.build_id})")
+                return page_data['pageProps']['initialData']
+        except (requests.exceptions.RequestException, ValueError, KeyError) as e:
+            print(f"⚠️ 데이터 라우트 실패, HTML로 대체: {e}")
+        
+        # 2. HTML 가져오기
         html_content = self.fetch_page_html()
         if not html_content:
             return None
         
-        # 2. JSON 추출
+        # 3. JSON 추출
         json_data = self.extract_next_data_json(html_content)
         if not json_data:
             return None
         
-        # 3. 상인 데이터 추출
+        # 4. 상인 데이터 추출
         try:
             merchant_data = json_data['props']['pageProps']['initialData']
             print(f"✅ 상인 데이터 추출 성공!")
@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+"""
+로스트아크 Open API 비동기 클라이언트
+- aiohttp 세션 하나로 keep-alive 연결 재사용 (요청마다 HTTPS 핸드셰이크 없음)
+- 요청별 타임아웃
+- 지터를 넣은 지수 백오프 재시도 (429 / 5xx / 네트워크 오류)
+- API 키 한도(분당 100회)에 맞춘 토큰 버킷으로 몰리는 요청은 대기열에서 순서대로 처리
+- 같은 캐릭터를 동시에 조회하면 한 번만 요청하고 결과를 공유 (single-flight)
+"""
+
+import asyncio
+import random
+import urllib.parse
+from typing import Any, Dict, List, Optional
+
+import aiohttp
+
+from rate_limiter import AsyncTokenBucket
+from single_flight import SingleFlight
+from ttl_lru_cache import normalize_character_name
+
+# 재시도할 HTTP 상태 코드
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+
+class LostArkAPIError(Exception):
+    """API 호출 실패 (캐릭터 없음/404가 아닌 오류)"""
+
+
+class LostArkCharacterAPI:
+    """로스트아크 캐릭터 정보 조회 API 클래스 (봇 전체에서 하나를 공유)"""
+
+    def __init__(self, api_key: str, timeout: float = 10.0, max_retries: int = 3,
+                 requests_per_minute: int = 100, burst: int = 10, pool_size: int = 10):
+        """
+        초기화
+        Args:
+            api_key: 로스트아크 Open API 키
+            timeout: 요청 하나의 전체 타임아웃(초)
+            max_retries: 실패시 재시도 횟수
+            requests_per_minute: API 키의 분당 요청 한도
+            burst: 한 번에 몰아서 보낼 수 있는 요청 수
+            pool_size: 유지할 최대 연결 수
+        """
+        self.api_key = api_key
+        self.base_url = "https://developer-lostark.game.onstove.com"
+        self.headers = {
+            'accept': 'application/json',
+            'authorization': f'bearer {api_key}'
+        }
+
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.max_retries = max_retries
+        self.pool_size = pool_size
+        self.rate_limiter = AsyncTokenBucket.per_minute(requests_per_minute, burst)
+
+        # 세션은 이벤트 루프 안에서 처음 요청할 때 생성
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        # 같은 조회가 진행 중이면 그 결과를 같이 기다림 (캐시 없이도 동작)
+        self._flight = SingleFlight()
+
+        self.stats = {
+            'requests': 0,
+            'retries': 0,
+            'rate_limited': 0,   # 서버에서 429를 받은 횟수
+            'errors': 0,
+        }
+
+    async def get_character_info(self, character_name: str, raise_errors: bool = False) -> Optional[Dict]:
+        """
+        캐릭터 기본 정보(프로필) 조회
+        Args:
+            raise_errors: True면 캐릭터 없음(None)과 구분되도록 오류시 LostArkAPIError 발생
+        """
+        encoded_name = urllib.parse.quote(character_name)
+        return await self._flight.do(
+            ('profiles', normalize_character_name(character_name), raise_errors),
+            lambda: self._get_json(f"/armories/characters/{encoded_name}/profiles", "캐릭터 정보", raise_errors)
+        )
+
+    async def get_character_siblings(self, character_name: str, raise_errors: bool = False) -> Optional[List[Dict]]:
+        """
+        캐릭터 원정대 정보 조회
+        Args:
+            raise_errors: True면 캐릭터 없음(None)과 구분되도록 오류시 LostArkAPIError 발생
+        """
+        encoded_name = urllib.parse.quote(character_name)
+        return await self._flight.do(
+            ('siblings', normalize_character_name(character_name), raise_errors),
+            lambda: self._get_json(f"/characters/{encoded_name}/siblings", "원정대 정보", raise_errors)
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """요청/재시도/대기 통계"""
+        stats = dict(self.stats)
+        stats['coalesced'] = self._flight.shared   # 합쳐져서 절약한 API 호출 수
+        stats['in_flight'] = self._flight.get_stats()['in_flight']
+        stats['rate_limiter'] = self.rate_limiter.get_stats()
+        return stats
+
+    async def close(self):
+        """세션 종료"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """공유 세션 반환 (없거나 닫혔으면 생성)"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.pool_size, keepalive_timeout=60, ttl_dns_cache=300)
+            self._session = aiohttp.ClientSession(headers=self.headers, timeout=self.timeout, connector=connector)
+        return self._session
+
+    async def _get_json(self, path: str, label: str, raise_errors: bool = False) -> Optional[Any]:
+        """
+        GET 요청 후 JSON 반환
+        404면 None, 인증 실패 / 재시도 소진시 None (raise_errors=True면 LostArkAPIError)
+        """
+        url = f"{self.base_url}{path}"
+
+        for attempt in range(self.max_retries + 1):
+            await self.rate_limiter.acquire()
+            self.stats['requests'] += 1
+
+            retry_after = None
+            try:
+                async with self._get_session().get(url) as response:
+                    if response.status == 200:
+                        # 없는 캐릭터는 200 + 빈 본문(null)으로 오는 경우가 있음
+                        return await response.json(content_type=None)
+
+                    if response.status == 404:
+                        return None
+
+                    if response.status == 401:
+                        print("❌ API 키 인증 실패")
+                        return self._fail("API 키 인증 실패", raise_errors)
+
+                    if response.status not in RETRYABLE_STATUSES:
+                        print(f"API 오류: {response.status}")
+                        self.stats['errors'] += 1
+                        return self._fail(f"HTTP {response.status}", raise_errors)
+
+                    if response.status == 429:
+                        self.stats['rate_limited'] += 1
+                        retry_after = self._parse_retry_after(response.headers)
+                        self.rate_limiter.pause(retry_after)
+
+                    error = f"HTTP {response.status}"
+
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+                error = f"{type(e).__name__}: {e}"
+
+            if attempt >= self.max_retries:
+                print(f"{label} 조회 오류: {error} (재시도 {self.max_retries}회 실패)")
+                self.stats['errors'] += 1
+                return self._fail(error, raise_errors)
+
+            self.stats['retries'] += 1
+            await asyncio.sleep(retry_after if retry_after is not None else self._backoff(attempt))
+
+        return None
+
+    @staticmethod
+    def _fail(message: str, raise_errors: bool) -> None:
+        """오류 처리 (raise_errors면 예외, 아니면 None)"""
+        if raise_errors:
+            raise LostArkAPIError(message)
+        return None
+
+    @staticmethod
+    def _backoff(attempt: int, base: float = 0.5, cap: float = 8.0) -> float:
+        """지수 백오프 + 전체 지터 (여러 요청이 동시에 재시도하지 않도록)"""
+        return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+    @staticmethod
+    def _parse_retry_after(headers) -> float:
+        """Retry-After 헤더(초) 해석, 없으면 1초"""
+        try:
+            return max(0.0, float(headers.get('Retry-After', 1)))
+        except (TypeError, ValueError):
+            return 1.0
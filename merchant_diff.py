@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""
+떠돌이 상인 목록 비교 (diff)
+- (지역, NPC) 키로 상인을 한 번씩만 훑어서 비교 → O(상인 수 + 아이템 수)
+- 상인마다 아이템 이름 집합과 지문(fingerprint)을 미리 계산해서 같은 상인은 지문 비교만 수행
+- 결과는 등장/사라진 상인, 상인별 추가/제거된 아이템 목록 (MerchantChangeset)
+- 봇 종류마다 다른 형식('region_name' / 'region', 아이템 dict / Item / 문자열)을 모두 받음
+"""
+
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+MerchantKey = Tuple[str, str]
+
+
+def merchant_key(merchant: Dict) -> MerchantKey:
+    """상인 식별 키 (지역, NPC)"""
+    region = merchant.get('region_name') or merchant.get('region') or ''
+    return region, merchant.get('npc_name') or ''
+
+
+def item_names(merchant: Dict) -> FrozenSet[str]:
+    """상인 아이템 이름 집합"""
+    return frozenset(item if isinstance(item, str) else item['name'] for item in merchant.get('items', []))
+
+
+class MerchantEntry:
+    """비교용으로 미리 계산해 둔 상인 정보"""
+
+    __slots__ = ('key', 'merchant', 'items', 'fingerprint')
+
+    def __init__(self, merchant: Dict):
+        self.key = merchant_key(merchant)
+        self.merchant = merchant
+        self.items = item_names(merchant)
+        self.fingerprint = hash(self.items)
+
+
+def build_merchant_index(merchants: Optional[Iterable[Dict]]) -> Dict[MerchantKey, MerchantEntry]:
+    """상인 목록 → {(지역, NPC): MerchantEntry} (데이터를 새로 받았을 때 한 번만 생성)"""
+    index: Dict[MerchantKey, MerchantEntry] = {}
+    for merchant in merchants or ():
+        entry = MerchantEntry(merchant)
+        index[entry.key] = entry
+    return index
+
+
+class MerchantChange:
+    """같은 상인의 아이템 변경"""
+
+    __slots__ = ('key', 'merchant', 'added_items', 'removed_items')
+
+    def __init__(self, key: MerchantKey, merchant: Dict, added_items: FrozenSet[str], removed_items: FrozenSet[str]):
+        self.key = key
+        self.merchant = merchant
+        self.added_items = added_items
+        self.removed_items = removed_items
+
+    def __repr__(self):
+        return f"MerchantChange({self.key}, +{sorted(self.added_items)}, -{sorted(self.removed_items)})"
+
+
+class MerchantChangeset:
+    """두 상인 목록의 차이"""
+
+    __slots__ = ('added', 'removed', 'changed')
+
+    def __init__(self, added: List[Dict], removed: List[Dict], changed: List[MerchantChange]):
+        self.added = added        # 새로 등장한 상인
+        self.removed = removed    # 사라진 상인
+        self.changed = changed    # 아이템이 바뀐 상인
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+    def summary(self) -> str:
+        """로그용 한 줄 요약"""
+        return f"등장 {len(self.added)} / 사라짐 {len(self.removed)} / 아이템 변경 {len(self.changed)}"
+
+    def __repr__(self):
+        return f"MerchantChangeset({self.summary()})"
+
+
+def diff_merchants(previous, current) -> MerchantChangeset:
+    """
+    이전/현재 상인 목록 비교
+    Args:
+        previous, current: 상인 dict 목록 또는 build_merchant_index() 결과 (None이면 빈 목록)
+    """
+    previous_index = previous if isinstance(previous, dict) else build_merchant_index(previous)
+    current_index = current if isinstance(current, dict) else build_merchant_index(current)
+
+    added, changed = [], []
+    for key, entry in current_index.items():
+        old = previous_index.get(key)
+        if old is None:
+            added.append(entry.merchant)
+        elif old.fingerprint != entry.fingerprint or old.items != entry.items:
+            changed.append(MerchantChange(key, entry.merchant, entry.items - old.items, old.items - entry.items))
+
+    removed = [entry.merchant for key, entry in previous_index.items() if key not in current_index]
+    return MerchantChangeset(added, removed, changed)
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+"""
+kloa 떠돌이 상인 페이지 DOM 한 번 훑기 (모든 서버 탭)
+- 브라우저 안에서 서버 버튼을 차례로 누르고 상인 목록이 바뀌면 바로 읽는 스크립트 하나를 실행
+  → 서버마다 click + WebDriverWait, 상인/아이템마다 find_element 왕복이 없어지고 WebDriver 호출은 한 번
+- 스크립트는 작은 JSON 문자열을 돌려줌: {서버: [[지역, NPC, [[아이템명, data-grade, 아이콘 title], ...]], ...] | null}
+  (null = 제한 시간 안에 그 서버 목록으로 바뀌지 않음)
+- 다시 그리는 도중 잠깐 빈 목록은 "상인 없음"으로 읽지 않음 → 비어 있는 상태가 EMPTY_SETTLE_SECONDS 동안 유지될 때만 인정
+- 셀렉터와 등급/타입 변환은 SeleniumMerchantFetcher의 요소별 추출과 같음
+"""
+
+import json
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Union
+
+MERCHANT_SELECTOR = "div.px-8.py-3"
+SERVER_NAME_SELECTOR = "p.text-sm.font-medium.text-bola"
+REGION_SELECTOR = "span.text-base.font-medium"
+NPC_SELECTOR = "span.text-sm.font-medium.text-secondary"
+ITEM_SELECTOR = "p.px-1.rounded.text-lostark-grade"
+PANEL_SELECTOR = "div.bg-elevated"
+
+# kloa data-grade(0~4) → 등급 텍스트 (값이 없거나 이상하면 영웅)
+GRADE_BY_ATTR = {4: "전설", 3: "영웅", 2: "희귀", 1: "고급", 0: "일반"}
+DEFAULT_GRADE_ATTR = 3
+
+# 서버 이름 요소가 하나도 없는 목록을 "상인 없음"으로 인정하기까지 기다리는 시간(초)
+EMPTY_SETTLE_SECONDS = 0.5
+
+# execute_async_script 인자: (서버 [[이름, 버튼 인덱스], ...], 셀렉터 dict, 서버당 대기 ms, 빈 목록 인정 ms, 완료 콜백)
+EXTRACT_ALL_REALMS_SCRIPT = """
+const [realms, sel, timeoutMs, settleMs, done] = arguments;
+const buttons = document.querySelectorAll(sel.button);
+const result = {};
+const text = (el) => (el ? (el.innerText || el.textContent || '').trim() : '');
+const panel = () => {
+  const panels = document.querySelectorAll(sel.panel);
+  return panels.length >= 2 ? panels[1] : null;
+};
+const serverNames = () => {
+  const p = panel();
+  return p === null ? null : Array.from(p.querySelectorAll(sel.serverName)).map(text);
+};
+const extract = (p) => Array.from(p.querySelectorAll(sel.merchant)).map((m) => [
+  text(m.querySelector(sel.region)),
+  text(m.querySelector(sel.npc)),
+  Array.from(m.querySelectorAll(sel.item)).map((item) => {
+    const img = item.querySelector('img');
+    return [text(item), item.getAttribute('data-grade'), img ? img.getAttribute('title') : null];
+  }),
+]);
+const next = (k) => {
+  if (k >= realms.length) {
+    done(JSON.stringify(result));
+    return;
+  }
+  const [realm, index] = realms[k];
+  if (!buttons[index]) {
+    result[realm] = null;
+    next(k + 1);
+    return;
+  }
+  buttons[index].click();
+  const deadline = Date.now() + timeoutMs;
+  let emptySince = null;
+  const poll = () => {
+    const names = serverNames();
+    let ready;
+    if (names !== null && names.length === 0) {
+      // 다시 그리는 중일 수 있으므로 계속 비어 있을 때만 인정
+      emptySince = emptySince === null ? Date.now() : emptySince;
+      ready = Date.now() - emptySince >= settleMs;
+    } else {
+      emptySince = null;
+      ready = names !== null && names.every((name) => name === realm);
+    }
+    if (ready) {
+      result[realm] = extract(panel());
+      next(k + 1);
+    } else if (Date.now() > deadline) {
+      result[realm] = null;
+      next(k + 1);
+    } else {
+      setTimeout(poll, 50);
+    }
+  };
+  poll();
+};
+next(0);
+"""
+
+
+class RealmPanelWait:
+    """서버 버튼을 누른 뒤 상인 목록이 그 서버 것으로 바뀌었는지 판단 (스크립트와 같은 규칙)"""
+
+    def __init__(self, realm: str, settle: float = EMPTY_SETTLE_SECONDS,
+                 clock: Callable[[], float] = time.monotonic):
+        self.realm = realm
+        self.settle = settle
+        self.clock = clock
+        self._empty_since: Optional[float] = None
+
+    def ready(self, names: Optional[Sequence[str]]) -> bool:
+        """
+        목록의 서버 이름들로 판단 (None = 목록 요소 자체가 없음)
+        빈 목록은 settle초 동안 계속 비어 있어야 True
+        """
+        if names is not None and not names:
+            now = self.clock()
+            if self._empty_since is None:
+                self._empty_since = now
+            return now - self._empty_since >= self.settle
+        self._empty_since = None
+        return names is not None and all(name == self.realm for name in names)
+
+
+def script_selectors(button_selector: str) -> Dict[str, str]:
+    """스크립트에 넘길 셀렉터 dict"""
+    return {
+        'button': button_selector,
+        'panel': PANEL_SELECTOR,
+        'serverName': SERVER_NAME_SELECTOR,
+        'merchant': MERCHANT_SELECTOR,
+        'region': REGION_SELECTOR,
+        'npc': NPC_SELECTOR,
+        'item': ITEM_SELECTOR,
+    }
+
+
+def item_grade(grade_attr: Optional[str]) -> str:
+    """data-grade 속성 → 등급 텍스트"""
+    try:
+        grade_num = int(grade_attr.strip()) if grade_attr and grade_attr.strip() else DEFAULT_GRADE_ATTR
+    except ValueError:
+        grade_num = DEFAULT_GRADE_ATTR
+    return GRADE_BY_ATTR.get(grade_num, "영웅")
+
+
+def item_type(type_title: Optional[str]) -> int:
+    """아이콘 title → 아이템 타입 (1 카드, 2 호감도, 3 특수)"""
+    title = type_title or ''
+    if "카드" in title:
+        return 1
+    if "호감도" in title:
+        return 2
+    return 3
+
+
+def build_merchant(row: Sequence) -> Optional[Dict]:
+    """[지역, NPC, 아이템 행 목록] → 상인 dict (아이템이 없으면 None)"""
+    region_name, npc_name, item_rows = row
+    items = [
+        {'name': name, 'type': item_type(type_title), 'grade': item_grade(grade_attr), 'hidden': False}
+        for name, grade_attr, type_title in item_rows if name
+    ]
+    if not items:
+        return None
+    return {'region_name': region_name, 'npc_name': npc_name, 'group': 1, 'items': items}
+
+
+def parse_realm_panels(payload: Union[str, Dict, None]) -> Dict[str, List[Dict]]:
+    """
+    스크립트 결과 → 서버 → 상인 목록
+    읽지 못한 서버(null)는 빠짐 (이전 스냅샷 유지)
+    """
+    data = json.loads(payload) if isinstance(payload, str) else payload
+    by_realm: Dict[str, List[Dict]] = {}
+    for realm, rows in (data or {}).items():
+        if rows is None:
+            continue
+        by_realm[realm] = [merchant for merchant in map(build_merchant, rows) if merchant]
+    return by_realm
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""
+블로킹 상인 데이터 수집(Selenium 등)을 전용 스레드에서 실행하는 비동기 워커
+- 디스코드 이벤트 루프를 막지 않음
+- 동시 요청은 하나의 수집으로 합쳐짐 (single-flight)
+- 타임아웃 및 취소 지원 (실행마다 새 취소 이벤트 → 버려진 수집이 다음 수집 때문에 다시 살아나지 않음)
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from single_flight import SingleFlight
+
+
+class FetchCancelledError(Exception):
+    """수집이 cancel()로 취소됨"""
+
+
+class MerchantFetchWorker:
+    """블로킹 수집 함수를 비동기로 감싸는 워커"""
+
+    FLIGHT_KEY = 'merchants'
+
+    def __init__(self, fetch_func: Callable[[threading.Event], Any], timeout: float = 90.0):
+        """
+        초기화
+        Args:
+            fetch_func: 취소 이벤트(threading.Event)를 인자로 받는 동기 수집 함수
+            timeout: 기본 대기 시간(초)
+        """
+        self.fetch_func = fetch_func
+        self.timeout = timeout
+
+        # Selenium 드라이버는 스레드 안전하지 않으므로 전용 스레드 1개에서만 실행
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='merchant-fetch')
+        self._flight = SingleFlight()
+        # 현재 실행의 스레드 쪽 / 이벤트 루프 쪽 취소 신호 (실행마다 새로 만듦)
+        self._cancel_event: Optional[threading.Event] = None
+        self._cancel_requested: Optional[asyncio.Event] = None
+        self._waiters = 0
+
+        self.timeouts = 0
+        self.cancellations = 0
+        self.last_duration: Optional[float] = None
+
+    async def fetch(self, timeout: Optional[float] = None) -> Any:
+        """
+        수집 결과 반환 (이미 진행 중인 수집이 있으면 그 결과를 공유)
+        Raises:
+            asyncio.TimeoutError: timeout 안에 끝나지 않음
+                (다른 호출자가 기다리고 있으면 수집은 계속, 마지막 호출자였으면 수집도 중단)
+            FetchCancelledError: cancel()로 취소됨
+        """
+        self._waiters += 1
+        try:
+            return await asyncio.wait_for(
+                self._flight.do(self.FLIGHT_KEY, self._run),
+                timeout if timeout is not None else self.timeout
+            )
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            # 결과를 기다리는 호출자가 더 없으면 스레드 작업도 중단 (다음 수집이 뒤에서 기다리지 않도록)
+            if self._waiters == 1:
+                self.cancel()
+            raise
+        finally:
+            self._waiters -= 1
+
+    def cancel(self) -> bool:
+        """진행 중인 수집 취소 (기다리던 호출자 모두에게 FetchCancelledError)"""
+        if not self.is_running() or self._cancel_requested is None:
+            return False
+
+        self._cancel_event.set()
+        self._cancel_requested.set()
+        return True
+
+    def is_running(self) -> bool:
+        """수집이 진행 중인지 확인"""
+        return self._flight.in_flight(self.FLIGHT_KEY)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """워커 통계"""
+        stats = self._flight.get_stats()
+        stats.update({
+            'timeouts': self.timeouts,
+            'cancellations': self.cancellations,
+            'last_duration': self.last_duration,
+        })
+        return stats
+
+    def close(self):
+        """워커 종료"""
+        if self._cancel_event is not None:
+            self._cancel_event.set()
+        self._executor.shutdown(wait=False)
+
+    async def _run(self) -> Any:
+        """전용 스레드에서 수집 실행 (취소 요청이 먼저 오면 즉시 중단)"""
+        loop = asyncio.get_running_loop()
+        # 이전 실행의 이벤트를 지우지 않음 (취소된 이전 작업은 자기 이벤트를 계속 보고 멈춤)
+        cancel_event = self._cancel_event = threading.Event()
+        cancel_requested = self._cancel_requested = asyncio.Event()
+
+        started = time.perf_counter()
+        fetch_future = loop.run_in_executor(self._executor, self.fetch_func, cancel_event)
+        cancel_waiter = loop.create_task(cancel_requested.wait())
+
+        try:
+            done, _ = await asyncio.wait({fetch_future, cancel_waiter}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            cancel_waiter.cancel()
+
+        # cancel()은 스레드 이벤트를 바로 설정하므로 수집이 먼저 끝나 있을 수 있음 → 취소 요청이 우선
+        if fetch_future in done and not cancel_requested.is_set():
+            self.last_duration = time.perf_counter() - started
+            return fetch_future.result()
+
+        # 스레드 쪽에도 중단 요청 (결과는 버림)
+        cancel_event.set()
+        fetch_future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self.cancellations += 1
+        raise FetchCancelledError("상인 데이터 수집이 취소되었습니다")
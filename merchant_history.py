@@ -0,0 +1,348 @@
+# -*- coding: utf-8 -*-
+"""
+떠돌이 상인 기록 저장소 (SQLite, 추가 전용)
+- 내용이 바뀐 스냅샷만 (지역, NPC, 아이템) 정수 ID 행으로 추가 → 폴링이 쌓여도 같은 데이터는 다시 저장하지 않음
+- 등장 주기(6시간, 04/10/16/22시 시작)마다 (지역, 아이템) 등장을 한 번만 집계해서 주간 집계 테이블에 바로 반영
+  - weekly_item_region: 주 × 아이템 × 지역 등장 횟수
+  - weekly_grade: 주 × 등급 등장 횟수
+  - cycles: 관측한 등장 주기 (주별 분모)
+  → "로웬에 웨이 카드가 얼마나 자주 나오나" 같은 통계는 원본 JSON을 다시 읽지 않고 집계 테이블만 조회
+- 쓰기(append)는 executor 스레드에서 호출, 읽기는 같은 연결을 락으로 보호
+"""
+
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from merchant_model import to_grade
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS regions (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE);
+CREATE TABLE IF NOT EXISTS npcs (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE);
+CREATE TABLE IF NOT EXISTS items (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE, grade INTEGER NOT NULL);
+
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY,
+    observed_at REAL NOT NULL,
+    cycle TEXT NOT NULL,
+    merchants INTEGER NOT NULL,
+    items INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS snapshot_items (
+    snapshot_id INTEGER NOT NULL,
+    region_id INTEGER NOT NULL,
+    item_id INTEGER NOT NULL,
+    npc_id INTEGER NOT NULL,
+    PRIMARY KEY (snapshot_id, region_id, item_id)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS cycles (cycle TEXT PRIMARY KEY, week TEXT NOT NULL, snapshots INTEGER NOT NULL) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS cycles_week ON cycles (week);
+CREATE TABLE IF NOT EXISTS appearances (
+    cycle TEXT NOT NULL,
+    region_id INTEGER NOT NULL,
+    item_id INTEGER NOT NULL,
+    PRIMARY KEY (cycle, region_id, item_id)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS weekly_item_region (
+    week TEXT NOT NULL,
+    item_id INTEGER NOT NULL,
+    region_id INTEGER NOT NULL,
+    appearances INTEGER NOT NULL,
+    PRIMARY KEY (week, item_id, region_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS weekly_item_region_item ON weekly_item_region (item_id, region_id, week);
+CREATE INDEX IF NOT EXISTS weekly_item_region_region ON weekly_item_region (region_id, week);
+CREATE TABLE IF NOT EXISTS weekly_grade (
+    week TEXT NOT NULL,
+    grade INTEGER NOT NULL,
+    appearances INTEGER NOT NULL,
+    PRIMARY KEY (week, grade)
+) WITHOUT ROWID;
+"""
+
+CYCLE_HOURS = 6
+CYCLE_OFFSET = timedelta(hours=4)   # 04:00 / 10:00 / 16:00 / 22:00 시작
+
+
+def cycle_start(moment: datetime) -> datetime:
+    """moment가 속한 등장 주기 시작 시각"""
+    shifted = moment - CYCLE_OFFSET
+    return shifted.replace(hour=shifted.hour // CYCLE_HOURS * CYCLE_HOURS, minute=0, second=0, microsecond=0) + CYCLE_OFFSET
+
+
+def week_key(moment: datetime) -> str:
+    """ISO 주 키 (예: 2024-W07)"""
+    year, week, _ = moment.isocalendar()
+    return f"{year}-W{week:02d}"
+
+
+def _item_grade(item) -> int:
+    grade = to_grade(item.get('grade', 1))
+    return int(grade) if isinstance(grade, int) else 0
+
+
+class MerchantHistoryStore:
+    """떠돌이 상인 기록 + 주간 집계"""
+
+    def __init__(self, path: str = "merchant_history.db"):
+        """
+        초기화
+        Args:
+            path: SQLite 파일 경로 (":memory:"면 메모리)
+        """
+        self.path = path
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+        # 이름 → ID (테이블 전체를 메모리에 보관, 게임 지역/아이템 수는 수백 개 수준)
+        self._ids: Dict[str, Dict[str, int]] = {}
+        self._load_ids()
+
+        # 마지막으로 저장한 스냅샷 (주기, 내용) / 현재 주기에 이미 집계한 (지역, 아이템)
+        self._last_rows: Optional[Tuple[str, frozenset]] = self._load_last_rows()
+        self._cycle: Optional[str] = None
+        self._cycle_seen: Set[Tuple[int, int]] = set()
+
+        # 통계
+        self.appended = 0
+        self.skipped = 0
+        self.new_appearances = 0
+        self.last_append_duration: Optional[float] = None
+
+    def _load_ids(self):
+        for table in ('regions', 'npcs', 'items'):
+            self._ids[table] = {name: row_id for row_id, name in self.conn.execute(f"SELECT id, name FROM {table}")}
+
+    def _load_last_rows(self) -> Optional[Tuple[str, frozenset]]:
+        row = self.conn.execute("SELECT id, cycle FROM snapshots ORDER BY id DESC LIMIT 1").fetchone()
+        if row is None:
+            return None
+        return row[1], frozenset(self.conn.execute(
+            "SELECT region_id, npc_id, item_id FROM snapshot_items WHERE snapshot_id=?", (row[0],)))
+
+    def _id(self, table: str, name: str, grade: Optional[int] = None) -> int:
+        ids = self._ids[table]
+        row_id = ids.get(name)
+        if row_id is None:
+            if table == 'items':
+                cursor = self.conn.execute("INSERT INTO items (name, grade) VALUES (?, ?)", (name, grade or 0))
+            else:
+                cursor = self.conn.execute(f"INSERT INTO {table} (name) VALUES (?)", (name,))
+            row_id = ids[name] = cursor.lastrowid
+        return row_id
+
+    # ------------------------------------------------------------------
+    # 기록 추가
+    # ------------------------------------------------------------------
+
+    def append(self, merchants: Iterable[Dict], observed_at: Optional[datetime] = None) -> Optional[int]:
+        """
+        스냅샷 추가 (MerchantSnapshot 또는 상인 목록, 동기 - executor 스레드에서 호출)
+        Returns:
+            추가한 스냅샷 ID (같은 주기의 직전 스냅샷과 내용이 같으면 None)
+        """
+        observed_at = observed_at or getattr(merchants, 'fetched_at', None) or datetime.now()
+        started = time.perf_counter()
+
+        with self._lock:
+            try:
+                snapshot_id, content, new = self._append(merchants, observed_at)
+            except Exception:
+                # 롤백된 이름 ID가 메모리에 남지 않도록 다시 읽음
+                self._load_ids()
+                self._cycle = None
+                raise
+        if snapshot_id is None:
+            self.skipped += 1
+            return None
+
+        self._cycle_seen.update(new)
+        self._last_rows = content
+        self.appended += 1
+        self.new_appearances += len(new)
+        self.last_append_duration = time.perf_counter() - started
+        return snapshot_id
+
+    def _append(self, merchants: Iterable[Dict], observed_at: datetime):
+        with self.conn:
+            rows = {}
+            grades = {}
+            for merchant in merchants:
+                region_id = self._id('regions', merchant['region_name'])
+                npc_id = self._id('npcs', merchant['npc_name'])
+                for item in merchant['items']:
+                    if isinstance(item, str):
+                        item = {'name': item}
+                    item_id = self._id('items', item['name'], _item_grade(item))
+                    rows[(region_id, item_id)] = npc_id
+                    grades[item_id] = _item_grade(item)
+
+            start = cycle_start(observed_at)
+            cycle, week = start.strftime('%Y-%m-%d %H:%M'), week_key(start)
+            content = (cycle, frozenset((region_id, npc_id, item_id) for (region_id, item_id), npc_id in rows.items()))
+            if content == self._last_rows:
+                return None, content, []
+            cursor = self.conn.execute(
+                "INSERT INTO snapshots (observed_at, cycle, merchants, items) VALUES (?, ?, ?, ?)",
+                (observed_at.timestamp(), cycle, len({region_id for region_id, _ in rows}), len(rows))
+            )
+            snapshot_id = cursor.lastrowid
+            self.conn.executemany(
+                "INSERT INTO snapshot_items (snapshot_id, region_id, item_id, npc_id) VALUES (?, ?, ?, ?)",
+                [(snapshot_id, region_id, item_id, npc_id) for (region_id, item_id), npc_id in rows.items()]
+            )
+            self.conn.execute(
+                "INSERT INTO cycles (cycle, week, snapshots) VALUES (?, ?, 1) "
+                "ON CONFLICT(cycle) DO UPDATE SET snapshots = snapshots + 1",
+                (cycle, week)
+            )
+
+            # 이번 주기에 처음 본 (지역, 아이템)만 집계
+            if cycle != self._cycle:
+                self._cycle = cycle
+                self._cycle_seen = set(self.conn.execute(
+                    "SELECT region_id, item_id FROM appearances WHERE cycle=?", (cycle,)))
+            new = [key for key in rows if key not in self._cycle_seen]
+            self.conn.executemany(
+                "INSERT INTO appearances (cycle, region_id, item_id) VALUES (?, ?, ?)",
+                [(cycle, region_id, item_id) for region_id, item_id in new]
+            )
+            self.conn.executemany(
+                "INSERT INTO weekly_item_region (week, item_id, region_id, appearances) VALUES (?, ?, ?, 1) "
+                "ON CONFLICT(week, item_id, region_id) DO UPDATE SET appearances = appearances + 1",
+                [(week, item_id, region_id) for region_id, item_id in new]
+            )
+            self.conn.executemany(
+                "INSERT INTO weekly_grade (week, grade, appearances) VALUES (?, ?, 1) "
+                "ON CONFLICT(week, grade) DO UPDATE SET appearances = appearances + 1",
+                [(week, grades[item_id]) for _, item_id in new]
+            )
+        return snapshot_id, content, new
+
+    # ------------------------------------------------------------------
+    # 통계 조회 (집계 테이블만 사용)
+    # ------------------------------------------------------------------
+
+    def _query(self, sql: str, params: Tuple = ()) -> List[Tuple]:
+        with self._lock:
+            return self.conn.execute(sql, params).fetchall()
+
+    @staticmethod
+    def since_week(weeks: Optional[int], now: Optional[datetime] = None) -> str:
+        """최근 weeks주의 시작 주 키 (None이면 전체)"""
+        if not weeks:
+            return ''
+        return week_key((now or datetime.now()) - timedelta(weeks=weeks - 1))
+
+    def cycle_count(self, weeks: Optional[int] = None, now: Optional[datetime] = None) -> int:
+        """관측한 등장 주기 수"""
+        return self._query("SELECT COUNT(*) FROM cycles WHERE week >= ?", (self.since_week(weeks, now),))[0][0]
+
+    def region_cycle_counts(self, weeks: Optional[int] = None, now: Optional[datetime] = None) -> Dict[str, int]:
+        """지역 → 그 지역에 상인이 있었던 등장 주기 수 (지역별 등장률 분모)"""
+        return dict(self._query(
+            "SELECT r.name, COUNT(DISTINCT a.cycle) FROM appearances a "
+            "JOIN regions r ON r.id = a.region_id JOIN cycles c ON c.cycle = a.cycle "
+            "WHERE c.week >= ? GROUP BY a.region_id",
+            (self.since_week(weeks, now),)
+        ))
+
+    def item_appearances(self, item: str, weeks: Optional[int] = None,
+                         now: Optional[datetime] = None) -> List[Tuple[str, int]]:
+        """아이템의 지역별 등장 횟수 (많은 순)"""
+        return self._query(
+            "SELECT r.name, SUM(w.appearances) AS total FROM weekly_item_region w "
+            "JOIN items i ON i.id = w.item_id JOIN regions r ON r.id = w.region_id "
+            "WHERE i.name = ? AND w.week >= ? GROUP BY w.region_id ORDER BY total DESC, r.name",
+            (item, self.since_week(weeks, now))
+        )
+
+    def region_items(self, region: str, weeks: Optional[int] = None, limit: int = 10,
+                     now: Optional[datetime] = None) -> List[Tuple[str, int]]:
+        """지역에 자주 나온 아이템 (많은 순)"""
+        return self._query(
+            "SELECT i.name, SUM(w.appearances) AS total FROM weekly_item_region w "
+            "JOIN items i ON i.id = w.item_id JOIN regions r ON r.id = w.region_id "
+            "WHERE r.name = ? AND w.week >= ? GROUP BY w.item_id ORDER BY total DESC, i.name LIMIT ?",
+            (region, self.since_week(weeks, now), limit)
+        )
+
+    def grade_distribution(self, weeks: Optional[int] = None, now: Optional[datetime] = None) -> Dict[int, int]:
+        """등급별 등장 횟수"""
+        return dict(self._query(
+            "SELECT grade, SUM(appearances) FROM weekly_grade WHERE week >= ? GROUP BY grade ORDER BY grade DESC",
+            (self.since_week(weeks, now),)
+        ))
+
+    def cycle_counts(self, before: Optional[datetime] = None) -> Tuple[Dict[str, int], List[Tuple[str, str, int]]]:
+        """
+        등장 주기 단위 카운트 (확률 추정 초기값, 시작할 때 한 번)
+        Args:
+            before: 이 시각이 속한 주기부터는 제외 (현재 주기는 호출한 쪽이 직접 집계)
+        Returns:
+            (지역 → 관측 주기 수, [(지역, 아이템, 등장 주기 수)])
+        """
+        cutoff = cycle_start(before).strftime('%Y-%m-%d %H:%M') if before else '9999'
+        visits = dict(self._query(
+            "SELECT r.name, COUNT(DISTINCT a.cycle) FROM appearances a JOIN regions r ON r.id = a.region_id "
+            "WHERE a.cycle < ? GROUP BY a.region_id",
+            (cutoff,)
+        ))
+        appearances = self._query(
+            "SELECT r.name, i.name, COUNT(*) FROM appearances a "
+            "JOIN regions r ON r.id = a.region_id JOIN items i ON i.id = a.item_id "
+            "WHERE a.cycle < ? GROUP BY a.region_id, a.item_id",
+            (cutoff,)
+        )
+        return visits, appearances
+
+    def appearance_rows(self, since_cycle: str = '') -> List[Tuple[str, int, int, int]]:
+        """
+        등장 행 (통계 배열 적재용, since_cycle 주기부터)
+        Returns:
+            [(주기, 지역 ID, 아이템 ID, 등급)] 주기 순
+        """
+        return self._query(
+            "SELECT a.cycle, a.region_id, a.item_id, i.grade FROM appearances a JOIN items i ON i.id = a.item_id "
+            "WHERE a.cycle >= ? ORDER BY a.cycle",
+            (since_cycle,)
+        )
+
+    def region_names(self) -> Dict[int, str]:
+        """지역 ID → 이름"""
+        return {row_id: name for row_id, name in self._query("SELECT id, name FROM regions")}
+
+    def weekly_summary(self, limit: int = 8) -> List[Tuple[str, int, int]]:
+        """최근 주별 (주, 등장 주기 수, 아이템 등장 수)"""
+        return self._query(
+            "SELECT c.week, c.cycles, COALESCE(g.total, 0) FROM "
+            "(SELECT week, COUNT(*) AS cycles FROM cycles GROUP BY week) c "
+            "LEFT JOIN (SELECT week, SUM(appearances) AS total FROM weekly_grade GROUP BY week) g ON g.week = c.week "
+            "ORDER BY c.week DESC LIMIT ?",
+            (limit,)
+        )
+
+    def close(self):
+        """닫기"""
+        with self._lock:
+            self.conn.close()
+
+    def get_stats(self) -> Dict:
+        """저장소 통계"""
+        snapshots, cycles = self._query("SELECT (SELECT COUNT(*) FROM snapshots), (SELECT COUNT(*) FROM cycles)")[0]
+        return {
+            'snapshots': snapshots,
+            'cycles': cycles,
+            'items': len(self._ids['items']),
+            'regions': len(self._ids['regions']),
+            'appended': self.appended,
+            'skipped': self.skipped,
+            'new_appearances': self.new_appearances,
+            'last_append_ms': round(self.last_append_duration * 1000, 2) if self.last_append_duration is not None else None,
+        }
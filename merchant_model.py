@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+"""
+떠돌이 상인 / 아이템 데이터 모델 (kloa 데이터 기준)
+- __slots__ 레코드라 인스턴스마다 dict를 만들지 않음
+- 등급/타입은 작은 정수(IntEnum), 이름은 sys.intern()으로 같은 문자열을 공유
+- 같은 (이름, 등급, 타입, 숨김) 아이템은 한 객체를 재사용 → 폴링/기록이 쌓여도 아이템 객체가 늘지 않음
+- 등급 텍스트/이모지, 타입 텍스트는 저장하지 않고 필요할 때 표에서 조회
+- 기존 dict 형식 코드(item['name'], merchant['items'] 등)도 그대로 읽을 수 있도록 [] / get() 지원
+"""
+
+import sys
+from datetime import datetime
+from enum import IntEnum
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+
+
+class ItemGrade(IntEnum):
+    """아이템 등급 (kloa 등급 값)"""
+    COMMON = 1      # 일반
+    UNCOMMON = 2    # 고급
+    RARE = 3        # 희귀
+    EPIC = 4        # 영웅
+    LEGENDARY = 5   # 전설
+
+
+class ItemType(IntEnum):
+    """아이템 타입 (kloa 타입 값)"""
+    CARD = 1
+    ITEM = 2
+    MATERIAL = 3
+
+
+GRADE_TEXT = {1: '일반', 2: '고급', 3: '희귀', 4: '영웅', 5: '전설'}
+GRADE_EMOJI = {1: '⚪', 2: '🟢', 3: '🔵', 4: '🟣', 5: '🟠'}
+TYPE_TEXT = {1: '카드', 2: '아이템', 3: '재료'}
+
+# 알려진 떠돌이 상인 아이템 등급표 (이름 → 등급, 검색/자동완성의 기본 아이템 목록)
+ITEM_CATALOG = {
+    # 카드
+    '바루투': 2, '페일린': 2, '위대한 성 네리아': 2, '케이사르': 3,
+    '킬리언': 1, '베른 젠로드': 2, '레퓌스': 1, '사일러스': 2,
+    '앙케': 2, '피엘라': 2, '하눈': 2, '다르시': 3,
+    '코니': 1, '티엔': 2, '프리우나': 2, '디오게네스': 2,
+    '벨루마테': 2, '아그리스': 1, '린': 2, '타라코룸': 2, '유즈': 3,
+
+    # 호감도 아이템
+    '더욱 화려한 꽃다발': 3, '아르테미스 성수': 3, '기사단 가입 신청서': 3,
+    '마법 옷감': 3, '피에르의 비법서': 3, '모형 반딧불이': 3,
+    '페브리 포션': 3, '늑대 이빨 목걸이': 3, '최상급 육포': 3,
+    '빛을 머금은 과실주': 3, '크레도프 유리경': 3, '둥근 뿌리 차': 3,
+    '전투 식량': 3, '기묘한 주전자': 3, '날씨 상자': 3,
+
+    # 특수 아이템
+    '뒷골목 럼주': 1, '보석 장식 주머니': 3, '신기한 마법 주머니': 3,
+    '집중 룬': 5, '반짝이는 주머니': 3, '향기 나는 주머니': 3,
+    '비법의 주머니': 3,
+}
+
+_GRADE_BY_TEXT = {text: grade for grade, text in GRADE_TEXT.items()}
+
+
+def to_grade(value: Union[int, str]) -> Union[ItemGrade, int]:
+    """등급 값/텍스트 → ItemGrade (모르는 값은 정수 그대로)"""
+    if isinstance(value, str):
+        value = _GRADE_BY_TEXT.get(value, value)
+    try:
+        return ItemGrade(value)
+    except ValueError:
+        return value
+
+
+def to_type(value: int) -> Union[ItemType, int]:
+    """타입 값 → ItemType (모르는 값은 그대로)"""
+    try:
+        return ItemType(value)
+    except ValueError:
+        return value
+
+
+class Item:
+    """떠돌이 상인 아이템 (불변)"""
+
+    __slots__ = ('name', 'grade', 'type', 'hidden', '_hash')
+
+    # dict 형식으로 읽을 수 있는 키 (표시용 문자열은 그때그때 계산)
+    _KEYS = ('name', 'grade', 'type', 'hidden', 'grade_text', 'grade_emoji', 'type_text')
+
+    _pool: Dict[Tuple, 'Item'] = {}
+
+    def __init__(self, name: str, grade: Union[int, str] = 1, type: int = 1, hidden: bool = False):
+        object.__setattr__(self, 'name', sys.intern(name))
+        object.__setattr__(self, 'grade', to_grade(grade))
+        object.__setattr__(self, 'type', to_type(type))
+        object.__setattr__(self, 'hidden', bool(hidden))
+        object.__setattr__(self, '_hash', hash((self.name, self.grade, self.type, self.hidden)))
+
+    @classmethod
+    def of(cls, name: str, grade: Union[int, str] = 1, type: int = 1, hidden: bool = False) -> 'Item':
+        """같은 아이템이면 이미 만든 객체 재사용 (게임 아이템 종류는 수백 개 수준이라 전부 보관)"""
+        key = (name, grade, type, bool(hidden))
+        item = cls._pool.get(key)
+        if item is None:
+            item = cls._pool[key] = cls(name, grade, type, hidden)
+        return item
+
+    @classmethod
+    def from_raw(cls, raw: Dict[str, Any]) -> 'Item':
+        """kloa 아이템 dict → Item"""
+        return cls.of(raw.get('name', '알 수 없음'), raw.get('grade', 1), raw.get('type', 1), raw.get('hidden', False))
+
+    def __setattr__(self, key, value):
+        raise AttributeError("Item은 수정할 수 없습니다")
+
+    @property
+    def grade_text(self) -> str:
+        return GRADE_TEXT.get(self.grade, '알 수 없음')
+
+    @property
+    def grade_emoji(self) -> str:
+        return GRADE_EMOJI.get(self.grade, '⚪')
+
+    @property
+    def type_text(self) -> str:
+        return TYPE_TEXT.get(self.type, '알 수 없음')
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key) if key in self._KEYS else default
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'name': self.name, 'grade': int(self.grade), 'type': int(self.type), 'hidden': self.hidden}
+
+    def __eq__(self, other):
+        if not isinstance(other, Item):
+            return NotImplemented
+        return (self.name, self.grade, self.type, self.hidden) == (other.name, other.grade, other.type, other.hidden)
+
+    def __hash__(self):
+        return self._hash
+
+    def __repr__(self):
+        return f"Item({self.name!r}, {self.grade_text}, {self.type_text})"
+
+
+class Merchant:
+    """떠돌이 상인 (지역 + NPC + 판매 아이템, 스케줄 정보는 있을 때만)"""
+
+    __slots__ = ('region_name', 'npc_name', 'group', 'items', 'start_time', 'duration', 'end_time')
+
+    _KEYS = ('region_name', 'npc_name', 'group', 'group_id', 'items',
+             'start_time', 'duration', 'end_time', 'schedule_key')
+
+    def __init__(self, region_name: str, npc_name: str, group: Optional[int], items: Iterable[Item],
+                 start_time: Optional[str] = None, duration: Optional[str] = None,
+                 end_time: Optional[datetime] = None):
+        object.__setattr__(self, 'region_name', sys.intern(region_name))
+        object.__setattr__(self, 'npc_name', sys.intern(npc_name))
+        object.__setattr__(self, 'group', group)
+        object.__setattr__(self, 'items', tuple(items))
+        object.__setattr__(self, 'start_time', start_time)
+        object.__setattr__(self, 'duration', duration)
+        object.__setattr__(self, 'end_time', end_time)
+
+    @classmethod
+    def from_region(cls, region: Dict[str, Any], items: Optional[Iterable[Item]] = None, **schedule) -> 'Merchant':
+        """
+        kloa 지역 dict → Merchant
+        Args:
+            items: 미리 정리한 아이템 (없으면 숨김 아이템을 뺀 지역 아이템)
+            schedule: start_time / duration / end_time
+        """
+        if items is None:
+            items = [Item.from_raw(item) for item in region.get('items', []) if not item.get('hidden', False)]
+        return cls(region.get('name', '알 수 없음'), region.get('npcName', '알 수 없음'),
+                   region.get('group'), items, **schedule)
+
+    def __setattr__(self, key, value):
+        raise AttributeError("Merchant는 수정할 수 없습니다")
+
+    @property
+    def group_id(self) -> Optional[int]:
+        return self.group
+
+    @property
+    def schedule_key(self) -> str:
+        return f"{self.region_name}_{self.start_time}"
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key) if key in self._KEYS else default
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {
+            'region_name': self.region_name,
+            'npc_name': self.npc_name,
+            'group': self.group,
+            'items': [item.to_dict() for item in self.items],
+        }
+        if self.start_time is not None:
+            data.update(start_time=self.start_time, duration=self.duration, end_time=self.end_time)
+        return data
+
+    def __repr__(self):
+        return f"Merchant({self.region_name} - {self.npc_name}, 아이템 {len(self.items)}개)"
@@ -3,10 +3,12 @@
 상인 정보 파싱 및 처리 모듈
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Dict, List, Optional, Any
 import json
 
+from schedule_index import ScheduleIndex, build_regions_by_group
+
 class MerchantParser:
     """상인 정보 파싱 클래스"""
     
@@ -20,6 +22,10 @@ class MerchantParser:
         self.schedules = self._get_schedules()
         self.regions = self._get_regions()
         
+        # 페이로드당 한 번만 생성: 주간 스케줄 구간 인덱스, 그룹 → 지역 목록
+        self.schedule_index = ScheduleIndex(self.schedules)
+        self.regions_by_group = build_regions_by_group(self.regions)
+        
     def _get_schedules(self) -> List[Dict]:
         """스케줄 데이터 추출"""
         try:
@@ -116,11 +122,7 @@ class MerchantParser:
             if day_name not in schedule_by_day:
                 schedule_by_day[day_name] = []
             
-            merchant_names = []
-            for group_id in schedule.get('groups', []):
-                region = next((r for r in self.regions if r.get('group') == group_id), None)
-                if region:
-                    merchant_names.append(f"{region.get('name', '알 수 없음')} ({region.get('npcName', '알 수 없음')})")
+            merchant_names = self._format_group_merchants(schedule.get('groups', []))
             
             schedule_info = {
                 '시작시간': schedule.get('startTime', '00:00:00'),
@@ -187,63 +189,34 @@ class MerchantParser:
         
         return sellers
     
-    def get_current_active_merchants(self) -> List[Dict]:
-        """현재 시간 기준 활성 상인 조회"""
-        now = datetime.now()
-        current_day = now.weekday()
-        current_day = (current_day + 1) % 7  # Python의 월요일=0을 일요일=0으로 변환
-        current_time = now.strftime('%H:%M:%S')
+    def get_current_active_merchants(self, now: Optional[datetime] = None) -> List[Dict]:
+        """현재 시간 기준 활성 상인 조회 (스케줄 인덱스 이진 탐색)"""
+        if now is None:
+            now = datetime.now()
         
         active_merchants = []
         
-        for schedule in self.schedules:
-            if schedule.get('dayOfWeek') != current_day:
-                continue
-            
-            start_time = schedule.get('startTime', '00:00:00')
-            duration = schedule.get('duration', '00:00:00')
-            
-            if self._is_time_in_range(current_time, start_time, duration):
-                merchant_names = []
-                for group_id in schedule.get('groups', []):
-                    region = next((r for r in self.regions if r.get('group') == group_id), None)
-                    if region:
-                        merchant_names.append(f"{region.get('name', '알 수 없음')} ({region.get('npcName', '알 수 없음')})")
-                
-                active_info = {
-                    '시작시간': start_time,
-                    '지속시간': duration,
-                    '활성상인들': merchant_names
-                }
-                active_merchants.append(active_info)
+        for slot in self.schedule_index.active_slots(now):
+            active_info = {
+                '시작시간': slot.start_time,
+                '지속시간': slot.duration,
+                '활성상인들': self._format_group_merchants(slot.groups)
+            }
+            active_merchants.append(active_info)
         
         return active_merchants
     
-    def _is_time_in_range(self, current_time: str, start_time: str, duration: str) -> bool:
-        """시간이 범위 내에 있는지 확인"""
-        try:
-            # 시간 문자열을 datetime 객체로 변환
-            current = datetime.strptime(current_time, '%H:%M:%S')
-            start = datetime.strptime(start_time, '%H:%M:%S')
-            
-            # 지속시간을 timedelta로 변환
-            duration_parts = duration.split(':')
-            duration_delta = timedelta(
-                hours=int(duration_parts[0]),
-                minutes=int(duration_parts[1]),
-                seconds=int(duration_parts[2])
-            )
-            
-            end = start + duration_delta
-            
-            # 자정을 넘어가는 경우 처리
-            if end.day > start.day:
-                return current >= start or current <= end.replace(day=start.day)
-            else:
-                return start <= current <= end
-                
-        except:
-            return False
+    def get_next_change_time(self, now: Optional[datetime] = None) -> Optional[datetime]:
+        """활성 상인 구성이 바뀌는 다음 시각"""
+        return self.schedule_index.next_change_after(now or datetime.now())
+    
+    def _format_group_merchants(self, group_ids) -> List[str]:
+        """그룹 ID들 → '지역 (상인)' 목록"""
+        merchant_names = []
+        for group_id in group_ids:
+            for region in self.regions_by_group.get(group_id, []):
+                merchant_names.append(f"{region.get('name', '알 수 없음')} ({region.get('npcName', '알 수 없음')})")
+        return merchant_names
     
     def format_merchant_list(self) -> str:
         """상인 목록을 디스코드 메시지 형식으로 포맷팅"""
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""
+로스트아크 서버(realm)별 떠돌이 상인 스냅샷
+- 한 번의 kloa 페이지 수집으로 모든 서버 상인을 읽고, 서버마다 스냅샷 저장소 하나씩 보관
+  → 서버를 늘려도 Chrome/폴링 루프는 그대로, 스냅샷 메모리만 늘어남
+- 같은 수집에서 나온 스냅샷은 모든 서버가 같은 세대 번호(version)를 가짐
+  → embed 캐시를 (화면, 서버) 키로 쓰면 서버끼리 캐시를 밀어내지 않음
+- 서버별 알림 설정은 SubscriptionStore 서버 설정(REALM_SETTING)에 저장
+"""
+
+import threading
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from item_search import normalize_text
+from merchant_snapshot import MerchantSnapshot, MerchantSnapshotStore
+
+# kloa 떠돌이 상인 페이지 서버 버튼 순서 (버튼 인덱스 = 목록 인덱스)
+REALMS = ('루페온', '실리안', '아만', '카마인', '카제로스', '아브렐슈드', '카단', '니나브')
+DEFAULT_REALM = '니나브'
+REALM_SETTING = 'realm'
+
+
+def resolve_realm(name: Optional[str]) -> Optional[str]:
+    """입력한 서버 이름 → REALMS 이름 (앞부분만 입력해도 하나로 정해지면 허용, 모르면 None)"""
+    query = normalize_text(name or '')
+    if not query:
+        return None
+    for realm in REALMS:
+        if normalize_text(realm) == query:
+            return realm
+    matches = [realm for realm in REALMS if normalize_text(realm).startswith(query)]
+    return matches[0] if len(matches) == 1 else None
+
+
+class RealmSnapshotStore:
+    """서버 → MerchantSnapshotStore (한 번의 수집 결과를 서버별로 교체)"""
+
+    def __init__(self, realms: Iterable[str] = REALMS):
+        self.realms = tuple(realms)
+        self.stores: Dict[str, MerchantSnapshotStore] = {realm: MerchantSnapshotStore() for realm in self.realms}
+        self.generation = 0
+        self._lock = threading.Lock()
+
+    def store(self, realm: str) -> MerchantSnapshotStore:
+        """서버 스냅샷 저장소"""
+        return self.stores[realm]
+
+    def current(self, realm: str) -> Optional[MerchantSnapshot]:
+        """서버 현재 스냅샷 (아직 수집 전이면 None)"""
+        return self.stores[realm].current
+
+    def publish_all(self, by_realm: Dict[str, List[Dict]],
+                    fetched_at: Optional[datetime] = None) -> Dict[str, MerchantSnapshot]:
+        """
+        수집 결과 반영 (읽지 못한 서버는 이전 스냅샷 유지)
+        Returns:
+            서버 → 새 스냅샷
+        """
+        fetched_at = fetched_at or datetime.now()
+        with self._lock:
+            self.generation += 1
+            return {
+                realm: self.stores[realm].publish(merchants, fetched_at, version=self.generation)
+                for realm, merchants in by_realm.items() if realm in self.stores
+            }
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """서버별 스냅샷 통계"""
+        return {realm: store.get_stats() for realm, store in self.stores.items()}
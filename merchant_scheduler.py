@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+"""
+스케줄 경계 기반 떠돌이 상인 체크 스케줄러
+- 고정 간격(30초/5분) 폴링 대신 다음 등장/마감/마감 30분 전 시각까지 잠들었다가 한 번만 확인
+- 경계 직후 변경이 안 보이면 짧은 재확인(검증 버스트)으로 사이트 반영 지연을 흡수
+- 스케줄을 모르면(데이터 없음/조회 실패) 기존처럼 고정 간격으로 확인
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, Optional, Sequence
+
+
+class MerchantScheduler:
+    """다음 스케줄 경계까지 대기했다가 체크 함수를 실행하는 스케줄러"""
+
+    def __init__(self,
+                 check: Callable[[str], Awaitable[bool]],
+                 next_boundary: Callable[[datetime], Optional[datetime]],
+                 verify_delays: Sequence[float] = (15, 45, 90),
+                 fallback_interval: float = 300,
+                 max_sleep: float = 3600,
+                 grace: float = 1.0,
+                 clock: Callable[[], datetime] = datetime.now):
+        """
+        Args:
+            check: async check(reason) → 변경을 감지했으면 True
+                   reason: 'start' / 'boundary' / 'verify' / 'fallback' / 'resync' / 'manual'
+            next_boundary: now → 다음 스케줄 경계 시각 (모르면 None)
+            verify_delays: 경계 체크 후 변경이 안 보일 때 재확인할 시점 (경계 체크로부터 초)
+            fallback_interval: 스케줄을 모를 때 확인 간격 (초)
+            max_sleep: 경계가 멀어도 이 시간마다 한 번은 확인 (스케줄 변경/시계 보정)
+            grace: 경계 시각보다 이만큼 늦게 깨어남 (서버 시계 오차)
+        """
+        self.check = check
+        self.next_boundary = next_boundary
+        self.verify_delays = tuple(verify_delays)
+        self.fallback_interval = fallback_interval
+        self.max_sleep = max_sleep
+        self.grace = grace
+        self.clock = clock
+
+        self._task: Optional[asyncio.Task] = None
+        self._wake_event: Optional[asyncio.Event] = None
+
+        # 통계
+        self.checks: Dict[str, int] = {}
+        self.changes = 0
+        self.errors = 0
+        self.next_wakeup: Optional[datetime] = None
+        self.next_reason: Optional[str] = None
+        self.last_check: Optional[datetime] = None
+
+    def start(self):
+        """스케줄러 시작 (실행 중인 이벤트 루프 안에서 호출)"""
+        if self.is_running():
+            return
+        self._wake_event = asyncio.Event()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def stop(self):
+        """스케줄러 중지"""
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def wake(self):
+        """대기 중이면 바로 깨워서 확인 (수동 새로고침, 스케줄 데이터 갱신 등)"""
+        if self._wake_event:
+            self._wake_event.set()
+
+    def plan(self, now: datetime):
+        """now 기준 다음 대기 시간(초)과 깨어날 이유"""
+        try:
+            boundary = self.next_boundary(now)
+        except Exception as e:
+            print(f"⚠️ 다음 스케줄 경계 계산 실패: {e}")
+            boundary = None
+
+        # 이미 지난 경계는 모르는 것으로 취급 (체크 실패가 반복될 때 바로 다시 깨어나는 것 방지)
+        if boundary is None or boundary <= now:
+            return self.fallback_interval, 'fallback'
+
+        delay = (boundary - now).total_seconds() + self.grace
+        if delay > self.max_sleep:
+            return self.max_sleep, 'resync'
+        return delay, 'boundary'
+
+    async def _run(self):
+        await self._check('start')
+
+        while True:
+            now = self.clock()
+            delay, reason = self.plan(now)
+            self.next_wakeup = now + timedelta(seconds=delay)
+            self.next_reason = reason
+
+            if await self._sleep(delay):
+                reason = 'manual'
+
+            changed = await self._check(reason)
+
+            # 경계에서 변경이 안 보이면 사이트 반영이 늦은 것일 수 있으므로 짧게 재확인
+            if reason == 'boundary' and not changed:
+                await self._verify()
+
+    async def _verify(self):
+        elapsed = 0.0
+        for delay in self.verify_delays:
+            self.next_wakeup = self.clock() + timedelta(seconds=delay - elapsed)
+            self.next_reason = 'verify'
+            await asyncio.sleep(delay - elapsed)
+            elapsed = delay
+            if await self._check('verify'):
+                return
+
+    async def _sleep(self, delay: float) -> bool:
+        """delay초 대기, wake()로 깨어났으면 True"""
+        try:
+            await asyncio.wait_for(self._wake_event.wait(), timeout=max(delay, 0))
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self._wake_event.clear()
+
+    async def _check(self, reason: str) -> bool:
+        self.checks[reason] = self.checks.get(reason, 0) + 1
+        self.last_check = self.clock()
+        try:
+            changed = bool(await self.check(reason))
+        except Exception as e:
+            self.errors += 1
+            print(f"❌ 상인 체크 오류 ({reason}): {e}")
+            return False
+
+        if changed:
+            self.changes += 1
+        return changed
+
+    def get_stats(self) -> Dict:
+        return {
+            'checks': sum(self.checks.values()),
+            'by_reason': dict(self.checks),
+            'changes': self.changes,
+            'errors': self.errors,
+            'last_check': self.last_check,
+            'next_wakeup': self.next_wakeup,
+            'next_reason': self.next_reason,
+        }
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""
+떠돌이 상인 데이터 스냅샷
+- 수집 결과를 읽기 전용 상인/아이템(FrozenRecord, tuple)으로 한 번 얼려서 버전 번호와 수집 시각을 붙임
+  (merchant_model의 Merchant/Item은 이미 불변이라 그대로 보관)
+- (지역, NPC) 인덱스, 지역별 상인, 등급별 아이템 수를 만들 때 한 번만 계산
+- 수집기는 새 스냅샷을 만들어 참조 하나만 바꿔 끼움(publish) → 명령어는 복사 없이 current를 잡고 끝까지 같은 데이터를 읽음
+"""
+
+import threading
+from collections import Counter
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional, Tuple
+
+from merchant_diff import MerchantChangeset, build_merchant_index, diff_merchants
+
+
+class FrozenRecord(dict):
+    """수정할 수 없는 dict (JSON 직렬화 / dict 접근은 그대로)"""
+
+    __slots__ = ()
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("스냅샷 데이터는 수정할 수 없습니다 (copy()로 복사 후 수정)")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def copy(self) -> Dict:
+        """수정 가능한 얕은 복사본"""
+        return dict(self)
+
+    def __reduce__(self):
+        return self.__class__, (dict(self),)
+
+
+def freeze(value: Any) -> Any:
+    """dict → FrozenRecord, list → tuple (중첩 포함)"""
+    if isinstance(value, FrozenRecord):
+        return value
+    if isinstance(value, dict):
+        return FrozenRecord((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+class MerchantSnapshot:
+    """특정 시점의 상인 목록 (읽기 전용)"""
+
+    __slots__ = ('version', 'fetched_at', 'merchants', 'index', 'by_region', 'grade_counts', 'item_count')
+
+    def __init__(self, version: int, merchants: Optional[Iterable[Dict]], fetched_at: Optional[datetime] = None):
+        self.version = version
+        self.fetched_at = fetched_at or datetime.now()
+        self.merchants: Tuple[FrozenRecord, ...] = tuple(freeze(merchant) for merchant in merchants or ())
+
+        # 조회/비교용 인덱스 (스냅샷마다 한 번만 계산)
+        self.index = build_merchant_index(self.merchants)
+
+        by_region: Dict[str, list] = {}
+        grade_counts: Counter = Counter()
+        for merchant in self.merchants:
+            region = merchant.get('region_name') or merchant.get('region') or ''
+            by_region.setdefault(region, []).append(merchant)
+            grade_counts.update(item['grade'] for item in merchant.get('items', ()) if not isinstance(item, str))
+
+        self.by_region: Mapping[str, Tuple[FrozenRecord, ...]] = MappingProxyType(
+            {region: tuple(merchants) for region, merchants in by_region.items()}
+        )
+        self.grade_counts: Mapping[Any, int] = MappingProxyType(dict(grade_counts))
+        self.item_count = sum(len(merchant.get('items', ())) for merchant in self.merchants)
+
+    def __len__(self) -> int:
+        return len(self.merchants)
+
+    def __iter__(self) -> Iterator[FrozenRecord]:
+        return iter(self.merchants)
+
+    def changes_since(self, previous: Optional['MerchantSnapshot']) -> MerchantChangeset:
+        """이전 스냅샷과 비교 (미리 만든 인덱스 사용)"""
+        return diff_merchants(previous.index if previous is not None else None, self.index)
+
+    def __repr__(self):
+        return f"MerchantSnapshot(v{self.version}, {len(self.merchants)}명, {self.fetched_at:%H:%M:%S})"
+
+
+class MerchantSnapshotStore:
+    """최신 스냅샷 보관소 (쓰기는 수집기 하나, 읽기는 잠금 없이 current 참조)"""
+
+    def __init__(self):
+        self.current: Optional[MerchantSnapshot] = None
+        self._version = 0
+        self._publish_lock = threading.Lock()
+        self.published = 0
+
+    @property
+    def merchants(self) -> Optional[Tuple[FrozenRecord, ...]]:
+        """현재 상인 목록 (아직 수집 전이면 None)"""
+        snapshot = self.current
+        return snapshot.merchants if snapshot is not None else None
+
+    @property
+    def version(self) -> int:
+        snapshot = self.current
+        return snapshot.version if snapshot is not None else 0
+
+    def publish(self, merchants: Optional[Iterable[Dict]], fetched_at: Optional[datetime] = None,
+                version: Optional[int] = None) -> MerchantSnapshot:
+        """
+        새 스냅샷을 만들어 current로 교체
+        스냅샷을 다 만든 뒤 참조 하나만 바꾸므로 읽는 쪽은 이전/새 스냅샷 중 하나를 온전히 봄
+        Args:
+            version: 버전 번호 지정 (여러 저장소가 같은 수집 세대 번호를 쓸 때, 이전 버전보다 커야 함)
+        """
+        with self._publish_lock:
+            self._version = max(self._version + 1, version or 0)
+            snapshot = MerchantSnapshot(self._version, merchants, fetched_at)
+            self.current = snapshot
+            self.published += 1
+        return snapshot
+
+    def get_stats(self) -> Dict[str, Any]:
+        """스냅샷 통계"""
+        snapshot = self.current
+        return {
+            'version': snapshot.version if snapshot is not None else 0,
+            'merchants': len(snapshot) if snapshot is not None else 0,
+            'items': snapshot.item_count if snapshot is not None else 0,
+            'fetched_at': snapshot.fetched_at.strftime("%H:%M:%S") if snapshot is not None else None,
+            'published': self.published,
+        }
@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+"""
+떠돌이 상인 통계 (NumPy 열 배열)
+- SnapshotColumns: 스냅샷의 아이템을 (상인 번호, 지역 ID, 등급 코드, 타입 코드) 배열로 한 번 변환
+  → 등급/타입/지역 분포는 np.bincount 한 번, 등급 필터는 불리언 마스크 한 번
+- ObservationHistory: 기록 저장소의 등장 행(주기 시각, 지역 ID, 등급)을 늘어나는 배열에 추가만 함
+  → 기간별 분포, 지역별 횟수, 주간 추이(주 × 등급)를 파이썬 반복 없이 계산
+- 등급 코드는 merchant_model과 같음 (0 모름, 1 일반 … 5 전설)
+"""
+
+import threading
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from merchant_model import to_grade
+
+GRADE_LEVELS = 6            # 0(모름) + 1~5
+TYPE_LEVELS = 4             # 0(모름) + 1~3
+WEEK_SECONDS = 7 * 24 * 3600
+# 주 번호 기준 (월요일 00:00, 기록 저장소의 ISO 주 키와 같은 경계)
+WEEK_ORIGIN = datetime(2000, 1, 3).timestamp()
+
+
+def grade_code(value) -> int:
+    """등급 텍스트/값 → 등급 코드 (모르면 0)"""
+    grade = to_grade(value)
+    return int(grade) if isinstance(grade, int) and 0 < grade < GRADE_LEVELS else 0
+
+
+def week_index(timestamps: np.ndarray) -> np.ndarray:
+    """유닉스 초 → WEEK_ORIGIN부터의 주 번호"""
+    return ((timestamps - WEEK_ORIGIN) // WEEK_SECONDS).astype(np.int64)
+
+
+class SnapshotColumns:
+    """스냅샷 한 개의 아이템 열 배열 (읽기 전용)"""
+
+    __slots__ = ('version', 'regions', 'merchant_count', 'merchant', 'region', 'grade', 'type')
+
+    def __init__(self, merchants: Iterable[Dict], version: int = 0):
+        self.version = version
+        region_ids: Dict[str, int] = {}
+        merchant_ids, regions, grades, types = [], [], [], []
+        merchant_count = 0
+        for merchant_count, merchant in enumerate(merchants, 1):
+            region_id = region_ids.setdefault(merchant.get('region_name') or '', len(region_ids))
+            for item in merchant.get('items', ()):
+                if isinstance(item, str):
+                    item = {'name': item}
+                merchant_ids.append(merchant_count - 1)
+                regions.append(region_id)
+                grades.append(grade_code(item.get('grade', 0)))
+                item_type = item.get('type', 0)
+                types.append(item_type if isinstance(item_type, int) and 0 < item_type < TYPE_LEVELS else 0)
+
+        self.regions: Tuple[str, ...] = tuple(region_ids)
+        self.merchant_count = merchant_count
+        self.merchant = np.array(merchant_ids, dtype=np.int32)
+        self.region = np.array(regions, dtype=np.int32)
+        self.grade = np.array(grades, dtype=np.int8)
+        self.type = np.array(types, dtype=np.int8)
+
+    def __len__(self) -> int:
+        return len(self.grade)
+
+    def grade_counts(self) -> Dict[int, int]:
+        """등급 코드 → 아이템 수 (모르는 등급 / 0개 등급 제외)"""
+        counts = np.bincount(self.grade, minlength=GRADE_LEVELS)
+        return {int(grade): int(counts[grade]) for grade in np.flatnonzero(counts[1:]) + 1}
+
+    def type_counts(self) -> Dict[int, int]:
+        """타입 코드 → 아이템 수 (모르는 타입 / 0개 타입 제외)"""
+        counts = np.bincount(self.type, minlength=TYPE_LEVELS)
+        return {int(item_type): int(counts[item_type]) for item_type in np.flatnonzero(counts[1:]) + 1}
+
+    def region_item_counts(self) -> Dict[str, int]:
+        """지역 → 아이템 수"""
+        counts = np.bincount(self.region, minlength=len(self.regions))
+        return dict(zip(self.regions, counts.tolist()))
+
+    def merchants_with(self, grade: Optional[int] = None, item_type: Optional[int] = None) -> np.ndarray:
+        """조건에 맞는 아이템을 하나라도 가진 상인 번호 (오름차순)"""
+        mask = np.ones(len(self.grade), dtype=bool)
+        if grade is not None:
+            mask &= self.grade == grade
+        if item_type is not None:
+            mask &= self.type == item_type
+        # 정렬(np.unique) 대신 상인별 개수를 세서 0이 아닌 상인만
+        return np.flatnonzero(np.bincount(self.merchant[mask], minlength=self.merchant_count))
+
+
+class ObservationHistory:
+    """등장 기록 열 배열 (추가 전용, 용량을 두 배씩 늘림)"""
+
+    def __init__(self, capacity: int = 1024):
+        self._timestamp = np.empty(capacity, dtype=np.float64)
+        self._region = np.empty(capacity, dtype=np.int32)
+        self._grade = np.empty(capacity, dtype=np.int8)
+        self._size = 0
+        self._view = (self._timestamp[:0], self._region[:0], self._grade[:0])
+        self._write_lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+
+        # 기록 저장소 동기화 위치 (마지막 주기와 그 주기에 이미 넣은 (지역, 아이템))
+        self._sync_cycle = ''
+        self._sync_seen: set = set()
+        self.region_names: Dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return self._size
+
+    def columns(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(시각, 지역 ID, 등급) 현재까지의 뷰 (읽는 쪽은 복사 없이 사용)"""
+        return self._view
+
+    def extend(self, timestamps, regions, grades):
+        """행 추가 (새 행을 다 쓴 뒤 뷰를 한 번에 교체 → 읽는 쪽은 이전/새 뷰 중 하나를 온전히 봄)"""
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        count = len(timestamps)
+        if not count:
+            return
+        with self._write_lock:
+            size = self._size
+            if size + count > len(self._timestamp):
+                capacity = max(size + count, len(self._timestamp) * 2)
+                for name in ('_timestamp', '_region', '_grade'):
+                    old = getattr(self, name)
+                    new = np.empty(capacity, dtype=old.dtype)
+                    new[:size] = old[:size]
+                    setattr(self, name, new)
+            self._timestamp[size:size + count] = timestamps
+            self._region[size:size + count] = regions
+            self._grade[size:size + count] = grades
+            self._size = size + count
+            self._view = (self._timestamp[:self._size], self._region[:self._size], self._grade[:self._size])
+
+    def sync(self, store) -> int:
+        """
+        MerchantHistoryStore에서 아직 안 읽은 등장 행만 추가 (동기 - executor 스레드에서 호출)
+        Returns:
+            추가한 행 수
+        """
+        with self._sync_lock:
+            return self._sync(store)
+
+    def _sync(self, store) -> int:
+        rows = store.appearance_rows(self._sync_cycle)
+        rows = [row for row in rows if row[0] != self._sync_cycle or (row[1], row[2]) not in self._sync_seen]
+        if not rows:
+            return 0
+
+        last_cycle = rows[-1][0]
+        if last_cycle != self._sync_cycle:
+            self._sync_cycle, self._sync_seen = last_cycle, set()
+        self._sync_seen.update((region_id, item_id) for cycle, region_id, item_id, _ in rows if cycle == last_cycle)
+        self.region_names = store.region_names()
+
+        # 주기 문자열은 종류가 적으므로 고유값만 시각으로 변환
+        cycles, inverse = np.unique(np.array([row[0] for row in rows]), return_inverse=True)
+        cycle_times = np.array([datetime.strptime(cycle, '%Y-%m-%d %H:%M').timestamp() for cycle in cycles])
+        self.extend(cycle_times[inverse], [row[1] for row in rows], [row[3] for row in rows])
+        return len(rows)
+
+    def _since(self, weeks: Optional[int], now: Optional[datetime]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        timestamp, region, grade = self.columns()
+        if not weeks:
+            return timestamp, region, grade
+        current_week = int(week_index(np.array([(now or datetime.now()).timestamp()]))[0])
+        start = WEEK_ORIGIN + (current_week - weeks + 1) * WEEK_SECONDS
+        # 시각 순으로 추가되므로 이진 탐색으로 시작 위치만 찾음
+        offset = int(np.searchsorted(timestamp, start))
+        return timestamp[offset:], region[offset:], grade[offset:]
+
+    def grade_distribution(self, weeks: Optional[int] = None, now: Optional[datetime] = None) -> Dict[int, int]:
+        """등급 코드 → 등장 횟수 (높은 등급 순, 0회 제외)"""
+        _, _, grade = self._since(weeks, now)
+        counts = np.bincount(grade, minlength=GRADE_LEVELS)
+        return {int(code): int(counts[code]) for code in np.flatnonzero(counts)[::-1]}
+
+    def region_counts(self, weeks: Optional[int] = None, now: Optional[datetime] = None,
+                      limit: Optional[int] = None) -> List[Tuple[str, int]]:
+        """지역별 등장 횟수 (많은 순)"""
+        _, region, _ = self._since(weeks, now)
+        if not len(region):
+            return []
+        counts = np.bincount(region)
+        order = np.argsort(-counts, kind='stable')
+        order = order[counts[order] > 0][:limit]
+        return [(self.region_names.get(int(region_id), str(region_id)), int(counts[region_id])) for region_id in order]
+
+    def weekly_trend(self, weeks: int = 4, now: Optional[datetime] = None) -> Tuple[List[datetime], np.ndarray]:
+        """
+        최근 weeks주 주 × 등급 등장 횟수
+        Returns:
+            (주 시작 시각 목록, shape (weeks, GRADE_LEVELS) 배열 - 마지막 행이 이번 주)
+        """
+        timestamp, _, grade = self._since(weeks, now)
+        current_week = int(week_index(np.array([(now or datetime.now()).timestamp()]))[0])
+        offset = week_index(timestamp) - (current_week - weeks + 1)
+        valid = (offset >= 0) & (offset < weeks)
+        counts = np.bincount(offset[valid] * GRADE_LEVELS + grade[valid], minlength=weeks * GRADE_LEVELS)
+        starts = [datetime.fromtimestamp(WEEK_ORIGIN + (current_week - weeks + 1 + i) * WEEK_SECONDS) for i in range(weeks)]
+        return starts, counts.reshape(weeks, GRADE_LEVELS)
+
+    def week_over_week(self, now: Optional[datetime] = None) -> Dict[int, Tuple[int, int]]:
+        """등급 코드 → (지난주, 이번 주) 등장 횟수 (둘 다 0이면 제외)"""
+        _, trend = self.weekly_trend(2, now)
+        active = np.flatnonzero(trend.sum(axis=0))[::-1]
+        return {int(code): (int(trend[0, code]), int(trend[1, code])) for code in active}
+
+
+class MerchantStatsEngine:
+    """스냅샷 열 배열 캐시 + 등장 기록 배열"""
+
+    def __init__(self):
+        self._columns: Optional[SnapshotColumns] = None
+        self.history = ObservationHistory()
+        self.builds = 0
+
+    def columns(self, snapshot) -> SnapshotColumns:
+        """스냅샷 열 배열 (버전마다 한 번만 변환)"""
+        columns = self._columns
+        if columns is None or columns.version != snapshot.version:
+            columns = self._columns = SnapshotColumns(snapshot.merchants, snapshot.version)
+            self.builds += 1
+        return columns
+
+    def sync_history(self, store) -> int:
+        """기록 저장소에서 새 등장 행 추가 (executor 스레드에서 호출)"""
+        return self.history.sync(store)
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+"""
+Next.js 데이터 라우트(/_next/data/<buildId>/<page>.json) 직접 호출 클라이언트
+- HTML 한 번으로 현재 buildId를 찾아서 캐시
+- 이후에는 HTML 대신 작은 JSON 라우트만 요청
+- kloa.gg 배포로 buildId가 바뀌어 404가 나면 자동으로 다시 찾음
+- 조건부 요청(ETag/Last-Modified)으로 304면 이전 파싱 결과 재사용
+"""
+
+import threading
+from typing import Any, Dict, Optional
+
+import requests
+
+from conditional_http import ConditionalHTTPClient
+from next_data_extractor import extract_next_data
+
+
+class NextDataClient:
+    """buildId 자동 탐색 Next.js 데이터 라우트 클라이언트"""
+
+    def __init__(self, base_url: str = "https://kloa.gg", headers: Optional[Dict[str, str]] = None,
+                 timeout: float = 10.0, session: Optional[requests.Session] = None):
+        """
+        초기화
+        Args:
+            base_url: 사이트 주소
+            headers: 요청 헤더
+            timeout: 요청 타임아웃(초)
+            session: 재사용할 requests 세션 (없으면 새로 생성, keep-alive 연결 유지)
+        """
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.session = session or requests.Session()
+        self.session.headers.update(headers or {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            'Accept-Language': 'ko-KR,ko;q=0.8,en-US;q=0.5,en;q=0.3',
+        })
+
+        self.http = ConditionalHTTPClient(self.session)
+
+        self.build_id: Optional[str] = None
+        self._lock = threading.Lock()
+
+        # url -> 마지막으로 파싱한 데이터 (304면 그대로 반환)
+        self._parsed: Dict[str, Dict[str, Any]] = {}
+
+        self.stats = {
+            'html_fetches': 0,
+            'data_fetches': 0,
+            'rediscoveries': 0,
+            'not_modified': 0,
+            'html_bytes': 0,
+            'data_bytes': 0,
+        }
+
+    def data_url(self, page: str) -> Optional[str]:
+        """현재 buildId 기준 데이터 라우트 URL (buildId를 아직 모르면 None)"""
+        if not self.build_id:
+            return None
+        return f"{self.base_url}/_next/data/{self.build_id}/{page.strip('/')}.json"
+
+    def discover_build_id(self, page: str = 'merchant') -> Optional[Dict[str, Any]]:
+        """
+        HTML 페이지에서 buildId를 찾아서 캐시
+        Returns:
+            해당 페이지의 데이터 ({'pageProps': ...} 형식), 실패하면 None
+        """
+        url = f"{self.base_url}/{page.strip('/')}"
+        response = self.http.get(url, timeout=self.timeout)
+        response.raise_for_status()
+
+        self.stats['html_fetches'] += 1
+
+        page_data = self._reuse_if_not_modified(url, response)
+        if page_data is None:
+            self.stats['html_bytes'] += len(response.content)
+
+            next_data = extract_next_data(response.content)
+            if not next_data or not next_data.get('buildId'):
+                return None
+
+            # 방금 받은 HTML에 같은 데이터가 있으므로 데이터 라우트와 같은 형식으로 돌려줌
+            page_data = {
+                'pageProps': next_data.get('props', {}).get('pageProps', {}),
+                'buildId': next_data['buildId'],
+            }
+            self._parsed[url] = page_data
+
+        with self._lock:
+            self.build_id = page_data['buildId']
+
+        return page_data
+
+    def fetch(self, page: str = 'merchant') -> Optional[Dict[str, Any]]:
+        """
+        페이지 데이터 가져오기 ({'pageProps': ...} 형식)
+        buildId가 없으면 HTML에서 찾고, 404(배포로 buildId 변경)면 한 번 다시 찾아서 재시도
+        Raises:
+            requests.exceptions.RequestException: 네트워크/HTTP 오류
+        """
+        if not self.build_id:
+            return self.discover_build_id(page)
+
+        url = self.data_url(page)
+        response = self.http.get(url, timeout=self.timeout)
+
+        if response.status_code == 404:
+            self.stats['rediscoveries'] += 1
+            self._parsed.pop(url, None)
+            with self._lock:
+                self.build_id = None
+            return self.discover_build_id(page)
+
+        response.raise_for_status()
+
+        self.stats['data_fetches'] += 1
+
+        page_data = self._reuse_if_not_modified(url, response)
+        if page_data is None:
+            self.stats['data_bytes'] += len(response.content)
+            page_data = response.json()
+            self._parsed[url] = page_data
+
+        return page_data
+
+    def _reuse_if_not_modified(self, url: str, response) -> Optional[Dict[str, Any]]:
+        """304 응답이면 이전에 파싱한 데이터 반환 (JSON 파싱 생략)"""
+        if response.not_modified and url in self._parsed:
+            self.stats['not_modified'] += 1
+            return self._parsed[url]
+        return None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """요청 통계"""
+        stats = dict(self.stats)
+        stats['build_id'] = self.build_id
+        stats['http'] = self.http.get_stats()
+        return stats
+
+    def close(self):
+        """세션 종료"""
+        self.session.close()
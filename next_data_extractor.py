@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""
+Next.js __NEXT_DATA__ JSON 고속 추출기
+- BeautifulSoup 트리를 만들지 않고 <script id="__NEXT_DATA__"> 위치를 바이트/문자열 검색으로 찾음
+- 해당 JSON 구간만 디코딩/파싱
+- 검색이 실패하면 BeautifulSoup으로 대체
+"""
+
+import json
+from typing import Dict, Optional, Union
+
+from bs4 import BeautifulSoup
+
+# 따옴표 형식이 다른 경우까지 모두 처리
+NEXT_DATA_MARKERS = ('id="__NEXT_DATA__"', "id='__NEXT_DATA__'", 'id=__NEXT_DATA__')
+
+# 어떤 방식으로 추출했는지 통계
+extract_stats = {'fast': 0, 'fallback': 0, 'failed': 0}
+
+
+def find_next_data_slice(html: Union[str, bytes]) -> Optional[Union[str, bytes]]:
+    """
+    HTML에서 __NEXT_DATA__ 스크립트 내용 구간만 잘라서 반환
+    Args:
+        html: HTML 문자열 또는 응답 바이트 (response.content)
+    Returns:
+        스크립트 내용 (입력과 같은 타입), 찾지 못하면 None
+    """
+    is_bytes = isinstance(html, (bytes, bytearray))
+
+    tag_open, tag_close, script_open, script_close = (
+        (b'<', b'>', b'<script', b'</script') if is_bytes else ('<', '>', '<script', '</script')
+    )
+
+    for marker in NEXT_DATA_MARKERS:
+        needle = marker.encode('ascii') if is_bytes else marker
+        marker_pos = html.find(needle)
+
+        while marker_pos != -1:
+            # 마커가 실제로 <script ...> 태그 안에 있는지 확인
+            tag_start = html.rfind(tag_open, 0, marker_pos)
+            if tag_start != -1 and html[tag_start:tag_start + 7].lower() == script_open:
+                content_start = html.find(tag_close, marker_pos)
+                if content_start == -1:
+                    return None
+                content_start += 1
+
+                content_end = html.find(script_close, content_start)
+                if content_end == -1:
+                    return None
+
+                return html[content_start:content_end]
+
+            marker_pos = html.find(needle, marker_pos + len(needle))
+
+    return None
+
+
+def extract_next_data(html: Union[str, bytes]) -> Optional[Dict]:
+    """
+    HTML에서 __NEXT_DATA__ JSON 추출 (고속 검색 → 실패시 BeautifulSoup)
+    Args:
+        html: HTML 문자열 또는 응답 바이트 (response.content)
+    Returns:
+        파싱된 JSON, 찾지 못하면 None
+    """
+    json_slice = find_next_data_slice(html)
+    if json_slice:
+        try:
+            data = json.loads(json_slice)
+            extract_stats['fast'] += 1
+            return data
+        except ValueError:
+            pass
+
+    return _extract_with_beautifulsoup(html)
+
+
+def _extract_with_beautifulsoup(html: Union[str, bytes]) -> Optional[Dict]:
+    """BeautifulSoup 전체 파싱으로 __NEXT_DATA__ 추출 (대체 경로)"""
+    try:
+        soup = BeautifulSoup(html, 'html.parser')
+        next_data_script = soup.find('script', {'id': '__NEXT_DATA__'})
+
+        if next_data_script and next_data_script.string:
+            data = json.loads(next_data_script.string)
+            extract_stats['fallback'] += 1
+            return data
+
+    except ValueError:
+        pass
+
+    extract_stats['failed'] += 1
+    return None
@@ -5,7 +5,7 @@ ninav_server_finder.py에서 가져온 실제 데이터 사용
 """
 
 import discord
-from discord.ext import commands, tasks
+from discord.ext import commands
 import requests
 from bs4 import BeautifulSoup
 import json
@@ -13,6 +13,11 @@ from datetime import datetime, timedelta
 import asyncio
 from typing import Dict, List, Optional
 from real_time_merchant_fetcher import RealTimeMerchantFetcher
+from merchant_scheduler import MerchantScheduler
+from merchant_diff import diff_merchants
+from merchant_snapshot import MerchantSnapshotStore
+from item_search import ItemSearchIndex
+from merchant_model import ITEM_CATALOG
 
 class NinavDynamicMerchantBot:
     """니나브 서버 전용 떠상봇 - 동적 데이터"""
@@ -29,15 +34,29 @@ class NinavDynamicMerchantBot:
         # 실시간 데이터 가져오기 초기화
         self.merchant_fetcher = RealTimeMerchantFetcher()
         
-        # 동적으로 가져온 상인 데이터 저장
-        self.ninav_merchants_data = None
+        # 동적으로 가져온 상인 데이터 저장 (가져올 때마다 읽기 전용 스냅샷을 새로 만들어 교체)
+        self.merchant_snapshots = MerchantSnapshotStore()
         self.last_data_update = None
+        self.item_index = ItemSearchIndex(catalog=ITEM_CATALOG)  # 아이템 이름 검색 인덱스
         
-        # 마지막 알림 시간 추적
+        # 마지막 알림 시간 / 알림 보낸 상인 목록 추적
         self.last_notification = None
+        self.notified_merchants = None
+        
+        # 5분 고정 폴링 대신 다음 등장/마감/마감 30분 전 시각에만 확인
+        self.scheduler = MerchantScheduler(
+            self.check_merchants,
+            self.merchant_fetcher.get_next_boundary,
+            fallback_interval=300
+        )
         
         self.setup_bot()
     
+    @property
+    def ninav_merchants_data(self):
+        """현재 스냅샷의 상인 목록 (읽기 전용 tuple, 아직 가져오기 전이면 None)"""
+        return self.merchant_snapshots.merchants
+    
     def setup_bot(self):
         """봇 이벤트 및 명령어 설정"""
         
@@ -49,8 +68,8 @@ class NinavDynamicMerchantBot:
             # 초기 데이터 로드
             await self.load_ninav_data()
             
-            # 주기적 체크 시작
-            self.check_merchants.start()
+            # 스케줄 경계 기반 체크 시작
+            self.scheduler.start()
         
         @self.bot.command(name='떠상')
         async def check_current_merchants(ctx):
@@ -328,13 +347,9 @@ class NinavDynamicMerchantBot:
                     await ctx.send("❌ 상인 데이터를 가져올 수 없습니다.")
                     return
                 
-                active_merchants = await self.get_current_active_merchants()
-                found_merchants = []
-                
-                for merchant in active_merchants:
-                    items = [item['name'] for item in merchant['items']]
-                    if any(item_name.lower() in item.lower() for item in items):
-                        found_merchants.append(merchant)
+                # 아이템 이름 역색인으로 검색
+                snapshot = self.merchant_snapshots.current
+                found_merchants = self.item_index.find(snapshot, item_name)
                 
                 if not found_merchants:
                     embed = discord.Embed(
@@ -343,6 +358,15 @@ class NinavDynamicMerchantBot:
                         color=0xff9900,
                         timestamp=datetime.now()
                     )
+                    
+                    # 초성/오타 허용 검색으로 비슷한 아이템 이름 제안
+                    suggestions = self.item_index.search(item_name, limit=5)
+                    if suggestions:
+                        embed.add_field(
+                            name="💡 혹시 이 아이템을 찾으셨나요?",
+                            value=', '.join(hit.name for hit in suggestions),
+                            inline=False
+                        )
                 else:
                     embed = discord.Embed(
                         title=f"🔍 '{item_name}' 검색 결과",
@@ -351,15 +375,15 @@ class NinavDynamicMerchantBot:
                         timestamp=datetime.now()
                     )
                     
-                    for merchant in found_merchants:
+                    for merchant, matched_item in found_merchants:
                         region = merchant['region_name']
                         npc = merchant['npc_name']
                         items = [item['name'] for item in merchant['items']]
                         
-                        # 검색된 아이템 하이라이트
+                        # 검색된 아이템 하이라이트 (초성/오타 검색이면 찾은 아이템 이름 기준)
                         highlighted_items = []
                         for item in items:
-                            if item_name.lower() in item.lower():
+                            if item == matched_item['name'] or item_name.lower() in item.lower():
                                 highlighted_items.append(f"**{item}**")
                             else:
                                 highlighted_items.append(item)
@@ -667,6 +691,15 @@ class NinavDynamicMerchantBot:
                 inline=True
             )
             
+            # 다음 확인 예정 시각
+            scheduler_stats = self.scheduler.get_stats()
+            if scheduler_stats['next_wakeup']:
+                embed.add_field(
+                    name="⏰ 다음 확인",
+                    value=f"```{scheduler_stats['next_wakeup'].strftime('%H:%M:%S')} ({scheduler_stats['next_reason']})```",
+                    inline=True
+                )
+            
             embed.set_footer(text="니나브 서버 전용 | 실시간 모니터링")
             await ctx.send(embed=embed)
         
@@ -746,12 +779,12 @@ class NinavDynamicMerchantBot:
             result = self.merchant_fetcher.get_current_active_merchants()
             
             if result and len(result) > 0:
-                self.ninav_merchants_data = result
-                self.last_data_update = datetime.now()
-                print(f"✅ 실시간 데이터 로드 성공: {len(result)}명")
+                snapshot = self.merchant_snapshots.publish(result)
+                self.last_data_update = snapshot.fetched_at
+                print(f"✅ 실시간 데이터 로드 성공: {len(snapshot)}명 (v{snapshot.version})")
                 
                 # 로드된 데이터 확인
-                for merchant in result:
+                for merchant in snapshot.merchants:
                     region = merchant['region_name']
                     npc = merchant['npc_name']
                     item_count = len(merchant['items'])
@@ -795,23 +828,30 @@ class NinavDynamicMerchantBot:
             print(f"❌ 활성 상인 확인 오류: {e}")
             return []
     
-    @tasks.loop(minutes=5)
-    async def check_merchants(self):
-        """5분마다 상인 상태 확인"""
+    async def check_merchants(self, reason: str = 'manual') -> bool:
+        """스케줄 경계마다 상인 상태 확인 (활성 상인 목록이 바뀌었으면 True)"""
         try:
             channel = self.bot.get_channel(self.channel_id)
             if not channel:
                 print(f"❌ 채널을 찾을 수 없습니다: {self.channel_id}")
-                return
+                return False
             
-            # 데이터 자동 새로고침
-            await self.refresh_data_if_needed()
+            # 경계 시각에는 항상 새로 가져옴 (그 외에는 30분마다)
+            if reason in ('boundary', 'verify'):
+                await self.load_ninav_data()
+            else:
+                await self.refresh_data_if_needed()
             
-            active_merchants = await self.get_current_active_merchants()
+            # 알림 전송이 끝날 때까지 같은 스냅샷 사용 (인덱스도 스냅샷에서 미리 계산됨)
+            snapshot = self.merchant_snapshots.current
+            active_merchants = snapshot.merchants if snapshot is not None else ()
+            current_merchants = snapshot.index if snapshot is not None else {}
+            changed = self.notified_merchants is None or bool(diff_merchants(self.notified_merchants, current_merchants))
             
-            # 상인이 활성화되어 있고, 마지막 알림으로부터 30분이 지났으면 알림
+            # 상인 목록이 바뀌었거나 마지막 알림으로부터 30분이 지났으면 알림
             now = datetime.now()
             if active_merchants and (
+                changed or
                 self.last_notification is None or 
                 (now - self.last_notification).total_seconds() > 1800  # 30분
             ):
@@ -837,14 +877,18 @@ class NinavDynamicMerchantBot:
                         inline=False
                     )
                 
-                embed.set_footer(text="니나브 서버 전용 | 다음 알림: 30분 후")
+                embed.set_footer(text="니나브 서버 전용 | 다음 알림: 상인 변경 또는 30분 후")
                 
                 await channel.send(embed=embed)
                 self.last_notification = now
                 print(f"✅ 니나브 서버 상인 알림 전송: {len(active_merchants)}명")
             
+            self.notified_merchants = current_merchants
+            return changed
+            
         except Exception as e:
             print(f"❌ 상인 체크 오류: {e}")
+            return False
     
     def run(self):
         """봇 실행"""
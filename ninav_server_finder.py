@@ -4,12 +4,14 @@
 """
 
 import requests
-from bs4 import BeautifulSoup
 import json
 import re
 from datetime import datetime
 from typing import Dict, List, Optional
 
+from next_data_extractor import extract_next_data
+from next_data_client import NextDataClient
+
 class NinavServerFinder:
     """니나브 서버 데이터 찾기"""
     
@@ -23,6 +25,24 @@ class NinavServerFinder:
             'Connection': 'keep-alive',
             'Referer': 'https://kloa.gg/merchant',
         }
+        self.next_data_client = NextDataClient(self.base_url, headers=self.headers)
+    
+    def data_route(self, page: str) -> Optional[str]:
+        """현재 buildId 기준 Next.js 데이터 라우트 경로 (배포마다 바뀌므로 하드코딩하지 않음, buildId를 못 찾으면 None)"""
+        if not self.next_data_client.build_id:
+            try:
+                self.next_data_client.discover_build_id('merchant')
+            except requests.exceptions.RequestException as e:
+                print(f"⚠️ buildId 탐색 실패: {e}")
+        
+        if not self.next_data_client.build_id:
+            return None
+        return f"/_next/data/{self.next_data_client.build_id}/{page}.json"
+    
+    def data_routes(self, *pages: str) -> List[str]:
+        """데이터 라우트 후보 목록 (buildId를 못 찾으면 빈 목록 → 404가 확실한 요청은 보내지 않음)"""
+        routes = [self.data_route(page) for page in pages]
+        return [route for route in routes if route]
     
     def method1_find_ninav_api_endpoints(self) -> Optional[Dict]:
         """방법 1: 니나브 서버 전용 API 엔드포인트 찾기"""
@@ -31,8 +51,7 @@ class NinavServerFinder:
         
         # 가능한 니나브 서버 API 엔드포인트들
         ninav_endpoints = [
-            "/_next/data/zg-3f6yHQunqL3skcaU9x/merchant/ninav.json",
-            "/_next/data/zg-3f6yHQunqL3skcaU9x/merchant/니나브.json",
+            *self.data_routes("merchant/ninav", "merchant/니나브"),
             "/api/merchant/ninav",
             "/api/merchant/니나브",
             "/api/v1/merchant/ninav",
@@ -84,7 +103,7 @@ class NinavServerFinder:
         print("=" * 60)
         
         base_endpoints = [
-            "/_next/data/zg-3f6yHQunqL3skcaU9x/merchant.json",
+            *self.data_routes("merchant"),
             "/api/merchant",
             "/merchant/api",
         ]
@@ -148,25 +167,18 @@ class NinavServerFinder:
             
             print(f"✅ HTML 가져오기 성공: {len(response.text):,} 바이트")
             
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
             # 1. __NEXT_DATA__ 스크립트에서 모든 서버 데이터 찾기
-            next_data_script = soup.find('script', {'id': '__NEXT_DATA__'})
-            if next_data_script:
-                try:
-                    json_data = json.loads(next_data_script.string)
-                    print("✅ __NEXT_DATA__ JSON 파싱 성공")
-                    
-                    # 서버별 데이터가 있는지 확인
-                    self.analyze_json_structure(json_data)
-                    
-                    # 니나브 서버 데이터 추출 시도
-                    ninav_data = self.extract_ninav_from_json(json_data)
-                    if ninav_data:
-                        return ninav_data
-                        
-                except json.JSONDecodeError as e:
-                    print(f"❌ JSON 파싱 실패: {e}")
+            json_data = extract_next_data(response.content)
+            if json_data:
+                print("✅ __NEXT_DATA__ JSON 파싱 성공")
+                
+                # 서버별 데이터가 있는지 확인
+                self.analyze_json_structure(json_data)
+                
+                # 니나브 서버 데이터 추출 시도
+                ninav_data = self.extract_ninav_from_json(json_data)
+                if ninav_data:
+                    return ninav_data
             
             # 2. 동적 콘텐츠에서 니나브 데이터 찾기
             print("\n🔍 동적 콘텐츠에서 니나브 데이터 검색...")
@@ -321,7 +333,7 @@ class NinavServerFinder:
         
         # 더 많은 조합 시도
         base_endpoints = [
-            "/_next/data/zg-3f6yHQunqL3skcaU9x/merchant.json",
+            *self.data_routes("merchant"),
             "/api/merchant",
             "/api/v1/merchant", 
             "/api/v2/merchant",
@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+"""
+디스코드 알림 동시 전송 (fan-out)
+- 서버 하나씩 순서대로 보내지 않고 동시 전송 개수를 제한해서 한꺼번에 전송
+- 디스코드 한도에 맞춘 토큰 버킷: 전체(봇 기준 초당 50회) + 채널별(5초에 5회)
+- 429는 Retry-After 만큼 해당 버킷을 멈추고, 일시적 오류는 지터를 넣은 지수 백오프로 재시도
+- 삭제된 채널/권한 없음(4xx)은 재시도하지 않고 영구 실패로 표시 → 호출한 쪽에서 구독 정리
+- 전송별 지연 시간 기록 (p50/p95/p99)
+"""
+
+import asyncio
+import random
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, List, Optional
+
+from rate_limiter import AsyncTokenBucket
+
+
+class PermanentDeliveryError(Exception):
+    """재시도해도 소용없는 전송 실패 (채널 없음 등)"""
+
+
+def is_permanent_error(error: Exception) -> bool:
+    """재시도하지 않을 오류인지 (discord.Forbidden/NotFound 등 429를 제외한 4xx)"""
+    if isinstance(error, PermanentDeliveryError):
+        return True
+    status = getattr(error, 'status', None)
+    return isinstance(status, int) and 400 <= status < 500 and status != 429
+
+
+def percentile(values: List[float], ratio: float) -> Optional[float]:
+    """정렬 후 ratio 위치의 값 (값이 없으면 None)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * ratio))]
+
+
+class DeliveryResult:
+    """전송 대상 하나의 결과"""
+
+    __slots__ = ('target', 'ok', 'attempts', 'latency', 'error', 'permanent')
+
+    def __init__(self, target: Hashable):
+        self.target = target
+        self.ok = False
+        self.attempts = 0
+        self.latency = 0.0       # fan-out 시작부터 이 대상 전송이 끝날 때까지(초)
+        self.error: Optional[str] = None
+        self.permanent = False
+
+
+class NotificationDispatcher:
+    """여러 채널에 같은 알림을 동시에 보내는 디스패처"""
+
+    def __init__(self, max_concurrency: int = 25, global_rate: float = 45.0, global_burst: float = 45.0,
+                 route_rate: float = 1.0, route_burst: float = 5.0, max_retries: int = 3,
+                 send_timeout: float = 15.0, backoff_base: float = 0.5, backoff_cap: float = 10.0):
+        """
+        초기화
+        Args:
+            max_concurrency: 동시에 진행할 최대 전송 수
+            global_rate / global_burst: 봇 전체 초당 전송 수 / 순간 최대 (디스코드 전역 한도 50/s 보다 약간 낮게)
+            route_rate / route_burst: 채널별 초당 전송 수 / 순간 최대 (메시지 전송 경로 5초에 5회)
+            max_retries: 일시적 오류 재시도 횟수
+            send_timeout: 전송 하나의 타임아웃(초)
+        """
+        self.max_concurrency = max_concurrency
+        self.route_rate = route_rate
+        self.route_burst = route_burst
+        self.max_retries = max_retries
+        self.send_timeout = send_timeout
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+
+        self.global_bucket = AsyncTokenBucket(rate=global_rate, capacity=global_burst)
+        self._route_buckets: Dict[Hashable, AsyncTokenBucket] = {}
+
+        # 통계
+        self.stats = {
+            'fanouts': 0,
+            'sent': 0,
+            'failed': 0,
+            'permanent_failures': 0,
+            'retries': 0,
+            'rate_limited': 0,
+        }
+        self.send_latencies = deque(maxlen=10000)   # 전송 1회 소요 시간(초)
+        self.last_fanout: Optional[Dict[str, Any]] = None
+
+    async def dispatch(self, targets: Iterable[Hashable], send: Callable[[Hashable], Awaitable[Any]],
+                       route_key: Optional[Callable[[Hashable], Hashable]] = None) -> List[DeliveryResult]:
+        """
+        모든 대상에 동시에 전송
+        Args:
+            targets: 전송 대상 목록 (예: (guild_id, channel_id))
+            send: async send(target) - 전송 실패시 예외 발생
+            route_key: 대상 → 속도 제한 경로 키 (기본값: 대상 자체, 보통 채널 ID)
+        Returns:
+            대상별 DeliveryResult (targets 순서)
+        """
+        targets = list(targets)
+        route_key = route_key or (lambda target: target)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        started = time.perf_counter()
+
+        results = await asyncio.gather(*(
+            self._deliver(target, send, route_key(target), semaphore, started) for target in targets
+        ))
+
+        duration = time.perf_counter() - started
+        latencies = [r.latency for r in results]
+        self.stats['fanouts'] += 1
+        self.last_fanout = {
+            'targets': len(targets),
+            'sent': sum(1 for r in results if r.ok),
+            'failed': sum(1 for r in results if not r.ok),
+            'duration': round(duration, 3),
+            'p50': percentile(latencies, 0.50),
+            'p95': percentile(latencies, 0.95),
+        }
+
+        self._prune_idle_routes()
+        return results
+
+    async def _deliver(self, target, send, route, semaphore, started) -> DeliveryResult:
+        result = DeliveryResult(target)
+        route_bucket = self._route_bucket(route)
+
+        for attempt in range(self.max_retries + 1):
+            result.attempts = attempt + 1
+
+            # 채널별 한도를 먼저 기다린 뒤 동시 전송 슬롯 + 전역 한도
+            await route_bucket.acquire()
+            async with semaphore:
+                await self.global_bucket.acquire()
+                send_started = time.perf_counter()
+                try:
+                    await asyncio.wait_for(send(target), timeout=self.send_timeout)
+                    error = None
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    error = e
+                finally:
+                    self.send_latencies.append(time.perf_counter() - send_started)
+
+            if error is None:
+                result.ok = True
+                result.error = None
+                self.stats['sent'] += 1
+                break
+
+            result.error = str(error) or type(error).__name__
+            if is_permanent_error(error):
+                result.permanent = True
+                self.stats['permanent_failures'] += 1
+                break
+
+            if attempt >= self.max_retries:
+                break
+
+            self.stats['retries'] += 1
+            retry_after = getattr(error, 'retry_after', None)
+            if getattr(error, 'status', None) == 429 or retry_after is not None:
+                self.stats['rate_limited'] += 1
+                wait = float(retry_after or 1.0)
+                # 전역 한도 초과면 모든 전송을, 아니면 해당 채널만 멈춤
+                (self.global_bucket if getattr(error, 'is_global', False) else route_bucket).pause(wait)
+            else:
+                await asyncio.sleep(self._backoff(attempt))
+
+        if not result.ok:
+            self.stats['failed'] += 1
+        result.latency = time.perf_counter() - started
+        return result
+
+    def _route_bucket(self, route: Hashable) -> AsyncTokenBucket:
+        bucket = self._route_buckets.get(route)
+        if bucket is None:
+            bucket = AsyncTokenBucket(rate=self.route_rate, capacity=self.route_burst)
+            self._route_buckets[route] = bucket
+        return bucket
+
+    def _prune_idle_routes(self):
+        """토큰이 가득 찬(최근에 안 쓴) 채널 버킷은 상태가 없으므로 제거"""
+        idle = [route for route, bucket in self._route_buckets.items() if bucket.available() >= bucket.capacity]
+        for route in idle:
+            del self._route_buckets[route]
+
+    def _backoff(self, attempt: int) -> float:
+        """지터를 넣은 지수 백오프 (full jitter)"""
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * (2 ** attempt)))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """전송 통계"""
+        latencies = list(self.send_latencies)
+        return {
+            **self.stats,
+            'send_p50': percentile(latencies, 0.50),
+            'send_p95': percentile(latencies, 0.95),
+            'send_p99': percentile(latencies, 0.99),
+            'last_fanout': self.last_fanout,
+            'rate_limiter': self.global_bucket.get_stats(),
+        }
@@ -0,0 +1,302 @@
+# -*- coding: utf-8 -*-
+"""
+디스크에 남는 알림 전송 대기열 (최소 한 번 전송)
+- 알림 × 채널 전송 작업을 보내기 전에 SQLite에 먼저 기록
+- 전송 성공 후에만 'sent'로 표시 → 전송 도중 재시작/연결 끊김이 있어도 다음 실행에서 이어서 전송
+- 같은 알림이 같은 채널에 두 번 들어가지 않도록 멱등 키(상인 목록 해시 + 채널)로 중복 제거
+- 대기열 길이 / 전송 속도 통계
+"""
+
+import asyncio
+import json
+import random
+import sqlite3
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from notification_dispatcher import DeliveryResult, NotificationDispatcher
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS notification_jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    idem_key TEXT NOT NULL UNIQUE,
+    guild_id INTEGER,
+    channel_id INTEGER NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    last_error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_notification_jobs_due ON notification_jobs (status, next_attempt_at);
+"""
+
+
+class QueuedNotification:
+    """대기열에서 꺼낸 전송 작업 하나"""
+
+    __slots__ = ('id', 'idem_key', 'guild_id', 'channel_id', 'payload', 'attempts')
+
+    def __init__(self, row: Tuple):
+        self.id, self.idem_key, self.guild_id, self.channel_id, payload, self.attempts = row
+        self.payload: Dict[str, Any] = json.loads(payload)
+
+
+class NotificationQueue:
+    """SQLite 기반 알림 전송 대기열"""
+
+    def __init__(self, path: str = "notification_queue.db", max_attempts: int = 5,
+                 retention: float = 6 * 3600):
+        """
+        초기화
+        Args:
+            path: SQLite 파일 경로 (":memory:"면 메모리)
+            max_attempts: 일시적 오류로 이만큼 실패하면 포기
+            retention: 보낸 작업을 남겨두는 시간(초) - 이 시간 안에는 같은 알림을 다시 넣어도 무시
+        """
+        self.path = path
+        self.max_attempts = max_attempts
+        self.retention = retention
+
+        # 작업 하나당 행 하나만 쓰므로 WAL + synchronous=NORMAL이면 이벤트 루프를 거의 막지 않음
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+        self.enqueued = 0
+        self.duplicates = 0
+        self.recovered = self._recover()
+
+    def _recover(self) -> int:
+        """지난 실행에서 전송 도중 멈춘 작업을 다시 대기 상태로 (최소 한 번 전송)"""
+        with self.conn:
+            cursor = self.conn.execute(
+                "UPDATE notification_jobs SET status='pending', updated_at=? WHERE status='sending'",
+                (time.time(),)
+            )
+        return cursor.rowcount
+
+    def enqueue(self, jobs: Iterable[Tuple[str, Optional[int], int, Dict[str, Any]]]) -> int:
+        """
+        전송 작업 추가 (이미 있는 멱등 키는 무시)
+        Args:
+            jobs: (멱등 키, guild_id, channel_id, payload) 목록
+        Returns:
+            새로 추가된 작업 수
+        """
+        now = time.time()
+        rows = [
+            (idem_key, guild_id, channel_id, json.dumps(payload, ensure_ascii=False), now, now, now)
+            for idem_key, guild_id, channel_id, payload in jobs
+        ]
+        if not rows:
+            return 0
+
+        with self.conn:
+            before = self.conn.total_changes
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO notification_jobs "
+                "(idem_key, guild_id, channel_id, payload, next_attempt_at, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            added = self.conn.total_changes - before
+
+        self.enqueued += added
+        self.duplicates += len(rows) - added
+        return added
+
+    def claim(self, limit: int = 500) -> List[QueuedNotification]:
+        """보낼 차례가 된 작업을 'sending'으로 바꾸고 반환"""
+        now = time.time()
+        with self.conn:
+            rows = self.conn.execute(
+                "SELECT id, idem_key, guild_id, channel_id, payload, attempts FROM notification_jobs "
+                "WHERE status='pending' AND next_attempt_at <= ? ORDER BY id LIMIT ?",
+                (now, limit)
+            ).fetchall()
+            self.conn.executemany(
+                "UPDATE notification_jobs SET status='sending', updated_at=? WHERE id=?",
+                [(now, row[0]) for row in rows]
+            )
+        return [QueuedNotification(row) for row in rows]
+
+    def mark_sent(self, job_ids: List[int]):
+        """전송 완료 표시"""
+        now = time.time()
+        with self.conn:
+            self.conn.executemany(
+                "UPDATE notification_jobs SET status='sent', attempts=attempts+1, updated_at=?, last_error=NULL "
+                "WHERE id=?",
+                [(now, job_id) for job_id in job_ids]
+            )
+
+    def mark_failed(self, job: QueuedNotification, error: Optional[str], permanent: bool):
+        """
+        전송 실패 표시
+        영구 실패이거나 최대 시도 횟수를 넘으면 'failed', 아니면 백오프 후 다시 대기
+        """
+        now = time.time()
+        attempts = job.attempts + 1
+        if permanent or attempts >= self.max_attempts:
+            status, next_attempt_at = 'failed', now
+        else:
+            delay = min(300, 10 * (2 ** attempts)) * random.uniform(0.5, 1.0)
+            status, next_attempt_at = 'pending', now + delay
+
+        with self.conn:
+            self.conn.execute(
+                "UPDATE notification_jobs SET status=?, attempts=?, next_attempt_at=?, updated_at=?, last_error=? "
+                "WHERE id=?",
+                (status, attempts, next_attempt_at, now, error, job.id)
+            )
+
+    def purge(self) -> int:
+        """보존 기간이 지난 완료/실패 작업 삭제"""
+        with self.conn:
+            cursor = self.conn.execute(
+                "DELETE FROM notification_jobs WHERE status IN ('sent', 'failed') AND updated_at < ?",
+                (time.time() - self.retention,)
+            )
+        return cursor.rowcount
+
+    def counts(self) -> Dict[str, int]:
+        """상태별 작업 수"""
+        counts = {'pending': 0, 'sending': 0, 'sent': 0, 'failed': 0}
+        for status, count in self.conn.execute("SELECT status, COUNT(*) FROM notification_jobs GROUP BY status"):
+            counts[status] = count
+        return counts
+
+    def oldest_pending_age(self) -> Optional[float]:
+        """가장 오래 기다린 대기 작업의 대기 시간(초)"""
+        row = self.conn.execute("SELECT MIN(created_at) FROM notification_jobs WHERE status='pending'").fetchone()
+        return time.time() - row[0] if row and row[0] is not None else None
+
+    def close(self):
+        self.conn.close()
+
+
+class NotificationOutbox:
+    """대기열을 비우는 전송 워커 (동시 전송은 NotificationDispatcher가 담당)"""
+
+    def __init__(self, queue: NotificationQueue, dispatcher: NotificationDispatcher,
+                 send: Callable[[QueuedNotification], Awaitable[Any]],
+                 on_permanent_failures: Optional[Callable[[List[QueuedNotification]], Any]] = None,
+                 batch_size: int = 500, poll_interval: float = 30.0):
+        """
+        초기화
+        Args:
+            send: async send(job) - 작업 하나 전송 (실패시 예외)
+            on_permanent_failures: 삭제된 채널 등 영구 실패한 작업 목록으로 배치마다 한 번 호출 (구독 일괄 정리용)
+            batch_size: 한 번에 꺼내서 동시에 보낼 작업 수
+            poll_interval: 재시도 대기 작업을 확인하는 간격(초)
+        """
+        self.queue = queue
+        self.dispatcher = dispatcher
+        self.send = send
+        self.on_permanent_failures = on_permanent_failures
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+
+        self._lock: Optional[asyncio.Lock] = None
+        self._task: Optional[asyncio.Task] = None
+        self._wake_event: Optional[asyncio.Event] = None
+
+        self.sent_times = deque(maxlen=100000)   # 전송 완료 시각 (전송 속도 계산용)
+        self.delivered = 0
+        self.failed = 0
+
+    async def drain(self) -> List[DeliveryResult]:
+        """보낼 차례가 된 작업을 모두 전송 (결과의 target은 QueuedNotification)"""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        results: List[DeliveryResult] = []
+        async with self._lock:
+            while True:
+                jobs = self.queue.claim(self.batch_size)
+                if not jobs:
+                    break
+
+                batch = await self.dispatcher.dispatch(jobs, self.send, route_key=lambda job: job.channel_id)
+                sent_ids = [r.target.id for r in batch if r.ok]
+                self.queue.mark_sent(sent_ids)
+                now = time.monotonic()
+                self.sent_times.extend([now] * len(sent_ids))
+                self.delivered += len(sent_ids)
+
+                permanent = []
+                for result in batch:
+                    if result.ok:
+                        continue
+                    self.failed += 1
+                    self.queue.mark_failed(result.target, result.error, result.permanent)
+                    if result.permanent:
+                        permanent.append(result.target)
+
+                if permanent and self.on_permanent_failures:
+                    self.on_permanent_failures(permanent)
+                results.extend(batch)
+
+            self.queue.purge()
+        return results
+
+    def start(self):
+        """백그라운드 워커 시작 (재시작 후 남은 작업 / 재시도 대기 작업 처리)"""
+        if self._task and not self._task.done():
+            return
+        self._wake_event = asyncio.Event()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def stop(self):
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    def wake(self):
+        if self._wake_event:
+            self._wake_event.set()
+
+    async def _run(self):
+        while True:
+            try:
+                await self.drain()
+            except Exception as e:
+                print(f"❌ 알림 대기열 처리 오류: {e}")
+
+            try:
+                await asyncio.wait_for(self._wake_event.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake_event.clear()
+
+    def drain_rate(self, window: float = 60.0) -> float:
+        """최근 window초 동안의 초당 전송 수"""
+        cutoff = time.monotonic() - window
+        recent = 0
+        for sent_at in reversed(self.sent_times):
+            if sent_at < cutoff:
+                break
+            recent += 1
+        return recent / window
+
+    def get_stats(self) -> Dict[str, Any]:
+        """대기열 통계"""
+        counts = self.queue.counts()
+        oldest = self.queue.oldest_pending_age()
+        return {
+            'depth': counts['pending'] + counts['sending'],
+            'pending': counts['pending'],
+            'sending': counts['sending'],
+            'failed': counts['failed'],
+            'enqueued': self.queue.enqueued,
+            'duplicates': self.queue.duplicates,
+            'recovered': self.queue.recovered,
+            'delivered': self.delivered,
+            'drain_rate': round(self.drain_rate(), 2),
+            'oldest_pending_age': round(oldest, 1) if oldest is not None else None,
+        }
@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+"""
+슬래시 명령어 자동완성용 접두어 트라이
+- 노드마다 그 아래 이름 중 상위 N개를 미리 정렬해서 보관 → 조회는 검색어 길이만큼 내려가서 목록을 그대로 반환
+- 이름 하나를 여러 키로 등록: 전체 이름, 두 번째 단어부터의 이름(`룬` → `집중 룬`), 초성(`ㅈㅈㄹ`)
+- AutocompleteIndex: 아이템 / 지역 / NPC 트라이 3개를 현재 스냅샷 + 고정 목록으로 만들고,
+  스냅샷 버전이나 고정 목록이 바뀔 때만 다시 만듦 (자동완성 요청은 수집/검색 없이 메모리만 조회)
+"""
+
+import bisect
+import time
+import unicodedata
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
+
+from hangul_search import choseong, to_compat_jamo
+from item_search import normalize_text
+
+# 키 종류별 순위 (작을수록 먼저)
+KEY_FULL, KEY_WORD, KEY_CHOSEONG = 0, 1, 2
+
+AUTOCOMPLETE_KINDS = ('items', 'regions', 'npcs')
+
+
+def completion_keys(name: str) -> List[Tuple[int, str]]:
+    """이름을 찾을 수 있는 (키 종류, 정규화된 키) 목록"""
+    words = to_compat_jamo(unicodedata.normalize('NFKC', name).casefold()).split()
+    full = ''.join(words)
+    if not full:
+        return []
+    keys = [(KEY_FULL, full)]
+    keys.extend((KEY_WORD, ''.join(words[i:])) for i in range(1, len(words)))
+    initials = choseong(full)
+    if initials != full:
+        keys.append((KEY_CHOSEONG, initials))
+    return keys
+
+
+class _TrieNode:
+    __slots__ = ('children', 'top')
+
+    def __init__(self):
+        self.children: Dict[str, '_TrieNode'] = {}
+        self.top: List[Tuple] = []      # (키 종류, -가중치, 이름 길이, 이름) 정렬, 상위 limit개
+
+
+class PrefixTrie:
+    """이름 접두어 트라이 (노드별 상위 limit개 미리 계산)"""
+
+    def __init__(self, limit: int = 25):
+        self.limit = limit
+        self.root = _TrieNode()
+        self.names = 0
+        self.nodes = 1
+
+    def add(self, name: str, weight: int = 0):
+        """
+        이름 등록
+        Args:
+            weight: 클수록 먼저 표시 (같은 키 종류 안에서)
+        """
+        self.names += 1
+        for kind, key in completion_keys(name):
+            entry = (kind, -weight, len(name), name)
+            node = self._offer(self.root, entry)
+            for char in key:
+                child = node.children.get(char)
+                if child is None:
+                    child = node.children[char] = _TrieNode()
+                    self.nodes += 1
+                node = self._offer(child, entry)
+
+    def _offer(self, node: _TrieNode, entry: Tuple) -> _TrieNode:
+        """노드 상위 목록에 반영 (같은 이름은 더 좋은 순위 하나만)"""
+        top = node.top
+        for index, existing in enumerate(top):
+            if existing[3] == entry[3]:
+                if existing <= entry:
+                    return node
+                del top[index]
+                break
+        if len(top) < self.limit or entry < top[-1]:
+            bisect.insort(top, entry)
+            if len(top) > self.limit:
+                top.pop()
+        return node
+
+    def complete(self, prefix: str, limit: Optional[int] = None) -> List[str]:
+        """접두어로 찾은 이름 (순위순)"""
+        node = self.root
+        for char in to_compat_jamo(normalize_text(prefix)):
+            node = node.children.get(char)
+            if node is None:
+                return []
+        return [entry[3] for entry in node.top[:limit or self.limit]]
+
+
+class AutocompleteIndex:
+    """아이템 / 지역 / NPC 자동완성 (현재 스냅샷 + 고정 목록)"""
+
+    def __init__(self, items: Iterable[str] = (), regions: Iterable[str] = (), npcs: Iterable[str] = (),
+                 limit: int = 25):
+        self.limit = limit
+        self.version: Optional[int] = None
+        self.tries: Dict[str, PrefixTrie] = {}
+
+        # 고정 목록은 스케줄 로드 스레드에서 바뀔 수 있으므로 세대 번호로 비교
+        self.catalog: Dict[str, Tuple[str, ...]] = {}
+        self.catalog_generation = 0
+        self._built_generation = -1
+        self.set_catalog(items=items, regions=regions, npcs=npcs)
+
+        # 통계
+        self.builds = 0
+        self.build_time = 0.0
+        self.queries = 0
+        self.latencies: Deque[float] = deque(maxlen=1000)
+
+    def set_catalog(self, items: Optional[Iterable[str]] = None, regions: Optional[Iterable[str]] = None,
+                    npcs: Optional[Iterable[str]] = None):
+        """고정 목록 교체 (None이면 그 종류는 유지, 바뀌면 다음 조회 때 다시 만듦)"""
+        for kind, names in (('items', items), ('regions', regions), ('npcs', npcs)):
+            if names is not None:
+                names = tuple(dict.fromkeys(name for name in names if name))
+                if names != self.catalog.get(kind):
+                    self.catalog[kind] = names
+                    self.catalog_generation += 1
+
+    def sync(self, snapshot) -> 'AutocompleteIndex':
+        """스냅샷 버전이 바뀌었으면 트라이 다시 만들기 (MerchantSnapshot 또는 None)"""
+        version = snapshot.version if snapshot is not None else 0
+        generation = self.catalog_generation
+        if self.tries and version == self.version and generation == self._built_generation:
+            return self
+
+        started = time.perf_counter()
+        catalog = dict(self.catalog)
+        live = {kind: set() for kind in AUTOCOMPLETE_KINDS}
+        for merchant in (snapshot.merchants if snapshot is not None else ()):
+            live['regions'].add(merchant['region_name'])
+            live['npcs'].add(merchant['npc_name'])
+            live['items'].update(item if isinstance(item, str) else item['name'] for item in merchant['items'])
+
+        tries = {}
+        for kind in AUTOCOMPLETE_KINDS:
+            trie = tries[kind] = PrefixTrie(self.limit)
+            # 지금 등장한 상인의 이름이 먼저
+            for name in live[kind]:
+                trie.add(name, weight=1)
+            for name in catalog[kind]:
+                if name not in live[kind]:
+                    trie.add(name)
+
+        self.tries, self.version, self._built_generation = tries, version, generation
+        self.builds += 1
+        self.build_time += time.perf_counter() - started
+        return self
+
+    def complete(self, kind: str, text: str, limit: Optional[int] = None) -> List[str]:
+        """kind('items' / 'regions' / 'npcs') 자동완성 후보"""
+        started = time.perf_counter()
+        trie = self.tries.get(kind)
+        names = trie.complete(text, limit) if trie is not None else []
+        self.queries += 1
+        self.latencies.append(time.perf_counter() - started)
+        return names
+
+    def get_stats(self) -> Dict:
+        """자동완성 통계 (최근 1000회 응답 시간)"""
+        latencies = sorted(self.latencies)
+        return {
+            'version': self.version,
+            'names': {kind: trie.names for kind, trie in self.tries.items()},
+            'nodes': sum(trie.nodes for trie in self.tries.values()),
+            'builds': self.builds,
+            'avg_build_ms': round(self.build_time / self.builds * 1000, 2) if self.builds else None,
+            'queries': self.queries,
+            'p99_us': round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1_000_000, 1)
+            if latencies else None,
+        }
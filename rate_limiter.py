@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""
+비동기 토큰 버킷 속도 제한기
+한도를 넘는 요청은 거절하지 않고 토큰이 찰 때까지 대기열에서 기다림
+"""
+
+import asyncio
+import time
+from typing import Dict, Optional
+
+
+class AsyncTokenBucket:
+    """asyncio용 토큰 버킷"""
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        초기화
+        Args:
+            rate: 초당 채워지는 토큰 수
+            capacity: 최대 토큰 수 (순간적으로 몰아서 보낼 수 있는 요청 수)
+        """
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("rate와 capacity는 0보다 커야 합니다")
+
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock: Optional[asyncio.Lock] = None
+        self._paused_until = 0.0
+
+        self.acquired = 0
+        self.waited = 0          # 기다려야 했던 요청 수
+        self.total_wait = 0.0    # 누적 대기 시간(초)
+
+    @classmethod
+    def per_minute(cls, requests_per_minute: int, burst: int = 10) -> 'AsyncTokenBucket':
+        """
+        분당 한도에 맞춘 버킷
+        어느 60초 구간에서도 burst + 충전량이 한도를 넘지 않도록 충전 속도를 낮춤
+        """
+        burst = max(1, min(burst, requests_per_minute - 1))
+        return cls(rate=(requests_per_minute - burst) / 60.0, capacity=burst)
+
+    async def acquire(self, tokens: float = 1.0) -> float:
+        """
+        토큰을 얻을 때까지 대기
+        Returns:
+            기다린 시간(초)
+        """
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        started = time.monotonic()
+
+        # 락을 잡은 순서대로 토큰을 받음 (먼저 온 요청이 먼저 나감)
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+
+                self._refill(now)
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    break
+
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
+
+        waited = time.monotonic() - started
+        self.acquired += 1
+        if waited > 0.001:
+            self.waited += 1
+            self.total_wait += waited
+        return waited
+
+    def pause(self, seconds: float):
+        """서버가 한도 초과(429)를 알려주면 해당 시간 동안 발급 중지"""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        self._tokens = 0.0
+
+    def available(self) -> float:
+        """현재 남은 토큰 수"""
+        self._refill(time.monotonic())
+        return self._tokens
+
+    def get_stats(self) -> Dict[str, float]:
+        """대기 통계"""
+        return {
+            'acquired': self.acquired,
+            'waited': self.waited,
+            'total_wait': round(self.total_wait, 3),
+            'available': round(self.available(), 2),
+        }
+
+    def _refill(self, now: float):
+        """경과 시간만큼 토큰 충전"""
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated = now
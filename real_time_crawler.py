@@ -4,8 +4,6 @@
 """
 
 import requests
-from bs4 import BeautifulSoup
-import json
 import re
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
@@ -16,6 +14,9 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import time
 
+from next_data_extractor import extract_next_data
+from merchant_model import ITEM_CATALOG
+
 class RealTimeCrawler:
     """실시간 KLOA 사이트 크롤링 클래스"""
     
@@ -31,26 +32,7 @@ class RealTimeCrawler:
         }
         
         # 실제 아이템 등급 매핑
-        self.item_grades = {
-            # 카드
-            '바루투': 2, '페일린': 2, '위대한 성 네리아': 2, '케이사르': 3,
-            '킬리언': 1, '베른 젠로드': 2, '레퓌스': 1, '사일러스': 2,
-            '앙케': 2, '피엘라': 2, '하눈': 2, '다르시': 3,
-            '코니': 1, '티엔': 2, '프리우나': 2, '디오게네스': 2,
-            '벨루마테': 2, '아그리스': 1, '린': 2, '타라코룸': 2, '유즈': 3,
-            
-            # 호감도 아이템
-            '더욱 화려한 꽃다발': 3, '아르테미스 성수': 3, '기사단 가입 신청서': 3,
-            '마법 옷감': 3, '피에르의 비법서': 3, '모형 반딧불이': 3,
-            '페브리 포션': 3, '늑대 이빨 목걸이': 3, '최상급 육포': 3,
-            '빛을 머금은 과실주': 3, '크레도프 유리경': 3, '둥근 뿌리 차': 3,
-            '전투 식량': 3, '기묘한 주전자': 3, '날씨 상자': 3,
-            
-            # 특수 아이템
-            '뒷골목 럼주': 1, '보석 장식 주머니': 3, '신기한 마법 주머니': 3,
-            '집중 룬': 5, '반짝이는 주머니': 3, '향기 나는 주머니': 3,
-            '비법의 주머니': 3,
-        }
+        self.item_grades = dict(ITEM_CATALOG)
     
     def setup_selenium_driver(self):
         """Selenium 드라이버 설정"""
@@ -225,12 +207,9 @@ class RealTimeCrawler:
             response = requests.get(self.base_url, headers=self.headers, timeout=15)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
             # JSON 데이터 추출 시도
-            script_tags = soup.find_all('script', {'id': '__NEXT_DATA__'})
-            if script_tags:
-                json_data = json.loads(script_tags[0].string)
+            json_data = extract_next_data(response.content)
+            if json_data:
                 return self.parse_json_data(json_data)
             
             return []
@@ -4,12 +4,13 @@
 kloa.gg에서 실시간 데이터를 가져와서 현재 활성 상인들을 계산
 """
 
-import requests
-from bs4 import BeautifulSoup
-import json
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 
+from next_data_client import NextDataClient
+from schedule_index import ScheduleIndex
+from merchant_model import Merchant
+
 class RealTimeMerchantFetcher:
     """실시간 떠돌이 상인 데이터 가져오기"""
     
@@ -23,37 +24,35 @@ class RealTimeMerchantFetcher:
             'Connection': 'keep-alive',
             'Referer': 'https://kloa.gg/merchant',
         }
+        self.next_data_client = NextDataClient(self.base_url, headers=self.headers, timeout=15)
+        
+        # 다음 스케줄 경계 계산용 (스케줄 목록이 바뀌었을 때만 다시 생성)
+        self.schedule_index: Optional[ScheduleIndex] = None
+        self._indexed_schedules = None
     
     def get_current_active_merchants(self) -> List[Dict]:
         """현재 활성화된 니나브 서버 상인들 가져오기"""
         try:
             print("🔄 kloa.gg에서 실시간 데이터 가져오는 중...")
             
-            # HTML 페이지 가져오기
-            url = f"{self.base_url}/merchant"
-            response = requests.get(url, headers=self.headers, timeout=15)
-            response.raise_for_status()
-            
-            # HTML 파싱
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # __NEXT_DATA__ 스크립트에서 JSON 데이터 추출
-            next_data_script = soup.find('script', {'id': '__NEXT_DATA__'})
-            if not next_data_script:
+            # 데이터 라우트 직접 호출 (buildId는 첫 호출과 배포 후 404일 때만 HTML에서 탐색)
+            page_data = self.next_data_client.fetch('merchant')
+            if not page_data:
                 print("❌ __NEXT_DATA__ 스크립트를 찾을 수 없습니다.")
                 return []
             
-            # JSON 파싱
-            json_data = json.loads(next_data_script.string)
-            
             # 스케줄과 지역 데이터 추출
-            initial_data = json_data['props']['pageProps']['initialData']
+            initial_data = page_data['pageProps']['initialData']
             scheme = initial_data['scheme']
             schedules = scheme['schedules']
             regions = scheme['regions']
             
             print(f"✅ 데이터 로드 성공: {len(schedules)}개 스케줄, {len(regions)}개 지역")
             
+            if schedules is not self._indexed_schedules:
+                self.schedule_index = ScheduleIndex(schedules)
+                self._indexed_schedules = schedules
+            
             # 현재 활성 그룹 계산
             active_groups = self.get_current_active_groups(schedules)
             print(f"🎯 현재 활성 그룹: {active_groups}")
@@ -66,22 +65,8 @@ class RealTimeMerchantFetcher:
             active_merchants = []
             for region in regions:
                 if region['group'] in active_groups:
-                    merchant_info = {
-                        'region_name': region['name'],
-                        'npc_name': region['npcName'],
-                        'group': region['group'],
-                        'items': [
-                            {
-                                'name': item['name'],
-                                'type': item['type'],
-                                'grade': item['grade'],
-                                'hidden': item.get('hidden', False)
-                            }
-                            for item in region['items']
-                            if not item.get('hidden', False)  # hidden이 true인 아이템 제외
-                        ]
-                    }
-                    active_merchants.append(merchant_info)
+                    # hidden이 true인 아이템은 제외, 이름/아이템 객체는 폴링 사이에 재사용
+                    active_merchants.append(Merchant.from_region(region))
             
             print(f"✅ 활성 상인 {len(active_merchants)}명 발견:")
             for merchant in active_merchants:
@@ -94,6 +79,12 @@ class RealTimeMerchantFetcher:
             print(f"❌ 실시간 데이터 가져오기 실패: {e}")
             return []
     
+    def get_next_boundary(self, now: datetime) -> Optional[datetime]:
+        """다음 등장/마감/마감 30분 전 시각 (스케줄을 아직 못 가져왔으면 None)"""
+        if self.schedule_index is None:
+            return None
+        return self.schedule_index.next_boundary_after(now, lead=timedelta(minutes=30))
+    
     def get_current_active_groups(self, schedules: List[Dict]) -> List[int]:
         """현재 시간 기준으로 활성화된 그룹들 계산"""
         try:
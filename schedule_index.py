@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+"""
+떠돌이 상인 주간 스케줄 인덱스
+- 스케줄을 한 번만 파싱해서 "주 시작(일요일 00:00) 기준 초" 구간으로 변환
+- 모든 시작/종료 시각을 정렬해 두고 구간별 활성 스케줄을 미리 계산
+- "T 시각에 누가 활성인가", "T 이후 다음 변경 시각"을 이진 탐색(O(log n))으로 조회
+"""
+
+from bisect import bisect_right
+from datetime import datetime, timedelta
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+DAY_SECONDS = 24 * 60 * 60
+WEEK_SECONDS = 7 * DAY_SECONDS
+
+
+def parse_hms(value: str) -> int:
+    """'HH:MM:SS' → 초"""
+    hours, minutes, seconds = value.split(':')
+    return int(hours) * 3600 + int(minutes) * 60 + int(seconds)
+
+
+def week_seconds(moment: datetime) -> float:
+    """datetime → 주 시작(KLOA 기준 일요일 00:00)부터 지난 초"""
+    kloa_day = (moment.weekday() + 1) % 7  # 0=일요일 (KLOA 형식)
+    return kloa_day * DAY_SECONDS + moment.hour * 3600 + moment.minute * 60 + moment.second + moment.microsecond / 1e6
+
+
+def week_start(moment: datetime) -> datetime:
+    """moment가 속한 주의 시작 시각 (일요일 00:00)"""
+    kloa_day = (moment.weekday() + 1) % 7
+    return (moment - timedelta(days=kloa_day)).replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+class ScheduleSlot:
+    """스케줄 하나 (주 기준 초 단위 구간)"""
+
+    __slots__ = ('day_of_week', 'start_time', 'duration', 'groups', 'start', 'end')
+
+    def __init__(self, schedule: Dict):
+        self.day_of_week = schedule.get('dayOfWeek', 0)
+        self.start_time = schedule.get('startTime', '00:00:00')
+        self.duration = schedule.get('duration', '00:00:00')
+        self.groups: Tuple[int, ...] = tuple(schedule.get('groups', []))
+
+        # 종료 시각은 포함 (기존 start <= now <= end 비교와 같음) → 다음 초부터 비활성
+        self.start = self.day_of_week * DAY_SECONDS + parse_hms(self.start_time)
+        self.end = self.start + parse_hms(self.duration)
+
+    def end_datetime(self, now: datetime) -> datetime:
+        """now 기준으로 이 스케줄이 끝나는 실제 시각"""
+        base = week_start(now)
+        end = base + timedelta(seconds=self.end)
+        # 토요일 밤에 시작해서 일요일로 넘어간 스케줄을 일요일에 조회한 경우
+        if week_seconds(now) < self.start and self.end > WEEK_SECONDS:
+            end -= timedelta(days=7)
+        return end
+
+
+class ScheduleIndex:
+    """주간 스케줄 구간 인덱스"""
+
+    def __init__(self, schedules: List[Dict]):
+        self.slots: List[ScheduleSlot] = []
+        for schedule in schedules:
+            try:
+                self.slots.append(ScheduleSlot(schedule))
+            except (ValueError, AttributeError):
+                continue
+
+        # (시작, 종료+1) 구간, 주 끝을 넘으면 두 구간으로 나눔
+        intervals: List[Tuple[int, int, ScheduleSlot]] = []
+        for slot in self.slots:
+            start, end = slot.start, slot.end + 1
+            if end <= WEEK_SECONDS:
+                intervals.append((start, end, slot))
+            else:
+                intervals.append((start, WEEK_SECONDS, slot))
+                intervals.append((0, end - WEEK_SECONDS, slot))
+
+        # 경계 시각을 정렬하고 앞에서부터 훑으면서 구간별 활성 스케줄 계산 (조회는 O(log n))
+        starts_at: Dict[int, List[int]] = {}
+        ends_at: Dict[int, List[int]] = {}
+        for order, (start, end, _) in enumerate(intervals):
+            starts_at.setdefault(start, []).append(order)
+            ends_at.setdefault(end, []).append(order)
+
+        boundaries = sorted({0, WEEK_SECONDS} | starts_at.keys() | ends_at.keys())
+
+        self.boundaries: List[int] = []
+        self._segments: List[Tuple[ScheduleSlot, ...]] = []
+        self._segment_groups: List[FrozenSet[int]] = []
+        active_orders = set()
+        for segment_start in boundaries[:-1]:
+            active_orders.difference_update(ends_at.get(segment_start, ()))
+            active_orders.update(starts_at.get(segment_start, ()))
+            active = tuple(intervals[order][2] for order in sorted(active_orders))
+
+            # 앞 구간과 같으면 합침 (주 경계에서 나눈 구간 등)
+            if self._segments and self._segments[-1] == active:
+                continue
+            self.boundaries.append(segment_start)
+            self._segments.append(active)
+            self._segment_groups.append(frozenset(g for slot in active for g in slot.groups))
+
+        # 종료 시각(포함) 정렬 목록 - "마감 N분 전" 조회용
+        self._ends: List[int] = sorted({slot.end % WEEK_SECONDS for slot in self.slots})
+
+    def _segment(self, seconds: float) -> int:
+        return bisect_right(self.boundaries, seconds % WEEK_SECONDS) - 1
+
+    def active_slots(self, moment: datetime) -> Tuple[ScheduleSlot, ...]:
+        """moment에 활성화된 스케줄들"""
+        if not self.boundaries:
+            return ()
+        return self._segments[self._segment(week_seconds(moment))]
+
+    def active_groups(self, moment: datetime) -> FrozenSet[int]:
+        """moment에 활성화된 그룹 ID 집합"""
+        if not self.boundaries:
+            return frozenset()
+        return self._segment_groups[self._segment(week_seconds(moment))]
+
+    def next_change_after(self, moment: datetime) -> Optional[datetime]:
+        """moment 이후 활성 스케줄이 바뀌는 다음 시각 (스케줄이 없으면 None)"""
+        if len(self.boundaries) <= 1:
+            return None
+
+        pos = bisect_right(self.boundaries, week_seconds(moment))
+        if pos < len(self.boundaries):
+            next_seconds = self.boundaries[pos]
+        elif self._segments[0] == self._segments[-1]:
+            # 주 마지막 구간이 다음 주 첫 구간으로 그대로 이어짐
+            next_seconds = WEEK_SECONDS + self.boundaries[1]
+        else:
+            next_seconds = WEEK_SECONDS
+        return week_start(moment) + timedelta(seconds=next_seconds)
+
+    def next_end_after(self, moment: datetime, lead: timedelta = timedelta(0)) -> Optional[datetime]:
+        """
+        moment 이후 "스케줄 종료 - lead" 가 되는 다음 시각
+        (예: lead=30분이면 다음 "마감 30분 전" 시각)
+        """
+        if not self._ends:
+            return None
+
+        target = week_seconds(moment) + lead.total_seconds()
+        week_offset = (target // WEEK_SECONDS) * WEEK_SECONDS
+        pos = bisect_right(self._ends, target - week_offset)
+        if pos < len(self._ends):
+            end_seconds = week_offset + self._ends[pos]
+        else:
+            end_seconds = week_offset + WEEK_SECONDS + self._ends[0]
+
+        return week_start(moment) + timedelta(seconds=end_seconds) - lead
+
+    def next_boundary_after(self, moment: datetime, lead: timedelta = timedelta(minutes=30)) -> Optional[datetime]:
+        """
+        moment 이후 알림 대상이 바뀔 수 있는 다음 시각
+        (스케줄 시작 / 마감 / 마감 lead 전 중 가장 빠른 시각, 스케줄이 없으면 None)
+        """
+        candidates = [self.next_change_after(moment), self.next_end_after(moment, lead=lead)]
+        candidates = [c for c in candidates if c is not None]
+        return min(candidates) if candidates else None
+
+
+def build_regions_by_group(regions: List[Dict]) -> Dict[int, List[Dict]]:
+    """그룹 ID → 지역 목록 (원래 순서 유지)"""
+    regions_by_group: Dict[int, List[Dict]] = {}
+    for region in regions:
+        regions_by_group.setdefault(region.get('group'), []).append(region)
+    return regions_by_group
@@ -6,6 +6,7 @@ Selenium을 사용한 kloa.gg 떠상 데이터 실시간 수집 + 디스코드 
 
 import json
 import time
+import threading
 from datetime import datetime, timedelta
 import asyncio
 from typing import Dict, List, Optional
@@ -23,11 +24,25 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import discord
 from discord.ext import commands, tasks
 
+from chrome_driver_pool import ChromeDriverPool
+from embed_cache import EmbedRenderCache, copy_embed
+from merchant_snapshot import MerchantSnapshot, MerchantSnapshotStore
+from item_search import ItemSearchIndex
+from merchant_model import GRADE_TEXT, ITEM_CATALOG
+from merchant_history import MerchantHistoryStore
+from merchant_stats import MerchantStatsEngine, grade_code
+
 class SeleniumMerchantFetcher:
     """Selenium을 사용한 실시간 떠돌이 상인 데이터 가져오기"""
     
-    def __init__(self):
+    # 서버 선택 버튼 (8번째 버튼 = 니나브)
+    SERVER_BUTTON_SELECTOR = "button.text-secondary.font-medium"
+    NINAV_BUTTON_INDEX = 7
+    
+    def __init__(self, driver_pool: Optional[ChromeDriverPool] = None):
         self.base_url = "https://kloa.gg/merchant"
+        # 페이지를 띄워 둔 Chrome 세션을 재사용 (매 새로고침마다 Chrome을 새로 띄우지 않음)
+        self.driver_pool = driver_pool or ChromeDriverPool(self.setup_driver)
     
     def setup_driver(self):
         """Chrome 드라이버 설정"""
@@ -47,27 +62,54 @@ class SeleniumMerchantFetcher:
             print("ChromeDriver가 설치되어 있는지 확인하세요.")
             return None
 
-    def fetch_merchant_data_selenium(self):
+    def _server_buttons_ready(self, driver):
+        """서버 버튼이 모두 렌더링되었으면 버튼 목록 반환"""
+        buttons = driver.find_elements(By.CSS_SELECTOR, self.SERVER_BUTTON_SELECTOR)
+        return buttons if len(buttons) > self.NINAV_BUTTON_INDEX else False
+
+    def prepare_page(self, pooled) -> bool:
+        """상인 페이지 준비 (처음이면 로드, 재사용이면 소프트 리로드) 후 니나브 서버 선택"""
+        driver = pooled.driver
+
+        if pooled.warm and driver.current_url.startswith(self.base_url):
+            print("♻️ 기존 Chrome 세션에서 kloa.gg 페이지 새로고침 중...")
+            driver.refresh()
+        else:
+            print("kloa.gg 페이지 로딩 중...")
+            driver.get(self.base_url)
+
+        # 서버 버튼이 렌더링될 때까지 대기 (고정 sleep 대신)
+        try:
+            buttons = WebDriverWait(driver, 15).until(self._server_buttons_ready)
+        except TimeoutException:
+            print("❌ 니나브 서버 버튼을 찾을 수 없습니다. 페이지 구조가 변경되었을 수 있습니다.")
+            return False
+
+        # 니나브 서버 클릭
+        buttons[self.NINAV_BUTTON_INDEX].click()
+        print("니나브 서버 선택 완료")
+        pooled.warm = True
+        return True
+
+    def fetch_merchant_data_selenium(self, cancel_event: Optional[threading.Event] = None):
         """Selenium으로 떠상 데이터 가져오기 (div.bg-elevated에서 구조화된 데이터 추출)"""
-        driver = self.setup_driver()
-        if not driver:
+        started = time.perf_counter()
+        pooled = self.driver_pool.acquire()
+        if not pooled:
             return None
-        
+
+        driver = pooled.driver
+        success = False
+
         try:
-            print("kloa.gg 페이지 로딩 중...")
-            driver.get(self.base_url)
-            
-            # 페이지가 완전히 로드될 때까지 대기
-            time.sleep(3)
-            
-            # 니나브 서버 클릭
-            try:
-                driver.find_elements(By.CSS_SELECTOR, "button.text-secondary.font-medium")[7].click()
-                print("니나브 서버 선택 완료")
-            except IndexError:
-                print("❌ 니나브 서버 버튼을 찾을 수 없습니다. 페이지 구조가 변경되었을 수 있습니다.")
+            if not self.prepare_page(pooled):
                 return []
-            
+
+            if cancel_event and cancel_event.is_set():
+                print("⏹️ 상인 데이터 수집 취소됨")
+                success = True  # 페이지는 정상이므로 드라이버는 그대로 재사용
+                return []
+
             # 페이지 로딩 대기
             wait = WebDriverWait(driver, 15)
             
@@ -91,6 +133,11 @@ class SeleniumMerchantFetcher:
             merchants = []
             
             for merchant_div in merchant_divs:
+                if cancel_event and cancel_event.is_set():
+                    print("⏹️ 상인 데이터 수집 취소됨")
+                    success = True
+                    return []
+
                 try:
                     # 서버명 확인 (니나브만 처리)
                     server_element = merchant_div.find_element(By.CSS_SELECTOR, "p.text-sm.font-medium.text-bola")
@@ -180,8 +227,9 @@ class SeleniumMerchantFetcher:
                     continue
             
             print(f"데이터 수집 완료! 총 {len(merchants)}명의 상인 발견")
+            success = True
             return merchants
-            
+
         except TimeoutException:
             print("페이지 로딩 시간 초과")
             return []
@@ -192,15 +240,21 @@ class SeleniumMerchantFetcher:
             print(f"예상치 못한 오류: {e}")
             return []
         finally:
-            driver.quit()
+            # 드라이버는 종료하지 않고 풀에 반납 (실패한 세션은 다음 사용 때 재생성)
+            self.driver_pool.release(pooled, broken=not success)
+            self.driver_pool.record_fetch(time.perf_counter() - started, success)
+
+    def close(self):
+        """드라이버 풀 종료"""
+        self.driver_pool.close()
     
-    def get_current_active_merchants(self) -> List[Dict]:
+    def get_current_active_merchants(self, cancel_event: Optional[threading.Event] = None) -> List[Dict]:
         """현재 활성화된 상인들 가져오기 (Selenium으로 직접 파싱)"""
         try:
             print("🔄 Selenium으로 실시간 데이터 가져오는 중...")
             
             # Selenium으로 데이터 가져오기 (이미 니나브 서버 상인들만 필터링됨)
-            merchants_data = self.fetch_merchant_data_selenium()
+            merchants_data = self.fetch_merchant_data_selenium(cancel_event)
             if not merchants_data:
                 return []
             
@@ -234,11 +288,17 @@ class SeleniumMerchantBot:
         # Selenium 데이터 가져오기 초기화
         self.merchant_fetcher = SeleniumMerchantFetcher()
         
-        # 상인 데이터 저장
-        self.merchant_data = None
+        # 상인 데이터 저장 (수집할 때마다 읽기 전용 스냅샷을 새로 만들어 교체)
+        self.merchant_snapshots = MerchantSnapshotStore()
         self.last_data_update = None
+        self.item_index = ItemSearchIndex(catalog=ITEM_CATALOG)  # 아이템 이름 검색 인덱스
+        self.merchant_history = MerchantHistoryStore("merchant_history.db")  # 상인 기록 + 주간 집계
+        self.stats_engine = MerchantStatsEngine()  # 스냅샷 / 등장 기록 NumPy 열 배열 (통계는 벡터 연산)
         self.last_notification = None
         
+        # 상인 embed는 데이터가 바뀔 때만 다시 만들고 명령어마다 재사용
+        self.embed_cache = EmbedRenderCache()
+        
         self.setup_bot()
     
     def format_item_with_color(self, item):
@@ -316,11 +376,17 @@ class SeleniumMerchantBot:
         # Selenium 데이터 가져오기 초기화
         self.merchant_fetcher = SeleniumMerchantFetcher()
         
-        # 상인 데이터 저장
-        self.merchant_data = None
+        # 상인 데이터 저장 (수집할 때마다 읽기 전용 스냅샷을 새로 만들어 교체)
+        self.merchant_snapshots = MerchantSnapshotStore()
         self.last_data_update = None
+        self.item_index = ItemSearchIndex(catalog=ITEM_CATALOG)  # 아이템 이름 검색 인덱스
+        self.merchant_history = MerchantHistoryStore("merchant_history.db")  # 상인 기록 + 주간 집계
+        self.stats_engine = MerchantStatsEngine()  # 스냅샷 / 등장 기록 NumPy 열 배열 (통계는 벡터 연산)
         self.last_notification = None
         
+        # 상인 embed는 데이터가 바뀔 때만 다시 만들고 명령어마다 재사용
+        self.embed_cache = EmbedRenderCache()
+        
         self.setup_bot()
     
     def setup_bot(self):
@@ -362,29 +428,8 @@ class SeleniumMerchantBot:
                         timestamp=datetime.now()
                     )
                 else:
-                    embed = discord.Embed(
-                        title="🏪 떠돌이 상인 (Selenium)",
-                        description=f"현재 **{len(self.merchant_data)}명**의 상인이 활성화되어 있습니다!",
-                        color=0x00ff00,
-                        timestamp=datetime.now()
-                    )
-                    
-                    for merchant in self.merchant_data:
-                        region = merchant['region_name']
-                        npc = merchant['npc_name']
-                        
-                        # 색상이 적용된 아이템 목록 생성
-                        colored_items = self.format_items_for_discord(merchant['items'])
-                        
-                        # 아이템을 2개씩 나누어 표시
-                        item_chunks = [colored_items[i:i+2] for i in range(0, len(colored_items), 2)]
-                        item_text = '\n'.join([' • '.join(chunk) for chunk in item_chunks])
-                        
-                        embed.add_field(
-                            name=f"📍 {region} - {npc}",
-                            value=f"```\n{item_text}```",
-                            inline=False
-                        )
+                    # 같은 데이터면 이전에 만든 embed를 복사해서 실시간 필드만 추가
+                    embed = copy_embed(self.render_summary_embed(self.merchant_snapshots.current))
                     
                     # 마감 시간 표시 추가
                     now = datetime.now()
@@ -495,16 +540,13 @@ class SeleniumMerchantBot:
             try:
                 await self.refresh_data_if_needed()
                 
-                if not self.merchant_data:
+                snapshot = self.merchant_snapshots.current
+                if snapshot is None or not snapshot.merchants:
                     await ctx.send("❌ 상인 데이터를 가져올 수 없습니다.")
                     return
                 
-                found_merchants = []
-                
-                for merchant in self.merchant_data:
-                    items = [item['name'] for item in merchant['items']]
-                    if any(item_name.lower() in item.lower() for item in items):
-                        found_merchants.append(merchant)
+                # 아이템 이름 역색인으로 검색
+                found_merchants = self.item_index.find(snapshot, item_name)
                 
                 if not found_merchants:
                     embed = discord.Embed(
@@ -513,6 +555,15 @@ class SeleniumMerchantBot:
                         color=0xff9900,
                         timestamp=datetime.now()
                     )
+                    
+                    # 초성/오타 허용 검색으로 비슷한 아이템 이름 제안
+                    suggestions = self.item_index.search(item_name, limit=5)
+                    if suggestions:
+                        embed.add_field(
+                            name="💡 혹시 이 아이템을 찾으셨나요?",
+                            value=', '.join(hit.name for hit in suggestions),
+                            inline=False
+                        )
                 else:
                     embed = discord.Embed(
                         title=f"🔍 '{item_name}' 검색 결과",
@@ -521,12 +572,12 @@ class SeleniumMerchantBot:
                         timestamp=datetime.now()
                     )
                     
-                    for merchant in found_merchants:
+                    for merchant, matched_item in found_merchants:
                         region = merchant['region_name']
                         npc = merchant['npc_name']
                         
-                        # 검색된 아이템 하이라이트 (색상 포함)
-                        colored_items = self.format_items_for_discord(merchant['items'], item_name)
+                        # 검색된 아이템 하이라이트 (색상 포함, 초성/오타 검색이면 찾은 아이템 이름 기준)
+                        colored_items = self.format_items_for_discord(merchant['items'], matched_item['name'])
                         
                         item_chunks = [colored_items[i:i+2] for i in range(0, len(colored_items), 2)]
                         item_text = '\n'.join([' • '.join(chunk) for chunk in item_chunks])
@@ -629,6 +680,14 @@ class SeleniumMerchantBot:
                 timestamp=datetime.now()
             )
             
+            render_stats = self.embed_cache.get_stats()
+            embed.add_field(
+                name="🖼️ embed 캐시",
+                value=f"재사용 {render_stats['hits']}회 / 렌더링 {render_stats['renders']}회 "
+                      f"(재사용률 {render_stats['hit_rate'] * 100:.1f}%)",
+                inline=False
+            )
+            
             embed.set_footer(text="Selenium 기반")
             await ctx.send(embed=embed)
         
@@ -652,33 +711,7 @@ class SeleniumMerchantBot:
                 }
                 
                 if not grade_name:
-                    embed = discord.Embed(
-                        title="📊 등급별 아이템 통계",
-                        description="현재 활성 상인들의 등급별 아이템 현황",
-                        color=0x7289da,
-                        timestamp=datetime.now()
-                    )
-                    
-                    # 등급별 카운트
-                    grade_count = {'전설': 0, '영웅': 0, '희귀': 0, '고급': 0, '일반': 0}
-                    for merchant in self.merchant_data:
-                        for item in merchant['items']:
-                            if item['grade'] in grade_count:
-                                grade_count[item['grade']] += 1
-                    
-                    for grade, count in grade_count.items():
-                        if count > 0:
-                            embed.add_field(
-                                name=f"🔸 {grade} 등급",
-                                value=f"**{count}개**",
-                                inline=True
-                            )
-                    
-                    embed.add_field(
-                        name="💡 사용법",
-                        value="`!등급별 전설` - 전설 등급만 보기\n`!등급별 영웅` - 영웅 등급만 보기",
-                        inline=False
-                    )
+                    embed = self.render_grade_counts_embed(self.merchant_snapshots.current)
                     
                     await ctx.send(embed=embed)
                     return
@@ -689,48 +722,8 @@ class SeleniumMerchantBot:
                     await ctx.send(f"❌ 올바른 등급을 입력하세요: 전설, 영웅, 희귀, 고급, 일반")
                     return
                 
-                # 해당 등급 아이템을 가진 상인들 찾기
-                filtered_merchants = []
-                for merchant in self.merchant_data:
-                    filtered_items = [item for item in merchant['items'] if item['grade'] == target_grade]
-                    if filtered_items:
-                        filtered_merchant = merchant.copy()
-                        filtered_merchant['items'] = filtered_items
-                        filtered_merchants.append(filtered_merchant)
-                
-                if not filtered_merchants:
-                    embed = discord.Embed(
-                        title=f"🔍 {target_grade} 등급 아이템 검색 결과",
-                        description=f"현재 **{target_grade}** 등급 아이템을 파는 상인이 없습니다.",
-                        color=0xff9900,
-                        timestamp=datetime.now()
-                    )
-                else:
-                    total_items = sum(len(m['items']) for m in filtered_merchants)
-                    embed = discord.Embed(
-                        title=f"🔍 {target_grade} 등급 아이템 검색 결과",
-                        description=f"**{len(filtered_merchants)}명**의 상인이 **{total_items}개**의 {target_grade} 등급 아이템을 판매합니다.",
-                        color=0x00ff00,
-                        timestamp=datetime.now()
-                    )
-                    
-                    for merchant in filtered_merchants:
-                        region = merchant['region_name']
-                        npc = merchant['npc_name']
-                        
-                        # 색상이 적용된 아이템 목록 생성
-                        colored_items = self.format_items_for_discord(merchant['items'])
-                        
-                        item_chunks = [colored_items[i:i+2] for i in range(0, len(colored_items), 2)]
-                        item_text = '\n'.join([' • '.join(chunk) for chunk in item_chunks])
-                        
-                        embed.add_field(
-                            name=f"📍 {region} - {npc}",
-                            value=f"```\n{item_text}```",
-                            inline=False
-                        )
+                embed = self.render_grade_embed(self.merchant_snapshots.current, target_grade)
                 
-                embed.set_footer(text="Selenium 기반 | 등급별 필터링")
                 await ctx.send(embed=embed)
                 
             except Exception as e:
@@ -763,14 +756,10 @@ class SeleniumMerchantBot:
                         timestamp=datetime.now()
                     )
                     
-                    # 타입별 카운트
-                    type_count = {1: 0, 2: 0, 3: 0}
-                    for merchant in self.merchant_data:
-                        for item in merchant['items']:
-                            if item['type'] in type_count:
-                                type_count[item['type']] += 1
+                    # 타입별 카운트 (스냅샷 열 배열에서 bincount 한 번)
+                    type_count = self.stats_engine.columns(self.merchant_snapshots.current).type_counts()
                     
-                    for type_id, count in type_count.items():
+                    for type_id, count in sorted(type_count.items()):
                         if count > 0:
                             type_emoji = "🃏" if type_id == 1 else "💝" if type_id == 2 else "⭐"
                             embed.add_field(
@@ -794,9 +783,11 @@ class SeleniumMerchantBot:
                     await ctx.send(f"❌ 올바른 타입을 입력하세요: 카드, 호감도, 특수")
                     return
                 
-                # 해당 타입 아이템을 가진 상인들 찾기
+                # 해당 타입 아이템을 가진 상인들 찾기 (마스크로 고른 상인만 아이템 필터링)
+                snapshot = self.merchant_snapshots.current
                 filtered_merchants = []
-                for merchant in self.merchant_data:
+                for index in self.stats_engine.columns(snapshot).merchants_with(item_type=target_type):
+                    merchant = snapshot.merchants[index]
                     filtered_items = [item for item in merchant['items'] if item['type'] == target_type]
                     if filtered_items:
                         filtered_merchant = merchant.copy()
@@ -854,88 +845,8 @@ class SeleniumMerchantBot:
                     await ctx.send("❌ 상인 데이터를 가져올 수 없습니다.")
                     return
                 
-                embed = discord.Embed(
-                    title="📊 떠돌이 상인 통계",
-                    description="현재 활성 상인들의 상세 통계 정보",
-                    color=0x7289da,
-                    timestamp=datetime.now()
-                )
-                
-                # 기본 통계
-                total_merchants = len(self.merchant_data)
-                total_items = sum(len(m['items']) for m in self.merchant_data)
-                
-                embed.add_field(
-                    name="🏪 기본 정보",
-                    value=f"```활성 상인: {total_merchants}명\n총 아이템: {total_items}개```",
-                    inline=False
-                )
-                
-                # 등급별 통계
-                grade_count = {'전설': 0, '영웅': 0, '희귀': 0, '고급': 0, '일반': 0}
-                for merchant in self.merchant_data:
-                    for item in merchant['items']:
-                        if item['grade'] in grade_count:
-                            grade_count[item['grade']] += 1
-                
-                grade_stats = []
-                for grade, count in grade_count.items():
-                    if count > 0:
-                        percentage = (count / total_items * 100) if total_items > 0 else 0
-                        grade_stats.append(f"{grade}: {count}개 ({percentage:.1f}%)")
-                
-                if grade_stats:
-                    embed.add_field(
-                        name="🔸 등급별 분포",
-                        value="```" + "\n".join(grade_stats) + "```",
-                        inline=True
-                    )
-                
-                # 타입별 통계
-                type_count = {1: 0, 2: 0, 3: 0}
-                type_names = {1: '카드', 2: '호감도', 3: '특수'}
-                
-                for merchant in self.merchant_data:
-                    for item in merchant['items']:
-                        if item['type'] in type_count:
-                            type_count[item['type']] += 1
-                
-                type_stats = []
-                for type_id, count in type_count.items():
-                    if count > 0:
-                        percentage = (count / total_items * 100) if total_items > 0 else 0
-                        type_stats.append(f"{type_names[type_id]}: {count}개 ({percentage:.1f}%)")
-                
-                if type_stats:
-                    embed.add_field(
-                        name="📦 타입별 분포",
-                        value="```" + "\n".join(type_stats) + "```",
-                        inline=True
-                    )
-                
-                # 지역별 통계
-                region_count = {}
-                for merchant in self.merchant_data:
-                    region = merchant['region_name']
-                    if region in region_count:
-                        region_count[region] += 1
-                    else:
-                        region_count[region] = 1
-                
-                if region_count:
-                    region_stats = [f"{region}: {count}명" for region, count in sorted(region_count.items())]
-                    embed.add_field(
-                        name="🗺️ 지역별 상인 수",
-                        value="```" + "\n".join(region_stats) + "```",
-                        inline=False
-                    )
-                
-                # 업데이트 정보
-                if self.last_data_update:
-                    update_time = self.last_data_update.strftime("%H:%M:%S")
-                    embed.set_footer(text=f"Selenium 기반 | 마지막 업데이트: {update_time}")
-                else:
-                    embed.set_footer(text="Selenium 기반 | 실시간 데이터")
+                # 같은 데이터면 이전에 만든 embed 재사용
+                embed = self.render_statistics_embed(self.merchant_snapshots.current)
                 
                 await ctx.send(embed=embed)
                 
@@ -1115,6 +1026,241 @@ class SeleniumMerchantBot:
             except Exception as e:
                 await ctx.send(f"❌ 상인 목록 조회 중 오류: {e}")
     
+    @property
+    def merchant_data(self):
+        """현재 스냅샷의 상인 목록 (읽기 전용 tuple, 아직 수집 전이면 None)"""
+        return self.merchant_snapshots.merchants
+    
+    def render_merchant_fields(self, snapshot: MerchantSnapshot) -> List[tuple]:
+        """상인별 embed 필드 (이름, 아이템 목록) - 스냅샷 버전마다 한 번만 생성"""
+        def render():
+            fields = []
+            for merchant in snapshot.merchants:
+                # 색상이 적용된 아이템 목록 생성
+                colored_items = self.format_items_for_discord(merchant['items'])
+                
+                # 아이템을 2개씩 나누어 표시
+                item_chunks = [colored_items[i:i+2] for i in range(0, len(colored_items), 2)]
+                item_text = '\n'.join([' • '.join(chunk) for chunk in item_chunks])
+                
+                fields.append((f"📍 {merchant['region_name']} - {merchant['npc_name']}", item_text))
+            return fields
+        
+        return self.embed_cache.get('merchant_fields', snapshot.version, render)
+    
+    def render_summary_embed(self, snapshot: MerchantSnapshot) -> discord.Embed:
+        """!떠상 embed의 상인 목록 부분 (남은 시간 등 실시간 필드는 copy_embed() 후 추가)"""
+        def render():
+            embed = discord.Embed(
+                title="🏪 떠돌이 상인 (Selenium)",
+                description=f"현재 **{len(snapshot)}명**의 상인이 활성화되어 있습니다!",
+                color=0x00ff00,
+                timestamp=snapshot.fetched_at
+            )
+            
+            for name, item_text in self.render_merchant_fields(snapshot):
+                embed.add_field(
+                    name=name,
+                    value=f"```\n{item_text}```",
+                    inline=False
+                )
+            return embed
+        
+        return self.embed_cache.get('summary', snapshot.version, render)
+    
+    def render_grade_embed(self, snapshot: MerchantSnapshot, target_grade: str) -> discord.Embed:
+        """!등급별 <등급> embed (등급마다 스냅샷 버전당 한 번만 생성)"""
+        def render():
+            # 해당 등급 아이템을 가진 상인들 찾기 (마스크로 고른 상인만 아이템 필터링)
+            filtered_merchants = []
+            for index in self.stats_engine.columns(snapshot).merchants_with(grade=grade_code(target_grade)):
+                merchant = snapshot.merchants[index]
+                filtered_items = [item for item in merchant['items'] if item['grade'] == target_grade]
+                if filtered_items:
+                    filtered_merchant = merchant.copy()
+                    filtered_merchant['items'] = filtered_items
+                    filtered_merchants.append(filtered_merchant)
+            
+            if not filtered_merchants:
+                embed = discord.Embed(
+                    title=f"🔍 {target_grade} 등급 아이템 검색 결과",
+                    description=f"현재 **{target_grade}** 등급 아이템을 파는 상인이 없습니다.",
+                    color=0xff9900,
+                    timestamp=snapshot.fetched_at
+                )
+            else:
+                total_items = sum(len(m['items']) for m in filtered_merchants)
+                embed = discord.Embed(
+                    title=f"🔍 {target_grade} 등급 아이템 검색 결과",
+                    description=f"**{len(filtered_merchants)}명**의 상인이 **{total_items}개**의 {target_grade} 등급 아이템을 판매합니다.",
+                    color=0x00ff00,
+                    timestamp=snapshot.fetched_at
+                )
+                
+                for merchant in filtered_merchants:
+                    region = merchant['region_name']
+                    npc = merchant['npc_name']
+                    
+                    # 색상이 적용된 아이템 목록 생성
+                    colored_items = self.format_items_for_discord(merchant['items'])
+                    
+                    item_chunks = [colored_items[i:i+2] for i in range(0, len(colored_items), 2)]
+                    item_text = '\n'.join([' • '.join(chunk) for chunk in item_chunks])
+                    
+                    embed.add_field(
+                        name=f"📍 {region} - {npc}",
+                        value=f"```\n{item_text}```",
+                        inline=False
+                    )
+            
+            embed.set_footer(text="Selenium 기반 | 등급별 필터링")
+            return embed
+        
+        return self.embed_cache.get(('grade', target_grade), snapshot.version, render)
+    
+    def render_grade_counts_embed(self, snapshot: MerchantSnapshot) -> discord.Embed:
+        """!등급별 (등급 지정 없음) embed"""
+        def render():
+            embed = discord.Embed(
+                title="📊 등급별 아이템 통계",
+                description="현재 활성 상인들의 등급별 아이템 현황",
+                color=0x7289da,
+                timestamp=snapshot.fetched_at
+            )
+            
+            # 등급별 카운트 (스냅샷 열 배열에서 bincount 한 번)
+            grade_codes = self.stats_engine.columns(snapshot).grade_counts()
+            grade_count = {grade: grade_codes.get(grade_code(grade), 0) for grade in ('전설', '영웅', '희귀', '고급', '일반')}
+            
+            for grade, count in grade_count.items():
+                if count > 0:
+                    embed.add_field(
+                        name=f"🔸 {grade} 등급",
+                        value=f"**{count}개**",
+                        inline=True
+                    )
+            
+            embed.add_field(
+                name="💡 사용법",
+                value="`!등급별 전설` - 전설 등급만 보기\n`!등급별 영웅` - 영웅 등급만 보기",
+                inline=False
+            )
+            return embed
+        
+        return self.embed_cache.get('grade_counts', snapshot.version, render)
+    
+    def render_statistics_embed(self, snapshot: MerchantSnapshot) -> discord.Embed:
+        """!통계 embed (스냅샷 버전마다 한 번만 생성)"""
+        def render():
+            embed = discord.Embed(
+                title="📊 떠돌이 상인 통계",
+                description="현재 활성 상인들의 상세 통계 정보",
+                color=0x7289da,
+                timestamp=snapshot.fetched_at
+            )
+            
+            # 기본 통계
+            total_merchants = len(snapshot)
+            total_items = snapshot.item_count
+            
+            embed.add_field(
+                name="🏪 기본 정보",
+                value=f"```활성 상인: {total_merchants}명\n총 아이템: {total_items}개```",
+                inline=False
+            )
+            
+            # 등급/타입 분포는 스냅샷 열 배열에서 bincount 한 번씩
+            columns = self.stats_engine.columns(snapshot)
+            grade_codes = columns.grade_counts()
+            grade_count = {grade: grade_codes.get(grade_code(grade), 0) for grade in ('전설', '영웅', '희귀', '고급', '일반')}
+            
+            grade_stats = []
+            for grade, count in grade_count.items():
+                if count > 0:
+                    percentage = (count / total_items * 100) if total_items > 0 else 0
+                    grade_stats.append(f"{grade}: {count}개 ({percentage:.1f}%)")
+            
+            if grade_stats:
+                embed.add_field(
+                    name="🔸 등급별 분포",
+                    value="```" + "\n".join(grade_stats) + "```",
+                    inline=True
+                )
+            
+            # 타입별 통계
+            type_count = columns.type_counts()
+            type_names = {1: '카드', 2: '호감도', 3: '특수'}
+            
+            type_stats = []
+            for type_id, count in sorted(type_count.items()):
+                if count > 0:
+                    percentage = (count / total_items * 100) if total_items > 0 else 0
+                    type_stats.append(f"{type_names[type_id]}: {count}개 ({percentage:.1f}%)")
+            
+            if type_stats:
+                embed.add_field(
+                    name="📦 타입별 분포",
+                    value="```" + "\n".join(type_stats) + "```",
+                    inline=True
+                )
+            
+            # 지역별 통계
+            region_count = {region: len(merchants) for region, merchants in snapshot.by_region.items()}
+            
+            if region_count:
+                region_stats = [f"{region}: {count}명" for region, count in sorted(region_count.items())]
+                embed.add_field(
+                    name="🗺️ 지역별 상인 수",
+                    value="```" + "\n".join(region_stats) + "```",
+                    inline=False
+                )
+            
+            # 누적 기록 (최근 4주, 등장 기록 배열에서 bincount)
+            cycles = self.merchant_history.cycle_count(weeks=4)
+            history_grades = self.stats_engine.history.grade_distribution(weeks=4)
+            if cycles and history_grades:
+                history_total = sum(history_grades.values())
+                history_stats = [f"관측한 등장 주기: {cycles}회"]
+                history_stats.extend(
+                    f"{GRADE_TEXT.get(grade, '알 수 없음')}: {count}회 ({count / history_total * 100:.1f}%)"
+                    for grade, count in history_grades.items()
+                )
+                embed.add_field(
+                    name="📈 최근 4주 누적 등장",
+                    value="```" + "\n".join(history_stats) + "```",
+                    inline=False
+                )
+                
+                # 지난주 대비 이번 주 (주 × 등급 표에서 마지막 두 주)
+                trend_stats = []
+                for grade, (last_week, this_week) in self.stats_engine.history.week_over_week().items():
+                    change = this_week - last_week
+                    trend_stats.append(f"{GRADE_TEXT.get(grade, '알 수 없음')}: {last_week} → {this_week}회 ({change:+d})")
+                if trend_stats:
+                    embed.add_field(
+                        name="📊 지난주 대비",
+                        value="```" + "\n".join(trend_stats) + "```",
+                        inline=True
+                    )
+                
+                top_regions = self.stats_engine.history.region_counts(weeks=4, limit=5)
+                if top_regions:
+                    embed.add_field(
+                        name="🗺️ 최근 4주 등장 많은 지역",
+                        value="```" + "\n".join(f"{region}: {count}회" for region, count in top_regions) + "```",
+                        inline=True
+                    )
+            
+            # 업데이트 정보
+            if self.last_data_update:
+                update_time = self.last_data_update.strftime("%H:%M:%S")
+                embed.set_footer(text=f"Selenium 기반 | 마지막 업데이트: {update_time}")
+            else:
+                embed.set_footer(text="Selenium 기반 | 실시간 데이터")
+            return embed
+        
+        return self.embed_cache.get('statistics', snapshot.version, render)
+    
     async def load_merchant_data(self) -> bool:
         """Selenium으로 상인 데이터 로드"""
         try:
@@ -1125,13 +1271,20 @@ class SeleniumMerchantBot:
             merchants = await loop.run_in_executor(None, self.merchant_fetcher.get_current_active_merchants)
             
             if merchants:
-                self.merchant_data = merchants
-                self.last_data_update = datetime.now()
+                snapshot = self.merchant_snapshots.publish(merchants)
+                self.last_data_update = snapshot.fetched_at
                 print(f"✅ Selenium 데이터 로드 성공: {len(merchants)}명")
+                
+                # 상인 기록 추가 (같은 주기에 내용이 같으면 저장 안 함)
+                try:
+                    await loop.run_in_executor(None, self.merchant_history.append, snapshot)
+                    await loop.run_in_executor(None, self.stats_engine.sync_history, self.merchant_history)
+                except Exception as e:
+                    print(f"❌ 상인 기록 저장 오류: {e}")
                 return True
             else:
                 print("❌ Selenium 데이터 로드 실패")
-                self.merchant_data = []
+                self.merchant_snapshots.publish([])
                 return False
                 
         except Exception as e:
@@ -1166,32 +1319,25 @@ class SeleniumMerchantBot:
             # 데이터 자동 새로고침
             await self.refresh_data_if_needed()
             
+            # 알림 전송이 끝날 때까지 같은 스냅샷 사용
+            snapshot = self.merchant_snapshots.current
+            
             # 상인이 활성화되어 있고, 마지막 알림으로부터 30분이 지났으면 알림
             now = datetime.now()
-            if self.merchant_data and len(self.merchant_data) > 0 and (
+            if snapshot is not None and len(snapshot) > 0 and (
                 self.last_notification is None or 
                 (now - self.last_notification).total_seconds() > 1800  # 30분
             ):
                 embed = discord.Embed(
                     title="🚨 떠돌이 상인 알림 (Selenium)",
-                    description=f"현재 **{len(self.merchant_data)}명**의 상인이 활성화되어 있습니다!",
+                    description=f"현재 **{len(snapshot)}명**의 상인이 활성화되어 있습니다!",
                     color=0xff6b35,
                     timestamp=now
                 )
                 
-                for merchant in self.merchant_data:
-                    region = merchant['region_name']
-                    npc = merchant['npc_name']
-                    
-                    # 색상이 적용된 아이템 목록 생성
-                    colored_items = self.format_items_for_discord(merchant['items'])
-                    
-                    # 아이템을 2개씩 나누어 표시
-                    item_chunks = [colored_items[i:i+2] for i in range(0, len(colored_items), 2)]
-                    item_text = '\n'.join([' • '.join(chunk) for chunk in item_chunks])
-                    
+                for name, item_text in self.render_merchant_fields(snapshot):
                     embed.add_field(
-                        name=f"📍 {region} - {npc}",
+                        name=name,
                         value=f"```\n{item_text}```",
                         inline=False
                     )
@@ -1200,7 +1346,7 @@ class SeleniumMerchantBot:
                 
                 await channel.send(embed=embed)
                 self.last_notification = now
-                print(f"✅ Selenium 상인 알림 전송: {len(self.merchant_data)}명")
+                print(f"✅ Selenium 상인 알림 전송: {len(snapshot)}명")
             
         except Exception as e:
             print(f"❌ 상인 체크 오류: {e}")
@@ -1211,6 +1357,9 @@ class SeleniumMerchantBot:
             self.bot.run(self.token)
         except Exception as e:
             print(f"❌ 봇 실행 오류: {e}")
+        finally:
+            self.merchant_fetcher.close()
+            self.merchant_history.close()
 
 def main():
     """메인 함수"""
@@ -1249,59 +1398,8 @@ if __name__ == "__main__":
 # 로스트아크 캐릭터 정보 조회 기능 (떠돌이상인 봇과 구분)
 # ============================================================================
 
-import requests
-import urllib.parse
-
-class LostArkCharacterAPI:
-    """로스트아크 캐릭터 정보 조회 API 클래스"""
-    
-    def __init__(self, api_key: str):
-        self.api_key = api_key
-        self.base_url = "https://developer-lostark.game.onstove.com"
-        self.headers = {
-            'accept': 'application/json',
-            'authorization': f'bearer {api_key}'
-        }
-    
-    async def get_character_info(self, character_name: str) -> Optional[Dict]:
-        """캐릭터 기본 정보 조회"""
-        try:
-            encoded_name = urllib.parse.quote(character_name)
-            url = f"{self.base_url}/characters/{encoded_name}"
-            
-            response = requests.get(url, headers=self.headers)
-            
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 404:
-                return None
-            else:
-                print(f"API 오류: {response.status_code}")
-                return None
-                
-        except Exception as e:
-            print(f"캐릭터 정보 조회 오류: {e}")
-            return None
-    
-    async def get_character_siblings(self, character_name: str) -> Optional[List[Dict]]:
-        """캐릭터 원정대 정보 조회"""
-        try:
-            encoded_name = urllib.parse.quote(character_name)
-            url = f"{self.base_url}/characters/{encoded_name}/siblings"
-            
-            response = requests.get(url, headers=self.headers)
-            
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 404:
-                return None
-            else:
-                print(f"API 오류: {response.status_code}")
-                return None
-                
-        except Exception as e:
-            print(f"원정대 정보 조회 오류: {e}")
-            return None
+from lostark_api_client import LostArkCharacterAPI
+from discord_runner import run_bot
 
 class CharacterInfoBot:
     """캐릭터 정보 조회 디스코드 봇 (떠돌이상인 봇과 별도)"""
@@ -1403,7 +1501,7 @@ class CharacterInfoBot:
     def run(self):
         """봇 실행"""
         try:
-            self.bot.run(self.discord_token)
+            run_bot(self.bot, self.discord_token, self.lostark_api)
         except Exception as e:
             print(f"❌ 캐릭터 정보 봇 실행 오류: {e}")
 
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""
+단일 실행(single-flight) 유틸리티
+같은 키로 동시에 들어온 비동기 요청을 하나의 실행으로 합쳐서 결과를 공유
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """같은 키의 동시 요청을 하나의 실행으로 합치는 클래스"""
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self.calls = 0    # 실제로 실행된 횟수
+        self.shared = 0   # 진행 중인 실행에 합류한 횟수 (= 절약한 실행 횟수)
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        key로 진행 중인 실행이 있으면 그 결과를 기다리고, 없으면 func()를 실행
+        호출자 한 명이 취소되거나 타임아웃 되어도 공유 실행은 계속 진행됨
+        """
+        task = self._inflight.get(key)
+
+        if task is not None:
+            self.shared += 1
+        else:
+            task = asyncio.get_running_loop().create_task(func())
+            self._inflight[key] = task
+            self.calls += 1
+            task.add_done_callback(lambda done, key=key: self._on_done(key, done))
+
+        return await asyncio.shield(task)
+
+    def in_flight(self, key: Hashable) -> bool:
+        """key로 진행 중인 실행이 있는지 확인"""
+        return key in self._inflight
+
+    def cancel(self, key: Hashable) -> bool:
+        """진행 중인 실행 취소 (기다리던 모든 호출자에게 CancelledError 전달)"""
+        task = self._inflight.get(key)
+        if task is None:
+            return False
+        return task.cancel()
+
+    def get_stats(self) -> Dict[str, int]:
+        """실행/공유 통계"""
+        return {
+            'calls': self.calls,
+            'shared': self.shared,
+            'in_flight': len(self._inflight),
+        }
+
+    def _on_done(self, key: Hashable, task: asyncio.Task):
+        """실행 완료시 정리 (기다리는 호출자가 없어도 예외 경고가 나지 않도록 회수)"""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+        if not task.cancelled():
+            task.exception()
@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+"""
+알림 채널 구독 저장소 (쓰기 지연 / write-behind)
+- 시작할 때 SQLite에서 한 번에 읽어서 서버(guild) ID 기준 메모리 인덱스로 보관
+- 읽기/쓰기는 메모리에서 바로 처리하고, 바뀐 서버만 모아서 백그라운드 스레드에서 한 번에 저장
+  → /알림설정, /알림해제가 디스크를 기다리지 않음
+- 삭제된 채널 일괄 정리 (prune)
+- 서버별 설정은 JSON 컬럼에 저장 → 설정 항목이 늘어도 스키마 변경 없음
+"""
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS guild_subscriptions (
+    guild_id INTEGER PRIMARY KEY,
+    channel_id INTEGER NOT NULL,
+    settings TEXT NOT NULL DEFAULT '{}',
+    updated_at REAL NOT NULL
+);
+"""
+
+
+class SubscriptionStore(MutableMapping):
+    """{guild_id: channel_id} 처럼 쓰는 영구 구독 저장소"""
+
+    MAX_RETRY_DELAY = 60.0   # 저장 실패 후 재시도 간격 상한(초)
+
+    def __init__(self, path: str = "subscriptions.db", flush_delay: float = 1.0):
+        """
+        초기화
+        Args:
+            path: SQLite 파일 경로 (":memory:"면 메모리)
+            flush_delay: 첫 변경 후 이만큼 기다렸다가 그동안 쌓인 변경을 한 번에 저장(초)
+        """
+        self.path = path
+        self.flush_delay = flush_delay
+
+        # 저장은 executor 스레드에서 하므로 스레드 검사를 끄고 락으로 한 번에 하나만 저장
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+        self._write_lock = threading.Lock()
+
+        self._channels: Dict[int, int] = {}
+        self._settings: Dict[int, Dict[str, Any]] = {}
+        self._dirty = set()
+
+        self._task: Optional[asyncio.Task] = None
+        self._dirty_event: Optional[asyncio.Event] = None
+        self._retry_delay = flush_delay
+
+        # 통계
+        self.flushes = 0
+        self.flush_failures = 0
+        self.rows_written = 0
+        self.last_flush_duration: Optional[float] = None
+
+        self._load()
+
+    def _load(self):
+        for guild_id, channel_id, settings in self.conn.execute(
+                "SELECT guild_id, channel_id, settings FROM guild_subscriptions"):
+            self._channels[guild_id] = channel_id
+            self._settings[guild_id] = json.loads(settings or '{}')
+
+    # ------------------------------------------------------------------
+    # dict 인터페이스 (메모리에서 바로 처리)
+    # ------------------------------------------------------------------
+
+    def __getitem__(self, guild_id: int) -> int:
+        return self._channels[guild_id]
+
+    def __setitem__(self, guild_id: int, channel_id: int):
+        self._channels[guild_id] = channel_id
+        self._settings.setdefault(guild_id, {})
+        self._mark_dirty(guild_id)
+
+    def __delitem__(self, guild_id: int):
+        del self._channels[guild_id]
+        self._settings.pop(guild_id, None)
+        self._mark_dirty(guild_id)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._channels)
+
+    def __len__(self) -> int:
+        return len(self._channels)
+
+    def __contains__(self, guild_id) -> bool:
+        return guild_id in self._channels
+
+    # ------------------------------------------------------------------
+    # 일괄 정리 / 서버별 설정
+    # ------------------------------------------------------------------
+
+    def prune(self, subscriptions: Iterable[Tuple[int, int]]) -> int:
+        """
+        (guild_id, channel_id) 구독 일괄 제거
+        그 사이 /알림설정으로 다른 채널을 다시 설정한 서버는 건드리지 않음
+        Returns:
+            제거한 구독 수
+        """
+        removed = 0
+        for guild_id, channel_id in subscriptions:
+            if self._channels.get(guild_id) == channel_id:
+                del self[guild_id]
+                removed += 1
+        return removed
+
+    def get_setting(self, guild_id: int, key: str, default: Any = None) -> Any:
+        """서버별 설정값"""
+        return self._settings.get(guild_id, {}).get(key, default)
+
+    def set_setting(self, guild_id: int, key: str, value: Any):
+        """서버별 설정값 변경 (구독 중인 서버만)"""
+        if guild_id not in self._channels:
+            raise KeyError(guild_id)
+        self._settings.setdefault(guild_id, {})[key] = value
+        self._mark_dirty(guild_id)
+
+    # ------------------------------------------------------------------
+    # 쓰기 지연 저장
+    # ------------------------------------------------------------------
+
+    def _mark_dirty(self, guild_id: int):
+        self._dirty.add(guild_id)
+        if self._dirty_event:
+            self._dirty_event.set()
+
+    def _take_changes(self):
+        """저장할 변경 목록을 가져오고 dirty 목록 비움 (이벤트 루프 스레드에서 호출)"""
+        upserts, deletes = [], []
+        now = time.time()
+        for guild_id in self._dirty:
+            if guild_id in self._channels:
+                settings = json.dumps(self._settings.get(guild_id, {}), ensure_ascii=False)
+                upserts.append((guild_id, self._channels[guild_id], settings, now))
+            else:
+                deletes.append((guild_id,))
+        self._dirty.clear()
+        return upserts, deletes
+
+    def _write(self, upserts, deletes):
+        started = time.perf_counter()
+        with self._write_lock, self.conn:
+            self.conn.executemany(
+                "INSERT INTO guild_subscriptions (guild_id, channel_id, settings, updated_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(guild_id) DO UPDATE SET channel_id=excluded.channel_id, "
+                "settings=excluded.settings, updated_at=excluded.updated_at",
+                upserts
+            )
+            self.conn.executemany("DELETE FROM guild_subscriptions WHERE guild_id=?", deletes)
+        self.flushes += 1
+        self.rows_written += len(upserts) + len(deletes)
+        self.last_flush_duration = time.perf_counter() - started
+
+    async def flush(self):
+        """쌓인 변경을 백그라운드 스레드에서 저장"""
+        if not self._dirty:
+            return
+        upserts, deletes = self._take_changes()
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(None, self._write, upserts, deletes)
+        except Exception as e:
+            # 저장 실패한 서버는 다시 dirty로 돌리고, 다른 변경이 없어도 잠시 후 스스로 재시도 (간격은 두 배씩)
+            self._dirty.update(row[0] for row in upserts)
+            self._dirty.update(row[0] for row in deletes)
+            self.flush_failures += 1
+            print(f"❌ 알림 채널 저장 실패 ({self._retry_delay:.1f}초 후 재시도): {e}")
+            if self._dirty_event:
+                loop.call_later(self._retry_delay, self._dirty_event.set)
+            self._retry_delay = min(self._retry_delay * 2 or 1.0, self.MAX_RETRY_DELAY)
+        else:
+            self._retry_delay = self.flush_delay
+
+    def flush_sync(self):
+        """이벤트 루프 밖에서 바로 저장 (종료할 때)"""
+        if self._dirty:
+            self._write(*self._take_changes())
+
+    def start(self):
+        """백그라운드 저장 작업 시작 (실행 중인 이벤트 루프 안에서 호출)"""
+        if self._task and not self._task.done():
+            return
+        self._dirty_event = asyncio.Event()
+        if self._dirty:
+            self._dirty_event.set()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self):
+        while True:
+            await self._dirty_event.wait()
+            # 잠깐 기다려서 그동안 들어온 변경을 한 번에 저장
+            await asyncio.sleep(self.flush_delay)
+            self._dirty_event.clear()
+            await self.flush()
+
+    def close(self):
+        """남은 변경 저장 후 닫기"""
+        if self._task:
+            self._task.cancel()
+            self._task = None
+        self.flush_sync()
+        self.conn.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """저장소 통계"""
+        return {
+            'subscriptions': len(self._channels),
+            'pending_writes': len(self._dirty),
+            'flushes': self.flushes,
+            'flush_failures': self.flush_failures,
+            'rows_written': self.rows_written,
+            'last_flush_ms': round(self.last_flush_duration * 1000, 2) if self.last_flush_duration is not None else None,
+        }
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""
+Chrome 드라이버 풀 테스트 (Chrome 대신 가짜 드라이버 사용)
+"""
+
+import time
+
+from chrome_driver_pool import ChromeDriverPool
+
+
+class FakeDriver:
+    """풀이 쓰는 속성만 흉내 내는 드라이버"""
+
+    def __init__(self, number):
+        self.number = number
+        self.healthy = True
+        self.quit_called = False
+
+    @property
+    def current_url(self):
+        if not self.healthy:
+            raise RuntimeError("세션 끊김")
+        return "https://kloa.gg/merchant"
+
+    def execute_script(self, script):
+        return "complete"
+
+    def quit(self):
+        self.quit_called = True
+
+
+class FakeFactory:
+    def __init__(self):
+        self.drivers = []
+
+    def __call__(self):
+        driver = FakeDriver(len(self.drivers) + 1)
+        self.drivers.append(driver)
+        return driver
+
+
+def test_chrome_driver_pool():
+    """드라이버 풀 테스트"""
+    print("=== Chrome 드라이버 풀 테스트 시작 ===\n")
+
+    print("1. 드라이버 재사용 후 max_uses에서 재생성:")
+    factory = FakeFactory()
+    pool = ChromeDriverPool(factory, max_uses=2, max_rss_mb=None)
+    first = pool.acquire()
+    pool.release(first)
+    assert pool.acquire() is first and first.use_count == 2
+    pool.release(first)
+    second = pool.acquire()
+    assert second is not first and first.driver.quit_called
+    assert pool.get_metrics()['recycled']['max_uses'] == 1
+    print(f"✅ 드라이버 {len(factory.drivers)}개 생성")
+
+    print("2. 실패(broken) / 응답 없는(unhealthy) 드라이버 재생성:")
+    second.warm = True
+    pool.release(second, broken=True)
+    assert not second.warm
+    third = pool.acquire()
+    assert third is not second and second.driver.quit_called
+    third.driver.healthy = False
+    pool.release(third)
+    fourth = pool.acquire()
+    assert fourth is not third and third.driver.quit_called
+    recycled = pool.get_metrics()['recycled']
+    assert recycled['broken'] == 1 and recycled['unhealthy'] == 1
+    print(f"✅ 재생성: {recycled}")
+
+    print("3. 모두 빌려 간 상태면 acquire 대기 시간 초과:")
+    started = time.monotonic()
+    assert pool.acquire(timeout=0.1) is None
+    assert time.monotonic() - started >= 0.1
+    print("✅ 대기 시간 초과")
+
+    print("4. 메트릭:")
+    pool.record_fetch(0.5)
+    pool.record_fetch(1.5, success=False)
+    metrics = pool.get_metrics()
+    assert metrics['fetch_count'] == 2 and metrics['fetch_failures'] == 1
+    assert metrics['drivers_created'] == 4 and metrics['drivers_alive'] == 1 and metrics['drivers_idle'] == 0
+    assert metrics['latency_avg'] == 1.0 and metrics['latency_max'] == 1.5
+    print(f"✅ 메트릭: {metrics}")
+
+    print("5. close()는 쉬고 있는 드라이버 종료, 이후 반납된 드라이버도 종료:")
+    pool = ChromeDriverPool(FakeFactory(), size=2, max_rss_mb=None)
+    idle, busy = pool.acquire(), pool.acquire()
+    pool.release(idle)
+    pool.close()
+    assert idle.driver.quit_called and not busy.driver.quit_called
+    assert pool.acquire(timeout=0.1) is None
+    pool.release(busy)
+    assert busy.driver.quit_called and pool.get_metrics()['drivers_alive'] == 0
+    print("✅ 종료")
+
+    print("\n=== Chrome 드라이버 풀 테스트 완료 ===")
+
+
+if __name__ == "__main__":
+    test_chrome_driver_pool()
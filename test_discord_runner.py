@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""
+디스코드 봇 실행 도우미 테스트 (가짜 봇 / 가짜 API 클라이언트 사용)
+"""
+
+import asyncio
+
+from discord_runner import run_bot, serve_bot
+
+
+class FakeBot:
+    """async with + start()만 흉내 내는 봇"""
+
+    def __init__(self, error=None):
+        self.error = error
+        self.events = []
+
+    async def __aenter__(self):
+        self.events.append('enter')
+        return self
+
+    async def __aexit__(self, *exc):
+        self.events.append('exit')
+
+    async def start(self, token):
+        self.events.append(('start', token))
+        if self.error:
+            raise self.error
+
+
+class FakeAPI:
+    def __init__(self):
+        self.closed_in_loop = None
+
+    async def close(self):
+        # 이벤트 루프가 살아 있을 때 닫혀야 함
+        self.closed_in_loop = asyncio.get_running_loop().is_running()
+
+
+def test_discord_runner():
+    """봇 실행 도우미 테스트"""
+    print("=== 디스코드 봇 실행 도우미 테스트 시작 ===\n")
+
+    print("1. 정상 종료 후 루프 안에서 API 세션 닫기:")
+    bot, api = FakeBot(), FakeAPI()
+    asyncio.run(serve_bot(bot, "token", api))
+    assert bot.events == ['enter', ('start', "token"), 'exit']
+    assert api.closed_in_loop is True
+    print("✅ 정상 종료")
+
+    print("2. 실행 오류여도 세션은 닫고 오류는 그대로 전달:")
+    bot, api = FakeBot(error=RuntimeError("로그인 실패")), FakeAPI()
+    try:
+        asyncio.run(serve_bot(bot, "token", api))
+        assert False, "RuntimeError가 나야 함"
+    except RuntimeError:
+        pass
+    assert bot.events[-1] == 'exit' and api.closed_in_loop is True
+    print("✅ 오류 시 정리")
+
+    print("3. Ctrl+C는 조용히 종료, API 없이도 실행:")
+    bot = FakeBot(error=KeyboardInterrupt())
+    run_bot(bot, "token")
+    assert bot.events[-1] == 'exit'
+    print("✅ Ctrl+C")
+
+    print("\n=== 디스코드 봇 실행 도우미 테스트 완료 ===")
+
+
+if __name__ == "__main__":
+    test_discord_runner()
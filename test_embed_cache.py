@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""
+embed 렌더링 캐시 테스트
+"""
+
+import discord
+
+from embed_cache import EmbedRenderCache, copy_embed
+
+
+def test_embed_cache():
+    """embed 캐시 테스트"""
+    print("=== embed 렌더링 캐시 테스트 시작 ===\n")
+
+    cache = EmbedRenderCache()
+    renders = []
+
+    def render_summary(merchants):
+        def render():
+            renders.append('summary')
+            embed = discord.Embed(title="🏪 떠돌이 상인", description=f"{len(merchants)}명")
+            for name in merchants:
+                embed.add_field(name=name, value="전설 카드 팩", inline=False)
+            return embed
+        return render
+
+    print("1. 같은 데이터 버전이면 한 번만 렌더링:")
+    merchants = ["벤", "피터"]
+    first = cache.get('summary', 1, render_summary(merchants))
+    for _ in range(99):
+        assert cache.get('summary', 1, render_summary(merchants)) is first
+    assert renders == ['summary']
+    stats = cache.get_stats()
+    assert stats['hits'] == 99 and stats['renders'] == 1 and stats['hit_rate'] == 0.99
+    print(f"✅ 통계: {stats}")
+
+    print("2. 실시간 필드는 copy_embed() 후 추가해도 캐시는 그대로:")
+    live = copy_embed(cache.get('summary', 1, render_summary(merchants)))
+    live.add_field(name="⏰ 마감까지 남은 시간", value="1시간 10분 남음")
+    assert len(first.fields) == 2 and len(live.fields) == 3
+    print("✅ 캐시된 embed 유지")
+
+    print("3. 데이터 버전이 바뀌면 다시 렌더링하고 이전 버전 화면은 정리:")
+    cache.get(('grade', '전설'), 1, lambda: "전설 목록")
+    assert cache.get_stats()['views'] == 2
+    second = cache.get('summary', 2, render_summary(["벤"]))
+    assert second is not first and second.description == "1명"
+    assert cache.get_stats()['views'] == 1
+    assert cache.get(('grade', '전설'), 2, lambda: "새 전설 목록") == "새 전설 목록"
+    print(f"✅ 통계: {cache.get_stats()}")
+
+    print("\n✅ 모든 테스트 완료!")
+
+
+if __name__ == "__main__":
+    test_embed_cache()
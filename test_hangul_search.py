@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""
+한글 초성 / 오타 허용 아이템 검색 테스트
+"""
+
+import random
+
+from hangul_search import bounded_distance, choseong, decompose, is_choseong_query
+from item_search import ItemSearchIndex, normalize_text
+from merchant_model import ITEM_CATALOG
+from merchant_snapshot import MerchantSnapshotStore
+
+
+def test_hangul_search():
+    """초성 / 자모 편집 거리 검색 테스트"""
+    print("=== 한글 초성 / 오타 허용 검색 테스트 시작 ===\n")
+
+    print("1. 초성 / 자모 분해:")
+    assert choseong("집중룬") == "ㅈㅈㄹ" and choseong("Card 팩") == "Card ㅍ"
+    assert decompose("닭") == "ㄷㅏㄹㄱ" and decompose("과") == "ㄱㅗㅏ"
+    assert is_choseong_query(normalize_text("ㅈㅈㄹ")) and not is_choseong_query("집중 룬")
+    assert bounded_distance(decompose("케이사루"), decompose("케이사르"), 2) == 1
+    assert bounded_distance("abcdef", "uvwxyz", 2) == 3
+    print("✅ 자모")
+
+    index = ItemSearchIndex(catalog=ITEM_CATALOG)
+    print("2. 기본 아이템 목록 순위 검색:")
+    assert index.search("ㅈㅈㄹ")[0][:2] == ("집중 룬", 'choseong')
+    assert index.search("집ㅈ")[0].name == "집중 룬"
+    assert index.search("케이사루")[0][:2] == ("케이사르", 'fuzzy')
+    assert index.search("기사단 가입 신청소")[0].name == "기사단 가입 신청서"
+    assert [hit.match for hit in index.search("비법")] == ['prefix', 'substring']
+    assert index.search("린")[0][:2] == ("린", 'exact')
+    assert index.search("ㅋㅋㅋㅋ") == [] and index.search("") == []
+    print(f"✅ 통계: {index.get_stats()}")
+
+    print("3. 현재 상인 검색: 일치하는 이름이 없으면 초성 / 오타로 다시 찾음:")
+    store = MerchantSnapshotStore()
+    snapshot = store.publish([
+        {'region_name': "아르테미스", 'npc_name': "벤", 'items': [{'name': "집중 룬", 'grade': '전설'}]},
+        {'region_name': "욘", 'npc_name': "라이티르", 'items': [{'name': "케이사르", 'grade': '희귀'}]},
+    ])
+    assert [(m['npc_name'], i['name']) for m, i in index.find(snapshot, "ㅈㅈㄹ")] == [("벤", "집중 룬")]
+    assert [m['npc_name'] for m, _ in index.find(snapshot, "케이사루")] == ["라이티르"]
+    assert index.find(snapshot, "케이사루", fuzzy=False) == []
+    assert index.find(snapshot, "바루투") == []          # 기본 목록에만 있는 아이템
+    index.sync(None)
+    assert index.get_stats()['names'] == len(ITEM_CATALOG)  # 기본 목록은 남음
+    print("✅ 상인 검색")
+
+    print("4. 무작위 이름에서 기존 선형 비교와 결과 동일:")
+    random.seed(9)
+    syllables = "가나다라마바사아자차카타파하전설영웅카드팩룬상자닭과"
+    names = list({''.join(random.choices(syllables, k=random.randint(2, 7))) for _ in range(400)})
+    index = ItemSearchIndex(catalog=names)
+    for _ in range(200):
+        target = random.choice(names)
+        query = list(target)
+        query[random.randrange(len(query))] = random.choice(syllables)
+        query = ''.join(query)
+        jamo = decompose(query)
+        found = {hit.name for hit in index.search(query, limit=len(names)) if hit.match == 'fuzzy'}
+        expected = {
+            name for name in names
+            if query not in name and bounded_distance(jamo, decompose(name), 3) <= (1 if len(jamo) <= 8 else 2 if len(jamo) <= 16 else 3)
+        }
+        assert found == expected, query
+
+        initials = choseong(target)[1:]
+        found = {hit.name for hit in index.search(initials, limit=len(names)) if hit.match == 'choseong'}
+        assert found == {name for name in names if initials in choseong(name)}, initials
+    print(f"✅ 통계: {index.get_stats()}")
+
+    print("\n✅ 모든 테스트 완료!")
+
+
+if __name__ == "__main__":
+    test_hangul_search()
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""
+아이템 등장 확률 추정 테스트
+"""
+
+import os
+import tempfile
+from datetime import datetime
+
+from item_forecast import ItemForecaster
+from merchant_history import MerchantHistoryStore
+from merchant_snapshot import MerchantSnapshotStore
+
+REGIONS = [
+    {'name': "로웬", 'npcName': "세라한", 'group': 1, 'items': [
+        {'name': "사일러스", 'default': True},
+        {'name': "웨이", 'default': False},
+        {'name': "전설 호감도 상자", 'default': False},
+        {'name': "숨겨진 아이템", 'default': False, 'hidden': True},
+    ]},
+    {'name': "욘", 'npcName': "라이티르", 'group': 2, 'items': [
+        {'name': "케이사르", 'default': True},
+        {'name': "웨이", 'default': False},
+    ]},
+]
+
+
+def make_merchant(region, npc, *items):
+    return {'region_name': region, 'npc_name': npc, 'items': [{'name': name, 'grade': '전설'} for name in items]}
+
+
+def test_item_forecast():
+    """등장 확률 추정 테스트"""
+    print("=== 아이템 등장 확률 추정 테스트 시작 ===\n")
+
+    forecaster = ItemForecaster()
+    forecaster.set_pools(REGIONS)
+
+    print("1. 관측 전에는 판매 목록 사전 확률:")
+    by_region = {forecast.region: forecast for forecast in forecaster.estimate("웨이", now=datetime(2024, 5, 1, 9))}
+    assert set(by_region) == {"로웬", "욘"}
+    assert by_region["로웬"].probability == 0.5          # 랜덤 후보 2개 중 1개 (숨김 제외)
+    assert by_region["욘"].probability == 1.0            # 랜덤 후보 1개
+    assert forecaster.estimate("사일러스", now=datetime(2024, 5, 1, 9))[0].probability == 1.0
+    assert forecaster.estimate("숨겨진 아이템", now=datetime(2024, 5, 1, 9)) == []
+    print("✅ 사전 확률")
+
+    print("2. 주기마다 (지역, 아이템) 첫 등장만 집계:")
+    rowen_wei = make_merchant("로웬", "세라한", "사일러스", "웨이")
+    rowen_box = make_merchant("로웬", "세라한", "사일러스", "전설 호감도 상자")
+    assert forecaster.observe([rowen_wei], datetime(2024, 5, 1, 10, 5)) == 2
+    assert forecaster.observe([rowen_wei], datetime(2024, 5, 1, 10, 30)) == 0
+    forecaster.observe([rowen_wei], datetime(2024, 5, 1, 16, 5))
+    forecaster.observe([rowen_box], datetime(2024, 5, 1, 22, 5))
+    forecaster.observe([rowen_wei], datetime(2024, 5, 2, 4, 5))
+    assert forecaster.visits == {"로웬": 4}
+    assert forecaster.counts["로웬"] == {"사일러스": 4, "웨이": 3, "전설 호감도 상자": 1}
+    print(f"✅ 카운트: {forecaster.get_stats()}")
+
+    print("3. 다음 주기 추정 (관측 + 사전 확률):")
+    later = datetime(2024, 5, 2, 10, 1)
+    wei = forecaster.estimate("웨이", region="로웬", now=later)[0]
+    assert wei.status == 'estimate' and (wei.appearances, wei.visits) == (3, 4)
+    assert abs(wei.probability - (3 + 2 * 0.5) / 6) < 1e-9      # 방문당 랜덤 1개 / 후보 2개
+    box = forecaster.estimate("전설 호감도 상자", region="로웬", now=later)[0]
+    assert box.probability < wei.probability
+    print(f"✅ 웨이 {wei.probability:.2f} / 상자 {box.probability:.2f}")
+
+    print("4. 이번 주기에 이미 관측한 지역은 확정, 등장하지 않는 그룹은 0:")
+    now = datetime(2024, 5, 2, 4, 30)
+    by_region = {forecast.region: forecast for forecast in forecaster.estimate("웨이", now=now)}
+    assert by_region["로웬"].status == 'selling' and by_region["로웬"].probability == 1.0
+    assert forecaster.estimate("전설 호감도 상자", now=now)[0].status == 'absent'
+    off = forecaster.estimate("웨이", region="욘", now=later, active_groups=frozenset({1}))[0]
+    assert off.status == 'off' and off.probability == 0.0
+    print("✅ 확정값")
+
+    print("5. 기록 저장소에서 초기값 (현재 주기는 제외):")
+    history = MerchantHistoryStore(os.path.join(tempfile.mkdtemp(), "history.db"))
+    store = MerchantSnapshotStore()
+    for observed_at, merchants in ((datetime(2024, 5, 1, 10, 5), [rowen_wei]),
+                                   (datetime(2024, 5, 1, 16, 5), [rowen_box]),
+                                   (datetime(2024, 5, 1, 22, 5), [rowen_wei])):
+        history.append(store.publish(merchants, fetched_at=observed_at))
+    visits, appearances = history.cycle_counts(before=datetime(2024, 5, 1, 22, 30))
+    assert visits == {"로웬": 2}
+    assert sorted(appearances) == [("로웬", "사일러스", 2), ("로웬", "웨이", 1), ("로웬", "전설 호감도 상자", 1)]
+    warm = ItemForecaster()
+    warm.load(visits, appearances)
+    warm.observe(store.current, datetime(2024, 5, 1, 22, 30))   # 현재 주기는 스냅샷으로 직접 집계
+    assert warm.visits == {"로웬": 3} and warm.counts["로웬"]["웨이"] == 2
+    history.close()
+    print("✅ 초기값")
+
+    print("\n=== 아이템 등장 확률 추정 테스트 완료 ===")
+
+
+if __name__ == "__main__":
+    test_item_forecast()
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""
+아이템 이름 검색 인덱스 테스트
+"""
+
+import random
+import unicodedata
+
+from item_search import ItemSearchIndex, normalize_text
+from merchant_snapshot import MerchantSnapshotStore
+
+
+def make_merchant(region, npc, *items):
+    return {'region_name': region, 'npc_name': npc, 'items': [{'name': name, 'grade': '전설'} for name in items]}
+
+
+def linear_search(merchants, query):
+    """기존 방식 (모든 상인의 모든 아이템을 확인)"""
+    query = normalize_text(query)
+    results = []
+    for merchant in merchants:
+        for item in merchant['items']:
+            if query in normalize_text(item['name']):
+                results.append((merchant['npc_name'], item['name']))
+                break
+    return results
+
+
+def test_item_search():
+    """아이템 검색 인덱스 테스트"""
+    print("=== 아이템 검색 인덱스 테스트 시작 ===\n")
+
+    store = MerchantSnapshotStore()
+    index = ItemSearchIndex()
+    snapshot = store.publish([
+        make_merchant("아르테미스", "벤", "전설 카드 팩", "실링", "Card Pack"),
+        make_merchant("베른 북부", "피터", "향신료", "전설 호감도 상자"),
+        make_merchant("욘", "라이티르", "욘의 기록"),
+    ])
+
+    print("1. 부분 문자열 / 대소문자 / 공백 / 분해된 한글 자모:")
+    assert [(m['npc_name'], i['name']) for m, i in index.find(snapshot, "전설")] == [("벤", "전설 카드 팩"), ("피터", "전설 호감도 상자")]
+    assert index.match_names("카드팩") == ["전설 카드 팩"]
+    assert index.match_names("card pack") == ["Card Pack"]
+    assert index.match_names(unicodedata.normalize('NFD', "호감도")) == ["전설 호감도 상자"]
+    assert index.match_names("료") == ["향신료"]
+    assert index.match_names("없는 아이템") == [] and index.match_names("  ") == []
+    print(f"✅ 통계: {index.get_stats()}")
+
+    print("2. 접두어 / 자동완성 (접두어 일치가 먼저):")
+    assert index.prefix_names("전설") == ["전설 카드 팩", "전설 호감도 상자"]
+    assert index.autocomplete("카드") == ["전설 카드 팩"]
+    assert index.autocomplete("욘")[0] == "욘의 기록"
+    assert len(index.autocomplete("", limit=2)) == 2
+    print("✅ 자동완성")
+
+    print("3. 스냅샷이 바뀌면 바뀐 아이템만 반영:")
+    added_before = index.names_added
+    snapshot = store.publish([
+        make_merchant("아르테미스", "벤", "전설 카드 팩", "영웅 카드 팩", "Card Pack"),
+        make_merchant("욘", "라이티르", "욘의 기록"),
+    ])
+    assert index.find(snapshot, "실링") == []
+    assert index.names_added - added_before == 1              # 영웅 카드 팩만 새로 색인
+    assert index.match_names("향신료") == []                    # 사라진 상인의 아이템 제거
+    assert index.match_names("카드 팩") == ["영웅 카드 팩", "전설 카드 팩"]
+    index.sync(None)
+    assert index.get_stats()['names'] == 0 and index.get_stats()['grams'] == 0
+    print("✅ 증분 갱신")
+
+    print("4. 무작위 데이터에서 기존 선형 검색과 결과 동일:")
+    random.seed(3)
+    syllables = "가나다라마바사아자차카타파하전설영웅카드팩룬상자"
+    for _ in range(5):
+        merchants = [
+            make_merchant(f"지역{m}", f"상인{m}",
+                          *{''.join(random.choices(syllables, k=random.randint(2, 6))) for _ in range(8)})
+            for m in range(30)
+        ]
+        snapshot = store.publish(merchants)
+        for query in ("전설", "카드", "팩", "가나", "룬상", "하"):
+            found = [(m['npc_name'], i['name']) for m, i in index.find(snapshot, query, fuzzy=False)]
+            assert found == linear_search(snapshot.merchants, query), query
+    print(f"✅ 통계: {index.get_stats()}")
+
+    print("\n✅ 모든 테스트 완료!")
+
+
+if __name__ == "__main__":
+    test_item_search()
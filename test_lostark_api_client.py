@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""
+로스트아크 API 클라이언트 / 토큰 버킷 테스트 (로컬 aiohttp 서버 사용)
+"""
+
+import asyncio
+import time
+
+from aiohttp import web
+
+from lostark_api_client import LostArkCharacterAPI
+from rate_limiter import AsyncTokenBucket
+
+
+async def start_fake_api():
+    """429 → 200 순서로 응답하는 가짜 Open API 서버"""
+    calls = {'siblings': 0, 'profiles': 0, 'broken': 0}
+
+    async def siblings(request):
+        calls['siblings'] += 1
+        if calls['siblings'] == 1:
+            return web.Response(status=429, headers={'Retry-After': '0'})
+        return web.json_response([{'CharacterName': request.match_info['name'], 'ServerName': '니나브'}])
+
+    async def profiles(request):
+        calls['profiles'] += 1
+        if request.match_info['name'] == '없는캐릭터':
+            return web.Response(status=404)
+        return web.json_response({'CharacterName': request.match_info['name'], 'ItemAvgLevel': '1,640.00'})
+
+    async def broken(request):
+        calls['broken'] += 1
+        return web.Response(status=503)
+
+    app = web.Application()
+    app.router.add_get('/characters/{name}/siblings', siblings)
+    app.router.add_get('/armories/characters/{name}/profiles', profiles)
+    app.router.add_get('/broken', broken)
+
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}", calls
+
+
+async def run_client_checks():
+    runner, base_url, calls = await start_fake_api()
+    api = LostArkCharacterAPI("test-key", timeout=5, max_retries=2)
+    api.base_url = base_url
+
+    try:
+        print("1. 429 응답 후 재시도:")
+        siblings = await api.get_character_siblings("유우니유니")
+        assert siblings[0]['CharacterName'] == "유우니유니"
+        assert calls['siblings'] == 2
+        assert api.stats['rate_limited'] == 1
+        print(f"✅ 재시도 성공: {siblings}")
+
+        print("2. 프로필 조회 / 없는 캐릭터:")
+        profile = await api.get_character_info("유우니유니")
+        assert profile['ItemAvgLevel'] == '1,640.00'
+        assert await api.get_character_info("없는캐릭터") is None
+        print("✅ 404는 재시도 없이 None")
+
+        print("3. 같은 캐릭터 동시 조회는 한 번만 요청:")
+        before = calls['profiles']
+        results = await asyncio.gather(*(api.get_character_info("유우니유니 ") for _ in range(20)))
+        assert all(r['CharacterName'] == "유우니유니 " for r in results)
+        assert calls['profiles'] - before == 1
+        assert api.get_stats()['coalesced'] == 19
+        print(f"✅ 20개 요청 → API 호출 1회 (절약 {api.get_stats()['coalesced']}회)")
+
+        print("4. 5xx가 계속되면 재시도 후 None:")
+        assert await api._get_json('/broken', '테스트') is None
+        assert calls['broken'] == 3
+        print(f"통계: {api.get_stats()}")
+    finally:
+        await api.close()
+        await runner.cleanup()
+
+
+async def run_bucket_checks():
+    print("5. 토큰 버킷은 한도를 넘는 요청을 대기시킴:")
+    bucket = AsyncTokenBucket(rate=50, capacity=5)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(bucket.acquire() for _ in range(15)))
+    elapsed = time.perf_counter() - started
+
+    # 5개는 바로, 나머지 10개는 초당 50개 속도로 → 약 0.2초
+    assert 0.15 <= elapsed < 1.0, elapsed
+    assert bucket.acquired == 15
+    print(f"✅ 15개 요청 {elapsed:.2f}초, 통계: {bucket.get_stats()}")
+
+    per_minute = AsyncTokenBucket.per_minute(100, burst=10)
+    assert per_minute.capacity + per_minute.rate * 60 <= 100 + 1e-9
+    print("✅ 분당 100회 한도 안에서 버스트 10회")
+
+
+def test_lostark_api_client():
+    """API 클라이언트 테스트"""
+    print("=== 로스트아크 API 클라이언트 테스트 시작 ===\n")
+    asyncio.run(run_client_checks())
+    asyncio.run(run_bucket_checks())
+    print("\n✅ 모든 테스트 완료!")
+
+
+if __name__ == "__main__":
+    test_lostark_api_client()
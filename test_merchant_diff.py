@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""
+상인 목록 비교(diff) 테스트
+"""
+
+from merchant_diff import build_merchant_index, diff_merchants, merchant_key
+
+
+def make_merchant(region, npc, *items, key='region_name'):
+    return {key: region, 'npc_name': npc, 'items': [{'name': name, 'grade': 3} for name in items]}
+
+
+def test_merchant_diff():
+    """상인 diff 테스트"""
+    print("=== 상인 목록 비교 테스트 시작 ===\n")
+
+    previous = [
+        make_merchant("아르테미스", "벤", "전설 카드 팩", "실링"),
+        make_merchant("베른 북부", "피터", "향신료"),
+        make_merchant("욘", "라이티르", "욘의 기록"),
+    ]
+    current = [
+        make_merchant("욘", "라이티르", "욘의 기록"),                 # 순서만 바뀜
+        make_merchant("아르테미스", "벤", "전설 카드 팩", "영웅 카드 팩"),  # 아이템 변경
+        make_merchant("로웬", "세라한", "늑대 이빨"),                  # 새로 등장
+    ]
+
+    print("1. 등장 / 사라짐 / 아이템 변경:")
+    changes = diff_merchants(previous, current)
+    assert [merchant_key(m) for m in changes.added] == [("로웬", "세라한")]
+    assert [merchant_key(m) for m in changes.removed] == [("베른 북부", "피터")]
+    assert len(changes.changed) == 1
+    change = changes.changed[0]
+    assert change.key == ("아르테미스", "벤")
+    assert change.added_items == {"영웅 카드 팩"} and change.removed_items == {"실링"}
+    print(f"✅ {changes.summary()} / {change}")
+
+    print("2. 같은 데이터 / 순서만 다른 데이터는 변경 없음:")
+    assert not diff_merchants(current, list(reversed(current)))
+    assert not diff_merchants(None, [])
+    print("✅ 변경 없음")
+
+    print("3. 아이템 수가 같아도 구성이 바뀌면 감지 (HTML 봇 형식):")
+    old_html = [make_merchant("아르테미스", "벤", "A", "B", key='region')]
+    new_html = [make_merchant("아르테미스", "벤", "A", "C", key='region')]
+    assert diff_merchants(old_html, new_html).changed
+    print("✅ 감지")
+
+    print("4. 미리 만든 인덱스 재사용:")
+    previous_index = build_merchant_index(previous)
+    assert diff_merchants(previous_index, current).summary() == changes.summary()
+    print("✅ 결과 동일")
+
+    print("\n✅ 모든 테스트 완료!")
+
+
+if __name__ == "__main__":
+    test_merchant_diff()
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""
+DOM 한 번 훑기 결과 변환 테스트
+"""
+
+import json
+import shutil
+import subprocess
+
+from merchant_dom_extractor import (
+    EXTRACT_ALL_REALMS_SCRIPT, RealmPanelWait, item_grade, item_type, parse_realm_panels, script_selectors,
+)
+
+# 서버 버튼을 누르면 목록이 잠깐 비었다가(다시 그리는 중) 그 서버 상인으로 채워지는 가짜 페이지
+FAKE_PAGE = """
+const sel = %(sel)s;
+const pages = {"니나브": [["로웬", "세라한", [["웨이", "4", "전설 카드"]]]], "카단": []};
+let shown = "루페온";
+const node = (text, attrs = {}, children = {}) => ({
+  innerText: text,
+  getAttribute: (key) => (key in attrs ? attrs[key] : null),
+  querySelector: (s) => (children[s] || [])[0] || null,
+  querySelectorAll: (s) => children[s] || [],
+});
+const panelFor = (realm) => {
+  const rows = realm === null ? [] : (pages[realm] || [["욘", "라이티르", [["케이사르", "2", "카드"]]]]);
+  return node("", {}, {
+    [sel.serverName]: rows.map(() => node(realm)),
+    [sel.merchant]: rows.map(([region, npc, items]) => node("", {}, {
+      [sel.region]: [node(region)],
+      [sel.npc]: [node(npc)],
+      [sel.item]: items.map(([name, grade, title]) => node(name, {"data-grade": grade}, {img: [node("", {title})]})),
+    })),
+  });
+};
+const button = (realm) => ({click: () => {
+  shown = null;                                     // 다시 그리는 동안 빈 목록
+  setTimeout(() => { shown = realm; }, 150);
+}});
+global.document = {querySelectorAll: (s) => {
+  if (s === sel.button) return [button("루페온"), button("니나브"), button("카단")];
+  if (s === sel.panel) return [node(""), panelFor(shown)];
+  return [];
+}};
+(function () { %(script)s }).apply(null, [[["니나브", 1], ["카단", 2]], sel, 2000, 500, (out) => console.log(out)]);
+"""
+
+
+def test_merchant_dom_extractor():
+    """스크립트 JSON → 서버별 상인 목록 테스트"""
+    print("=== DOM 한 번 훑기 결과 변환 테스트 시작 ===\n")
+
+    print("1. data-grade / 아이콘 title 변환 (요소별 추출과 같음):")
+    assert [item_grade(str(grade)) for grade in range(5)] == ["일반", "고급", "희귀", "영웅", "전설"]
+    assert item_grade(None) == item_grade("") == item_grade("x") == item_grade("9") == "영웅"
+    assert item_type("전설 카드") == 1 and item_type("호감도 아이템") == 2
+    assert item_type("특수") == 3 and item_type(None) == 3
+    print("✅ 등급 / 타입")
+
+    print("2. 스크립트 결과 변환:")
+    payload = json.dumps({
+        "니나브": [
+            ["로웬", "세라한", [["웨이", "4", "전설 카드"], ["", "3", "카드"], ["향신료", None, "특수 재료"]]],
+            ["욘", "라이티르", []],                             # 아이템 없는 상인은 제외
+        ],
+        "루페온": [],
+        "카단": None,                                            # 목록이 안 바뀐 서버는 제외
+    }, ensure_ascii=False)
+    by_realm = parse_realm_panels(payload)
+    assert set(by_realm) == {"니나브", "루페온"}
+    assert by_realm["루페온"] == []
+    assert by_realm["니나브"] == [{
+        'region_name': "로웬", 'npc_name': "세라한", 'group': 1,
+        'items': [
+            {'name': "웨이", 'type': 1, 'grade': "전설", 'hidden': False},
+            {'name': "향신료", 'type': 3, 'grade': "영웅", 'hidden': False},
+        ],
+    }]
+    assert parse_realm_panels(json.loads(payload)) == by_realm
+    assert parse_realm_panels(None) == {}
+    print(f"✅ 변환: {sum(len(merchants) for merchants in by_realm.values())}명")
+
+    print("3. 스크립트가 쓰는 셀렉터 키:")
+    selectors = script_selectors("button.server")
+    for key in selectors:
+        assert f"sel.{key}" in EXTRACT_ALL_REALMS_SCRIPT
+    assert selectors['merchant'] == "div.px-8.py-3" and "text-lostark-grade" in selectors['item']
+    assert "data-grade" in EXTRACT_ALL_REALMS_SCRIPT
+    print("✅ 셀렉터")
+
+    print("4. 다시 그리는 도중 잠깐 빈 목록은 상인 없음으로 읽지 않음:")
+    now = [0.0]
+    wait = RealmPanelWait("니나브", settle=0.5, clock=lambda: now[0])
+    assert not wait.ready(["루페온", "루페온"])             # 아직 이전 서버 목록
+    assert not wait.ready(None)                              # 목록 요소 없음
+    assert not wait.ready([])                                # 빈 목록 시작
+    now[0] = 0.3
+    assert not wait.ready([])
+    assert wait.ready(["니나브"])                            # 채워지면 바로 인정
+    assert not wait.ready([])                                # 다시 비면 처음부터
+    now[0] = 0.79
+    assert not wait.ready([])
+    now[0] = 0.81
+    assert wait.ready([])                                    # 0.5초 넘게 비어 있으면 상인 없음
+    print("✅ 빈 목록 대기")
+
+    if shutil.which("node"):
+        page = FAKE_PAGE % {'sel': json.dumps(script_selectors("button.server")), 'script': EXTRACT_ALL_REALMS_SCRIPT}
+        output = subprocess.run(["node", "-e", page], capture_output=True, text=True, timeout=30, check=True).stdout
+        by_realm = parse_realm_panels(output.strip())
+        assert [merchant['npc_name'] for merchant in by_realm["니나브"]] == ["세라한"]
+        assert by_realm["카단"] == []
+        print(f"✅ 스크립트(node): {output.strip()}")
+    else:
+        print("⚠️ node가 없어 스크립트 실행 확인은 건너뜀")
+
+    print("\n=== DOM 한 번 훑기 결과 변환 테스트 완료 ===")
+
+
+if __name__ == "__main__":
+    test_merchant_dom_extractor()
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""
+상인 수집 워커 테스트 (Selenium 대신 취소 이벤트를 보는 가짜 수집 함수 사용)
+"""
+
+import asyncio
+import threading
+import time
+
+from merchant_fetch_worker import FetchCancelledError, MerchantFetchWorker
+
+
+class FakeFetch:
+    """취소 이벤트가 설정되거나 hold초가 지날 때까지 블로킹되는 수집 함수"""
+
+    def __init__(self, hold: float = 0.0):
+        self.hold = hold
+        self.events = []
+        self.finished = []
+
+    def __call__(self, cancel_event: threading.Event):
+        self.events.append(cancel_event)
+        cancelled = cancel_event.wait(self.hold)
+        self.finished.append((len(self.events), cancelled))
+        return None if cancelled else f"수집 {len(self.events)}"
+
+
+async def expect(exception, awaitable):
+    try:
+        await awaitable
+    except exception:
+        return
+    assert False, f"{exception.__name__}이 나야 함"
+
+
+async def run_worker_checks():
+    print("1. 동시 요청은 수집 한 번으로 합쳐짐:")
+    fetch = FakeFetch(hold=0.1)
+    worker = MerchantFetchWorker(fetch, timeout=5)
+    assert await asyncio.gather(worker.fetch(), worker.fetch()) == ["수집 1", "수집 1"]
+    assert len(fetch.events) == 1 and worker.get_stats()['shared'] == 1
+    worker.close()
+    print("✅ 공유")
+
+    print("2. 타임아웃 (마지막 호출자면 스레드 작업도 중단):")
+    fetch = FakeFetch(hold=5)
+    worker = MerchantFetchWorker(fetch, timeout=5)
+    await expect(asyncio.TimeoutError, worker.fetch(timeout=0.1))
+    assert fetch.events[0].wait(1)
+    for _ in range(100):                    # 스레드가 이벤트를 보고 끝날 때까지 (부하가 있으면 조금 걸림)
+        if fetch.finished:
+            break
+        await asyncio.sleep(0.01)
+    assert fetch.finished == [(1, True)] and worker.timeouts == 1 and not worker.is_running()
+    worker.close()
+    print("✅ 타임아웃")
+
+    print("3. cancel()은 기다리던 호출자와 스레드 작업 모두 중단:")
+    fetch = FakeFetch(hold=5)
+    worker = MerchantFetchWorker(fetch, timeout=5)
+    assert not worker.cancel()
+    pending = asyncio.ensure_future(worker.fetch())
+    await asyncio.sleep(0.05)
+    assert worker.is_running() and worker.cancel()
+    await expect(FetchCancelledError, pending)
+    assert fetch.events[0].is_set() and worker.cancellations == 1
+    worker.close()
+    print("✅ 취소")
+
+    print("4. 취소 후 다시 수집해도 이전 작업은 계속 취소 상태 (새 수집이 뒤에서 기다리지 않음):")
+    fetch = FakeFetch(hold=5)
+    worker = MerchantFetchWorker(fetch, timeout=5)
+    pending = asyncio.ensure_future(worker.fetch())
+    await asyncio.sleep(0.05)
+    worker.cancel()
+    await expect(FetchCancelledError, pending)
+    fetch.hold = 0.05
+    started = time.perf_counter()
+    assert await worker.fetch() == "수집 2"
+    assert time.perf_counter() - started < 1
+    assert fetch.events[0] is not fetch.events[1]
+    assert fetch.events[0].is_set() and not fetch.events[1].is_set()
+    assert fetch.finished == [(1, True), (2, False)]
+    worker.close()
+    print("✅ 취소 후 재수집")
+
+    print("5. cancel()과 수집 종료가 같은 루프 턴에 겹쳐도 항상 FetchCancelledError:")
+    fetch = FakeFetch(hold=5)
+    worker = MerchantFetchWorker(fetch, timeout=5)
+    for _ in range(30):
+        pending = asyncio.ensure_future(worker.fetch())
+        await asyncio.sleep(0.01)
+        worker.cancel()
+        await asyncio.sleep(0.01)           # 스레드가 먼저 끝나도록 (이벤트를 보고 바로 반환)
+        await expect(FetchCancelledError, pending)
+    assert worker.cancellations == 30
+    worker.close()
+    print("✅ 취소 우선")
+
+
+def test_merchant_fetch_worker():
+    """상인 수집 워커 테스트"""
+    print("=== 상인 수집 워커 테스트 시작 ===\n")
+    asyncio.run(run_worker_checks())
+    print("\n✅ 모든 테스트 완료!")
+
+
+if __name__ == "__main__":
+    test_merchant_fetch_worker()
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""
+떠돌이 상인 기록 저장소 테스트
+"""
+
+import os
+import tempfile
+from datetime import datetime
+
+from merchant_history import MerchantHistoryStore, cycle_start, week_key
+from merchant_snapshot import MerchantSnapshotStore
+
+
+def make_merchant(region, npc, *items):
+    return {'region_name': region, 'npc_name': npc, 'items': [{'name': name, 'grade': grade} for name, grade in items]}
+
+
+def test_merchant_history():
+    """상인 기록 / 주간 집계 테스트"""
+    print("=== 상인 기록 저장소 테스트 시작 ===\n")
+
+    print("1. 등장 주기 / 주 키:")
+    assert cycle_start(datetime(2024, 5, 1, 10, 30)) == datetime(2024, 5, 1, 10, 0)
+    assert cycle_start(datetime(2024, 5, 2, 2, 0)) == datetime(2024, 5, 1, 22, 0)    # 22:00 ~ 03:30
+    assert cycle_start(datetime(2024, 5, 1, 3, 59)) == datetime(2024, 4, 30, 22, 0)
+    assert week_key(datetime(2024, 5, 1)) == "2024-W18"
+    print("✅ 주기")
+
+    path = os.path.join(tempfile.mkdtemp(), "history.db")
+    history = MerchantHistoryStore(path)
+    rowen = make_merchant("로웬", "세라한", ("웨이", '전설'), ("사일러스", '고급'))
+    yorn = make_merchant("욘", "라이티르", ("케이사르", '희귀'))
+
+    print("2. 같은 주기에 같은 내용은 한 번만 저장, 새로 나온 아이템만 집계:")
+    assert history.append([rowen], datetime(2024, 5, 1, 10, 5)) is not None
+    assert history.append([rowen], datetime(2024, 5, 1, 10, 10)) is None
+    assert history.append([rowen, yorn], datetime(2024, 5, 1, 10, 15)) is not None
+    assert history.item_appearances("웨이") == [("로웬", 1)]
+    assert history.grade_distribution() == {5: 1, 3: 1, 2: 1}
+    print(f"✅ 통계: {history.get_stats()}")
+
+    print("3. 다음 주기에 같은 내용이면 새 등장으로 집계:")
+    assert history.append([rowen, yorn], datetime(2024, 5, 1, 16, 5)) is not None
+    history.append([yorn], datetime(2024, 5, 8, 10, 5))          # 다음 주
+    assert history.item_appearances("웨이") == [("로웬", 2)]
+    assert history.item_appearances("케이사르") == [("욘", 3)]
+    assert history.cycle_count() == 3
+    assert history.region_cycle_counts() == {"로웬": 2, "욘": 3}
+    assert history.region_cycle_counts(weeks=1, now=datetime(2024, 5, 9)) == {"욘": 1}
+    assert history.weekly_summary() == [("2024-W19", 1, 1), ("2024-W18", 2, 6)]
+    assert history.region_items("로웬") == [("사일러스", 2), ("웨이", 2)]
+    assert history.item_appearances("없는 아이템") == []
+    print("✅ 주간 집계")
+
+    print("4. 다시 열어도 집계 / 중복 판단 유지:")
+    history.close()
+    history = MerchantHistoryStore(path)
+    assert history.append([yorn], datetime(2024, 5, 8, 10, 30)) is None
+    assert history.item_appearances("케이사르") == [("욘", 3)]
+    store = MerchantSnapshotStore()
+    snapshot = store.publish([yorn], fetched_at=datetime(2024, 5, 8, 16, 1))
+    assert history.append(snapshot) is not None                  # fetched_at 사용
+    assert history.item_appearances("케이사르", weeks=1, now=datetime(2024, 5, 9)) == [("욘", 2)]
+    print(f"✅ 통계: {history.get_stats()}")
+
+    print("5. 저장 실패해도 이름 ID가 꼬이지 않음:")
+    try:
+        history.append([{'region_name': "새 지역", 'npc_name': "새 NPC", 'items': [{'grade': 1}]}])
+        assert False, "이름 없는 아이템은 실패해야 함"
+    except KeyError:
+        pass
+    history.append([make_merchant("새 지역", "새 NPC", ("새 아이템", 1))], datetime(2024, 5, 9, 10, 0))
+    assert history.item_appearances("새 아이템") == [("새 지역", 1)]
+    history.close()
+    print("✅ 롤백")
+
+    print("\n✅ 모든 테스트 완료!")
+
+
+if __name__ == "__main__":
+    test_merchant_history()
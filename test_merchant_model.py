@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""
+상인/아이템 데이터 모델 테스트
+"""
+
+import json
+from datetime import datetime, timedelta
+
+from merchant_diff import diff_merchants
+from merchant_model import Item, ItemGrade, ItemType, Merchant
+from merchant_snapshot import MerchantSnapshotStore
+from wandering_merchant_tracker import WanderingMerchantTracker
+
+
+def make_payload(now):
+    """지금 활성인 스케줄 하나 + 지역 두 개"""
+    start = now - timedelta(minutes=30)
+    return json.loads(json.dumps({
+        'pageProps': {'initialData': {'scheme': {
+            'schedules': [{
+                'dayOfWeek': (start.weekday() + 1) % 7,
+                'startTime': start.strftime('%H:%M:%S'),
+                'duration': '02:00:00',
+                'groups': [1],
+            }],
+            'regions': [
+                {'id': '1', 'name': '아르테미스', 'npcName': '벤', 'group': 1, 'items': [
+                    {'name': '시이라', 'type': 1, 'grade': 1, 'hidden': False},
+                    {'name': '카마인', 'type': 1, 'grade': 4, 'hidden': False},
+                    {'name': '두근두근 상자', 'type': 2, 'grade': 5, 'hidden': False},
+                    {'name': '숨김 아이템', 'type': 3, 'grade': 5, 'hidden': True},
+                ]},
+                {'id': '2', 'name': '유디아', 'npcName': '루카스', 'group': 2, 'items': []},
+            ],
+        }}}
+    }))
+
+
+def test_merchant_model():
+    """상인/아이템 모델 테스트"""
+    print("=== 상인/아이템 데이터 모델 테스트 시작 ===\n")
+
+    print("1. 아이템: 정수 등급/타입, 표시 문자열은 필요할 때 계산:")
+    item = Item.of("카마인", 4, 1)
+    assert item.grade is ItemGrade.EPIC and item.type is ItemType.CARD
+    assert (item.grade_text, item.grade_emoji, item.type_text) == ('영웅', '🟣', '카드')
+    assert item['name'] == "카마인" and item['grade'] >= 3 and item.get('missing', 0) == 0
+    assert not hasattr(item, '__dict__')
+    try:
+        item.name = "다른 이름"
+        assert False, "수정되면 안 됨"
+    except AttributeError:
+        pass
+    print(f"✅ {item}")
+
+    print("2. 같은 아이템은 한 객체, 이름은 intern된 문자열 공유:")
+    parsed = json.loads('{"name": "카마인", "grade": 4, "type": 1}')
+    assert Item.from_raw(parsed) is item
+    assert Item("".join(["카", "마인"]), 4, 1).name is item.name
+    assert Item.of("전설 카드 팩", '전설').grade is ItemGrade.LEGENDARY
+    assert Item.of("이상한 아이템", 9, 7).grade == 9
+    print("✅ 재사용")
+
+    print("3. 상인: dict처럼 읽기 / 숨김 아이템 제외 / to_dict:")
+    merchant = Merchant.from_region(make_payload(datetime.now())['pageProps']['initialData']['scheme']['regions'][0])
+    assert merchant['region_name'] == "아르테미스" and merchant.get('group') == 1
+    assert [i['name'] for i in merchant['items']] == ["시이라", "카마인", "두근두근 상자"]
+    assert json.loads(json.dumps(merchant.to_dict()))['items'][1] == {'name': "카마인", 'grade': 4, 'type': 1, 'hidden': False}
+    print(f"✅ {merchant}")
+
+    print("4. 추적기: Merchant 레코드 반환, 같은 페이로드면 아이템 재사용:")
+    tracker = WanderingMerchantTracker()
+    payload = make_payload(datetime.now())
+    first = tracker.get_active_merchants_now(payload)
+    second = tracker.get_active_merchants_now(payload)
+    assert len(first) == 1 and isinstance(first[0], Merchant)
+    assert [i.grade for i in first[0].items] == [5, 4, 1]  # 높은 등급부터
+    assert first[0].items is second[0].items
+    assert first[0]['schedule_key'].startswith("아르테미스_")
+    alert = tracker.format_new_merchant_alert(first)
+    assert "🟠 **두근두근 상자** (전설 아이템)" in alert
+    assert "🛍️ 🟠 두근두근 상자" in tracker.format_current_active_summary(first)
+    print("✅ 알림 메시지 동일")
+
+    print("5. 스냅샷 / diff와 함께 사용:")
+    store = MerchantSnapshotStore()
+    snapshot = store.publish(first)
+    assert snapshot.merchants[0] is first[0]
+    assert snapshot.grade_counts[ItemGrade.LEGENDARY] == 1
+    assert not diff_merchants(first, second)
+    print(f"✅ {snapshot}")
+
+    print("\n✅ 모든 테스트 완료!")
+
+
+if __name__ == "__main__":
+    test_merchant_model()
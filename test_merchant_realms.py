@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""
+서버별 상인 스냅샷 테스트
+"""
+
+from merchant_realms import DEFAULT_REALM, REALMS, RealmSnapshotStore, resolve_realm
+from merchant_snapshot import MerchantSnapshotStore
+
+
+def make_merchants(region, npc, *items):
+    return [{'region_name': region, 'npc_name': npc,
+             'items': [{'name': name, 'grade': '전설', 'type': 1} for name in items]}]
+
+
+def test_merchant_realms():
+    """서버 이름 해석 / 서버별 스냅샷 테스트"""
+    print("=== 서버별 상인 스냅샷 테스트 시작 ===\n")
+
+    print("1. 서버 이름 해석:")
+    assert resolve_realm("니나브") == "니나브"
+    assert resolve_realm(" 카마 ") == "카마인"
+    assert resolve_realm("아브") == "아브렐슈드"
+    assert resolve_realm("카") is None                      # 카마인/카제로스/카단
+    assert resolve_realm("없는서버") is None
+    assert resolve_realm("") is None and resolve_realm(None) is None
+    assert DEFAULT_REALM in REALMS
+    print("✅ 이름 해석")
+
+    print("2. 한 번의 수집은 모든 서버가 같은 세대 번호:")
+    realms = RealmSnapshotStore()
+    assert realms.current(DEFAULT_REALM) is None
+    published = realms.publish_all({
+        "니나브": make_merchants("로웬", "세라한", "웨이"),
+        "루페온": make_merchants("욘", "라이티르", "케이사르"),
+    })
+    assert set(published) == {"니나브", "루페온"}
+    assert {snapshot.version for snapshot in published.values()} == {1}
+    assert realms.current("니나브").merchants[0]['npc_name'] == "세라한"
+    assert realms.current("루페온").merchants[0]['npc_name'] == "라이티르"
+    assert realms.current("카단") is None
+    print("✅ 세대 번호")
+
+    print("3. 읽지 못한 서버는 이전 스냅샷 유지:")
+    realms.publish_all({"니나브": make_merchants("로웬", "세라한", "사일러스"), "없는서버": []})
+    assert realms.generation == 2
+    assert realms.current("니나브").version == 2
+    assert realms.current("루페온").version == 1
+    assert realms.current("루페온").merchants[0]['npc_name'] == "라이티르"
+    assert realms.get_stats()["카단"]["version"] == 0
+    print("✅ 이전 스냅샷 유지")
+
+    print("4. 버전 지정 발행도 단조 증가:")
+    store = MerchantSnapshotStore()
+    assert store.publish([], version=5).version == 5
+    assert store.publish([]).version == 6
+    assert store.publish([], version=3).version == 7
+    print("✅ 단조 증가")
+
+    print("\n=== 서버별 상인 스냅샷 테스트 완료 ===")
+
+
+if __name__ == "__main__":
+    test_merchant_realms()
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""
+스케줄 경계 기반 떠상 체크 스케줄러 테스트
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+from merchant_scheduler import MerchantScheduler
+from schedule_index import ScheduleIndex
+
+schedules = [
+    {"dayOfWeek": 0, "startTime": "10:00:00", "duration": "05:30:00", "groups": [1]},
+    {"dayOfWeek": 0, "startTime": "16:00:00", "duration": "05:30:00", "groups": [2]},
+]
+
+# 2026-10-18은 일요일
+SUNDAY = datetime(2026, 10, 18)
+
+
+async def run_scheduler_checks():
+    reasons = []
+
+    print("2. 경계에서 변경이 안 보이면 짧게 재확인:")
+    results = {'start': True, 'boundary': False}
+    verify_results = iter([False, True])
+
+    async def check(reason):
+        reasons.append(reason)
+        if reason == 'verify':
+            return next(verify_results)
+        return results.get(reason, False)
+
+    boundaries = iter([0.05])
+    scheduler = MerchantScheduler(
+        check,
+        lambda now: now + timedelta(seconds=next(boundaries, 60)),
+        verify_delays=(0.02, 0.04, 0.06),
+        grace=0,
+        max_sleep=120,
+    )
+    scheduler.start()
+    await asyncio.sleep(0.3)
+
+    # 두 번째 재확인에서 변경을 확인했으므로 세 번째는 생략하고 다음 경계까지 대기
+    assert reasons == ['start', 'boundary', 'verify', 'verify'], reasons
+    assert scheduler.next_reason == 'boundary'
+    assert scheduler.get_stats()['changes'] == 2
+    print(f"✅ 체크 순서: {reasons}")
+
+    print("3. wake()로 바로 확인:")
+    scheduler.wake()
+    await asyncio.sleep(0.05)
+    assert reasons[-1] == 'manual'
+    scheduler.stop()
+    assert not scheduler.is_running()
+    print(f"통계: {scheduler.get_stats()}")
+
+    print("4. 스케줄을 모르거나 경계가 이미 지났으면 고정 간격:")
+    fallback_reasons = []
+
+    async def failing_check(reason):
+        fallback_reasons.append(reason)
+        raise RuntimeError("수집 실패")
+
+    scheduler = MerchantScheduler(
+        failing_check,
+        lambda now: now - timedelta(seconds=1),
+        fallback_interval=0.02,
+    )
+    scheduler.start()
+    await asyncio.sleep(0.15)
+    scheduler.stop()
+    assert fallback_reasons[0] == 'start'
+    assert 3 <= fallback_reasons.count('fallback') <= 10, fallback_reasons  # 지난 경계로 바로 재실행하지 않음
+    assert scheduler.errors == len(fallback_reasons)
+    print(f"✅ 실패해도 계속 동작 ({len(fallback_reasons)}회 확인, 오류 {scheduler.errors}회)")
+
+
+def test_merchant_scheduler():
+    """스케줄러 테스트"""
+    print("=== 떠상 체크 스케줄러 테스트 시작 ===\n")
+
+    print("1. 다음 경계 = 등장 / 마감 30분 전 / 마감 중 가장 빠른 시각:")
+    index = ScheduleIndex(schedules)
+    lead = timedelta(minutes=30)
+    assert index.next_boundary_after(SUNDAY + timedelta(hours=9), lead) == SUNDAY + timedelta(hours=10)
+    assert index.next_boundary_after(SUNDAY + timedelta(hours=12), lead) == SUNDAY + timedelta(hours=15)
+    assert index.next_boundary_after(SUNDAY + timedelta(hours=15, minutes=10), lead) == SUNDAY + timedelta(hours=15, minutes=30, seconds=1)
+    assert index.next_boundary_after(SUNDAY + timedelta(hours=22), lead) == SUNDAY + timedelta(days=7, hours=10)
+    assert ScheduleIndex([]).next_boundary_after(SUNDAY, lead) is None
+
+    scheduler = MerchantScheduler(None, lambda now: index.next_boundary_after(now, lead), max_sleep=3600)
+    assert scheduler.plan(SUNDAY + timedelta(hours=9, minutes=50)) == (601.0, 'boundary')
+    assert scheduler.plan(SUNDAY + timedelta(hours=3)) == (3600, 'resync')
+    print("✅ 경계 계산 정상")
+
+    asyncio.run(run_scheduler_checks())
+    print("\n✅ 모든 테스트 완료!")
+
+
+if __name__ == "__main__":
+    test_merchant_scheduler()
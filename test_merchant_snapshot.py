@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""
+상인 스냅샷 테스트
+"""
+
+import json
+import threading
+
+from merchant_snapshot import FrozenRecord, MerchantSnapshotStore
+
+
+def make_merchants(*entries):
+    return [
+        {'region_name': region, 'npc_name': npc,
+         'items': [{'name': name, 'grade': grade, 'type': 1} for name, grade in items]}
+        for region, npc, items in entries
+    ]
+
+
+def test_merchant_snapshot():
+    """상인 스냅샷 테스트"""
+    print("=== 상인 스냅샷 테스트 시작 ===\n")
+
+    store = MerchantSnapshotStore()
+    assert store.current is None and store.merchants is None and store.version == 0
+
+    print("1. 스냅샷은 읽기 전용이고 원본 목록과 분리됨:")
+    raw = make_merchants(
+        ("아르테미스", "벤", [("전설 카드 팩", '전설'), ("실링", '일반')]),
+        ("베른 북부", "피터", [("향신료", '영웅')]),
+    )
+    first = store.publish(raw)
+    raw[0]['items'].clear()
+    assert len(first.merchants[0]['items']) == 2
+    for mutate in (lambda: first.merchants[0].__setitem__('npc_name', "X"),
+                   lambda: first.merchants[0]['items'][0].update(grade='일반')):
+        try:
+            mutate()
+            assert False, "수정되면 안 됨"
+        except TypeError:
+            pass
+    editable = first.merchants[0].copy()
+    editable['items'] = []
+    assert isinstance(first.merchants[0], FrozenRecord) and len(first.merchants[0]['items']) == 2
+    assert json.loads(json.dumps(first.merchants))[1]['npc_name'] == "피터"
+    print(f"✅ {first}")
+
+    print("2. 미리 계산된 인덱스:")
+    assert first.version == 1 and store.version == 1
+    assert set(first.index) == {("아르테미스", "벤"), ("베른 북부", "피터")}
+    assert first.grade_counts == {'전설': 1, '일반': 1, '영웅': 1}
+    assert [m['npc_name'] for m in first.by_region["아르테미스"]] == ["벤"]
+    assert first.item_count == 3
+    print(f"✅ 통계: {store.get_stats()}")
+
+    print("3. 새 스냅샷 교체 후에도 이전 참조는 그대로 (복사 없이 비교):")
+    reader = store.current
+    second = store.publish(make_merchants(
+        ("아르테미스", "벤", [("전설 카드 팩", '전설'), ("영웅 카드 팩", '영웅')]),
+    ))
+    assert reader is first and store.current is second and second.version == 2
+    changes = second.changes_since(reader)
+    assert len(changes.changed) == 1 and len(changes.removed) == 1 and not changes.added
+    assert not second.changes_since(second)
+    assert second.changes_since(None).added
+    print(f"✅ {changes.summary()}")
+
+    print("4. 여러 스레드에서 동시에 교체해도 버전은 겹치지 않음:")
+    versions = []
+    lock = threading.Lock()
+
+    def publisher():
+        for _ in range(50):
+            snapshot = store.publish(raw)
+            with lock:
+                versions.append(snapshot.version)
+
+    threads = [threading.Thread(target=publisher) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(set(versions)) == 200 and store.version == 202
+    print(f"✅ 최종 버전 v{store.version}")
+
+    print("\n✅ 모든 테스트 완료!")
+
+
+if __name__ == "__main__":
+    test_merchant_snapshot()
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""
+NumPy 통계 엔진 테스트
+"""
+
+import os
+import tempfile
+from datetime import datetime
+
+from merchant_history import MerchantHistoryStore
+from merchant_snapshot import MerchantSnapshotStore
+from merchant_stats import MerchantStatsEngine, ObservationHistory, SnapshotColumns
+
+
+def make_merchant(region, npc, *items):
+    return {'region_name': region, 'npc_name': npc,
+            'items': [{'name': name, 'grade': grade, 'type': item_type} for name, grade, item_type in items]}
+
+
+def test_merchant_stats():
+    """스냅샷 / 기록 통계 테스트"""
+    print("=== NumPy 통계 엔진 테스트 시작 ===\n")
+
+    merchants = [
+        make_merchant("로웬", "세라한", ("웨이", '전설', 1), ("사일러스", '고급', 2)),
+        make_merchant("욘", "라이티르", ("케이사르", '희귀', 1), ("전설 호감도 상자", '전설', 3), ("향신료", '일반', 0)),
+        make_merchant("로웬", "다른 상인", ("마리나", '영웅', 1)),
+    ]
+
+    print("1. 스냅샷 분포 (기존 반복문 결과와 같아야 함):")
+    columns = SnapshotColumns(merchants)
+    assert len(columns) == 6 and columns.merchant_count == 3
+    assert columns.grade_counts() == {5: 2, 4: 1, 3: 1, 2: 1, 1: 1}
+    assert columns.type_counts() == {1: 3, 2: 1, 3: 1}
+    assert columns.region_item_counts() == {"로웬": 3, "욘": 3}
+    assert columns.merchants_with(grade=5).tolist() == [0, 1]
+    assert columns.merchants_with(item_type=1).tolist() == [0, 1, 2]
+    assert columns.merchants_with(grade=4, item_type=2).tolist() == []
+    assert SnapshotColumns([]).grade_counts() == {}
+    print("✅ 스냅샷")
+
+    print("2. 스냅샷 버전마다 한 번만 변환:")
+    engine = MerchantStatsEngine()
+    store = MerchantSnapshotStore()
+    snapshot = store.publish(merchants)
+    assert engine.columns(snapshot) is engine.columns(snapshot)
+    engine.columns(store.publish(merchants[:1]))
+    assert engine.builds == 2
+    print("✅ 캐시")
+
+    print("3. 기록 저장소 등장 행 증분 적재 (SQL 주간 집계와 같아야 함):")
+    history = MerchantHistoryStore(os.path.join(tempfile.mkdtemp(), "history.db"))
+    history.append(merchants[:1], datetime(2024, 4, 24, 10, 5))            # 지난주
+    history.append(merchants[:2], datetime(2024, 5, 1, 10, 5))             # 이번 주
+    assert engine.sync_history(history) == 2 + 5
+    assert engine.sync_history(history) == 0
+    history.append(merchants, datetime(2024, 5, 1, 10, 30))                # 같은 주기에 새 상인만
+    assert engine.sync_history(history) == 1
+    assert len(engine.history) == 8
+
+    now = datetime(2024, 5, 2, 12, 0)
+    assert engine.history.grade_distribution() == history.grade_distribution()
+    assert engine.history.grade_distribution(weeks=1, now=now) == history.grade_distribution(weeks=1, now=now)
+    assert engine.history.region_counts() == [("로웬", 5), ("욘", 3)]
+    assert engine.history.region_counts(weeks=1, now=now, limit=1) == [("로웬", 3)]
+    assert engine.history.week_over_week(now) == {5: (1, 2), 4: (0, 1), 3: (0, 1), 2: (1, 1), 1: (0, 1)}
+    starts, trend = engine.history.weekly_trend(4, now)
+    assert starts[-1] == datetime(2024, 4, 29) and trend.shape == (4, 6)
+    assert trend.sum() == 8
+    history.close()
+    print(f"✅ 기록: {engine.history.region_counts()}")
+
+    print("4. 용량 늘리기:")
+    growing = ObservationHistory(capacity=2)
+    for day in range(1, 6):
+        growing.extend([datetime(2024, 5, day).timestamp()] * 3, [0, 1, 1], [5, 4, 4])
+    assert len(growing) == 15
+    assert growing.grade_distribution() == {5: 5, 4: 10}
+    print("✅ 용량")
+
+    print("\n=== NumPy 통계 엔진 테스트 완료 ===")
+
+
+if __name__ == "__main__":
+    test_merchant_stats()
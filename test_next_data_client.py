@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""
+Next.js 데이터 라우트 클라이언트 / 조건부 요청 테스트 (네트워크 없이 가짜 세션 사용)
+"""
+
+import json
+from conditional_http import PayloadChangeTracker
+from next_data_client import NextDataClient
+
+
+class FakeResponse:
+    """requests.Response 대용"""
+
+    def __init__(self, status_code, body, headers=None):
+        self.status_code = status_code
+        self.content = body.encode('utf-8')
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class FakeKloaSession:
+    """배포(buildId 변경)를 흉내내는 가짜 세션"""
+
+    def __init__(self):
+        self.headers = {}
+        self.build_id = 'build-1'
+        self.requested = []
+        self.etag = None
+
+    def page_props(self):
+        return {'initialData': {'scheme': {'schedules': [], 'regions': []}, 'build': self.build_id}}
+
+    def get(self, url, headers=None, timeout=None):
+        self.requested.append(url)
+
+        if '/_next/data/' in url:
+            if f'/_next/data/{self.build_id}/' not in url:
+                return FakeResponse(404, 'Not Found')
+            if self.etag and (headers or {}).get('If-None-Match') == self.etag:
+                return FakeResponse(304, '')
+            return FakeResponse(200, json.dumps({'pageProps': self.page_props(), '__N_SSP': True}),
+                                {'ETag': self.etag} if self.etag else None)
+
+        next_data = {'props': {'pageProps': self.page_props()}, 'buildId': self.build_id}
+        return FakeResponse(200, (
+            '<html><body><div id="__next"></div>'
+            f'<script id="__NEXT_DATA__" type="application/json">{json.dumps(next_data)}</script>'
+            '</body></html>'
+        ))
+
+    def close(self):
+        pass
+
+
+def test_next_data_client():
+    """buildId 탐색/캐시/재탐색 테스트"""
+    print("=== Next.js 데이터 라우트 클라이언트 테스트 시작 ===\n")
+
+    session = FakeKloaSession()
+    client = NextDataClient("https://kloa.gg", session=session)
+
+    print("1. 첫 호출은 HTML에서 buildId 탐색:")
+    data = client.fetch('merchant')
+    assert client.build_id == 'build-1'
+    assert data['pageProps']['initialData']['build'] == 'build-1'
+    assert session.requested == ["https://kloa.gg/merchant"]
+    print(f"buildId: {client.build_id}")
+
+    print("2. 이후 호출은 데이터 라우트만 사용:")
+    data = client.fetch('merchant')
+    assert session.requested[-1] == "https://kloa.gg/_next/data/build-1/merchant.json"
+    assert data['pageProps']['initialData']['build'] == 'build-1'
+    print("✅ HTML 요청 없음")
+
+    print("3. 배포로 buildId가 바뀌면 404 후 자동 재탐색:")
+    session.build_id = 'build-2'
+    data = client.fetch('merchant')
+    assert client.build_id == 'build-2'
+    assert data['pageProps']['initialData']['build'] == 'build-2'
+    assert client.fetch('merchant')['pageProps']['initialData']['build'] == 'build-2'
+    assert session.requested[-1] == "https://kloa.gg/_next/data/build-2/merchant.json"
+    print(f"새 buildId: {client.build_id}")
+
+    stats = client.get_stats()
+    assert stats['html_fetches'] == 2
+    assert stats['data_fetches'] == 2
+    assert stats['rediscoveries'] == 1
+    print(f"통계: {stats}")
+
+    print("4. ETag가 같으면 304로 이전 파싱 결과 재사용:")
+    session.etag = '"v1"'
+    tracker = PayloadChangeTracker()
+    first = client.fetch('merchant')
+    assert tracker.check(first['pageProps']['initialData']) is True
+    second = client.fetch('merchant')
+    assert second is first
+    assert tracker.check(second['pageProps']['initialData']) is False
+    assert client.get_stats()['not_modified'] == 1
+    assert client.http.get_stats()['not_modified'] == 1
+    print(f"HTTP 통계: {client.http.get_stats()}")
+
+    print("5. 내용이 같은 새 응답은 해시로 적중 처리:")
+    session.etag = None
+    third = client.fetch('merchant')
+    assert third is not first
+    assert tracker.check(third['pageProps']['initialData']) is False
+    session.build_id = 'build-3'
+    client.fetch('merchant')
+    assert tracker.check(client.fetch('merchant')['pageProps']['initialData']) is True
+    assert tracker.get_stats()['hits'] == 2
+    assert tracker.get_stats()['misses'] == 2
+    print(f"페이로드 통계: {tracker.get_stats()}")
+
+    print("\n✅ 모든 테스트 완료!")
+
+
+if __name__ == "__main__":
+    test_next_data_client()
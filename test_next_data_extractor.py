@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""
+__NEXT_DATA__ 고속 추출기 테스트
+"""
+
+import json
+from next_data_extractor import find_next_data_slice, extract_next_data
+
+sample_next_data = {
+    "props": {
+        "pageProps": {
+            "initialData": {
+                "scheme": {
+                    "schedules": [
+                        {"dayOfWeek": 0, "startTime": "10:00:00", "duration": "05:30:00", "groups": [1]}
+                    ],
+                    "regions": [
+                        {"id": "1", "name": "아르테미스", "npcName": "벤", "group": 1, "items": []}
+                    ]
+                }
+            }
+        }
+    },
+    "buildId": "test-build-id"
+}
+
+sample_html = (
+    '<!DOCTYPE html><html><head><title>떠돌이 상인</title></head><body>'
+    '<div id="__next"><div class="bg-elevated">상인 목록</div></div>'
+    '<script id="__NEXT_DATA__" type="application/json">'
+    + json.dumps(sample_next_data, ensure_ascii=False) +
+    '</script><script src="/_next/static/chunks/main.js"></script></body></html>'
+)
+
+
+def test_next_data_extractor():
+    """__NEXT_DATA__ 추출기 테스트"""
+    print("=== __NEXT_DATA__ 추출기 테스트 시작 ===\n")
+
+    print("1. 문자열 HTML에서 추출:")
+    data = extract_next_data(sample_html)
+    assert data == sample_next_data
+    print(f"buildId: {data['buildId']}")
+
+    print("2. 응답 바이트에서 추출:")
+    data = extract_next_data(sample_html.encode('utf-8'))
+    assert data == sample_next_data
+    print(f"지역 수: {len(data['props']['pageProps']['initialData']['scheme']['regions'])}")
+
+    print("3. 스크립트가 아닌 요소에 같은 id가 먼저 나오는 경우:")
+    tricky_html = '<div id="__NEXT_DATA__">가짜</div>' + sample_html
+    assert extract_next_data(tricky_html) == sample_next_data
+    print("✅ 실제 <script> 태그만 사용")
+
+    print("4. 작은따옴표 속성:")
+    quoted_html = sample_html.replace('id="__NEXT_DATA__"', "id='__NEXT_DATA__'")
+    assert extract_next_data(quoted_html) == sample_next_data
+    print("✅ 작은따옴표 처리")
+
+    print("5. 스크립트가 없는 경우:")
+    assert find_next_data_slice('<html><body>없음</body></html>') is None
+    assert extract_next_data('<html><body>없음</body></html>') is None
+    print("✅ None 반환")
+
+    print("\n✅ 모든 테스트 완료!")
+
+
+if __name__ == "__main__":
+    test_next_data_extractor()
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""
+알림 동시 전송 디스패처 테스트 (가짜 채널 사용)
+"""
+
+import asyncio
+import time
+
+from notification_dispatcher import NotificationDispatcher, PermanentDeliveryError
+
+
+class FakeHTTPError(Exception):
+    """discord.HTTPException 흉내 (status / retry_after)"""
+
+    def __init__(self, status, retry_after=None):
+        super().__init__(f"HTTP {status}")
+        self.status = status
+        if retry_after is not None:
+            self.retry_after = retry_after
+
+
+async def run_dispatch_checks():
+    sent = []
+    attempts = {}
+
+    async def send(channel_id):
+        attempts[channel_id] = attempts.get(channel_id, 0) + 1
+        if channel_id == 'slow':
+            await asyncio.sleep(0.3)
+        elif channel_id == 'flaky' and attempts[channel_id] <= 2:
+            raise FakeHTTPError(503)
+        elif channel_id == 'limited' and attempts[channel_id] == 1:
+            raise FakeHTTPError(429, retry_after=0.05)
+        elif channel_id == 'deleted':
+            raise FakeHTTPError(404)
+        elif channel_id == 'missing':
+            raise PermanentDeliveryError("채널을 찾을 수 없음")
+        else:
+            await asyncio.sleep(0.01)
+        sent.append(channel_id)
+
+    dispatcher = NotificationDispatcher(max_concurrency=10, global_rate=1000, global_burst=1000,
+                                        backoff_base=0.01, backoff_cap=0.05)
+    targets = ['slow', 'flaky', 'limited', 'deleted', 'missing'] + [f"ch{i}" for i in range(50)]
+
+    print("1. 느린 채널이 다른 채널을 막지 않음:")
+    results = await dispatcher.dispatch(targets, send)
+    by_target = {r.target: r for r in results}
+    assert [r.target for r in results] == targets
+    assert max(by_target[f"ch{i}"].latency for i in range(50)) < by_target['slow'].latency
+    print(f"✅ 느린 채널 {by_target['slow'].latency:.2f}초, 나머지 최대 "
+          f"{max(by_target[f'ch{i}'].latency for i in range(50)):.2f}초")
+
+    print("2. 일시적 오류는 재시도, 삭제된 채널은 재시도 없이 영구 실패:")
+    assert by_target['flaky'].ok and by_target['flaky'].attempts == 3
+    assert by_target['limited'].ok and by_target['limited'].attempts == 2
+    assert not by_target['deleted'].ok and by_target['deleted'].permanent and attempts['deleted'] == 1
+    assert not by_target['missing'].ok and by_target['missing'].permanent
+    stats = dispatcher.get_stats()
+    assert stats['sent'] == 53 and stats['failed'] == 2 and stats['rate_limited'] == 1
+    assert stats['send_p50'] is not None
+    print(f"통계: {stats}")
+
+    print("3. 같은 채널은 채널별 한도(순간 5회, 초당 20회)를 지킴:")
+    dispatcher = NotificationDispatcher(global_rate=1000, global_burst=1000, route_rate=20, route_burst=5)
+
+    async def quick_send(target):
+        pass
+
+    started = time.perf_counter()
+    await dispatcher.dispatch([('guild', i) for i in range(15)], quick_send, route_key=lambda t: t[0])
+    elapsed = time.perf_counter() - started
+    # 5개는 바로, 나머지 10개는 초당 20개 → 약 0.5초
+    assert 0.4 <= elapsed < 1.5, elapsed
+    print(f"✅ 15개 전송 {elapsed:.2f}초")
+
+
+def test_notification_dispatcher():
+    """디스패처 테스트"""
+    print("=== 알림 동시 전송 디스패처 테스트 시작 ===\n")
+    asyncio.run(run_dispatch_checks())
+    print("\n✅ 모든 테스트 완료!")
+
+
+if __name__ == "__main__":
+    test_notification_dispatcher()
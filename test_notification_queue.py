@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""
+디스크 알림 대기열 테스트 (임시 SQLite 파일 사용)
+"""
+
+import asyncio
+import os
+import tempfile
+
+from notification_dispatcher import NotificationDispatcher, PermanentDeliveryError
+from notification_queue import NotificationQueue, NotificationOutbox
+
+
+def make_jobs(alert_key, channel_ids):
+    return [(f"{alert_key}:{channel_id}", channel_id * 10, channel_id, {'embed': {'title': alert_key}})
+            for channel_id in channel_ids]
+
+
+async def run_queue_checks(path):
+    print("1. 멱등 키로 중복 제거:")
+    queue = NotificationQueue(path)
+    assert queue.enqueue(make_jobs("상인A", range(1, 6))) == 5
+    assert queue.enqueue(make_jobs("상인A", range(1, 8))) == 2
+    assert queue.duplicates == 5
+    print(f"✅ 상태별 작업 수: {queue.counts()}")
+
+    print("2. 전송 도중 재시작 → 남은 작업 복구:")
+    claimed = queue.claim(limit=3)
+    queue.mark_sent([claimed[0].id])
+    queue.close()  # claimed[1:]은 'sending' 상태로 남음
+
+    queue = NotificationQueue(path)
+    assert queue.recovered == 2
+    assert queue.counts() == {'pending': 6, 'sending': 0, 'sent': 1, 'failed': 0}
+    print(f"✅ 복구 {queue.recovered}건")
+
+    print("3. 워커가 대기열을 비움 (삭제된 채널은 영구 실패, 일시적 오류는 재시도 대기):")
+    delivered = []
+    removed = []
+
+    async def send(job):
+        if job.channel_id == 4:
+            raise PermanentDeliveryError("채널을 찾을 수 없음")
+        if job.channel_id == 5:
+            raise ConnectionError("일시적 오류")
+        delivered.append((job.channel_id, job.payload['embed']['title']))
+
+    dispatcher = NotificationDispatcher(global_rate=1000, global_burst=1000, max_retries=0)
+    outbox = NotificationOutbox(queue, dispatcher, send, on_permanent_failures=removed.extend, batch_size=2)
+    results = await outbox.drain()
+
+    assert sorted(delivered) == [(2, "상인A"), (3, "상인A"), (6, "상인A"), (7, "상인A")]
+    assert [job.channel_id for job in removed] == [4]
+    counts = queue.counts()
+    assert counts['sent'] == 5 and counts['failed'] == 1 and counts['pending'] == 1
+    assert len(results) == 6
+    stats = outbox.get_stats()
+    assert stats['depth'] == 1 and stats['delivered'] == 4 and stats['drain_rate'] > 0
+    print(f"통계: {stats}")
+
+    print("4. 재시도 대기 중인 작업은 백오프 전에는 꺼내지 않음:")
+    assert queue.claim() == []
+    print("✅ 백오프 대기")
+    queue.close()
+
+
+def test_notification_queue():
+    """디스크 알림 대기열 테스트"""
+    print("=== 알림 대기열 테스트 시작 ===\n")
+    with tempfile.TemporaryDirectory() as directory:
+        asyncio.run(run_queue_checks(os.path.join(directory, "queue.db")))
+    print("\n✅ 모든 테스트 완료!")
+
+
+if __name__ == "__main__":
+    test_notification_queue()
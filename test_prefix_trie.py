@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""
+자동완성 접두어 트라이 테스트
+"""
+
+import random
+import time
+
+from item_search import normalize_text
+from merchant_model import ITEM_CATALOG
+from merchant_snapshot import MerchantSnapshotStore
+from prefix_trie import AutocompleteIndex, PrefixTrie
+
+
+def test_prefix_trie():
+    """트라이 자동완성 테스트"""
+    print("=== 자동완성 접두어 트라이 테스트 시작 ===\n")
+
+    print("1. 전체 이름 / 두 번째 단어부터 / 초성 접두어:")
+    trie = PrefixTrie(limit=5)
+    for name in ITEM_CATALOG:
+        trie.add(name)
+    assert trie.complete("집중") == ["집중 룬"]
+    assert trie.complete("룬") == ["집중 룬"]
+    assert trie.complete("ㅈㅈ") == ["집중 룬"]
+    assert trie.complete("비법")[0] == "비법의 주머니"          # 전체 이름 접두어가 먼저
+    assert "피에르의 비법서" in trie.complete("비법")
+    assert len(trie.complete("")) == 5 and trie.complete("없는") == []
+    print(f"✅ 이름 {trie.names}개, 노드 {trie.nodes}개")
+
+    print("2. 스냅샷 + 고정 목록, 지금 파는 아이템이 먼저:")
+    store = MerchantSnapshotStore()
+    index = AutocompleteIndex(items=ITEM_CATALOG, regions=["아르테미스", "베른 북부"], npcs=["벤", "피터"])
+    assert index.sync(None).complete('items', "주머니")[0] == "비법의 주머니"
+    snapshot = store.publish([
+        {'region_name': "베른 북부", 'npc_name': "피터", 'items': [{'name': "향기 나는 주머니", 'grade': '희귀'}]},
+        {'region_name': "욘", 'npc_name': "라이티르", 'items': [{'name': "새로운 아이템", 'grade': '전설'}]},
+    ])
+    index.sync(snapshot)
+    assert index.complete('items', "주머니")[0] == "향기 나는 주머니"
+    assert index.complete('items', "새로") == ["새로운 아이템"]
+    assert index.complete('regions', "베") == ["베른 북부"]
+    assert index.complete('regions', "ㅇ") == ["욘", "아르테미스"]       # 지금 등장한 지역 먼저
+    assert index.complete('npcs', "라이") == ["라이티르"]
+    assert index.complete('npcs', "") == ["피터", "라이티르", "벤"]
+    builds = index.builds
+    index.sync(snapshot)
+    assert index.builds == builds                            # 같은 버전이면 그대로
+    index.set_catalog(regions=["아르테미스", "베른 북부", "유디아"])
+    assert index.sync(snapshot).complete('regions', "유") == ["유디아"]
+    print(f"✅ 통계: {index.get_stats()}")
+
+    print("3. 이름 1만 개에서 결과가 정렬/필터와 같고 p99 5ms 미만:")
+    random.seed(21)
+    syllables = "가나다라마바사아자차카타파하전설영웅카드팩룬상자"
+    names = list({''.join(random.choices(syllables, k=random.randint(2, 6))) for _ in range(10_000)})
+    trie = PrefixTrie(limit=25)
+    for name in names:
+        trie.add(name)
+    samples = []
+    for _ in range(1000):
+        prefix = random.choice(names)[:random.randint(1, 3)]
+        started = time.perf_counter()
+        found = trie.complete(prefix)
+        samples.append(time.perf_counter() - started)
+        expected = sorted((name for name in names if normalize_text(name).startswith(prefix)), key=lambda n: (len(n), n))[:25]
+        assert found == expected, prefix
+    p99 = sorted(samples)[int(len(samples) * 0.99)] * 1000
+    assert p99 < 5, p99
+    print(f"✅ p99 {p99:.3f}ms")
+
+    print("\n✅ 모든 테스트 완료!")
+
+
+if __name__ == "__main__":
+    test_prefix_trie()
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""
+주간 스케줄 인덱스 테스트
+"""
+
+from datetime import datetime, timedelta
+
+from merchant_parser import MerchantParser
+from schedule_index import ScheduleIndex, build_regions_by_group, week_seconds, WEEK_SECONDS
+
+schedules = [
+    {"dayOfWeek": 0, "startTime": "10:00:00", "duration": "05:30:00", "groups": [1, 2]},
+    {"dayOfWeek": 0, "startTime": "16:00:00", "duration": "05:30:00", "groups": [3]},
+    {"dayOfWeek": 3, "startTime": "04:00:00", "duration": "05:30:00", "groups": [1]},
+    {"dayOfWeek": 6, "startTime": "22:00:00", "duration": "05:30:00", "groups": [2]},  # 일요일로 넘어감
+]
+
+regions = [
+    {"id": "1", "name": "아르테미스", "npcName": "벤", "group": 1, "items": []},
+    {"id": "2", "name": "베른 북부", "npcName": "피터", "group": 1, "items": []},
+    {"id": "3", "name": "욘", "npcName": "라이티르", "group": 2, "items": []},
+    {"id": "4", "name": "로웬", "npcName": "세라한", "group": 3, "items": []},
+]
+
+# 2026-10-18은 일요일
+SUNDAY = datetime(2026, 10, 18)
+
+
+def brute_force_groups(moment):
+    """모든 스케줄을 직접 비교 (주 경계를 넘는 구간 포함)"""
+    now_seconds = week_seconds(moment)
+    groups = set()
+    for schedule in schedules:
+        h, m, s = map(int, schedule['startTime'].split(':'))
+        dh, dm, ds = map(int, schedule['duration'].split(':'))
+        start = schedule['dayOfWeek'] * 86400 + h * 3600 + m * 60 + s
+        end = start + dh * 3600 + dm * 60 + ds
+        for offset in (0, -WEEK_SECONDS):
+            if start + offset <= now_seconds <= end + offset:
+                groups.update(schedule['groups'])
+    return groups
+
+
+def test_schedule_index():
+    """스케줄 인덱스 테스트"""
+    print("=== 주간 스케줄 인덱스 테스트 시작 ===\n")
+
+    index = ScheduleIndex(schedules)
+
+    print("1. 일주일 전체를 10분 간격으로 전수 비교:")
+    moment = SUNDAY
+    while moment < SUNDAY + timedelta(days=7):
+        assert set(index.active_groups(moment)) == brute_force_groups(moment), moment
+        moment += timedelta(minutes=10)
+    print("✅ 전수 비교 일치")
+
+    print("2. 토요일 밤 → 일요일 새벽으로 넘어가는 스케줄:")
+    saturday_night = SUNDAY + timedelta(days=6, hours=23)
+    sunday_dawn = SUNDAY + timedelta(hours=2)
+    assert index.active_groups(saturday_night) == {2}
+    assert index.active_groups(sunday_dawn) == {2}
+    slot = index.active_slots(sunday_dawn)[0]
+    assert slot.end_datetime(sunday_dawn) == SUNDAY + timedelta(hours=3, minutes=30)
+    assert slot.end_datetime(saturday_night) == SUNDAY + timedelta(days=7, hours=3, minutes=30)
+    print("✅ 마감 시간 정상")
+
+    print("3. 다음 변경 시각:")
+    assert index.next_change_after(SUNDAY + timedelta(hours=9)) == SUNDAY + timedelta(hours=10)
+    assert index.next_change_after(SUNDAY + timedelta(hours=12)) == SUNDAY + timedelta(hours=15, minutes=30, seconds=1)
+    assert index.next_end_after(SUNDAY + timedelta(hours=12), lead=timedelta(minutes=30)) == SUNDAY + timedelta(hours=15)
+    print("✅ 다음 변경 시각 정상")
+
+    print("4. 그룹 → 지역 목록 / MerchantParser 연동:")
+    regions_by_group = build_regions_by_group(regions)
+    assert [r['name'] for r in regions_by_group[1]] == ["아르테미스", "베른 북부"]
+
+    parser = MerchantParser({'pageProps': {'initialData': {'scheme': {'schedules': schedules, 'regions': regions}}}})
+    active = parser.get_current_active_merchants(SUNDAY + timedelta(hours=11))
+    assert len(active) == 1
+    assert active[0]['활성상인들'] == ["아르테미스 (벤)", "베른 북부 (피터)", "욘 (라이티르)"]
+    assert parser.get_current_active_merchants(SUNDAY + timedelta(hours=9)) == []
+    print(f"활성 상인: {active[0]['활성상인들']}")
+
+    print("\n✅ 모든 테스트 완료!")
+
+
+if __name__ == "__main__":
+    test_schedule_index()
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""
+단일 실행(single-flight) 유틸리티 테스트
+"""
+
+import asyncio
+
+from single_flight import SingleFlight
+
+
+async def run_single_flight_checks():
+    flight = SingleFlight()
+    calls = []
+
+    async def slow_fetch():
+        calls.append(1)
+        await asyncio.sleep(0.2)
+        return "결과"
+
+    print("1. 동시 호출은 한 번만 실행하고 결과 공유:")
+    results = await asyncio.gather(*(flight.do('merchants', slow_fetch) for _ in range(5)))
+    assert results == ["결과"] * 5 and len(calls) == 1
+    assert flight.get_stats() == {'calls': 1, 'shared': 4, 'in_flight': 0}
+    print(f"✅ 호출 5번 → 실행 {len(calls)}번")
+
+    print("2. 한 호출자의 타임아웃은 공유 실행을 취소하지 않음:")
+    patient = asyncio.ensure_future(flight.do('merchants', slow_fetch))
+    await asyncio.sleep(0)
+    try:
+        await asyncio.wait_for(flight.do('merchants', slow_fetch), 0.05)
+        assert False, "타임아웃이 나야 함"
+    except asyncio.TimeoutError:
+        pass
+    assert flight.in_flight('merchants')
+    assert await patient == "결과" and len(calls) == 2
+    assert not flight.in_flight('merchants')
+    print("✅ 나머지 호출자는 결과를 받음")
+
+    print("3. 명시적 취소는 모든 호출자에게 전달:")
+    waiters = [asyncio.ensure_future(flight.do('merchants', slow_fetch)) for _ in range(2)]
+    await asyncio.sleep(0)
+    assert flight.cancel('merchants') and not flight.cancel('other')
+    for waiter in waiters:
+        try:
+            await waiter
+            assert False, "취소되어야 함"
+        except asyncio.CancelledError:
+            pass
+    assert not flight.in_flight('merchants')
+    print("✅ 취소")
+
+
+def test_single_flight():
+    """단일 실행 테스트"""
+    print("=== 단일 실행(single-flight) 테스트 시작 ===\n")
+    asyncio.run(run_single_flight_checks())
+    print("\n✅ 모든 테스트 완료!")
+
+
+if __name__ == "__main__":
+    test_single_flight()
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""
+알림 채널 구독 저장소 테스트 (임시 SQLite 파일 사용)
+"""
+
+import asyncio
+import os
+import tempfile
+
+from subscription_store import SubscriptionStore
+
+
+async def run_store_checks(path):
+    print("1. 변경은 메모리에 바로 반영되고 저장은 모아서 한 번에:")
+    store = SubscriptionStore(path, flush_delay=0.05)
+    store.start()
+
+    for guild_id in range(100):
+        store[guild_id] = guild_id * 10
+    del store[99]
+    assert len(store) == 99 and store[5] == 50 and 99 not in store
+    assert store.flushes == 0
+
+    await asyncio.sleep(0.2)
+    stats = store.get_stats()
+    assert stats['flushes'] == 1 and stats['pending_writes'] == 0
+    print(f"✅ 변경 101건 → 저장 {stats['flushes']}회, 통계: {stats}")
+
+    print("2. 삭제된 채널 일괄 정리 (다른 채널로 다시 설정한 서버는 유지):")
+    store[1] = 11
+    removed = store.prune([(1, 10), (2, 20), (3, 30), (1000, 1)])
+    assert removed == 2
+    assert store[1] == 11 and 2 not in store and 3 not in store
+    print(f"✅ {removed}개 제거")
+
+    print("3. 서버별 설정 (스키마 변경 없이 JSON 저장):")
+    store.set_setting(5, 'mention_role', 1234)
+    assert store.get_setting(5, 'mention_role') == 1234
+    assert store.get_setting(6, 'mention_role', 'none') == 'none'
+    store.close()  # 남은 변경 저장
+
+    print("4. 재시작 후 그대로 불러옴:")
+    store = SubscriptionStore(path)
+    assert len(store) == 97
+    assert store[1] == 11 and store[5] == 50 and 2 not in store
+    assert store.get_setting(5, 'mention_role') == 1234
+    assert dict(store.items())[10] == 100
+    print(f"✅ 구독 {len(store)}개 복원")
+    store.close()
+
+
+async def run_retry_checks(path):
+    print("5. 저장 실패 후 다른 변경이 없어도 스스로 재시도:")
+    store = SubscriptionStore(path, flush_delay=0.05)
+    write = store._write
+    failures = []
+
+    def flaky_write(upserts, deletes):
+        if not failures:
+            failures.append(len(upserts))
+            raise OSError("database is locked")
+        write(upserts, deletes)
+
+    store._write = flaky_write
+    store.start()
+    store[500] = 5000
+    await asyncio.sleep(0.5)
+    stats = store.get_stats()
+    assert failures == [1] and stats['flush_failures'] == 1
+    assert stats['flushes'] == 1 and stats['pending_writes'] == 0
+    store.close()
+
+    store = SubscriptionStore(path)
+    assert store[500] == 5000
+    store.close()
+    print(f"✅ 실패 {stats['flush_failures']}회 후 저장")
+
+
+def test_subscription_store():
+    """구독 저장소 테스트"""
+    print("=== 알림 채널 구독 저장소 테스트 시작 ===\n")
+    with tempfile.TemporaryDirectory() as directory:
+        asyncio.run(run_store_checks(os.path.join(directory, "subscriptions.db")))
+        asyncio.run(run_retry_checks(os.path.join(directory, "subscriptions.db")))
+    print("\n✅ 모든 테스트 완료!")
+
+
+if __name__ == "__main__":
+    test_subscription_store()
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""
+TTL + LRU 캐시 테스트
+"""
+
+import asyncio
+
+from ttl_lru_cache import TTLLRUCache, normalize_character_name
+
+
+async def run_cache_checks():
+    calls = []
+
+    def make_loader(name, value):
+        async def load():
+            calls.append(name)
+            await asyncio.sleep(0.01)
+            return value
+        return load
+
+    cache = TTLLRUCache(maxsize=2, ttl=0.1, negative_ttl=0.05, stale_ttl=0.5, key_func=normalize_character_name)
+
+    print("1. 정규화된 이름으로 적중:")
+    assert await cache.get_or_load("유우니유니", make_loader("유우니유니", ["원정대"])) == ["원정대"]
+    assert await cache.get_or_load(" 유우니유니 ", make_loader("유우니유니", ["다른값"])) == ["원정대"]
+    assert calls == ["유우니유니"]
+    print(f"통계: {cache.get_stats()}")
+
+    print("2. 없는 캐릭터(None) 네거티브 캐시:")
+    assert await cache.get_or_load("없는캐릭터", make_loader("없는캐릭터", None)) is None
+    assert await cache.get_or_load("없는캐릭터", make_loader("없는캐릭터", None)) is None
+    assert calls.count("없는캐릭터") == 1
+    assert cache.negative_hits == 1
+    print("✅ 두 번째 조회는 API 호출 없음")
+
+    print("3. 최대 개수 초과시 LRU 제거:")
+    await cache.get_or_load("세번째", make_loader("세번째", ["세번째"]))
+    assert len(cache) == 2
+    assert cache.evictions == 1
+    assert cache.get("유우니유니") is None
+    print(f"✅ 가장 오래 안 쓴 항목 제거, 통계: {cache.get_stats()}")
+
+    print("4. 만료 후에는 이전 값을 바로 주고 한 번만 갱신:")
+    await asyncio.sleep(0.12)
+    results = await asyncio.gather(*(
+        cache.get_or_load("세번째", make_loader("세번째", ["갱신됨"])) for _ in range(5)
+    ))
+    assert results == [["세번째"]] * 5
+    assert cache.stale_hits == 5
+    await asyncio.sleep(0.05)
+    assert calls.count("세번째") == 2
+    assert cache.refreshes == 1
+    assert await cache.get_or_load("세번째", make_loader("세번째", ["또갱신"])) == ["갱신됨"]
+    print(f"✅ 백그라운드 갱신 1회, 통계: {cache.get_stats()}")
+
+    print("5. 로더 예외는 캐시하지 않음:")
+    async def failing():
+        raise RuntimeError("API 오류")
+    try:
+        await cache.get_or_load("실패", failing)
+        assert False, "예외가 전달되어야 함"
+    except RuntimeError:
+        pass
+    assert cache.get("실패") is None
+    print("✅ 예외 전달")
+
+
+def test_ttl_lru_cache():
+    """TTL + LRU 캐시 테스트"""
+    print("=== TTL + LRU 캐시 테스트 시작 ===\n")
+    asyncio.run(run_cache_checks())
+    print("\n✅ 모든 테스트 완료!")
+
+
+if __name__ == "__main__":
+    test_ttl_lru_cache()
@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+"""
+TTL + LRU 비동기 캐시
+- 최대 개수를 넘으면 가장 오래 안 쓴 항목부터 제거 (LRU)
+- 항목별 유효 시간(TTL), 결과 없음(None)은 짧은 TTL로 따로 캐시 (네거티브 캐시)
+- 만료 후 일정 시간 동안은 이전 값을 바로 돌려주고 백그라운드에서 한 번만 갱신 (stale-while-revalidate)
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+class _CacheEntry:
+    """캐시 항목"""
+
+    __slots__ = ('value', 'expires_at', 'stale_until', 'negative')
+
+    def __init__(self, value: Any, expires_at: float, stale_until: float, negative: bool):
+        self.value = value
+        self.expires_at = expires_at
+        self.stale_until = stale_until
+        self.negative = negative
+
+
+class TTLLRUCache:
+    """TTL + LRU 캐시 (stale-while-revalidate, 네거티브 캐시 지원)"""
+
+    def __init__(self, maxsize: int = 512, ttl: float = 300.0, negative_ttl: float = 60.0,
+                 stale_ttl: float = 600.0, key_func: Optional[Callable[[Any], Hashable]] = None):
+        """
+        초기화
+        Args:
+            maxsize: 최대 항목 수
+            ttl: 정상 결과 유효 시간(초)
+            negative_ttl: 결과 없음(None) 유효 시간(초)
+            stale_ttl: 만료 후 이전 값을 대신 돌려줄 수 있는 시간(초), 0이면 사용 안 함
+            key_func: 키 정규화 함수 (예: 캐릭터명 공백/대소문자 정리)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.stale_ttl = stale_ttl
+        self.key_func = key_func
+
+        self._entries: 'OrderedDict[Hashable, _CacheEntry]' = OrderedDict()
+        self._refreshing: Dict[Hashable, asyncio.Task] = {}
+
+        self.hits = 0
+        self.negative_hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.refreshes = 0
+        self.refresh_failures = 0
+
+    def normalize(self, key: Any) -> Hashable:
+        """캐시 키 정규화"""
+        return self.key_func(key) if self.key_func else key
+
+    async def get_or_load(self, key: Any, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        캐시에서 값을 찾고, 없으면 loader()로 불러와서 저장
+        loader에서 예외가 나면 캐시하지 않고 그대로 전달
+        """
+        cache_key = self.normalize(key)
+        now = time.monotonic()
+        entry = self._entries.get(cache_key)
+
+        if entry is not None:
+            if now < entry.expires_at:
+                self._entries.move_to_end(cache_key)
+                if entry.negative:
+                    self.negative_hits += 1
+                else:
+                    self.hits += 1
+                return entry.value
+
+            if now < entry.stale_until and not entry.negative:
+                # 만료됐지만 이전 값을 바로 돌려주고 갱신은 백그라운드에서 한 번만
+                self._entries.move_to_end(cache_key)
+                self.stale_hits += 1
+                self._schedule_refresh(cache_key, loader)
+                return entry.value
+
+            del self._entries[cache_key]
+            self.expirations += 1
+
+        self.misses += 1
+        value = await loader()
+        self._store(cache_key, value)
+        return value
+
+    def get(self, key: Any) -> Optional[Any]:
+        """유효한 값만 조회 (없거나 만료면 None, 통계에 포함하지 않음)"""
+        entry = self._entries.get(self.normalize(key))
+        if entry is None or time.monotonic() >= entry.expires_at:
+            return None
+        return entry.value
+
+    def set(self, key: Any, value: Any):
+        """값 저장 (None이면 네거티브 캐시)"""
+        self._store(self.normalize(key), value)
+
+    def invalidate(self, key: Any) -> bool:
+        """항목 삭제"""
+        return self._entries.pop(self.normalize(key), None) is not None
+
+    def clear(self):
+        """전체 삭제"""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _store(self, cache_key: Hashable, value: Any):
+        """정규화된 키로 저장하고 최대 개수를 넘으면 LRU 제거"""
+        now = time.monotonic()
+        negative = value is None
+        ttl = self.negative_ttl if negative else self.ttl
+
+        if ttl <= 0:
+            self._entries.pop(cache_key, None)
+            return
+
+        self._entries[cache_key] = _CacheEntry(value, now + ttl, now + ttl + self.stale_ttl, negative)
+        self._entries.move_to_end(cache_key)
+
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """적중률/제거 통계"""
+        lookups = self.hits + self.negative_hits + self.stale_hits + self.misses
+        served = self.hits + self.negative_hits + self.stale_hits
+        return {
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+            'hits': self.hits,
+            'negative_hits': self.negative_hits,
+            'stale_hits': self.stale_hits,
+            'misses': self.misses,
+            'hit_rate': served / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'refreshes': self.refreshes,
+            'refresh_failures': self.refresh_failures,
+        }
+
+    def _schedule_refresh(self, cache_key: Hashable, loader: Callable[[], Awaitable[Any]]):
+        """키별로 하나의 백그라운드 갱신만 실행"""
+        if cache_key in self._refreshing:
+            return
+
+        task = asyncio.get_running_loop().create_task(self._refresh(cache_key, loader))
+        self._refreshing[cache_key] = task
+
+    async def _refresh(self, cache_key: Hashable, loader: Callable[[], Awaitable[Any]]):
+        """백그라운드 갱신 (실패하면 이전 값을 stale 기간 동안 계속 사용)"""
+        try:
+            value = await loader()
+            self.refreshes += 1
+            self._store(cache_key, value)
+        except Exception as e:
+            self.refresh_failures += 1
+            print(f"⚠️ 캐시 갱신 실패 ({cache_key}): {e}")
+        finally:
+            self._refreshing.pop(cache_key, None)
+
+
+def normalize_character_name(name: str) -> str:
+    """캐릭터명 캐시 키 (앞뒤/중간 공백 제거, 영문 대소문자 무시)"""
+    return ''.join(name.split()).casefold()
@@ -4,9 +4,10 @@
 """
 
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Set
+from typing import Dict, List, Optional, Any, Set, Tuple
 import json
 from merchant_parser import MerchantParser
+from merchant_model import GRADE_EMOJI, GRADE_TEXT, TYPE_TEXT, Item, Merchant
 
 class WanderingMerchantTracker:
     """떠돌이 상인 실시간 추적 클래스"""
@@ -16,6 +17,26 @@ class WanderingMerchantTracker:
         self.last_check_time = None
         self.merchant_end_times: Dict[str, datetime] = {}
         
+        # 같은 페이로드면 파서(스케줄 인덱스 포함)를 다시 만들지 않음
+        self._cached_api_data = None
+        self._cached_parser: Optional[MerchantParser] = None
+        self._cached_items: Dict[int, Tuple[Item, ...]] = {}  # 지역 dict id → 정리된 아이템 (같은 페이로드 동안)
+    
+    def get_parser(self, api_data: Dict[Any, Any]) -> MerchantParser:
+        """페이로드별 MerchantParser (같은 객체면 재사용)"""
+        if self._cached_parser is None or api_data is not self._cached_api_data:
+            self._cached_parser = MerchantParser(api_data)
+            self._cached_api_data = api_data
+            self._cached_items = {}
+        return self._cached_parser
+    
+    def get_region_items(self, region: Dict[str, Any]) -> Tuple[Item, ...]:
+        """지역 아이템 (같은 페이로드면 폴링마다 다시 만들지 않음)"""
+        items = self._cached_items.get(id(region))
+        if items is None:
+            items = self._cached_items[id(region)] = self.get_merchant_items(region.get('items', []))
+        return items
+        
     def get_current_time_info(self) -> Dict[str, Any]:
         """현재 시간 정보 반환"""
         now = datetime.now()
@@ -57,42 +78,31 @@ class WanderingMerchantTracker:
             print(f"시간 계산 오류: {e}")
             return current_date + timedelta(hours=5, minutes=30)  # 기본값
     
-    def get_active_merchants_now(self, api_data: Dict[Any, Any]) -> List[Dict[str, Any]]:
+    def get_active_merchants_now(self, api_data: Dict[Any, Any]) -> List[Merchant]:
         """현재 시간에 활성화된 떠돌이 상인들 반환"""
         try:
-            parser = MerchantParser(api_data)
-            time_info = self.get_current_time_info()
+            parser = self.get_parser(api_data)
+            now = datetime.now()
             
             active_merchants = []
             
-            for schedule in parser.schedules:
-                # 오늘 스케줄인지 확인
-                if schedule.get('dayOfWeek') != time_info['kloa_day']:
-                    continue
-                
-                start_time = schedule.get('startTime', '00:00:00')
-                duration = schedule.get('duration', '05:30:00')
-                
-                # 마감 시간 계산
-                end_time = self.calculate_end_time(start_time, duration, time_info['datetime'])
+            # 스케줄 인덱스에서 현재 활성 스케줄만 이진 탐색으로 조회
+            for slot in parser.schedule_index.active_slots(now):
+                end_time = slot.end_datetime(now)
                 
-                # 현재 시간이 활성 시간 범위 내인지 확인
-                if self.is_merchant_active_now(start_time, duration, time_info):
-                    # 해당 그룹의 상인들 찾기
-                    for group_id in schedule.get('groups', []):
-                        region = next((r for r in parser.regions if r.get('group') == group_id), None)
-                        if region:
-                            merchant_info = {
-                                'region_name': region.get('name', '알 수 없음'),
-                                'npc_name': region.get('npcName', '알 수 없음'),
-                                'group_id': group_id,
-                                'start_time': start_time,
-                                'duration': duration,
-                                'end_time': end_time,
-                                'items': self.get_merchant_items(region.get('items', [])),
-                                'schedule_key': f"{region.get('name')}_{start_time}"
-                            }
-                            active_merchants.append(merchant_info)
+                # 해당 그룹의 상인들 찾기
+                for group_id in slot.groups:
+                    for region in parser.regions_by_group.get(group_id, []):
+                        merchant_info = Merchant(
+                            region.get('name', '알 수 없음'),
+                            region.get('npcName', '알 수 없음'),
+                            group_id,
+                            self.get_region_items(region),
+                            start_time=slot.start_time,
+                            duration=slot.duration,
+                            end_time=end_time
+                        )
+                        active_merchants.append(merchant_info)
             
             return active_merchants
             
@@ -100,6 +110,17 @@ class WanderingMerchantTracker:
             print(f"활성 상인 조회 오류: {e}")
             return []
     
+    def get_next_transition_time(self, api_data: Dict[Any, Any]) -> datetime:
+        """
+        활성 상인 목록이나 마감 임박 여부가 바뀔 수 있는 다음 시각
+        (스케줄 시작 / 마감 / 마감 30분 전 중 가장 빠른 시각)
+        """
+        now = datetime.now()
+        boundary = self.get_parser(api_data).schedule_index.next_boundary_after(now, lead=timedelta(minutes=30))
+        
+        # 스케줄이 없으면 하루 뒤 다시 확인
+        return boundary or now + timedelta(days=1)
+    
     def is_merchant_active_now(self, start_time: str, duration: str, time_info: Dict) -> bool:
         """상인이 현재 활성 상태인지 확인"""
         try:
@@ -129,42 +150,26 @@ class WanderingMerchantTracker:
             print(f"활성 상태 확인 오류: {e}")
             return False
     
-    def get_merchant_items(self, items: List[Dict]) -> List[Dict[str, Any]]:
-        """상인 아이템 정보 정리"""
-        processed_items = []
-        
-        for item in items:
-            if item.get('hidden', False):
-                continue  # 숨김 아이템 제외
-                
-            item_info = {
-                'name': item.get('name', '알 수 없음'),
-                'grade': item.get('grade', 1),
-                'grade_text': self.get_grade_text(item.get('grade', 1)),
-                'grade_emoji': self.get_grade_emoji(item.get('grade', 1)),
-                'type': item.get('type', 1),
-                'type_text': self.get_item_type_text(item.get('type', 1))
-            }
-            processed_items.append(item_info)
+    def get_merchant_items(self, items: List[Dict]) -> Tuple[Item, ...]:
+        """상인 아이템 정보 정리 (등급/타입 텍스트, 이모지는 Item에서 필요할 때 계산)"""
+        # 숨김 아이템 제외
+        processed_items = [Item.from_raw(item) for item in items if not item.get('hidden', False)]
         
         # 등급순으로 정렬 (높은 등급부터)
-        processed_items.sort(key=lambda x: x['grade'], reverse=True)
-        return processed_items
+        processed_items.sort(key=lambda x: x.grade, reverse=True)
+        return tuple(processed_items)
     
     def get_grade_text(self, grade: int) -> str:
         """등급 텍스트 반환"""
-        grade_map = {1: '일반', 2: '고급', 3: '희귀', 4: '영웅', 5: '전설'}
-        return grade_map.get(grade, '알 수 없음')
+        return GRADE_TEXT.get(grade, '알 수 없음')
     
     def get_grade_emoji(self, grade: int) -> str:
         """등급 이모지 반환"""
-        grade_emoji = {1: '⚪', 2: '🟢', 3: '🔵', 4: '🟣', 5: '🟠'}
-        return grade_emoji.get(grade, '⚪')
+        return GRADE_EMOJI.get(grade, '⚪')
     
     def get_item_type_text(self, item_type: int) -> str:
         """아이템 타입 텍스트 반환"""
-        type_map = {1: '카드', 2: '아이템', 3: '재료'}
-        return type_map.get(item_type, '알 수 없음')
+        return TYPE_TEXT.get(item_type, '알 수 없음')
     
     def check_merchant_changes(self, api_data: Dict[Any, Any]) -> Dict[str, List[Dict]]:
         """상인 변경사항 확인 (새로 등장/사라진 상인)"""
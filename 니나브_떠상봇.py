@@ -11,6 +11,9 @@ import logging
 from typing import Optional, Dict, Any
 from merchant_parser import MerchantParser
 from wandering_merchant_tracker import WanderingMerchantTracker
+from next_data_client import NextDataClient
+from conditional_http import PayloadChangeTracker
+from merchant_scheduler import MerchantScheduler
 
 class Main:
     def __init__(self):
@@ -156,9 +159,19 @@ class Main:
     def setup_variables(self):
         """변수 초기화"""
         self.last_data = None
-        self.api_url = "https://kloa.gg/_next/data/zg-3f6yHQunqL3skcaU9x/statistics/merchant.json"
+        self.data_page = "statistics/merchant"
+        self.next_data_client = NextDataClient(headers={
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+        })  # buildId 자동 탐색 (배포마다 바뀌는 경로 하드코딩 제거)
         self.merchant_tracker = WanderingMerchantTracker()  # 떠돌이 상인 추적기 추가
         
+        # initialData 해시가 같으면 파서 생성과 변경 감지를 생략
+        self.payload_tracker = PayloadChangeTracker()
+        self.cached_parser = None
+        self.cached_parser_hash = None
+        self.monitored_hash = None
+        self.next_transition_time = None
+        
     def setup_logging(self):
         """로깅 설정"""
         logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -190,14 +203,12 @@ class Main:
     def fetch_merchant_data(self) -> Optional[Dict[Any, Any]]:
         """KLOA API에서 상인 데이터 가져오기"""
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            
-            response = requests.get(self.api_url, headers=headers, timeout=10)
-            response.raise_for_status()
+            data = self.next_data_client.fetch(self.data_page)
+            if not data:
+                self.log_message("buildId를 찾을 수 없습니다", "ERROR")
+                return None
             
-            data = response.json()
+            self.payload_tracker.check(data.get('pageProps', {}).get('initialData'))
             self.log_message("API 데이터 가져오기 성공", "SUCCESS")
             return data
             
@@ -211,6 +222,14 @@ class Main:
             self.log_message(f"예상치 못한 오류: {str(e)}", "ERROR")
             return None
             
+    def get_merchant_parser(self, data: Dict[Any, Any]) -> MerchantParser:
+        """페이로드가 바뀌었을 때만 MerchantParser 새로 생성"""
+        current_hash = self.payload_tracker.last_hash
+        if self.cached_parser is None or current_hash is None or self.cached_parser_hash != current_hash:
+            self.cached_parser = MerchantParser(data)
+            self.cached_parser_hash = current_hash
+        return self.cached_parser
+        
     def format_merchant_data(self, data: Dict[Any, Any]) -> str:
         """상인 데이터를 디스코드 메시지 형식으로 포맷팅"""
         try:
@@ -218,7 +237,7 @@ class Main:
                 return "❌ 데이터 형식이 올바르지 않습니다."
             
             # 새로운 파서 사용
-            parser = MerchantParser(data)
+            parser = self.get_merchant_parser(data)
             
             # 현재 활성 상인 정보 가져오기
             active_merchants_msg = parser.format_active_merchants()
@@ -284,7 +303,7 @@ class Main:
             data = self.fetch_merchant_data()
             if data:
                 try:
-                    parser = MerchantParser(data)
+                    parser = self.get_merchant_parser(data)
                     message = parser.format_merchant_list()
                     
                     if len(message) > 2000:
@@ -306,7 +325,7 @@ class Main:
             data = self.fetch_merchant_data()
             if data:
                 try:
-                    parser = MerchantParser(data)
+                    parser = self.get_merchant_parser(data)
                     
                     # 요일 변환
                     target_day = None
@@ -339,7 +358,7 @@ class Main:
             data = self.fetch_merchant_data()
             if data:
                 try:
-                    parser = MerchantParser(data)
+                    parser = self.get_merchant_parser(data)
                     message = parser.format_merchant_detail(merchant_name)
                     
                     if len(message) > 2000:
@@ -361,7 +380,7 @@ class Main:
             data = self.fetch_merchant_data()
             if data:
                 try:
-                    parser = MerchantParser(data)
+                    parser = self.get_merchant_parser(data)
                     message = parser.format_item_search(item_name)
                     
                     if len(message) > 2000:
@@ -448,11 +467,10 @@ class Main:
             """
             await ctx.send(help_text)
         
-        @tasks.loop(seconds=30)
-        async def monitor_merchants():
-            """떠돌이 상인 실시간 모니터링 루프"""
+        async def monitor_merchants(reason: str) -> bool:
+            """떠돌이 상인 변경 확인 (스케줄 경계마다 스케줄러가 호출, 변경이 있으면 True)"""
             if not self.is_monitoring:
-                return
+                return False
                 
             try:
                 channel_id = int(self.channel_entry.get().strip())
@@ -460,14 +478,24 @@ class Main:
                 
                 if not channel:
                     self.log_message(f"채널 ID {channel_id}를 찾을 수 없습니다.", "ERROR")
-                    return
+                    return False
                 
                 data = self.fetch_merchant_data()
                 if not data:
-                    return
+                    return False
+                
+                # 내용이 같고 스케줄 경계(시작/마감 30분 전/마감)도 안 지났으면 변경 감지 생략
+                payload_hash = self.payload_tracker.last_hash
+                if (payload_hash is not None and payload_hash == self.monitored_hash
+                        and self.next_transition_time and datetime.now() < self.next_transition_time):
+                    stats = self.payload_tracker.get_stats()
+                    self.log_message(f"떠돌이 상인 변경사항 없음 (캐시 적중 {stats['hits']} / 미스 {stats['misses']})", "INFO")
+                    return False
                 
                 # 떠돌이 상인 변경사항 확인
                 changes = self.merchant_tracker.check_merchant_changes(data)
+                self.monitored_hash = payload_hash
+                self.next_transition_time = self.merchant_tracker.get_next_transition_time(data)
                 
                 # 새로운 상인 등장 알림
                 if changes['new_merchants']:
@@ -494,24 +522,39 @@ class Main:
                 # 변경사항이 없을 때는 로그만
                 if not any(changes.values()):
                     self.log_message("떠돌이 상인 변경사항 없음", "INFO")
+                    return False
+                
+                next_time = self.next_transition_time.strftime('%H:%M:%S')
+                self.log_message(f"다음 확인 예정: {next_time} (스케줄 경계)", "INFO")
+                return True
                     
             except ValueError:
                 self.log_message("올바른 채널 ID를 입력해주세요.", "ERROR")
             except Exception as e:
                 self.log_message(f"모니터링 오류: {str(e)}", "ERROR")
+            return False
         
-        # 모니터링 간격 업데이트
+        # 모니터링 간격 업데이트 (스케줄을 모를 때만 사용하는 확인 간격)
         @tasks.loop(seconds=1)
         async def update_monitor_interval():
             try:
                 new_interval = int(self.interval_var.get())
-                if monitor_merchants.seconds != new_interval:
-                    monitor_merchants.change_interval(seconds=new_interval)
+                if self.monitor_merchants.fallback_interval != new_interval:
+                    self.monitor_merchants.fallback_interval = new_interval
                     self.log_message(f"모니터링 간격을 {new_interval}초로 변경했습니다.", "INFO")
             except:
                 pass
         
-        self.monitor_merchants = monitor_merchants
+        # 고정 간격 폴링 대신 다음 등장/마감/마감 30분 전 시각에만 확인
+        try:
+            fallback_interval = int(self.interval_var.get())
+        except ValueError:
+            fallback_interval = 30
+        self.monitor_merchants = MerchantScheduler(
+            monitor_merchants,
+            lambda now: self.next_transition_time,
+            fallback_interval=fallback_interval
+        )
         
         return bot
     
@@ -10,6 +10,7 @@ from datetime import datetime
 import logging
 from typing import Optional, Dict, Any, List
 from html_merchant_parser import HTMLMerchantParser
+from merchant_diff import diff_merchants
 
 class Main:
     def __init__(self):
@@ -212,23 +213,11 @@ class Main:
             return f"❌ 데이터 처리 중 오류가 발생했습니다: {str(e)}"
     
     def merchants_changed(self, new_merchants: List[Dict]) -> bool:
-        """상인 정보 변경 여부 확인"""
-        if len(new_merchants) != len(self.last_merchants):
-            return True
-        
-        # 간단한 비교 (지역, NPC명, 아이템 수로)
-        for new_merchant in new_merchants:
-            found = False
-            for old_merchant in self.last_merchants:
-                if (new_merchant['region'] == old_merchant['region'] and 
-                    new_merchant['npc_name'] == old_merchant['npc_name'] and
-                    len(new_merchant['items']) == len(old_merchant['items'])):
-                    found = True
-                    break
-            if not found:
-                return True
-        
-        return False
+        """상인 정보 변경 여부 확인 (등장/사라짐 + 아이템 구성 변경)"""
+        changes = diff_merchants(self.last_merchants, new_merchants)
+        if changes:
+            self.log_message(f"상인 변경: {changes.summary()}", "INFO")
+        return bool(changes)
     
     def create_discord_bot(self):
         """디스코드 봇 생성 및 설정"""